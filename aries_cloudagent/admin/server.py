@@ -2,6 +2,7 @@
 
 import asyncio
 from hmac import compare_digest
+import json
 import logging
 import re
 from typing import Callable, Coroutine
@@ -11,6 +12,8 @@ import warnings
 from aiohttp import web
 from aiohttp_apispec import (
     docs,
+    querystring_schema,
+    request_schema,
     response_schema,
     setup_aiohttp_apispec,
     validation_middleware,
@@ -19,15 +22,19 @@ import aiohttp_cors
 import jwt
 from marshmallow import fields
 
+from ..cache.base import BaseCache
 from ..config.injection_context import InjectionContext
+from ..core.dispatcher import LANE_ADMIN
 from ..core.event_bus import Event, EventBus
 from ..core.plugin_registry import PluginRegistry
 from ..core.profile import Profile
 from ..ledger.error import LedgerConfigError, LedgerTransactionError
 from ..messaging.models.openapi import OpenAPISchema
 from ..messaging.responder import BaseResponder
+from ..messaging.valid import NATURAL_NUM, WHOLE_NUM
 from ..multitenant.manager import MultitenantManager, MultitenantManagerError
 from ..storage.error import StorageNotFoundError
+from ..transport.outbound.manager import WEBHOOK_SEQ_HEADER
 from ..transport.outbound.message import OutboundMessage
 from ..transport.outbound.status import OutboundSendStatus
 from ..transport.queue.basic import BasicMessageQueue
@@ -37,6 +44,7 @@ from ..version import __version__
 from .base_server import BaseAdminServer
 from .error import AdminSetupError
 from .request_context import AdminRequestContext
+from .webhook_outbox import WebhookOutbox
 
 LOGGER = logging.getLogger(__name__)
 
@@ -97,6 +105,46 @@ class AdminShutdownSchema(OpenAPISchema):
     """Response schema for admin Module."""
 
 
+class WebhookOutboxQueryStringSchema(OpenAPISchema):
+    """Query string parameters for the webhook outbox replay endpoint."""
+
+    after = fields.Int(
+        description="Return events with a sequence number after this one",
+        required=False,
+        **WHOLE_NUM,
+    )
+    limit = fields.Int(
+        description="Maximum number of events to return (default 100)",
+        required=False,
+        **NATURAL_NUM,
+    )
+
+
+class WebhookOutboxResultSchema(OpenAPISchema):
+    """Result schema for the webhook outbox replay endpoint."""
+
+    results = fields.List(
+        fields.Dict(description="Webhook event with seq, topic and payload"),
+        description="Webhook events in sequence order",
+    )
+
+
+class WebhookOutboxAckSchema(OpenAPISchema):
+    """Request schema for acknowledging webhook events."""
+
+    seq = fields.Int(
+        description="Last sequence number processed; earlier events are removed",
+        required=True,
+        **WHOLE_NUM,
+    )
+
+
+class WebhookOutboxAckResultSchema(OpenAPISchema):
+    """Result schema for acknowledging webhook events."""
+
+    removed = fields.Int(description="Number of events removed", **WHOLE_NUM)
+
+
 class AdminResponder(BaseResponder):
     """Handle outgoing messages from message handlers."""
 
@@ -250,6 +298,12 @@ class AdminServer(BaseAdminServer):
         self.task_queue = task_queue
         self.webhook_router = webhook_router
         self.websocket_queues = {}
+        self.webhook_outbox = None
+        if context.settings.get("admin.webhook_outbox_path"):
+            self.webhook_outbox = WebhookOutbox(
+                context.settings["admin.webhook_outbox_path"],
+                ttl_seconds=context.settings.get("admin.webhook_outbox_ttl"),
+            )
         self.site = None
         self.multitenant_manager = context.inject(MultitenantManager, required=False)
 
@@ -327,6 +381,7 @@ class AdminServer(BaseAdminServer):
         async def setup_context(request: web.Request, handler):
             authorization_header = request.headers.get("Authorization")
             profile = self.root_profile
+            profile_cache = None
 
             # Multitenancy context setup
             if self.multitenant_manager and authorization_header:
@@ -345,26 +400,38 @@ class AdminServer(BaseAdminServer):
                 except (jwt.InvalidTokenError, StorageNotFoundError):
                     raise web.HTTPUnauthorized()
 
-            # Create a responder with the request specific context
-            responder = AdminResponder(
-                profile,
-                self.outbound_message_router,
-            )
-            profile.context.injector.bind_instance(BaseResponder, responder)
-
-            # TODO may dynamically adjust the profile used here according to
-            # headers or other parameters
-            admin_context = AdminRequestContext(profile)
+                # keep the subwallet profile open until the request is handled
+                profile_cache = self.multitenant_manager.profile_cache
+                profile_cache.acquire(profile)
 
-            request["context"] = admin_context
-            request["outbound_message_router"] = responder.send
-
-            if collector:
-                handler = collector.wrap_coro(handler, [handler.__qualname__])
-            if self.task_queue:
-                task = await self.task_queue.put(handler(request))
-                return await task
-            return await handler(request)
+            try:
+                # Create a responder with the request specific context
+                responder = AdminResponder(
+                    profile,
+                    self.outbound_message_router,
+                )
+                profile.context.injector.bind_instance(BaseResponder, responder)
+
+                # TODO may dynamically adjust the profile used here according to
+                # headers or other parameters
+                admin_context = AdminRequestContext(profile)
+
+                request["context"] = admin_context
+                request["outbound_message_router"] = responder.send
+
+                if collector:
+                    handler = collector.wrap_coro(handler, [handler.__qualname__])
+                if self.task_queue:
+                    task = await self.task_queue.put(
+                        handler(request),
+                        lane=LANE_ADMIN,
+                        fair_key=profile.settings.get("wallet.id"),
+                    )
+                    return await task
+                return await handler(request)
+            finally:
+                if profile_cache is not None:
+                    profile_cache.release(profile)
 
         middlewares.append(setup_context)
 
@@ -387,6 +454,8 @@ class AdminServer(BaseAdminServer):
             web.get("/status/ready", self.readiness_handler, allow_head=False),
             web.get("/shutdown", self.shutdown_handler, allow_head=False),
             web.get("/ws", self.websocket_handler, allow_head=False),
+            web.get("/webhooks/outbox", self.webhook_outbox_handler, allow_head=False),
+            web.post("/webhooks/outbox/ack", self.webhook_outbox_ack_handler),
         ]
 
         # Store server_paths for multitenant authorization handling
@@ -502,6 +571,9 @@ class AdminServer(BaseAdminServer):
         if self.site:
             await self.site.stop()
             self.site = None
+        if self.webhook_outbox:
+            self.webhook_outbox.close()
+            self.webhook_outbox = None
 
     async def on_startup(self, app: web.Application):
         """Perform webserver startup actions."""
@@ -605,6 +677,9 @@ class AdminServer(BaseAdminServer):
         collector = self.context.inject(Collector, required=False)
         if collector:
             status["timing"] = collector.results
+        cache = self.context.inject(BaseCache, required=False)
+        if cache and cache.stats:
+            status["cache"] = cache.stats
         if self.conductor_stats:
             status["conductor"] = await self.conductor_stats()
         return web.json_response(status)
@@ -627,6 +702,53 @@ class AdminServer(BaseAdminServer):
             collector.reset()
         return web.json_response({})
 
+    @docs(tags=["server"], summary="Replay recorded webhook events")
+    @querystring_schema(WebhookOutboxQueryStringSchema())
+    @response_schema(WebhookOutboxResultSchema(), 200, description="")
+    async def webhook_outbox_handler(self, request: web.BaseRequest):
+        """
+        Request handler for replaying webhook events from the outbox.
+
+        Args:
+            request: aiohttp request object
+
+        Returns:
+            The web response
+
+        """
+        if not self.webhook_outbox:
+            raise web.HTTPNotFound(reason="Webhook outbox is not enabled")
+        profile = request["context"].profile
+        results = await self.webhook_outbox.replay(
+            after=int(request.query.get("after") or 0),
+            wallet_id=profile.settings.get("wallet.id"),
+            limit=int(request.query.get("limit") or 100),
+        )
+        return web.json_response({"results": results})
+
+    @docs(tags=["server"], summary="Acknowledge processed webhook events")
+    @request_schema(WebhookOutboxAckSchema())
+    @response_schema(WebhookOutboxAckResultSchema(), 200, description="")
+    async def webhook_outbox_ack_handler(self, request: web.BaseRequest):
+        """
+        Request handler for removing processed webhook events from the outbox.
+
+        Args:
+            request: aiohttp request object
+
+        Returns:
+            The web response
+
+        """
+        if not self.webhook_outbox:
+            raise web.HTTPNotFound(reason="Webhook outbox is not enabled")
+        profile = request["context"].profile
+        body = await request.json()
+        removed = await self.webhook_outbox.acknowledge(
+            body["seq"], wallet_id=profile.settings.get("wallet.id")
+        )
+        return web.json_response({"removed": removed})
+
     async def redirect_handler(self, request: web.BaseRequest):
         """Perform redirect to documentation."""
         raise web.HTTPFound("/api/doc")
@@ -776,7 +898,10 @@ class AdminServer(BaseAdminServer):
                                 "authenticated": queue.authenticated,
                             }
                         if not closed:
-                            if msg:
+                            if isinstance(msg, str):
+                                # webhook body already serialized
+                                await ws.send_str(msg)
+                            elif msg:
                                 await ws.send_json(msg)
                             send = loop.create_task(queue.dequeue(timeout=5.0))
 
@@ -814,21 +939,41 @@ class AdminServer(BaseAdminServer):
         if wallet_id:
             metadata = {"x-wallet-id": wallet_id}
 
-        if self.webhook_router:
+        # serialize the payload once, to be shared by all targets
+        payload_json = None
+        seq = None
+        if self.webhook_outbox:
+            # record the event before dispatch, so that it can be replayed
+            payload_json = json.dumps(payload)
+            seq = await self.webhook_outbox.append(topic, payload_json, wallet_id)
+            metadata = dict(metadata or {}, **{WEBHOOK_SEQ_HEADER: str(seq)})
+
+        if self.webhook_router and webhook_urls:
+            if payload_json is None:
+                payload_json = json.dumps(payload)
             for endpoint in webhook_urls:
                 self.webhook_router(
                     topic,
-                    payload,
+                    payload_json,
                     endpoint,
                     None,
                     metadata,
                 )
 
-        # set ws webhook body, optionally add wallet id for multitenant mode
-        webhook_body = {"topic": topic, "payload": payload}
-        if wallet_id:
-            webhook_body["wallet_id"] = wallet_id
-
-        for queue in self.websocket_queues.values():
-            if queue.authenticated or topic in ("ping", "settings"):
+        queues = [
+            queue
+            for queue in self.websocket_queues.values()
+            if queue.authenticated or topic in ("ping", "settings")
+        ]
+        if queues:
+            # set ws webhook body, optionally add wallet id for multitenant mode
+            if payload_json is None:
+                payload_json = json.dumps(payload)
+            webhook_body = f'{{"topic": {json.dumps(topic)}, "payload": {payload_json}'
+            if wallet_id:
+                webhook_body += f', "wallet_id": {json.dumps(wallet_id)}'
+            if seq is not None:
+                webhook_body += f', "seq": {seq}'
+            webhook_body += "}"
+            for queue in queues:
                 await queue.enqueue(webhook_body)
@@ -7,6 +7,8 @@ from aiohttp.test_utils import unused_port
 from asynctest import TestCase as AsyncTestCase
 from asynctest import mock as async_mock
 
+from ...cache.base import BaseCache
+from ...cache.in_memory import InMemoryCache
 from ...config.default_context import DefaultContextBuilder
 from ...config.injection_context import InjectionContext
 from ...core.event_bus import Event
@@ -182,6 +184,42 @@ class TestAdminServer(AsyncTestCase):
             with self.assertRaises(AdminSetupError):
                 await self.get_admin_server(settings).start()
 
+    async def test_send_webhook(self):
+        server = self.get_admin_server({"admin.admin_insecure_mode": True})
+        profile = InMemoryProfile.test_profile(
+            {
+                "wallet.id": "wallet",
+                "admin.webhook_urls": ["http://one", "http://two"],
+            }
+        )
+        queues = [
+            async_mock.MagicMock(
+                authenticated=True, enqueue=async_mock.CoroutineMock()
+            ),
+            async_mock.MagicMock(
+                authenticated=False, enqueue=async_mock.CoroutineMock()
+            ),
+        ]
+        server.websocket_queues = {"one": queues[0], "two": queues[1]}
+
+        await server.send_webhook(profile, "topic", {"a": [1]})
+        assert [result[2] for result in self.webhook_results] == [
+            "http://one",
+            "http://two",
+        ]
+        # payload is serialized once for all targets
+        payload_json = self.webhook_results[0][1]
+        assert json.loads(payload_json) == {"a": [1]}
+        assert self.webhook_results[1][1] is payload_json
+        assert self.webhook_results[0][4] == {"x-wallet-id": "wallet"}
+        queues[0].enqueue.assert_awaited_once()
+        assert json.loads(queues[0].enqueue.call_args[0][0]) == {
+            "topic": "topic",
+            "payload": {"a": [1]},
+            "wallet_id": "wallet",
+        }
+        queues[1].enqueue.assert_not_called()
+
     async def test_import_routes(self):
         # this test just imports all default admin routes
         # for routes with associated tests, this shouldn't make a difference in coverage
@@ -318,6 +356,84 @@ class TestAdminServer(AsyncTestCase):
 
         await server.stop()
 
+    async def test_status_cache_stats(self):
+        context = InjectionContext()
+        cache = InMemoryCache()
+        context.injector.bind_instance(BaseCache, cache)
+        await cache.set("key", "value")
+        await cache.get("key")
+        await cache.get("missing")
+        server = self.get_admin_server({"admin.admin_insecure_mode": True}, context)
+        await server.start()
+
+        async with self.client_session.get(
+            f"http://127.0.0.1:{self.port}/status", headers={}
+        ) as response:
+            assert response.status == 200
+            result = await response.json()
+        assert result["cache"]["entries"] == 1
+        assert result["cache"]["hits"] == 1
+        assert result["cache"]["misses"] == 1
+
+        await server.stop()
+
+    async def test_webhook_outbox(self):
+        server = self.get_admin_server(
+            {"admin.admin_insecure_mode": True, "admin.webhook_outbox_path": ":memory:"}
+        )
+        await server.start()
+        profile = InMemoryProfile.test_profile(
+            {"admin.webhook_urls": ["http://one#key"]}
+        )
+        for index in range(3):
+            await server.send_webhook(profile, "topic", {"index": index})
+        # sequence number is sent with the webhook
+        assert [result[4] for result in self.webhook_results] == [
+            {"x-webhook-seq": "1"},
+            {"x-webhook-seq": "2"},
+            {"x-webhook-seq": "3"},
+        ]
+
+        async with self.client_session.get(
+            f"http://127.0.0.1:{self.port}/webhooks/outbox?after=1"
+        ) as response:
+            assert response.status == 200
+            result = await response.json()
+        assert [(event["seq"], event["payload"]) for event in result["results"]] == [
+            (2, {"index": 1}),
+            (3, {"index": 2}),
+        ]
+
+        async with self.client_session.post(
+            f"http://127.0.0.1:{self.port}/webhooks/outbox/ack", json={"seq": 2}
+        ) as response:
+            assert response.status == 200
+            assert await response.json() == {"removed": 2}
+
+        async with self.client_session.get(
+            f"http://127.0.0.1:{self.port}/webhooks/outbox"
+        ) as response:
+            result = await response.json()
+        assert [event["seq"] for event in result["results"]] == [3]
+
+        await server.stop()
+        assert server.webhook_outbox is None
+
+    async def test_webhook_outbox_disabled(self):
+        server = self.get_admin_server({"admin.admin_insecure_mode": True})
+        await server.start()
+
+        async with self.client_session.get(
+            f"http://127.0.0.1:{self.port}/webhooks/outbox"
+        ) as response:
+            assert response.status == 404
+        async with self.client_session.post(
+            f"http://127.0.0.1:{self.port}/webhooks/outbox/ack", json={"seq": 1}
+        ) as response:
+            assert response.status == 404
+
+        await server.stop()
+
     async def test_visit_secure_mode(self):
         settings = {
             "admin.admin_insecure_mode": False,
@@ -0,0 +1,66 @@
+import asyncio
+import json
+import os
+
+from tempfile import TemporaryDirectory
+from asynctest import TestCase
+
+from .. import webhook_outbox as test_module
+from ..webhook_outbox import WebhookOutbox
+
+
+class TestWebhookOutbox(TestCase):
+    def setUp(self):
+        self.tmp_dir = TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "outbox.db")
+        self.outbox = WebhookOutbox(self.path)
+
+    def tearDown(self):
+        self.outbox.close()
+        self.tmp_dir.cleanup()
+
+    async def test_replay_acknowledge(self):
+        assert await self.outbox.append("topic", json.dumps({"a": 1})) == 1
+        assert await self.outbox.append("topic", json.dumps({"a": 2}), "wallet") == 2
+        assert await self.outbox.append("other", json.dumps({"a": 3})) == 3
+
+        events = await self.outbox.replay()
+        assert [(e["seq"], e["topic"], e["payload"]) for e in events] == [
+            (1, "topic", {"a": 1}),
+            (3, "other", {"a": 3}),
+        ]
+        assert [e["seq"] for e in await self.outbox.replay(after=1)] == [3]
+        assert [e["seq"] for e in await self.outbox.replay(limit=1)] == [1]
+        assert [e["seq"] for e in await self.outbox.replay(wallet_id="wallet")] == [2]
+
+        assert await self.outbox.acknowledge(1) == 1
+        assert [e["seq"] for e in await self.outbox.replay()] == [3]
+        assert [e["seq"] for e in await self.outbox.replay(wallet_id="wallet")] == [2]
+        assert await self.outbox.acknowledge(3) == 1
+
+        # sequence numbers are not reused
+        assert await self.outbox.append("topic", "{}") == 4
+
+    async def test_persistent(self):
+        await self.outbox.append("topic", "{}")
+        self.outbox.close()
+        self.outbox = WebhookOutbox(self.path)
+        assert [e["seq"] for e in await self.outbox.replay()] == [1]
+        assert await self.outbox.append("topic", "{}") == 2
+
+    async def test_expire(self):
+        self.outbox.ttl_seconds = -1
+        await self.outbox.append("topic", "{}")
+        self.outbox._appended = test_module.EXPIRE_INTERVAL - 1
+        await self.outbox.append("topic", "{}")
+        assert await self.outbox.replay() == []
+
+    async def test_concurrent_append(self):
+        seqs = await asyncio.gather(
+            *(self.outbox.append("topic", json.dumps({"a": i})) for i in range(20))
+        )
+        assert seqs == list(range(1, 21))
+        events = await self.outbox.replay()
+        assert [e["payload"]["a"] for e in events] == list(range(20))
+        # NORMAL
+        assert self.outbox._conn.execute("PRAGMA synchronous").fetchone()[0] == 1
@@ -0,0 +1,165 @@
+"""
+Persistent outbox of webhook events.
+
+Each webhook event is recorded with a monotonic sequence number before it is
+dispatched, so that a controller which missed events (for example while
+restarting) can replay them from the last sequence number it processed, and
+acknowledge them once handled.
+"""
+
+import asyncio
+import json
+import sqlite3
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Sequence
+
+DEFAULT_TTL_SECONDS = 604800  # one week
+EXPIRE_INTERVAL = 1000  # events appended between expiry runs
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS webhook_event (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    wallet_id TEXT,
+    topic TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_webhook_event_wallet
+    ON webhook_event (wallet_id, seq);
+CREATE INDEX IF NOT EXISTS ix_webhook_event_time
+    ON webhook_event (created_at);
+"""
+
+
+class WebhookOutbox:
+    """
+    Webhook event log persisted to an SQLite database.
+
+    Sequence numbers are never reused, even after events are removed, and
+    events are kept per wallet until acknowledged or expired.
+
+    Database access runs in order on a dedicated thread, keeping the event
+    loop free while statements wait on the disk or the database lock.
+    """
+
+    def __init__(self, path: str, ttl_seconds: int = None):
+        """
+        Initialize the webhook outbox.
+
+        Args:
+            path: The database file path
+            ttl_seconds: Seconds to keep unacknowledged events
+
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds or DEFAULT_TTL_SECONDS
+        self._appended = 0
+        self._executor = ThreadPoolExecutor(1, thread_name_prefix="WebhookOutbox")
+        self._conn: sqlite3.Connection = None
+        self._executor.submit(self._connect).result()
+
+    def _connect(self):
+        """Open the database, creating the schema if necessary."""
+        self._conn = sqlite3.connect(
+            self.path, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # in WAL mode, only sync at checkpoints: commits may be lost on power
+        # failure, but not on a crash of the agent, and the database stays intact
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    async def _run(self, fn: Callable, *args):
+        """Run a function on the database thread."""
+        return await asyncio.get_event_loop().run_in_executor(self._executor, fn, *args)
+
+    async def append(self, topic: str, payload_json: str, wallet_id: str = None) -> int:
+        """
+        Record a webhook event.
+
+        Args:
+            topic: The webhook topic
+            payload_json: The serialized webhook payload
+            wallet_id: The wallet the event belongs to, if not the base wallet
+
+        Returns:
+            The sequence number of the event
+
+        """
+        return await self._run(
+            self._append, (wallet_id, topic, payload_json, time.time())
+        )
+
+    def _append(self, values: tuple) -> int:
+        seq = self._conn.execute(
+            "INSERT INTO webhook_event (wallet_id, topic, payload, created_at) "
+            "VALUES (?, ?, ?, ?)",
+            values,
+        ).lastrowid
+        self._appended += 1
+        if self._appended >= EXPIRE_INTERVAL:
+            self._appended = 0
+            self._expire()
+        return seq
+
+    async def replay(
+        self, after: int = 0, wallet_id: str = None, limit: int = 100
+    ) -> Sequence[dict]:
+        """
+        Fetch recorded webhook events in sequence order.
+
+        Args:
+            after: Only return events with a greater sequence number
+            wallet_id: The wallet to return events for
+            limit: The maximum number of events to return
+
+        """
+        rows = await self._run(
+            lambda: self._conn.execute(
+                "SELECT seq, topic, payload, created_at FROM webhook_event "
+                "WHERE wallet_id IS ? AND seq > ? ORDER BY seq LIMIT ?",
+                (wallet_id, after, limit),
+            ).fetchall()
+        )
+        return [
+            {
+                "seq": seq,
+                "topic": topic,
+                "payload": json.loads(payload),
+                "created_at": created_at,
+            }
+            for seq, topic, payload, created_at in rows
+        ]
+
+    async def acknowledge(self, seq: int, wallet_id: str = None) -> int:
+        """
+        Remove the events up to and including a sequence number.
+
+        Args:
+            seq: The last sequence number processed by the controller
+            wallet_id: The wallet to remove events for
+
+        Returns:
+            The number of events removed
+
+        """
+        return await self._run(
+            lambda: self._conn.execute(
+                "DELETE FROM webhook_event WHERE wallet_id IS ? AND seq <= ?",
+                (wallet_id, seq),
+            ).rowcount
+        )
+
+    def _expire(self):
+        """Remove unacknowledged events past the time limit."""
+        self._conn.execute(
+            "DELETE FROM webhook_event WHERE created_at < ?",
+            (time.time() - self.ttl_seconds,),
+        )
+
+    def close(self):
+        """Finish pending statements and close the database connection."""
+        self._executor.submit(self._conn.close)
+        self._executor.shutdown(wait=True)
@@ -57,6 +57,14 @@ class BaseCache(ABC):
     async def flush(self):
         """Remove all items from the cache."""
 
+    @property
+    def stats(self) -> dict:
+        """Get the cache usage statistics, if tracked by the implementation."""
+        return {}
+
+    async def close(self):
+        """Release any resources held by the cache."""
+
     def acquire(self, key: Text):
         """Acquire a lock on a given cache key."""
         result = CacheKeyLock(self, key)
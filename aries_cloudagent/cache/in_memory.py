@@ -1,29 +1,121 @@
 """Basic in-memory cache implementation."""
 
+import heapq
+import sys
+import threading
 import time
+
+from collections import OrderedDict
 from typing import Any, Sequence, Text, Union
 
 from .base import BaseCache
 
 
+def estimate_size(value: Any, seen: set = None) -> int:
+    """Estimate the memory used by a cached value, including nested values."""
+    if seen is None:
+        seen = set()
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        for k, v in value.items():
+            size += estimate_size(k, seen) + estimate_size(v, seen)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for v in value:
+            size += estimate_size(v, seen)
+    elif hasattr(value, "__dict__"):
+        size += estimate_size(vars(value), seen)
+    return size
+
+
 class InMemoryCache(BaseCache):
-    """Basic in-memory cache class."""
+    """
+    Basic in-memory cache class.
 
-    def __init__(self):
-        """Initialize a `InMemoryCache` instance."""
+    Entries are kept in least recently used order and indexed by expiry time,
+    so that neither lookups nor expiry need to scan the cache. If a maximum
+    number of entries or bytes is set, the least recently used entries are
+    evicted to stay within the limit.
+
+    Operations are guarded by a thread lock, as the cache is also used from
+    the JSON-LD document loader's background loop thread.
+    """
+
+    def __init__(self, max_entries: int = None, max_bytes: int = None):
+        """
+        Initialize a `InMemoryCache` instance.
+
+        Args:
+            max_entries: The maximum number of cached keys
+            max_bytes: The maximum estimated size of the cached values
+
+        """
         super().__init__()
         # looks like { "key": { "expires": <epoch timestamp>, "value": <val> } }
-        self._cache = {}
+        # in least recently used order
+        self._cache = OrderedDict()
+        # heap of (expires, sequence, key, entry) for entries with a ttl;
+        # stale items are skipped when popped
+        self._expiry = []
+        self._expiry_seq = 0
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> dict:
+        """Get the cache usage statistics."""
+        stats = {
+            "entries": len(self._cache),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+        if self.max_bytes:
+            stats["bytes"] = self.total_bytes
+        return stats
+
+    def _remove(self, key: Text):
+        """Remove an entry from the cache."""
+        entry = self._cache.pop(key)
+        self.total_bytes -= entry.get("size", 0)
 
     def _remove_expired_cache_items(self):
         """Remove all expired items from cache."""
-        for key, val in self._cache.copy().items():  # iterate copy, del from original
-            cache_item_expiry = val["expires"]
-            if cache_item_expiry is None:
-                continue
-            now = time.perf_counter()
-            if now >= cache_item_expiry:
-                del self._cache[key]
+        expiry = self._expiry
+        if not expiry:
+            return
+        now = time.perf_counter()
+        while expiry and expiry[0][0] <= now:
+            _, _, key, entry = heapq.heappop(expiry)
+            if self._cache.get(key) is entry:
+                self._remove(key)
+                self.expirations += 1
+
+    def _compact_expiry(self):
+        """Drop expiry index items for replaced or removed entries."""
+        if len(self._expiry) > 2 * len(self._cache) + 64:
+            self._expiry = [
+                item for item in self._expiry if self._cache.get(item[2]) is item[3]
+            ]
+            heapq.heapify(self._expiry)
+
+    def _evict(self):
+        """Evict least recently used entries until within the configured limits."""
+        while self._cache and (
+            (self.max_entries and len(self._cache) > self.max_entries)
+            or (self.max_bytes and self.total_bytes > self.max_bytes)
+        ):
+            self._remove(next(iter(self._cache)))
+            self.evictions += 1
 
     async def get(self, key: Text):
         """
@@ -36,8 +128,15 @@ class InMemoryCache(BaseCache):
             The record found or `None`
 
         """
-        self._remove_expired_cache_items()
-        return self._cache.get(key)["value"] if self._cache.get(key) else None
+        with self._lock:
+            self._remove_expired_cache_items()
+            entry = self._cache.get(key)
+            if not entry:
+                self.misses += 1
+                return None
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return entry["value"]
 
     async def set(self, keys: Union[Text, Sequence[Text]], value: Any, ttl: int = None):
         """
@@ -51,10 +150,25 @@ class InMemoryCache(BaseCache):
             ttl: number of seconds that the record should persist
 
         """
-        self._remove_expired_cache_items()
-        expires_ts = time.perf_counter() + ttl if ttl else None
-        for key in [keys] if isinstance(keys, Text) else keys:
-            self._cache[key] = {"expires": expires_ts, "value": value}
+        size = estimate_size(value) if self.max_bytes else 0
+        with self._lock:
+            self._remove_expired_cache_items()
+            expires_ts = time.perf_counter() + ttl if ttl else None
+            for key in [keys] if isinstance(keys, Text) else keys:
+                if key in self._cache:
+                    self._remove(key)
+                entry = {"expires": expires_ts, "value": value}
+                if size:
+                    entry["size"] = size
+                    self.total_bytes += size
+                self._cache[key] = entry
+                if expires_ts is not None:
+                    self._expiry_seq += 1
+                    heapq.heappush(
+                        self._expiry, (expires_ts, self._expiry_seq, key, entry)
+                    )
+            self._evict()
+            self._compact_expiry()
 
     async def clear(self, key: Text):
         """
@@ -64,10 +178,13 @@ class InMemoryCache(BaseCache):
             key: the key to remove
 
         """
-        if key in self._cache:
-            del self._cache[key]
+        with self._lock:
+            if key in self._cache:
+                self._remove(key)
 
     async def flush(self):
         """Remove all items from the cache."""
-
-        self._cache = {}
+        with self._lock:
+            self._cache = OrderedDict()
+            self._expiry = []
+            self.total_bytes = 0
@@ -0,0 +1,310 @@
+"""Redis cache implementation, shared between agent processes."""
+
+import asyncio
+import logging
+import threading
+import weakref
+
+from typing import Any, Sequence, Text, Union
+from uuid import uuid4
+
+import aioredis
+import msgpack
+
+from .base import BaseCache, CacheKeyLock
+
+LOGGER = logging.getLogger(__name__)
+
+# delete a lock only if it is still held with the given token
+UNLOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+class RedisCacheKeyLock(CacheKeyLock):
+    """
+    A lock on a cache key, shared with other processes using the same cache.
+
+    While one process produces the value for a key, other processes wait for
+    it to appear in the cache instead of producing it themselves. If the
+    value does not appear within the lock timeout, waiters proceed without it.
+    """
+
+    def __init__(self, cache: "RedisCache", key: Text):
+        """Initialize the key lock."""
+        super().__init__(cache, key)
+        self._token: str = None
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        await super().__aenter__()
+        if not self.done and not self.parent:
+            await self._acquire_shared()
+        return self
+
+    async def _acquire_shared(self):
+        """Acquire the shared lock, or wait for another holder's result."""
+        cache: RedisCache = self.cache
+        loop = asyncio.get_event_loop()
+        deadline = loop.time() + cache.lock_timeout
+        token = uuid4().hex
+        delay = 0.01
+        while True:
+            if await cache.lock(self.key, token):
+                self._token = token
+                # the value may have been set just before the lock was released
+                found = await cache.get(self.key)
+                if found:
+                    self._future.set_result(found)
+                return
+            found = await cache.get(self.key)
+            if found:
+                self._future.set_result(found)
+                return
+            if loop.time() >= deadline:
+                LOGGER.warning("Timed out waiting for cache lock on %s", self.key)
+                return
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.5)
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit, releasing the shared lock."""
+        await super().__aexit__(exc_type, exc_val, exc_tb)
+        if self._token:
+            token, self._token = self._token, None
+            await self.cache.unlock(self.key, token)
+
+
+class RedisCache(BaseCache):
+    """
+    Cache class storing values in Redis.
+
+    Values are serialized with msgpack, so they must be composed of basic
+    types such as those produced by model serialization.
+
+    Connection pools are bound to the event loop they were created on, so one
+    pool is opened for each loop the cache is used from, such as the JSON-LD
+    document loader's background loop.
+    """
+
+    def __init__(self, connection: str, prefix: str = None, lock_timeout: float = 10.0):
+        """
+        Initialize a `RedisCache` instance.
+
+        Args:
+            connection: The Redis connection string, e.g. 'redis://127.0.0.1:6379'
+            prefix: The prefix for cache keys, 'acapy' by default
+            lock_timeout: Seconds a key lock is held before it expires, and
+                waiters stop waiting for its result
+
+        """
+        super().__init__()
+        self.connection = connection
+        self.prefix = prefix or "acapy"
+        self.lock_timeout = lock_timeout
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        # event loop -> (connection pool or None, connect lock)
+        self._pools = weakref.WeakKeyDictionary()
+        self._pools_lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        """Human readable representation of this instance."""
+        return f"<RedisCache(connection={self.connection}, prefix={self.prefix})>"
+
+    @property
+    def stats(self) -> dict:
+        """Get the cache usage statistics."""
+        return {"hits": self.hits, "misses": self.misses, "errors": self.errors}
+
+    def _cache_key(self, key: Text) -> str:
+        """Get the Redis key for a cache key."""
+        return f"{self.prefix}.cache:{key}"
+
+    def _lock_key(self, key: Text) -> str:
+        """Get the Redis key for a cache key lock."""
+        return f"{self.prefix}.cache_lock:{key}"
+
+    def _loop_pool(self) -> list:
+        """Get the connection pool entry for the current event loop."""
+        loop = asyncio.get_event_loop()
+        with self._pools_lock:
+            entry = self._pools.get(loop)
+            if not entry:
+                entry = self._pools[loop] = [None, asyncio.Lock()]
+            return entry
+
+    @property
+    def redis(self):
+        """Get the Redis connection pool of the current event loop, if open."""
+        return self._loop_pool()[0]
+
+    @redis.setter
+    def redis(self, pool):
+        """Set the Redis connection pool of the current event loop."""
+        self._loop_pool()[0] = pool
+
+    async def _get_redis(self):
+        """Get the Redis connection pool, connecting if necessary."""
+        entry = self._loop_pool()
+        if not entry[0]:
+            async with entry[1]:
+                if not entry[0]:
+                    entry[0] = await aioredis.create_redis_pool(
+                        self.connection, minsize=1, maxsize=10
+                    )
+        return entry[0]
+
+    def _handle_error(self, err: Exception, action: str):
+        """Log a Redis error; cache failures are not fatal."""
+        self.errors += 1
+        LOGGER.warning("Redis cache error on %s: %s", action, err)
+
+    async def get(self, key: Text):
+        """
+        Get an item from the cache.
+
+        Args:
+            key: the key to retrieve an item for
+
+        Returns:
+            The record found or `None`
+
+        """
+        try:
+            redis = await self._get_redis()
+            data = await redis.get(self._cache_key(key))
+        except (aioredis.RedisError, OSError) as err:
+            self._handle_error(err, "get")
+            data = None
+        if data is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return msgpack.unpackb(data, raw=False)
+
+    async def set(self, keys: Union[Text, Sequence[Text]], value: Any, ttl: int = None):
+        """
+        Add an item to the cache with an optional ttl.
+
+        Overwrites existing cache entries.
+
+        Args:
+            keys: the key or keys for which to set an item
+            value: the value to store in the cache
+            ttl: number of seconds that the record should persist
+
+        """
+        data = msgpack.packb(value, use_bin_type=True)
+        pexpire = int(ttl * 1000) if ttl else 0
+        try:
+            redis = await self._get_redis()
+            tr = redis.multi_exec()
+            for key in [keys] if isinstance(keys, Text) else keys:
+                tr.set(self._cache_key(key), data, pexpire=pexpire)
+            await tr.execute()
+        except (aioredis.RedisError, OSError) as err:
+            self._handle_error(err, "set")
+
+    async def clear(self, key: Text):
+        """
+        Remove an item from the cache, if present.
+
+        Args:
+            key: the key to remove
+
+        """
+        try:
+            redis = await self._get_redis()
+            await redis.delete(self._cache_key(key))
+        except (aioredis.RedisError, OSError) as err:
+            self._handle_error(err, "clear")
+
+    async def flush(self):
+        """Remove all items from the cache."""
+        try:
+            redis = await self._get_redis()
+            keys = []
+            async for key in redis.iscan(match=self._cache_key("*")):
+                keys.append(key)
+                if len(keys) >= 1000:
+                    await redis.delete(*keys)
+                    keys = []
+            if keys:
+                await redis.delete(*keys)
+        except (aioredis.RedisError, OSError) as err:
+            self._handle_error(err, "flush")
+
+    async def lock(self, key: Text, token: str) -> bool:
+        """
+        Try to take the shared lock on a cache key.
+
+        Args:
+            key: the cache key to lock
+            token: a unique value identifying the lock holder
+
+        Returns:
+            True if the lock was taken, or if Redis is unavailable
+
+        """
+        try:
+            redis = await self._get_redis()
+            return bool(
+                await redis.set(
+                    self._lock_key(key),
+                    token,
+                    pexpire=int(self.lock_timeout * 1000),
+                    exist=redis.SET_IF_NOT_EXIST,
+                )
+            )
+        except (aioredis.RedisError, OSError) as err:
+            self._handle_error(err, "lock")
+            return True
+
+    async def unlock(self, key: Text, token: str):
+        """
+        Release the shared lock on a cache key, if still held with `token`.
+
+        Args:
+            key: the cache key to unlock
+            token: the value the lock was taken with
+
+        """
+        try:
+            redis = await self._get_redis()
+            await redis.eval(UNLOCK_SCRIPT, keys=[self._lock_key(key)], args=[token])
+        except (aioredis.RedisError, OSError) as err:
+            self._handle_error(err, "unlock")
+
+    def acquire(self, key: Text):
+        """Acquire a lock on a given cache key, shared with other processes."""
+        result = RedisCacheKeyLock(self, key)
+        first = self._key_locks.setdefault(key, result)
+        if first is not result:
+            result.parent = first
+        return result
+
+    async def close(self):
+        """Close the Redis connection pools."""
+        current = asyncio.get_event_loop()
+        with self._pools_lock:
+            pools = [(loop, entry[0]) for loop, entry in self._pools.items()]
+            self._pools.clear()
+        for loop, redis in pools:
+            if not redis:
+                continue
+            if loop is current:
+                await self._close_pool(redis)
+            elif loop.is_running():
+                # pools must be closed on their own loop
+                asyncio.run_coroutine_threadsafe(self._close_pool(redis), loop)
+
+    @staticmethod
+    async def _close_pool(redis):
+        """Close a Redis connection pool."""
+        redis.close()
+        await redis.wait_closed()
@@ -3,7 +3,7 @@ import pytest
 from asyncio import ensure_future, sleep, wait_for
 
 from ..base import CacheError
-from ..in_memory import InMemoryCache
+from ..in_memory import InMemoryCache, estimate_size
 
 
 @pytest.fixture()
@@ -67,6 +67,81 @@ class TestBasicCache:
             item = await cache.get(key)
             assert item is None
 
+    @pytest.mark.asyncio
+    async def test_expiry_index(self, cache):
+        await cache.set("short", "value", 0.05)
+        await cache.set("long", "value", 60)
+        await cache.set("short", "replaced", 60)
+        await cache.set("long", "replaced")
+
+        await sleep(0.05)
+
+        assert await cache.get("short") == "replaced"
+        assert await cache.get("long") == "replaced"
+        assert cache.expirations == 0
+
+        for i in range(200):
+            await cache.set("churn", i, 60)
+        # replaced entries are compacted out of the expiry index
+        assert len(cache._expiry) <= 2 * len(cache._cache) + 64
+
+    @pytest.mark.asyncio
+    async def test_max_entries(self):
+        cache = InMemoryCache(max_entries=2)
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+        assert await cache.get("a") == 1
+        await cache.set("c", 3)
+
+        # "b" was least recently used
+        assert await cache.get("b") is None
+        assert await cache.get("a") == 1
+        assert await cache.get("c") == 3
+        assert cache.stats == {
+            "entries": 2,
+            "hits": 3,
+            "misses": 1,
+            "evictions": 1,
+            "expirations": 0,
+        }
+
+    @pytest.mark.asyncio
+    async def test_max_bytes(self):
+        value = {"data": ["x" * 1000]}
+        size = estimate_size(value)
+        cache = InMemoryCache(max_bytes=2 * size + 10)
+        await cache.set(["a", "b"], value)
+        assert cache.stats["bytes"] == 2 * size
+        await cache.set("c", value, 60)
+
+        assert await cache.get("a") is None
+        assert await cache.get("b") == value
+        assert cache.evictions == 1
+        await cache.clear("b")
+        assert cache.total_bytes == size
+
+        await cache.set("c", "small")
+        assert cache.total_bytes == estimate_size("small")
+        await cache.flush()
+        assert cache.total_bytes == 0
+
+    @pytest.mark.asyncio
+    async def test_expirations_counted(self, cache):
+        await cache.set("key", "value", 0.01)
+        await sleep(0.02)
+        assert await cache.get("key") is None
+        assert cache.expirations == 1
+        assert "key" not in cache._cache
+
+    def test_estimate_size(self):
+        class Value:
+            def __init__(self):
+                self.data = "x" * 1000
+                self.me = self
+
+        assert estimate_size(Value()) > 1000
+        assert estimate_size(["x" * 1000, ("y" * 1000,)]) > 2000
+
     @pytest.mark.asyncio
     async def test_flush(self, cache):
         await cache.flush()
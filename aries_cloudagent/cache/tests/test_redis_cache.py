@@ -0,0 +1,251 @@
+import asyncio
+import os
+import unittest
+
+import aioredis
+
+from asynctest import TestCase as AsyncTestCase, mock as async_mock
+
+from ...core.in_memory import InMemoryProfile
+from ...resolver.did_resolver import DIDResolver
+from ...vc.ld_proofs.document_loader import DocumentLoader
+from ..base import BaseCache
+from .. import redis as test_module
+from ..redis import RedisCache, RedisCacheKeyLock
+
+REDIS_CONF = os.environ.get("TEST_REDIS_CONFIG", None)
+
+
+class FakeTransaction:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def set(self, *args, **kwargs):
+        self.commands.append((args, kwargs))
+
+    async def execute(self):
+        for args, kwargs in self.commands:
+            await self.redis.set(*args, **kwargs)
+
+
+class FakeRedis:
+    """Minimal stand-in for an aioredis connection pool."""
+
+    SET_IF_NOT_EXIST = "SET_IF_NOT_EXIST"
+
+    def __init__(self):
+        self.data = {}
+        self.expire = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, *, pexpire=0, exist=None):
+        if exist == self.SET_IF_NOT_EXIST and key in self.data:
+            return False
+        self.data[key] = value if isinstance(value, bytes) else value.encode()
+        self.expire[key] = pexpire
+        return True
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+    async def eval(self, script, keys=[], args=[]):
+        if self.data.get(keys[0]) == args[0].encode():
+            del self.data[keys[0]]
+
+    async def iscan(self, match=None):
+        prefix = match.rstrip("*")
+        for key in list(self.data):
+            if key.startswith(prefix):
+                yield key
+
+    def multi_exec(self):
+        return FakeTransaction(self)
+
+    def close(self):
+        pass
+
+    async def wait_closed(self):
+        pass
+
+
+class LoopBoundRedis(FakeRedis):
+    """Fake connection pool which may only be used from its own event loop."""
+
+    def __init__(self, data: dict):
+        super().__init__()
+        self.data = data
+        self.loop = asyncio.get_event_loop()
+        self.closed = False
+
+    async def get(self, key):
+        assert asyncio.get_event_loop() is self.loop
+        return await super().get(key)
+
+    async def set(self, key, value, **kwargs):
+        assert asyncio.get_event_loop() is self.loop
+        return await super().set(key, value, **kwargs)
+
+    def close(self):
+        assert asyncio.get_event_loop() is self.loop
+        self.closed = True
+
+
+class TestRedisCache(AsyncTestCase):
+    async def setUp(self):
+        self.redis = FakeRedis()
+        self.cache = RedisCache("redis://127.0.0.1:6379", lock_timeout=0.2)
+        self.cache.redis = self.redis
+
+    async def test_get_set(self):
+        assert await self.cache.get("key") is None
+        await self.cache.set(["key", "other"], {"a": [1, "b"], "c": b"\x00"}, 60)
+        assert self.redis.expire["acapy.cache:key"] == 60000
+        assert await self.cache.get("key") == {"a": [1, "b"], "c": b"\x00"}
+        assert await self.cache.get("other") == {"a": [1, "b"], "c": b"\x00"}
+        assert self.cache.stats == {"hits": 2, "misses": 1, "errors": 0}
+
+        await self.cache.clear("key")
+        assert await self.cache.get("key") is None
+        await self.cache.set("unrelated", 1)
+        self.redis.data["other-prefix"] = b"1"
+        await self.cache.flush()
+        assert self.redis.data == {"other-prefix": b"1"}
+        assert repr(self.cache)
+
+        await self.cache.close()
+        assert self.cache.redis is None
+
+    async def test_connect(self):
+        cache = RedisCache("redis://127.0.0.1:6379", prefix="agent")
+        with async_mock.patch.object(
+            test_module.aioredis,
+            "create_redis_pool",
+            async_mock.CoroutineMock(return_value=self.redis),
+        ) as mock_create:
+            await cache.set("key", "value")
+            assert await cache.get("key") == "value"
+        mock_create.assert_called_once()
+        assert "agent.cache:key" in self.redis.data
+
+    async def test_loader_thread(self):
+        cache = RedisCache("redis://127.0.0.1:6379")
+        data = {}
+        pools = []
+
+        async def create_pool(*args, **kwargs):
+            pools.append(LoopBoundRedis(data))
+            return pools[-1]
+
+        profile = InMemoryProfile.test_profile()
+        profile.context.injector.bind_instance(DIDResolver, async_mock.MagicMock())
+        profile.context.injector.bind_instance(BaseCache, cache)
+        loader = DocumentLoader(profile)
+        loader.requests_loader = async_mock.MagicMock(
+            return_value={"document": {"@context": {}}}
+        )
+        url = "https://example.org/context"
+
+        with async_mock.patch.object(
+            test_module.aioredis, "create_redis_pool", create_pool
+        ):
+            # the loader uses the cache from its background loop
+            await cache.set("key", "value")
+            loop = asyncio.get_event_loop()
+            await loop.run_in_executor(None, loader, url, {})
+            assert await loop.run_in_executor(None, loader, url, {})
+            loader.requests_loader.assert_called_once()
+            assert await cache.get("key") == "value"
+            assert await cache.get(f"json_ld_document_resolver::{url}")
+
+        assert [pool.loop for pool in pools] == [loop, loader._loop]
+        await cache.close()
+        await asyncio.sleep(0.05)
+        assert all(pool.closed for pool in pools)
+        loader.close()
+
+    async def test_redis_error(self):
+        self.cache.redis = async_mock.MagicMock(
+            get=async_mock.CoroutineMock(side_effect=aioredis.RedisError()),
+            set=async_mock.CoroutineMock(side_effect=ConnectionRefusedError()),
+            delete=async_mock.CoroutineMock(side_effect=aioredis.RedisError()),
+            eval=async_mock.CoroutineMock(side_effect=aioredis.RedisError()),
+            multi_exec=async_mock.MagicMock(
+                return_value=async_mock.MagicMock(
+                    execute=async_mock.CoroutineMock(side_effect=aioredis.RedisError())
+                )
+            ),
+        )
+        assert await self.cache.get("key") is None
+        await self.cache.set("key", "value")
+        await self.cache.clear("key")
+        assert await self.cache.lock("key", "token")
+        await self.cache.unlock("key", "token")
+        assert self.cache.errors == 5
+
+    async def test_acquire_shared(self):
+        lock = self.cache.acquire("key")
+        assert isinstance(lock, RedisCacheKeyLock)
+        async with lock as entry:
+            assert not entry.done
+            assert "acapy.cache_lock:key" in self.redis.data
+            await entry.set_result("value", 60)
+        assert "acapy.cache_lock:key" not in self.redis.data
+
+        # value is found without locking
+        async with self.cache.acquire("key") as entry:
+            assert entry.result == "value"
+            assert "acapy.cache_lock:key" not in self.redis.data
+
+    async def test_acquire_other_process(self):
+        other = RedisCache("redis://127.0.0.1:6379", lock_timeout=1)
+        other.redis = self.redis
+
+        async with other.acquire("key") as other_entry:
+            # another process waits for the value
+            waiter = asyncio.ensure_future(self._acquire_result("key"))
+            await asyncio.sleep(0.05)
+            assert not waiter.done()
+            await other_entry.set_result("value")
+        assert await asyncio.wait_for(waiter, 1) == "value"
+
+    async def test_acquire_other_process_timeout(self):
+        await self.cache.lock("key", "other-token")
+        async with self.cache.acquire("key") as entry:
+            # holder did not produce a value in time
+            assert not entry.done
+            assert self.cache._key_locks["key"] is entry
+        assert self.redis.data["acapy.cache_lock:key"] == b"other-token"
+
+    async def _acquire_result(self, key):
+        async with self.cache.acquire(key) as entry:
+            return entry.result
+
+
+@unittest.skipUnless(
+    REDIS_CONF,
+    ("Redis conf not defined via OS environment variable TEST_REDIS_CONFIG"),
+)
+class TestRedisCacheServer(AsyncTestCase):
+    async def setUp(self):
+        self.cache = RedisCache(REDIS_CONF, prefix="acapy-test")
+        await self.cache.flush()
+
+    async def tearDown(self):
+        await self.cache.flush()
+        await self.cache.close()
+
+    async def test_get_set_expire(self):
+        await self.cache.set("key", {"a": 1}, 0.05)
+        assert await self.cache.get("key") == {"a": 1}
+        await asyncio.sleep(0.1)
+        assert await self.cache.get("key") is None
+
+    async def test_acquire(self):
+        async with self.cache.acquire("key") as entry:
+            await entry.set_result("value")
+        async with self.cache.acquire("key") as entry:
+            assert entry.result == "value"
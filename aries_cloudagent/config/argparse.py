@@ -161,6 +161,52 @@ class AdminGroup(ArgumentGroup):
                 "admin API. If not specified, webhooks are not published by the agent."
             ),
         )
+        parser.add_argument(
+            "--webhook-batch-size",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_WEBHOOK_BATCH_SIZE",
+            help=(
+                "Maximum number of webhook events sent to a webhook URL in one "
+                "request. If greater than 1, events are posted to <url>/topic/batch/ "
+                "as a JSON array of objects with 'topic' and 'payload' properties. "
+                "Default: 1 (no batching)."
+            ),
+        )
+        parser.add_argument(
+            "--webhook-batch-linger",
+            type=BoundedInt(min=0),
+            metavar="<milliseconds>",
+            env_var="ACAPY_WEBHOOK_BATCH_LINGER",
+            help=(
+                "Maximum time a webhook event waits for more events to be batched "
+                "with, in milliseconds. Only used with --webhook-batch-size. "
+                "Default: 100."
+            ),
+        )
+        parser.add_argument(
+            "--webhook-outbox-path",
+            type=str,
+            metavar="<path>",
+            env_var="ACAPY_WEBHOOK_OUTBOX_PATH",
+            help=(
+                "Record webhook events in a persistent outbox at the given SQLite "
+                "database path. Each event is given a sequence number, sent in the "
+                "x-webhook-seq header, so that controllers can replay missed events "
+                "from the /webhooks/outbox admin endpoint and acknowledge processed "
+                "ones with /webhooks/outbox/ack."
+            ),
+        )
+        parser.add_argument(
+            "--webhook-outbox-ttl",
+            type=BoundedInt(min=1),
+            metavar="<seconds>",
+            env_var="ACAPY_WEBHOOK_OUTBOX_TTL",
+            help=(
+                "Seconds to keep unacknowledged events in the webhook outbox. "
+                "Default: 604800 (one week)."
+            ),
+        )
         parser.add_argument(
             "--admin-client-max-request-size",
             default=1,
@@ -199,6 +245,14 @@ class AdminGroup(ArgumentGroup):
             if hook_url:
                 hook_urls.append(hook_url)
             settings["admin.webhook_urls"] = hook_urls
+            if args.webhook_batch_size:
+                settings["admin.webhook_batch_size"] = args.webhook_batch_size
+            if args.webhook_batch_linger is not None:
+                settings["admin.webhook_batch_linger"] = args.webhook_batch_linger
+            if args.webhook_outbox_path:
+                settings["admin.webhook_outbox_path"] = args.webhook_outbox_path
+            if args.webhook_outbox_ttl:
+                settings["admin.webhook_outbox_ttl"] = args.webhook_outbox_ttl
 
             settings["admin.admin_client_max_request_size"] = (
                 args.admin_client_max_request_size or 1
@@ -554,6 +608,224 @@ class GeneralGroup(ArgumentGroup):
                 "tails server base url."
             ),
         )
+        parser.add_argument(
+            "--jsonld-persist-contexts",
+            action="store_true",
+            env_var="ACAPY_JSONLD_PERSIST_CONTEXTS",
+            help=(
+                "Keep JSON-LD documents fetched from remote urls in storage, so "
+                "they are only downloaded once. Well-known contexts are always "
+                "loaded from the bundled copies. Default: false."
+            ),
+        )
+        parser.add_argument(
+            "--jsonld-no-remote-contexts",
+            action="store_true",
+            env_var="ACAPY_JSONLD_NO_REMOTE_CONTEXTS",
+            help=(
+                "Reject JSON-LD documents which are neither bundled nor held in "
+                "the context store, instead of fetching them over the network. "
+                "Default: false."
+            ),
+        )
+        parser.add_argument(
+            "--cache-max-entries",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_CACHE_MAX_ENTRIES",
+            help=(
+                "Maximum number of entries held in the in-memory cache; the least "
+                "recently used entries are evicted first. Default: no limit."
+            ),
+        )
+        parser.add_argument(
+            "--cache-max-size",
+            type=ByteSize(min=1024),
+            metavar="<size>",
+            env_var="ACAPY_CACHE_MAX_SIZE",
+            help=(
+                "Maximum estimated size in bytes of the values held in the "
+                "in-memory cache, for example 64M; the least recently used "
+                "entries are evicted first. Default: no limit."
+            ),
+        )
+        parser.add_argument(
+            "--cache-connection",
+            type=str,
+            metavar="<connection>",
+            env_var="ACAPY_CACHE_CONNECTION",
+            help=(
+                "Connection string for a Redis server to use as the cache, "
+                "shared with other agent processes; e.g., "
+                "'redis://127.0.0.1:6379'. Default: in-memory cache."
+            ),
+        )
+        parser.add_argument(
+            "--cache-prefix",
+            type=str,
+            metavar="<prefix>",
+            env_var="ACAPY_CACHE_PREFIX",
+            help=(
+                "Prefix of the keys stored on the cache server, to separate "
+                "agents sharing a server. Default: 'acapy'."
+            ),
+        )
+        parser.add_argument(
+            "--event-bus-concurrent",
+            action="store_true",
+            env_var="ACAPY_EVENT_BUS_CONCURRENT",
+            help=(
+                "Deliver internal events to subscribers from a queue per subscriber, "
+                "concurrently and without waiting for the subscribers to finish. "
+                "Events are dropped when a subscriber queue is full. "
+                "Default: events are delivered to each subscriber in turn."
+            ),
+        )
+        parser.add_argument(
+            "--event-bus-queue-size",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_EVENT_BUS_QUEUE_SIZE",
+            help=(
+                "Maximum number of events queued per subscriber with "
+                "--event-bus-concurrent. Default: 1000."
+            ),
+        )
+        parser.add_argument(
+            "--worker-pool-size",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_WORKER_POOL_SIZE",
+            help=(
+                "Maximum number of CPU-bound operations, such as message packing, "
+                "signing and JSON-LD canonicalization, run at once outside the "
+                "event loop. Default: the number of processors."
+            ),
+        )
+        parser.add_argument(
+            "--worker-pool-mode",
+            type=str,
+            choices=("thread", "process"),
+            metavar="<mode>",
+            env_var="ACAPY_WORKER_POOL_MODE",
+            help=(
+                "Run CPU-bound operations in worker threads ('thread'), or where "
+                "possible in worker processes ('process') to use several cores. "
+                "Default: 'thread'."
+            ),
+        )
+        parser.add_argument(
+            "--dispatcher-lane-quota",
+            type=str,
+            action="append",
+            nargs=2,
+            metavar=("<lane>", "<count>"),
+            env_var="ACAPY_DISPATCHER_LANE_QUOTA",
+            help=(
+                "Limit the number of message and admin request handlers running "
+                "at once in a dispatcher lane: 'priority' (trust pings and "
+                "mediation), 'admin' (admin API requests) or 'inbound' (other "
+                "inbound messages, including forwarded messages, shared fairly "
+                "between senders). A count of 0 removes the "
+                "limit. May be specified once per lane. Default: the 'inbound' "
+                "lane uses at most 4/5 of the dispatcher capacity."
+            ),
+        )
+        parser.add_argument(
+            "--resolver-cache-ttl",
+            type=BoundedInt(min=0),
+            metavar="<seconds>",
+            env_var="ACAPY_RESOLVER_CACHE_TTL",
+            help=(
+                "Number of seconds to cache resolved DID documents, or 0 to "
+                "disable caching. Default: 300."
+            ),
+        )
+        parser.add_argument(
+            "--resolver-method-cache-ttl",
+            type=str,
+            action="append",
+            nargs=2,
+            metavar=("<method>", "<seconds>"),
+            env_var="ACAPY_RESOLVER_METHOD_CACHE_TTL",
+            help=(
+                "Number of seconds to cache resolved DID documents of a DID "
+                "method, overriding --resolver-cache-ttl. May be specified "
+                "once per method, e.g. 'key 86400'."
+            ),
+        )
+        parser.add_argument(
+            "--resolver-negative-cache-ttl",
+            type=BoundedInt(min=0),
+            metavar="<seconds>",
+            env_var="ACAPY_RESOLVER_NEGATIVE_CACHE_TTL",
+            help=(
+                "Number of seconds to remember that a DID could not be found, "
+                "or 0 to disable. Default: 30."
+            ),
+        )
+        parser.add_argument(
+            "--http-client-limit",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_HTTP_CLIENT_LIMIT",
+            help=(
+                "Maximum number of open connections kept by the HTTP client used "
+                "for did:web resolution and tails file transfers. Default: 100."
+            ),
+        )
+        parser.add_argument(
+            "--http-client-limit-per-host",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_HTTP_CLIENT_LIMIT_PER_HOST",
+            help=(
+                "Maximum number of open connections to one host kept by the HTTP "
+                "client. Default: 10."
+            ),
+        )
+        parser.add_argument(
+            "--http-client-timeout",
+            type=BoundedInt(min=1),
+            metavar="<seconds>",
+            env_var="ACAPY_HTTP_CLIENT_TIMEOUT",
+            help=(
+                "Number of seconds the HTTP client waits to connect to a server, "
+                "or for more data to be received. Default: 30."
+            ),
+        )
+        parser.add_argument(
+            "--tails-cache-max-size",
+            type=ByteSize(min=1048576),
+            metavar="<size>",
+            env_var="ACAPY_TAILS_CACHE_MAX_SIZE",
+            help=(
+                "Maximum total size of the tails files downloaded from tails "
+                "servers, for example 1G; the least recently used files are "
+                "removed first. Default: no limit."
+            ),
+        )
+        parser.add_argument(
+            "--revocation-state-refresh-interval",
+            type=BoundedInt(min=1),
+            metavar="<seconds>",
+            env_var="ACAPY_REVOCATION_STATE_REFRESH_INTERVAL",
+            help=(
+                "Bring the cached revocation states of frequently presented "
+                "credentials up to date in the background at this interval. "
+                "Default: no background refresh."
+            ),
+        )
+        parser.add_argument(
+            "--revocation-state-refresh-threshold",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_REVOCATION_STATE_REFRESH_THRESHOLD",
+            help=(
+                "Number of times a credential must be presented within a refresh "
+                "interval for its revocation state to be refreshed. Default: 3."
+            ),
+        )
 
     def get_settings(self, args: Namespace) -> dict:
         """Extract general settings."""
@@ -583,6 +855,66 @@ class GeneralGroup(ArgumentGroup):
             settings["tails_server_upload_url"] = args.tails_server_base_url
         if args.tails_server_upload_url:
             settings["tails_server_upload_url"] = args.tails_server_upload_url
+        if args.jsonld_persist_contexts:
+            settings["jsonld.persist_contexts"] = True
+        if args.jsonld_no_remote_contexts:
+            settings["jsonld.no_remote_contexts"] = True
+        if args.cache_max_entries:
+            settings["cache.max_entries"] = args.cache_max_entries
+        if args.cache_max_size:
+            settings["cache.max_bytes"] = args.cache_max_size
+        if args.cache_connection:
+            settings["cache.connection"] = args.cache_connection
+        if args.cache_prefix:
+            settings["cache.prefix"] = args.cache_prefix
+        if args.event_bus_concurrent:
+            settings["event_bus.concurrent"] = True
+        if args.event_bus_queue_size:
+            settings["event_bus.queue_size"] = args.event_bus_queue_size
+        if args.worker_pool_size:
+            settings["worker_pool.size"] = args.worker_pool_size
+        if args.worker_pool_mode:
+            settings["worker_pool.mode"] = args.worker_pool_mode
+        if args.dispatcher_lane_quota:
+            quotas = {}
+            for lane, count in args.dispatcher_lane_quota:
+                if lane not in ("priority", "admin", "inbound"):
+                    raise ArgsParseError(f"Unknown dispatcher lane: {lane}")
+                if not count.isdigit():
+                    raise ArgsParseError(
+                        f"Invalid quota for dispatcher lane {lane}: {count}"
+                    )
+                quotas[lane] = int(count)
+            settings["dispatcher.lane_quotas"] = quotas
+        if args.resolver_cache_ttl is not None:
+            settings["resolver.cache_ttl"] = args.resolver_cache_ttl
+        if args.resolver_method_cache_ttl:
+            ttls = {}
+            for method, ttl in args.resolver_method_cache_ttl:
+                if not ttl.isdigit():
+                    raise ArgsParseError(
+                        f"Invalid resolver cache time for DID method {method}: {ttl}"
+                    )
+                ttls[method] = int(ttl)
+            settings["resolver.method_cache_ttls"] = ttls
+        if args.resolver_negative_cache_ttl is not None:
+            settings["resolver.negative_cache_ttl"] = args.resolver_negative_cache_ttl
+        if args.http_client_limit:
+            settings["http_client.limit"] = args.http_client_limit
+        if args.http_client_limit_per_host:
+            settings["http_client.limit_per_host"] = args.http_client_limit_per_host
+        if args.http_client_timeout:
+            settings["http_client.timeout"] = args.http_client_timeout
+        if args.tails_cache_max_size:
+            settings["tails_cache.max_bytes"] = args.tails_cache_max_size
+        if args.revocation_state_refresh_interval:
+            settings[
+                "revocation_state.refresh_interval"
+            ] = args.revocation_state_refresh_interval
+        if args.revocation_state_refresh_threshold:
+            settings[
+                "revocation_state.refresh_threshold"
+            ] = args.revocation_state_refresh_threshold
         return settings
 
 
@@ -655,6 +987,17 @@ class LedgerGroup(ArgumentGroup):
             env_var="ACAPY_LEDGER_KEEP_ALIVE",
             help="Specifies how many seconds to keep the ledger open. Default: 5",
         )
+        parser.add_argument(
+            "--ledger-max-concurrent-fetches",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_LEDGER_MAX_CONCURRENT_FETCHES",
+            help=(
+                "Maximum number of ledger lookups made at once when fetching the "
+                "schemas, credential definitions and revocation registries used "
+                "in a presentation. Default: 10."
+            ),
+        )
 
     def get_settings(self, args: Namespace) -> dict:
         """Extract ledger settings."""
@@ -678,6 +1021,10 @@ class LedgerGroup(ArgumentGroup):
                 settings["ledger.pool_name"] = args.ledger_pool_name
             if args.ledger_keepalive:
                 settings["ledger.keepalive"] = args.ledger_keepalive
+            if args.ledger_max_concurrent_fetches:
+                settings[
+                    "ledger.max_concurrent_fetches"
+                ] = args.ledger_max_concurrent_fetches
 
         return settings
 
@@ -830,6 +1177,38 @@ class ProtocolGroup(ArgumentGroup):
             env_var="ACAPY_TRACE_LABEL",
             help="Label (agent name) used logging events.",
         )
+        parser.add_argument(
+            "--trace-buffer-size",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_TRACE_BUFFER_SIZE",
+            help=(
+                "Maximum number of trace events buffered for posting to an http "
+                "trace target. Default: 1000."
+            ),
+        )
+        parser.add_argument(
+            "--trace-batch-size",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_TRACE_BATCH_SIZE",
+            help=(
+                "Post up to <count> trace events to an http trace target in one "
+                "request, as a JSON array: the trace target must accept arrays of "
+                "events. Default: 1, each event is posted as a JSON object."
+            ),
+        )
+        parser.add_argument(
+            "--trace-drop-policy",
+            type=str,
+            choices=("oldest", "newest"),
+            metavar="<policy>",
+            env_var="ACAPY_TRACE_DROP_POLICY",
+            help=(
+                "Trace event to drop when the trace buffer is full: 'oldest' "
+                "(default) or 'newest'."
+            ),
+        )
         parser.add_argument(
             "--preserve-exchange-records",
             action="store_true",
@@ -901,6 +1280,12 @@ class ProtocolGroup(ArgumentGroup):
             settings["trace.label"] = args.label
         else:
             settings["trace.label"] = "aca-py.agent"
+        if args.trace_buffer_size:
+            settings["trace.buffer_size"] = args.trace_buffer_size
+        if args.trace_batch_size:
+            settings["trace.batch_size"] = args.trace_batch_size
+        if args.trace_drop_policy:
+            settings["trace.drop_policy"] = args.trace_drop_policy
         if settings.get("trace.enabled") or settings.get("trace.target"):
             # make sure we can trace to the configured target
             # (target can be set even if tracing is off)
@@ -1071,6 +1456,52 @@ class TransportGroup(ArgumentGroup):
                 "option will require additional memory to store messages in the queue."
             ),
         )
+        parser.add_argument(
+            "--undelivered-queue-path",
+            type=str,
+            metavar="<path>",
+            env_var="ACAPY_UNDELIVERED_QUEUE_PATH",
+            help=(
+                "Keep the undelivered queue in an SQLite database at <path> "
+                "instead of in memory, so that queued messages survive restarts "
+                "and can be shared by agents on the same host. The database must "
+                "be on a local file system: it cannot be shared over a network "
+                "file system, use --undelivered-queue-redis to share a queue "
+                "between hosts."
+            ),
+        )
+        parser.add_argument(
+            "--undelivered-queue-redis",
+            type=str,
+            metavar="<connection>",
+            env_var="ACAPY_UNDELIVERED_QUEUE_REDIS",
+            help=(
+                "Keep the undelivered queue on the Redis server at <connection>, "
+                "e.g. 'redis://127.0.0.1:6379', so that it is shared by all "
+                "agents connected to the server, such as mediator replicas on "
+                "different hosts. Requires the aioredis package."
+            ),
+        )
+        parser.add_argument(
+            "--undelivered-queue-ttl",
+            type=BoundedInt(min=1),
+            metavar="<seconds>",
+            env_var="ACAPY_UNDELIVERED_QUEUE_TTL",
+            help=(
+                "Number of seconds to hold messages in the undelivered queue. "
+                "Default: 604800 (one week)."
+            ),
+        )
+        parser.add_argument(
+            "--undelivered-queue-class",
+            type=str,
+            metavar="<module.Class>",
+            env_var="ACAPY_UNDELIVERED_QUEUE_CLASS",
+            help=(
+                "Full class path of a custom undelivered queue implementing "
+                "BaseDeliveryQueue, for example one shared between agent hosts."
+            ),
+        )
         parser.add_argument(
             "--max-outbound-retry",
             default=4,
@@ -1082,6 +1513,17 @@ class TransportGroup(ArgumentGroup):
                 "accumulated messages in message queue. Default value is 4."
             ),
         )
+        parser.add_argument(
+            "--outbound-circuit-threshold",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_OUTBOUND_CIRCUIT_THRESHOLD",
+            help=(
+                "Set the number of consecutive delivery failures after which "
+                "outbound messages to an endpoint are held back, and only "
+                "periodic probes are sent until it recovers. Default value is 5."
+            ),
+        )
 
     def get_settings(self, args: Namespace):
         """Extract transport settings."""
@@ -1112,6 +1554,14 @@ class TransportGroup(ArgumentGroup):
         )
 
         settings["transport.enable_undelivered_queue"] = args.enable_undelivered_queue
+        if args.undelivered_queue_path:
+            settings["transport.undelivered_queue_path"] = args.undelivered_queue_path
+        if args.undelivered_queue_redis:
+            settings["transport.undelivered_queue_redis"] = args.undelivered_queue_redis
+        if args.undelivered_queue_ttl:
+            settings["transport.undelivered_queue_ttl"] = args.undelivered_queue_ttl
+        if args.undelivered_queue_class:
+            settings["transport.undelivered_queue_class"] = args.undelivered_queue_class
 
         if args.label:
             settings["default_label"] = args.label
@@ -1121,6 +1571,10 @@ class TransportGroup(ArgumentGroup):
             settings["transport.max_message_size"] = args.max_message_size
         if args.max_outbound_retry:
             settings["transport.max_outbound_retry"] = args.max_outbound_retry
+        if args.outbound_circuit_threshold:
+            settings[
+                "transport.circuit_failure_threshold"
+            ] = args.outbound_circuit_threshold
 
         return settings
 
@@ -1409,6 +1863,37 @@ class MultitenantGroup(ArgumentGroup):
             env_var="ACAPY_MULTITENANT_ADMIN",
             help="Specify whether to enable the multitenant admin api.",
         )
+        parser.add_argument(
+            "--multitenant-cache-size",
+            type=BoundedInt(min=1),
+            metavar="<size>",
+            env_var="ACAPY_MULTITENANT_CACHE_SIZE",
+            help=(
+                "Maximum number of subwallet profiles to keep open. The least "
+                "recently used profile is closed when the limit is exceeded, "
+                "once no longer in use. Default: no limit."
+            ),
+        )
+        parser.add_argument(
+            "--multitenant-cache-idle-timeout",
+            type=BoundedInt(min=1),
+            metavar="<seconds>",
+            env_var="ACAPY_MULTITENANT_CACHE_IDLE_TIMEOUT",
+            help=(
+                "Close subwallet profiles that have not been used for this many "
+                "seconds. Default: profiles are only closed when the cache is full."
+            ),
+        )
+        parser.add_argument(
+            "--multitenant-route-cache-size",
+            type=BoundedInt(min=1),
+            metavar="<size>",
+            env_var="ACAPY_MULTITENANT_ROUTE_CACHE_SIZE",
+            help=(
+                "Maximum number of recipient keys to keep in the in-memory table "
+                "used to route inbound messages to subwallets. Default: 10000."
+            ),
+        )
 
     def get_settings(self, args: Namespace):
         """Extract multitenant settings."""
@@ -1425,4 +1910,17 @@ class MultitenantGroup(ArgumentGroup):
 
             if args.multitenant_admin:
                 settings["multitenant.admin_enabled"] = True
+
+            if args.multitenant_cache_size:
+                settings["multitenant.cache_size"] = args.multitenant_cache_size
+
+            if args.multitenant_cache_idle_timeout:
+                settings[
+                    "multitenant.cache_idle_timeout"
+                ] = args.multitenant_cache_idle_timeout
+
+            if args.multitenant_route_cache_size:
+                settings[
+                    "multitenant.route_cache_size"
+                ] = args.multitenant_route_cache_size
         return settings
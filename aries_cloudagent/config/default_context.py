@@ -6,6 +6,7 @@ from .provider import CachedProvider, ClassProvider
 
 from ..cache.base import BaseCache
 from ..cache.in_memory import InMemoryCache
+from ..cache.redis import RedisCache
 from ..core.event_bus import EventBus
 from ..core.plugin_registry import PluginRegistry
 from ..core.profile import ProfileManager, ProfileManagerProvider
@@ -22,6 +23,10 @@ from ..protocols.introduction.v0_1.demo_service import DemoIntroductionService
 from ..transport.wire_format import BaseWireFormat
 from ..utils.stats import Collector
 from ..utils.dependencies import is_indy_sdk_module_installed
+from ..revocation.models.revocation_state_cache import RevocationStateCache
+from ..revocation.models.tails_cache import TailsCacheManager
+from ..utils.http import HttpClient
+from ..utils.worker_pool import WorkerPool, get_worker_pool
 
 
 class DefaultContextBuilder(ContextBuilder):
@@ -37,21 +42,63 @@ class DefaultContextBuilder(ContextBuilder):
             collector = Collector(log_path=timing_log)
             context.injector.bind_instance(Collector, collector)
 
-        # Shared in-memory cache
-        context.injector.bind_instance(BaseCache, InMemoryCache())
+        # Shared cache, in-memory unless a cache server is configured
+        if context.settings.get("cache.connection"):
+            cache = RedisCache(
+                context.settings["cache.connection"],
+                prefix=context.settings.get("cache.prefix"),
+            )
+        else:
+            cache = InMemoryCache(
+                max_entries=context.settings.get("cache.max_entries"),
+                max_bytes=context.settings.get("cache.max_bytes"),
+            )
+        context.injector.bind_instance(BaseCache, cache)
 
         # Global protocol registry
         context.injector.bind_instance(ProtocolRegistry, ProtocolRegistry())
 
         # Global event bus
-        context.injector.bind_instance(EventBus, EventBus())
+        context.injector.bind_instance(
+            EventBus,
+            EventBus(
+                concurrent=bool(context.settings.get("event_bus.concurrent")),
+                queue_size=context.settings.get("event_bus.queue_size"),
+            ),
+        )
+
+        # Shared worker pool for CPU-bound work
+        context.injector.bind_instance(WorkerPool, get_worker_pool(context.settings))
+
+        # Shared HTTP client for fetching and uploading resources
+        context.injector.bind_instance(
+            HttpClient, HttpClient.from_settings(context.settings)
+        )
+
+        # Cache of downloaded tails files
+        context.injector.bind_instance(
+            TailsCacheManager, TailsCacheManager.from_settings(context.settings)
+        )
+
+        # Cache of holder revocation states
+        context.injector.bind_instance(
+            RevocationStateCache, RevocationStateCache.from_settings(context.settings)
+        )
 
         # Global did resolver registry
         did_resolver_registry = DIDResolverRegistry()
         context.injector.bind_instance(DIDResolverRegistry, did_resolver_registry)
 
         # Global did resolver
-        context.injector.bind_instance(DIDResolver, DIDResolver(did_resolver_registry))
+        context.injector.bind_instance(
+            DIDResolver,
+            DIDResolver(
+                did_resolver_registry,
+                cache_ttl=context.settings.get("resolver.cache_ttl"),
+                method_cache_ttls=context.settings.get("resolver.method_cache_ttls"),
+                negative_cache_ttl=context.settings.get("resolver.negative_cache_ttl"),
+            ),
+        )
 
         await self.bind_providers(context)
         await self.load_plugins(context)
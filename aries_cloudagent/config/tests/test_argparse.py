@@ -42,6 +42,8 @@ class TestArgParse(AsyncTestCase):
                 "http",
                 "--max-outbound-retry",
                 "5",
+                "--outbound-circuit-threshold",
+                "3",
             ]
         )
 
@@ -53,6 +55,7 @@ class TestArgParse(AsyncTestCase):
         assert settings.get("transport.inbound_configs") == [["http", "0.0.0.0", "80"]]
         assert settings.get("transport.outbound_configs") == ["http"]
         assert result.max_outbound_retry == 5
+        assert settings.get("transport.circuit_failure_threshold") == 3
 
     async def test_outbound_is_required(self):
         """Test that either -ot or -oq are required"""
@@ -201,6 +204,196 @@ class TestArgParse(AsyncTestCase):
             "methods": ["sov", "btcr"]
         }
 
+    async def test_jsonld_context_settings(self):
+        """Test JSON-LD context loading settings."""
+
+        parser = argparse.create_argument_parser()
+        group = argparse.GeneralGroup()
+        group.add_arguments(parser)
+
+        result = parser.parse_args(
+            [
+                "--endpoint",
+                "localhost",
+                "--jsonld-persist-contexts",
+                "--jsonld-no-remote-contexts",
+            ]
+        )
+
+        settings = group.get_settings(result)
+
+        assert settings.get("jsonld.persist_contexts") is True
+        assert settings.get("jsonld.no_remote_contexts") is True
+
+    async def test_cache_settings(self):
+        """Test in-memory cache limit settings."""
+
+        parser = argparse.create_argument_parser()
+        group = argparse.GeneralGroup()
+        group.add_arguments(parser)
+
+        result = parser.parse_args(
+            [
+                "--endpoint",
+                "localhost",
+                "--cache-max-entries",
+                "1000",
+                "--cache-max-size",
+                "64M",
+                "--cache-connection",
+                "redis://127.0.0.1:6379",
+                "--cache-prefix",
+                "agent1",
+                "--event-bus-concurrent",
+                "--event-bus-queue-size",
+                "50",
+                "--worker-pool-size",
+                "4",
+                "--worker-pool-mode",
+                "process",
+                "--dispatcher-lane-quota",
+                "inbound",
+                "30",
+                "--dispatcher-lane-quota",
+                "admin",
+                "0",
+                "--resolver-cache-ttl",
+                "0",
+                "--resolver-method-cache-ttl",
+                "key",
+                "86400",
+                "--resolver-negative-cache-ttl",
+                "10",
+                "--http-client-limit",
+                "50",
+                "--http-client-limit-per-host",
+                "4",
+                "--http-client-timeout",
+                "20",
+                "--tails-cache-max-size",
+                "2G",
+                "--revocation-state-refresh-interval",
+                "60",
+                "--revocation-state-refresh-threshold",
+                "5",
+            ]
+        )
+
+        settings = group.get_settings(result)
+
+        assert settings.get("cache.max_entries") == 1000
+        assert settings.get("cache.max_bytes") == 64 << 20
+        assert settings.get("cache.connection") == "redis://127.0.0.1:6379"
+        assert settings.get("cache.prefix") == "agent1"
+        assert settings.get("event_bus.concurrent") is True
+        assert settings.get("event_bus.queue_size") == 50
+        assert settings.get("worker_pool.size") == 4
+        assert settings.get("worker_pool.mode") == "process"
+        assert settings.get("dispatcher.lane_quotas") == {"inbound": 30, "admin": 0}
+        assert settings.get("resolver.cache_ttl") == 0
+        assert settings.get("resolver.method_cache_ttls") == {"key": 86400}
+        assert settings.get("resolver.negative_cache_ttl") == 10
+        assert settings.get("http_client.limit") == 50
+        assert settings.get("http_client.limit_per_host") == 4
+        assert settings.get("http_client.timeout") == 20
+        assert settings.get("tails_cache.max_bytes") == 2 << 30
+        assert settings.get("revocation_state.refresh_interval") == 60
+        assert settings.get("revocation_state.refresh_threshold") == 5
+
+        for option, name, value in (
+            ("--dispatcher-lane-quota", "bulk", "1"),
+            ("--dispatcher-lane-quota", "inbound", "-1"),
+            ("--resolver-method-cache-ttl", "key", "forever"),
+        ):
+            result = parser.parse_args(["--endpoint", "localhost", option, name, value])
+            with self.assertRaises(argparse.ArgsParseError):
+                group.get_settings(result)
+
+    async def test_trace_export_settings(self):
+        """Test trace exporter settings."""
+
+        parser = argparse.create_argument_parser()
+        argparse.TransportGroup().add_arguments(parser)
+        group = argparse.ProtocolGroup()
+        group.add_arguments(parser)
+
+        result = parser.parse_args(
+            [
+                "--trace-buffer-size",
+                "100",
+                "--trace-batch-size",
+                "10",
+                "--trace-drop-policy",
+                "newest",
+            ]
+        )
+
+        settings = group.get_settings(result)
+
+        assert settings.get("trace.buffer_size") == 100
+        assert settings.get("trace.batch_size") == 10
+        assert settings.get("trace.drop_policy") == "newest"
+
+        with self.assertRaises(SystemExit):
+            parser.parse_args(["--trace-drop-policy", "random"])
+
+    async def test_ledger_settings(self):
+        """Test ledger settings."""
+
+        parser = argparse.create_argument_parser()
+        group = argparse.LedgerGroup()
+        group.add_arguments(parser)
+
+        result = parser.parse_args(
+            [
+                "--genesis-url",
+                "http://localhost:9000/genesis",
+                "--ledger-max-concurrent-fetches",
+                "4",
+            ]
+        )
+
+        settings = group.get_settings(result)
+
+        assert settings.get("ledger.genesis_url") == "http://localhost:9000/genesis"
+        assert settings.get("ledger.max_concurrent_fetches") == 4
+
+        with self.assertRaises(SystemExit):
+            parser.parse_args(["--ledger-max-concurrent-fetches", "0"])
+
+    async def test_webhook_settings(self):
+        """Test webhook batching and outbox settings."""
+
+        parser = argparse.create_argument_parser()
+        group = argparse.AdminGroup()
+        group.add_arguments(parser)
+
+        result = parser.parse_args(
+            [
+                "--admin",
+                "0.0.0.0",
+                "8080",
+                "--admin-insecure-mode",
+                "--webhook-url",
+                "http://localhost:8022",
+                "--webhook-batch-size",
+                "20",
+                "--webhook-batch-linger",
+                "0",
+                "--webhook-outbox-path",
+                "/tmp/outbox.db",
+                "--webhook-outbox-ttl",
+                "3600",
+            ]
+        )
+
+        settings = group.get_settings(result)
+
+        assert settings.get("admin.webhook_batch_size") == 20
+        assert settings.get("admin.webhook_batch_linger") == 0
+        assert settings.get("admin.webhook_outbox_path") == "/tmp/outbox.db"
+        assert settings.get("admin.webhook_outbox_ttl") == 3600
+
     async def test_transport_settings_file(self):
         """Test file argument parsing."""
 
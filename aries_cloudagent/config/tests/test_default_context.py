@@ -3,9 +3,16 @@ from tempfile import NamedTemporaryFile
 from asynctest import TestCase as AsyncTestCase
 
 from ...cache.base import BaseCache
+from ...cache.redis import RedisCache
+from ...core.event_bus import EventBus
 from ...core.profile import ProfileManager
 from ...core.protocol_registry import ProtocolRegistry
+from ...resolver.did_resolver import DIDResolver
 from ...transport.wire_format import BaseWireFormat
+from ...revocation.models.revocation_state_cache import RevocationStateCache
+from ...revocation.models.tails_cache import TailsCacheManager
+from ...utils.http import HttpClient
+from ...utils.worker_pool import WorkerPool
 
 from ..default_context import DefaultContextBuilder
 from ..injection_context import InjectionContext
@@ -22,8 +29,12 @@ class TestDefaultContext(AsyncTestCase):
         for cls in (
             BaseCache,
             BaseWireFormat,
+            HttpClient,
             ProfileManager,
             ProtocolRegistry,
+            RevocationStateCache,
+            TailsCacheManager,
+            WorkerPool,
         ):
             assert isinstance(result.inject(cls), cls)
 
@@ -36,3 +47,36 @@ class TestDefaultContext(AsyncTestCase):
         )
         result = await builder.build_context()
         assert isinstance(result, InjectionContext)
+
+    async def test_build_context_redis_cache(self):
+        builder = DefaultContextBuilder(
+            settings={"cache.connection": "redis://127.0.0.1:6379"}
+        )
+        result = await builder.build_context()
+        cache = result.inject(BaseCache)
+        assert isinstance(cache, RedisCache)
+        assert cache.connection == "redis://127.0.0.1:6379"
+        assert cache.redis is None  # connects on first use
+
+    async def test_build_context_resolver_cache(self):
+        builder = DefaultContextBuilder(
+            settings={
+                "resolver.cache_ttl": 0,
+                "resolver.method_cache_ttls": {"key": 60},
+                "resolver.negative_cache_ttl": 5,
+            }
+        )
+        result = await builder.build_context()
+        resolver = result.inject(DIDResolver)
+        assert resolver.cache_ttl == 0
+        assert resolver.method_cache_ttls == {"key": 60}
+        assert resolver.negative_cache_ttl == 5
+
+    async def test_build_context_concurrent_event_bus(self):
+        builder = DefaultContextBuilder(
+            settings={"event_bus.concurrent": True, "event_bus.queue_size": 10}
+        )
+        result = await builder.build_context()
+        event_bus = result.inject(EventBus)
+        assert event_bus.concurrent
+        assert event_bus.queue_size == 10
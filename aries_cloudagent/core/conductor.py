@@ -12,14 +12,18 @@ import hashlib
 import json
 import logging
 
+from typing import Union
+
 from ..admin.base_server import BaseAdminServer
 from ..admin.server import AdminResponder, AdminServer
+from ..cache.base import BaseCache
 from ..config.default_context import ContextBuilder
 from ..config.injection_context import InjectionContext
 from ..config.ledger import get_genesis_transactions, ledger_config
 from ..config.logging import LoggingConfigurator
 from ..config.wallet import wallet_config
 from ..connections.models.conn_record import ConnRecord
+from ..core.event_bus import EventBus
 from ..core.profile import Profile
 from ..ledger.error import LedgerConfigError, LedgerTransactionError
 from ..messaging.responder import BaseResponder
@@ -34,6 +38,9 @@ from ..protocols.connections.v1_0.messages.connection_invitation import (
 from ..protocols.coordinate_mediation.v1_0.manager import MediationManager
 from ..protocols.out_of_band.v1_0.manager import OutOfBandManager
 from ..protocols.out_of_band.v1_0.messages.invitation import HSProto, InvitationMessage
+from ..resolver.did_resolver import DIDResolver
+from ..revocation.models.revocation_state_cache import RevocationStateCache
+from ..revocation.models.tails_cache import TailsCacheManager
 from ..transport.inbound.manager import InboundTransportManager
 from ..transport.inbound.message import InboundMessage
 from ..transport.outbound.base import OutboundDeliveryError
@@ -45,6 +52,9 @@ from ..transport.outbound.status import OutboundSendStatus
 from ..transport.wire_format import BaseWireFormat
 from ..utils.stats import Collector
 from ..utils.task_queue import CompletedTask, TaskQueue
+from ..utils.tracing import get_trace_exporter
+from ..utils.http import HttpClient
+from ..utils.worker_pool import WorkerPool, close_worker_pool
 from ..vc.ld_proofs.document_loader import DocumentLoader
 from ..wallet.did_info import DIDInfo
 from .dispatcher import Dispatcher
@@ -129,6 +139,7 @@ class Conductor:
         if context.settings.get("multitenant.enabled"):
             multitenant_mgr = MultitenantManager(self.root_profile)
             context.injector.bind_instance(MultitenantManager, multitenant_mgr)
+            await multitenant_mgr.load_routes()
 
         # Bind default PyLD document loader
         context.injector.bind_instance(
@@ -360,8 +371,33 @@ class Conductor:
         # close multitenant profiles
         multitenant_mgr = self.context.inject(MultitenantManager, required=False)
         if multitenant_mgr:
-            for profile in multitenant_mgr._instances.values():
-                shutdown.run(profile.close())
+            shutdown.run(multitenant_mgr.profile_cache.clear())
+
+        document_loader = self.context.inject(DocumentLoader, required=False)
+        if document_loader:
+            document_loader.close()
+
+        trace_exporter = get_trace_exporter()
+        if trace_exporter:
+            shutdown.run(trace_exporter.close())
+
+        cache = self.context.inject(BaseCache, required=False)
+        if cache:
+            shutdown.run(cache.close())
+
+        event_bus = self.context.inject(EventBus, required=False)
+        if event_bus:
+            shutdown.run(event_bus.close(timeout))
+
+        close_worker_pool(wait=False)
+
+        rev_state_cache = self.context.inject(RevocationStateCache, required=False)
+        if rev_state_cache:
+            rev_state_cache.close()
+
+        http_client = self.context.inject(HttpClient, required=False)
+        if http_client:
+            shutdown.run(http_client.close())
 
         if self.root_profile:
             shutdown.run(self.root_profile.close())
@@ -393,14 +429,26 @@ class Conductor:
         # Note: at this point we could send the message to a shared queue
         # if this pod is too busy to process it
 
+        # keep a subwallet profile open until the message is handled
+        multitenant_mgr = self.context.inject(MultitenantManager, required=False)
+        if multitenant_mgr:
+            multitenant_mgr.profile_cache.acquire(profile)
+
+        def complete(completed: CompletedTask):
+            if multitenant_mgr:
+                multitenant_mgr.profile_cache.release(profile)
+            self.dispatch_complete(message, completed)
+
         try:
             self.dispatcher.queue_message(
                 profile,
                 message,
                 self.outbound_message_router,
-                lambda completed: self.dispatch_complete(message, completed),
+                complete,
             )
         except (LedgerConfigError, LedgerTransactionError) as e:
+            if multitenant_mgr:
+                multitenant_mgr.profile_cache.release(profile)
             LOGGER.error("Shutdown on ledger error %s", str(e))
             if self.admin_server:
                 self.admin_server.notify_fatal_error()
@@ -436,16 +484,45 @@ class Conductor:
             "in_sessions": len(self.inbound_transport_manager.sessions),
             "out_encode": 0,
             "out_deliver": 0,
+            "out_retry": 0,
+            "out_parked": 0,
             "task_active": self.dispatcher.task_queue.current_active,
             "task_done": self.dispatcher.task_queue.total_done,
             "task_failed": self.dispatcher.task_queue.total_failed,
             "task_pending": self.dispatcher.task_queue.current_pending,
+            "task_lanes": self.dispatcher.task_queue.lane_stats(),
         }
         for m in self.outbound_transport_manager.outbound_buffer:
             if m.state == QueuedOutboundMessage.STATE_ENCODE:
                 stats["out_encode"] += 1
             if m.state == QueuedOutboundMessage.STATE_DELIVER:
                 stats["out_deliver"] += 1
+            if m.state == QueuedOutboundMessage.STATE_RETRY:
+                stats["out_retry"] += 1
+            if m.state == QueuedOutboundMessage.STATE_PARKED:
+                stats["out_parked"] += 1
+        stats["out_endpoints"] = self.outbound_transport_manager.endpoint_stats()
+        trace_exporter = get_trace_exporter()
+        if trace_exporter:
+            stats.update(trace_exporter.stats)
+        event_bus = self.context.inject(EventBus, required=False)
+        if event_bus:
+            stats.update(event_bus.stats)
+        worker_pool = self.context.inject(WorkerPool, required=False)
+        if worker_pool:
+            stats.update(worker_pool.stats)
+        resolver = self.context.inject(DIDResolver, required=False)
+        if resolver:
+            stats.update(resolver.stats)
+        tails_cache = self.context.inject(TailsCacheManager, required=False)
+        if tails_cache:
+            stats.update(tails_cache.stats)
+        rev_state_cache = self.context.inject(RevocationStateCache, required=False)
+        if rev_state_cache:
+            stats.update(rev_state_cache.stats)
+        multitenant_mgr = self.context.inject(MultitenantManager, required=False)
+        if multitenant_mgr:
+            stats.update(multitenant_mgr.stats)
         return stats
 
     async def outbound_message_router(
@@ -570,7 +647,7 @@ class Conductor:
     def webhook_router(
         self,
         topic: str,
-        payload: dict,
+        payload: Union[dict, str],
         endpoint: str,
         max_attempts: int = None,
         metadata: dict = None,
@@ -580,7 +657,7 @@ class Conductor:
 
         Args:
             topic: The webhook topic
-            payload: The webhook payload
+            payload: The webhook payload, or its JSON serialization
             endpoint: The endpoint of the webhook target
             max_attempts: The maximum number of attempts
             metadata: Additional metadata associated with the payload
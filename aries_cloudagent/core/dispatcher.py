@@ -36,6 +36,15 @@ from .protocol_registry import ProtocolRegistry
 
 LOGGER = logging.getLogger(__name__)
 
+# task queue lanes, in priority order
+LANE_PRIORITY = "priority"
+LANE_ADMIN = "admin"
+LANE_INBOUND = "inbound"
+
+# protocols of inbound messages handled in the priority lane: forwarded
+# messages are not included, as their volume is driven by other agents
+PRIORITY_PROTOCOLS = ("coordinate-mediation", "trust_ping")
+
 
 class ProblemReportParseError(MessageParseError):
     """Error to raise on failure to parse problem-report message."""
@@ -59,15 +68,40 @@ class Dispatcher:
         """Perform async instance setup."""
         self.collector = self.profile.inject(Collector, required=False)
         max_active = int(os.getenv("DISPATCHER_MAX_ACTIVE", 50))
+        quotas = self.profile.settings.get("dispatcher.lane_quotas") or {}
+        # by default, keep some room for priority and admin tasks
+        lanes = {
+            LANE_PRIORITY: quotas.get(LANE_PRIORITY, 0),
+            LANE_ADMIN: quotas.get(LANE_ADMIN, 0),
+            LANE_INBOUND: quotas.get(LANE_INBOUND, max(1, max_active * 4 // 5)),
+        }
         self.task_queue = TaskQueue(
-            max_active=max_active, timed=bool(self.collector), trace_fn=self.log_task
+            max_active=max_active,
+            timed=bool(self.collector),
+            trace_fn=self.log_task,
+            lanes=lanes,
         )
 
     def put_task(
-        self, coro: Coroutine, complete: Callable = None, ident: str = None
+        self,
+        coro: Coroutine,
+        complete: Callable = None,
+        ident: str = None,
+        lane: str = None,
+        fair_key: str = None,
     ) -> PendingTask:
         """Run a task in the task queue, potentially blocking other handlers."""
-        return self.task_queue.put(coro, complete, ident)
+        return self.task_queue.put(coro, complete, ident, lane, fair_key)
+
+    def message_lane(self, payload: dict) -> str:
+        """Select the task queue lane for an inbound message payload."""
+        message_type = isinstance(payload, dict) and payload.get("@type")
+        if isinstance(message_type, str):
+            # <prefix>/<protocol>/<version>/<name>
+            parts = message_type.rsplit("/", 3)
+            if len(parts) == 4 and parts[1] in PRIORITY_PROTOCOLS:
+                return LANE_PRIORITY
+        return LANE_INBOUND
 
     def run_task(
         self, coro: Coroutine, complete: Callable = None, ident: str = None
@@ -111,9 +145,13 @@ class Dispatcher:
             A pending task instance resolving to the handler task
 
         """
+        receipt = inbound_message.receipt
         return self.put_task(
             self.handle_message(profile, inbound_message, send_outbound),
             complete,
+            lane=self.message_lane(inbound_message.payload),
+            # share the lane fairly between connections
+            fair_key=receipt.sender_verkey or receipt.recipient_verkey,
         )
 
     async def handle_message(
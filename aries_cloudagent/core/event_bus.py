@@ -1,8 +1,10 @@
 """A simple event bus."""
 
+import asyncio
 import logging
+import re
 
-from itertools import chain
+from itertools import chain, count
 from typing import TYPE_CHECKING, Any, Callable, Dict, Pattern, Sequence
 
 if TYPE_CHECKING:  # To avoid circular import error
@@ -40,12 +42,136 @@ class Event:
         return "<Event topic={}, payload={}>".format(self._topic, self._payload)
 
 
+def pattern_prefix(pattern: Pattern) -> str:
+    """Get the literal text that topics matching a pattern must start with."""
+    source = pattern.pattern
+    if not isinstance(source, str) or pattern.flags & re.IGNORECASE or "|" in source:
+        return ""
+    if source.startswith("^"):
+        source = source[1:]
+    prefix = []
+    for char in source:
+        if char in ".^$*+?{}[]\\|()":
+            if char in "*?{" and prefix:
+                # the last character is optional or repeated
+                prefix.pop()
+            break
+        prefix.append(char)
+    return "".join(prefix)
+
+
+class EventSubscriberQueue:
+    """Bounded queue of events pending delivery to one subscriber."""
+
+    def __init__(self, processor: Callable, max_size: int):
+        """Initialize the subscriber queue."""
+        self.processor = processor
+        self.queue = asyncio.Queue(max_size)
+        self.overflow = 0
+        self.task: asyncio.Task = None
+
+    def put(self, profile: "Profile", event: Event) -> bool:
+        """Queue an event without waiting, returning False if the queue is full."""
+        try:
+            self.queue.put_nowait((profile, event))
+        except asyncio.QueueFull:
+            self.overflow += 1
+            return False
+        if not self.task:
+            self.task = asyncio.get_event_loop().create_task(self._process())
+        return True
+
+    async def _process(self):
+        """Deliver queued events to the subscriber in order."""
+        while True:
+            profile, event = await self.queue.get()
+            try:
+                await self.processor(profile, event)
+            except Exception:
+                LOGGER.exception("Error occurred while processing event")
+            finally:
+                self.queue.task_done()
+
+    async def close(self, timeout: float = None):
+        """Wait for queued events to be delivered, then stop processing."""
+        if self.task:
+            try:
+                await asyncio.wait_for(self.queue.join(), timeout)
+            except asyncio.TimeoutError:
+                LOGGER.warning(
+                    "Dropped %d queued events for subscriber %s",
+                    self.queue.qsize(),
+                    self.processor,
+                )
+            self.task.cancel()
+            self.task = None
+
+
 class EventBus:
-    """A simple event bus implementation."""
+    """
+    A simple event bus implementation.
 
-    def __init__(self):
-        """Initialize Event Bus."""
+    Subscriptions are indexed by the literal prefix of their topic patterns,
+    so that only patterns which may match are evaluated for each event.
+
+    By default, `notify` calls the matching subscribers in turn and returns
+    once they are done. In concurrent mode, events are instead added to a
+    bounded queue per subscriber, and the subscribers process their queues
+    concurrently; events arriving when a queue is full are dropped and
+    counted.
+    """
+
+    def __init__(self, concurrent: bool = False, queue_size: int = None):
+        """
+        Initialize Event Bus.
+
+        Args:
+            concurrent: Deliver events to subscribers from per-subscriber queues,
+                without waiting for the subscribers in `notify`
+            queue_size: The maximum number of events queued per subscriber
+
+        """
         self.topic_patterns_to_subscribers: Dict[Pattern, Sequence[Callable]] = {}
+        # literal topic prefix -> patterns
+        self._prefix_index: Dict[str, Sequence[Pattern]] = {}
+        self._prefix_lengths: Sequence[int] = []
+        # pattern -> subscription order, for notifying in a consistent order
+        self._pattern_order: Dict[Pattern, int] = {}
+        self._pattern_seq = count()
+        self.concurrent = concurrent
+        self.queue_size = queue_size or 1000
+        self.subscriber_queues: Dict[Callable, EventSubscriberQueue] = {}
+
+    @property
+    def stats(self) -> dict:
+        """Get the event queue statistics for concurrent dispatch."""
+        if not self.concurrent:
+            return {}
+        return {
+            "event_queued": sum(
+                queue.queue.qsize() for queue in self.subscriber_queues.values()
+            ),
+            "event_overflow": sum(
+                queue.overflow for queue in self.subscriber_queues.values()
+            ),
+        }
+
+    def _matching_subscribers(self, topic: str) -> Sequence[Sequence[Callable]]:
+        """Get the subscriber lists of the patterns matching a topic."""
+        matched = []
+        for length in self._prefix_lengths:
+            if length > len(topic):
+                break
+            for pattern in self._prefix_index.get(topic[:length], ()):
+                if pattern.match(topic):
+                    matched.append(pattern)
+        if len(matched) > 1:
+            matched.sort(key=self._pattern_order.get)
+        return [self.topic_patterns_to_subscribers[pattern] for pattern in matched]
+
+    def _index_prefixes(self):
+        """Update the sorted list of indexed prefix lengths."""
+        self._prefix_lengths = sorted({len(prefix) for prefix in self._prefix_index})
 
     async def notify(self, profile: "Profile", event: Event):
         """Notify subscribers of event.
@@ -55,23 +181,38 @@ class EventBus:
             event (Event): event to emit
 
         """
-        # TODO don't block notifier until subscribers have all been called?
-        # TODO trigger each processor but don't await?
-        # TODO log errors but otherwise ignore?
-
         LOGGER.debug("Notifying subscribers: %s", event)
-        matched = [
-            processor
-            for pattern, processor in self.topic_patterns_to_subscribers.items()
-            if pattern.match(event.topic)
-        ]
+        matched = self._matching_subscribers(event.topic)
+
+        if self.concurrent:
+            for processor in chain(*matched):
+                queue = self.subscriber_queues.get(processor)
+                if not queue:
+                    queue = self.subscriber_queues[processor] = EventSubscriberQueue(
+                        processor, self.queue_size
+                    )
+                if not queue.put(profile, event):
+                    LOGGER.warning(
+                        "Event queue full for subscriber %s, dropped event: %s",
+                        processor,
+                        event.topic,
+                    )
+            return
 
-        for processor in chain(*matched):
+        # copy the subscriber lists, as processors may unsubscribe
+        for processor in list(chain(*matched)):
             try:
                 await processor(profile, event)
             except Exception:
                 LOGGER.exception("Error occurred while processing event")
 
+    async def close(self, timeout: float = None):
+        """Deliver any queued events and stop the subscriber queues."""
+        queues = list(self.subscriber_queues.values())
+        self.subscriber_queues = {}
+        if queues:
+            await asyncio.gather(*(queue.close(timeout) for queue in queues))
+
     def subscribe(self, pattern: Pattern, processor: Callable):
         """Subscribe to an event.
 
@@ -83,6 +224,12 @@ class EventBus:
         LOGGER.debug("Subscribed: topic %s, processor %s", pattern, processor)
         if pattern not in self.topic_patterns_to_subscribers:
             self.topic_patterns_to_subscribers[pattern] = []
+            self._pattern_order[pattern] = next(self._pattern_seq)
+            prefix = pattern_prefix(pattern)
+            if prefix not in self._prefix_index:
+                self._prefix_index[prefix] = []
+                self._index_prefixes()
+            self._prefix_index[prefix].append(pattern)
         self.topic_patterns_to_subscribers[pattern].append(processor)
 
     def unsubscribe(self, pattern: Pattern, processor: Callable):
@@ -104,6 +251,20 @@ class EventBus:
             del self.topic_patterns_to_subscribers[pattern][index]
             if not self.topic_patterns_to_subscribers[pattern]:
                 del self.topic_patterns_to_subscribers[pattern]
+                del self._pattern_order[pattern]
+                prefix = pattern_prefix(pattern)
+                self._prefix_index[prefix].remove(pattern)
+                if not self._prefix_index[prefix]:
+                    del self._prefix_index[prefix]
+                    self._index_prefixes()
+            if processor in self.subscriber_queues and not any(
+                processor in processors
+                for processors in self.topic_patterns_to_subscribers.values()
+            ):
+                # deliver the events already queued, then stop the queue
+                queue = self.subscriber_queues.pop(processor)
+                if queue.task:
+                    asyncio.ensure_future(queue.close())
             LOGGER.debug("Unsubscribed: topic %s, processor %s", pattern, processor)
 
 
@@ -1,12 +1,12 @@
 """Manage in-memory profile interaction."""
 
-from collections import OrderedDict
 from typing import Any, Mapping, Type
 from weakref import ref
 
 from ..config.injection_context import InjectionContext
 from ..config.provider import ClassProvider
 from ..storage.base import BaseStorage
+from ..storage.record_index import RecordIndex
 from ..storage.vc_holder.base import VCHolder
 from ..utils.classloader import DeferLoad
 from ..wallet.base import BaseWallet
@@ -34,7 +34,7 @@ class InMemoryProfile(Profile):
         self.keys = {}
         self.local_dids = {}
         self.pair_dids = {}
-        self.records = OrderedDict()
+        self.records = RecordIndex()
         self.bind_providers()
 
     def bind_providers(self):
@@ -1,3 +1,5 @@
+import asyncio
+
 from io import StringIO
 
 from asynctest import TestCase as AsyncTestCase
@@ -202,7 +204,11 @@ class TestConductor(AsyncTestCase, Config, TestDIDs):
             mock_outbound_mgr.return_value.outbound_buffer = [
                 async_mock.MagicMock(state=QueuedOutboundMessage.STATE_ENCODE),
                 async_mock.MagicMock(state=QueuedOutboundMessage.STATE_DELIVER),
+                async_mock.MagicMock(state=QueuedOutboundMessage.STATE_PARKED),
             ]
+            mock_outbound_mgr.return_value.endpoint_stats.return_value = {
+                "http://1.2.3.4:8081": {"state": "open", "failures": 5, "parked": 1}
+            }
 
             await conductor.setup()
 
@@ -219,6 +225,9 @@ class TestConductor(AsyncTestCase, Config, TestDIDs):
                     "task_pending",
                 ]
             )
+            assert stats["out_parked"] == 1
+            assert stats["out_endpoints"]["http://1.2.3.4:8081"]["state"] == "open"
+            assert stats["task_lanes"]["inbound"]["pending"] == 0
 
     async def test_inbound_message_handler(self):
         builder: ContextBuilder = StubContextBuilder(self.test_settings)
@@ -244,6 +253,35 @@ class TestConductor(AsyncTestCase, Config, TestDIDs):
             assert mock_dispatch_q.call_args[0][2] == conductor.outbound_message_router
             assert callable(mock_dispatch_q.call_args[0][3])
 
+    async def test_inbound_message_handler_multitenant(self):
+        builder: ContextBuilder = StubContextBuilder(
+            {**self.test_settings, "multitenant.enabled": True}
+        )
+        conductor = test_module.Conductor(builder)
+
+        await conductor.setup()
+        multitenant_mgr = conductor.context.inject(MultitenantManager)
+        profile = async_mock.MagicMock(close=async_mock.CoroutineMock())
+        await multitenant_mgr.profile_cache.put("test", profile)
+
+        with async_mock.patch.object(
+            conductor.dispatcher, "queue_message", autospec=True
+        ) as mock_dispatch_q:
+            message = InboundMessage("{}", MessageReceipt())
+            conductor.inbound_message_router(profile, message, can_respond=False)
+
+            # evicted while the message is handled, closed once it completes
+            await multitenant_mgr.profile_cache.remove("test", close=True)
+            profile.close.assert_not_called()
+            complete = mock_dispatch_q.call_args[0][3]
+            complete(async_mock.MagicMock(exc_info=None))
+            await asyncio.sleep(0)
+            profile.close.assert_awaited_once_with()
+
+        stats = await conductor.get_stats()
+        assert stats["profile_cache_size"] == 0
+        assert stats["profile_cache_in_use"] == 0
+
     async def test_inbound_message_handler_ledger_x(self):
         builder: ContextBuilder = StubContextBuilder(self.test_settings_admin)
         conductor = test_module.Conductor(builder)
@@ -938,12 +976,15 @@ class TestConductor(AsyncTestCase, Config, TestDIDs):
 
             multitenant_mgr = conductor.context.inject(MultitenantManager)
 
-            multitenant_mgr._instances = {
+            profiles = {
                 "test1": async_mock.MagicMock(close=async_mock.CoroutineMock()),
                 "test2": async_mock.MagicMock(close=async_mock.CoroutineMock()),
             }
+            for wallet_id, profile in profiles.items():
+                await multitenant_mgr.profile_cache.put(wallet_id, profile)
 
             await conductor.stop()
 
-            multitenant_mgr._instances["test1"].close.assert_called_once_with()
-            multitenant_mgr._instances["test2"].close.assert_called_once_with()
+            profiles["test1"].close.assert_called_once_with()
+            profiles["test2"].close.assert_called_once_with()
+            assert not len(multitenant_mgr.profile_cache)
@@ -126,6 +126,84 @@ class TestDispatcher(AsyncTestCase):
                 handler_mock.call_args[0][2], test_module.DispatcherResponder
             )
 
+    async def test_dispatch_lanes(self):
+        profile = make_profile()
+        profile.settings["dispatcher.lane_quotas"] = {"admin": 5}
+        dispatcher = test_module.Dispatcher(profile)
+        await dispatcher.setup()
+        quotas = {
+            name: lane.quota for name, lane in dispatcher.task_queue.lanes.items()
+        }
+        assert quotas == {"priority": 0, "admin": 5, "inbound": 40, "default": 0}
+
+        for message_type, lane in (
+            ("https://didcomm.org/trust_ping/1.0/ping", test_module.LANE_PRIORITY),
+            (
+                "https://didcomm.org/coordinate-mediation/1.0/keylist-update",
+                test_module.LANE_PRIORITY,
+            ),
+            (
+                "did:sov:BzCbsNYhMrjHiqZDTUASHg;spec/routing/1.0/forward",
+                test_module.LANE_INBOUND,
+            ),
+            (DIDCommPrefix.qualify_current("proto-name/1.1/message-type"), "inbound"),
+            ("bad", test_module.LANE_INBOUND),
+            (None, test_module.LANE_INBOUND),
+        ):
+            assert dispatcher.message_lane({"@type": message_type}) == lane
+        assert dispatcher.message_lane([]) == test_module.LANE_INBOUND
+
+        message = make_inbound({"@type": "https://didcomm.org/trust_ping/1.0/ping"})
+        message.receipt.sender_verkey = "sender-verkey"
+        with async_mock.patch.object(
+            dispatcher.task_queue, "put", autospec=True
+        ) as mock_put, async_mock.patch.object(
+            dispatcher, "handle_message", async_mock.MagicMock()
+        ):
+            dispatcher.queue_message(profile, message, None)
+        assert mock_put.call_args[0][3:] == (test_module.LANE_PRIORITY, "sender-verkey")
+
+    async def test_dispatch_forward_flood(self):
+        profile = make_profile()
+        dispatcher = test_module.Dispatcher(profile)
+        await dispatcher.setup()
+        started = []
+        blocked = []
+
+        async def handle_message(profile, inbound_message, send_outbound):
+            started.append(inbound_message.payload["@type"])
+            blocked.append(asyncio.get_event_loop().create_future())
+            await blocked[-1]
+
+        def queue(message_type, sender):
+            message = make_inbound({"@type": message_type})
+            message.receipt.sender_verkey = sender
+            dispatcher.queue_message(profile, message, None)
+
+        forward = DIDCommPrefix.qualify_current("routing/1.0/forward")
+        ping = DIDCommPrefix.qualify_current("trust_ping/1.0/ping")
+        other = DIDCommPrefix.qualify_current("basicmessage/1.0/message")
+        with async_mock.patch.object(dispatcher, "handle_message", handle_message):
+            for _ in range(100):
+                queue(forward, "flood-verkey")
+            queue(other, "other-verkey")
+            queue(ping, "flood-verkey")
+            await asyncio.sleep(0.01)
+
+            # forwards are limited to the inbound lane, pings are not held up
+            assert started.count(forward) == 40
+            assert started[-1] == ping
+            # senders take turns in the free inbound slots
+            blocked[0].set_result(None)
+            blocked[1].set_result(None)
+            await asyncio.sleep(0.01)
+            assert started[-2:] == [forward, other]
+
+            for future in blocked:
+                if not future.done():
+                    future.set_result(None)
+            await dispatcher.task_queue.complete()
+
     async def test_dispatch_versioned_message(self):
         profile = make_profile()
         registry = profile.inject(ProtocolRegistry)
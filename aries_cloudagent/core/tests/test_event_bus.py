@@ -1,5 +1,6 @@
 """Test Event Bus."""
 
+import asyncio
 import pytest
 import re
 
@@ -168,3 +169,111 @@ async def test_sub_notify_both(event_bus: EventBus, context, event, processor):
     assert processor.event == event
     assert processor1.context == context
     assert processor1.event == event
+
+
+@pytest.mark.parametrize(
+    "pattern, prefix",
+    [
+        ("^acapy::record::([^:]*)(?:::.*)?$", "acapy::record::"),
+        ("acapy::webhook::(.*)$", "acapy::webhook::"),
+        ("topics?", "topic"),
+        ("a|b", ""),
+        ("(?i)topic", ""),
+        (".*", ""),
+    ],
+)
+def test_pattern_prefix(pattern, prefix):
+    assert test_module.pattern_prefix(re.compile(pattern)) == prefix
+    assert test_module.pattern_prefix(re.compile("topic", re.IGNORECASE)) == ""
+
+
+@pytest.mark.asyncio
+async def test_sub_notify_prefix_index(event_bus: EventBus, context):
+    """Test subscribers are notified in order of subscription."""
+    calls = []
+
+    def make_processor(name):
+        async def _processor(profile, event):
+            calls.append(name)
+
+        return _processor
+
+    event_bus.subscribe(re.compile("^acapy::record::.*"), make_processor("record"))
+    event_bus.subscribe(re.compile(".*"), make_processor("any"))
+    event_bus.subscribe(re.compile("^acapy::"), make_processor("acapy"))
+    event_bus.subscribe(re.compile("^acapy::webhook::"), make_processor("webhook"))
+
+    await event_bus.notify(context, Event("acapy::record::connections"))
+    assert calls == ["record", "any", "acapy"]
+    calls.clear()
+    await event_bus.notify(context, Event("other"))
+    assert calls == ["any"]
+
+    assert len(event_bus._prefix_index) == 4
+    for pattern, processors in list(event_bus.topic_patterns_to_subscribers.items()):
+        for processor in list(processors):
+            event_bus.unsubscribe(pattern, processor)
+    assert not event_bus._prefix_index
+    assert not event_bus._prefix_lengths
+
+
+@pytest.mark.asyncio
+async def test_notify_concurrent(context, event):
+    """Test events are queued for each subscriber without waiting."""
+    event_bus = EventBus(concurrent=True, queue_size=2)
+    release = asyncio.Event()
+    slow_events = []
+    processor = TestProcessor()
+
+    async def slow_processor(profile, event):
+        await release.wait()
+        slow_events.append(event)
+
+    event_bus.subscribe(re.compile(".*"), slow_processor)
+    event_bus.subscribe(re.compile(".*"), processor)
+    with async_mock.patch.object(
+        test_module.LOGGER, "warning", async_mock.MagicMock()
+    ) as mock_log_warning:
+        for index in range(4):
+            await event_bus.notify(context, Event("topic", index))
+            await asyncio.sleep(0.01)
+        mock_log_warning.assert_called_once()
+    assert event_bus.stats == {"event_queued": 2, "event_overflow": 1}
+
+    # the slow subscriber does not hold up the others
+    assert processor.event == Event("topic", 3)
+    assert not slow_events
+
+    release.set()
+    await event_bus.close(1.0)
+    assert slow_events == [Event("topic", index) for index in range(3)]
+    assert not event_bus.subscriber_queues
+
+
+@pytest.mark.asyncio
+async def test_notify_concurrent_unsubscribe(context, event, processor):
+    """Test queued events are delivered after unsubscribing."""
+    event_bus = EventBus(concurrent=True)
+    event_bus.subscribe(re.compile(".*"), processor)
+    await event_bus.notify(context, event)
+    event_bus.unsubscribe(re.compile(".*"), processor)
+    assert not event_bus.subscriber_queues
+    await asyncio.sleep(0.01)
+    assert processor.event == event
+
+
+@pytest.mark.asyncio
+async def test_notify_concurrent_close_timeout(context, event):
+    """Test closing with events still pending."""
+    event_bus = EventBus(concurrent=True)
+
+    async def stuck_processor(profile, event):
+        await asyncio.sleep(10)
+
+    event_bus.subscribe(re.compile(".*"), stuck_processor)
+    await event_bus.notify(context, event)
+    with async_mock.patch.object(
+        test_module.LOGGER, "warning", async_mock.MagicMock()
+    ) as mock_log_warning:
+        await event_bus.close(0.01)
+        mock_log_warning.assert_called_once()
@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+import time
 
 from typing import Sequence, Tuple
 
@@ -20,6 +21,8 @@ from indy_credx import (
 )
 
 from ...askar.profile import AskarProfile
+from ...revocation.models.issuer_cred_rev_record import IssuerCredRevRecord
+from ...storage.error import StorageError
 
 from ..issuer import (
     IndyIssuer,
@@ -27,6 +30,7 @@ from ..issuer import (
     IndyIssuerRevocationRegistryFullError,
     DEFAULT_CRED_DEF_TAG,
     DEFAULT_SIGNATURE_TYPE,
+    log_revocation_metrics,
 )
 
 LOGGER = logging.getLogger(__name__)
@@ -374,6 +378,7 @@ class IndyCredxIssuer(IndyIssuer):
 
         """
 
+        start = time.perf_counter()
         txn = await self._profile.transaction()
         try:
             rev_reg_def = await txn.handle.fetch(CATEGORY_REV_REG_DEF, revoc_reg_id)
@@ -455,12 +460,34 @@ class IndyCredxIssuer(IndyIssuer):
                 await txn.handle.replace(
                     CATEGORY_REV_REG_INFO, revoc_reg_id, value_json=rev_info
                 )
+            except StoreError as err:
+                raise IndyIssuerError("Error saving revocation registry") from err
+
+            # update the issuer cred rev records in the same transaction
+            try:
+                recs = await IssuerCredRevRecord.query_by_cred_rev_ids(
+                    txn, revoc_reg_id, rev_crids
+                )
+                for rec in recs:
+                    rec.state = IssuerCredRevRecord.STATE_REVOKED
+                    await rec.save(txn, reason="Marked revoked")
+            except StorageError as err:
+                LOGGER.warning(
+                    "Error marking revoked credentials on rev reg id %s: %s",
+                    revoc_reg_id,
+                    err.roll_up,
+                )
+
+            try:
                 await txn.commit()
             except StoreError as err:
                 raise IndyIssuerError("Error saving revocation registry") from err
         else:
             delta = None
 
+        log_revocation_metrics(
+            LOGGER, revoc_reg_id, len(rev_crids), len(failed_crids), start
+        )
         return (delta and delta.to_json(), failed_crids)
 
     async def merge_revocation_registry_deltas(
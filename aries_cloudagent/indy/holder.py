@@ -162,3 +162,28 @@ class IndyHolder(ABC, metaclass=ABCMeta):
             the revocation state
 
         """
+
+    @abstractmethod
+    async def update_revocation_state(
+        self,
+        cred_rev_id: str,
+        rev_reg_def: dict,
+        rev_state: str,
+        rev_reg_delta: dict,
+        timestamp: int,
+        tails_file_path: str,
+    ) -> str:
+        """
+        Update a revocation state for a received credential to a later time.
+
+        Args:
+            cred_rev_id: credential revocation id in revocation registry
+            rev_reg_def: revocation registry definition
+            rev_state: the revocation state to update
+            rev_reg_delta: revocation delta since the time of the revocation state
+            timestamp: delta timestamp
+
+        Returns:
+            the updated revocation state
+
+        """
@@ -1,5 +1,8 @@
 """Base Indy Issuer class."""
 
+import logging
+import time
+
 from abc import ABC, ABCMeta, abstractmethod
 from typing import Sequence, Tuple
 
@@ -18,6 +21,21 @@ class IndyIssuerRevocationRegistryFullError(IndyIssuerError):
     """Revocation registry is full when issuing a new credential."""
 
 
+def log_revocation_metrics(
+    logger: logging.Logger, rev_reg_id: str, revoked: int, failed: int, start: float
+):
+    """Log the throughput of a batch revocation started at `start` (perf counter)."""
+    elapsed = time.perf_counter() - start
+    logger.info(
+        "Revoked %d credential(s) on rev reg id %s in %.3fs (%.1f/s), %d failed",
+        revoked,
+        rev_reg_id,
+        elapsed,
+        revoked / elapsed if elapsed > 0 else 0.0,
+        failed,
+    )
+
+
 class IndyIssuer(ABC, metaclass=ABCMeta):
     """Base class for Indy Issuer."""
 
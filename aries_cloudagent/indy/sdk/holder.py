@@ -483,3 +483,40 @@ class IndySdkHolder(IndyHolder):
             )
 
         return rev_state_json
+
+    async def update_revocation_state(
+        self,
+        cred_rev_id: str,
+        rev_reg_def: dict,
+        rev_state: str,
+        rev_reg_delta: dict,
+        timestamp: int,
+        tails_file_path: str,
+    ) -> str:
+        """
+        Update a revocation state for a received credential to a later time.
+
+        Args:
+            cred_rev_id: credential revocation id in revocation registry
+            rev_reg_def: revocation registry definition
+            rev_state: the revocation state to update
+            rev_reg_delta: revocation delta since the time of the revocation state
+            timestamp: delta timestamp
+
+        Returns:
+            the updated revocation state
+
+        """
+
+        with IndyErrorHandler("Error when updating revocation state", IndyHolderError):
+            tails_file_reader = await create_tails_reader(tails_file_path)
+            rev_state_json = await indy.anoncreds.update_revocation_state(
+                tails_file_reader,
+                rev_state_json=rev_state,
+                rev_reg_def_json=json.dumps(rev_reg_def),
+                rev_reg_delta_json=json.dumps(rev_reg_delta),
+                timestamp=timestamp,
+                cred_rev_id=cred_rev_id,
+            )
+
+        return rev_state_json
@@ -2,6 +2,7 @@
 
 import json
 import logging
+import time
 from typing import Sequence, Tuple
 
 import indy.anoncreds
@@ -19,6 +20,7 @@ from ..issuer import (
     IndyIssuerRevocationRegistryFullError,
     DEFAULT_CRED_DEF_TAG,
     DEFAULT_SIGNATURE_TYPE,
+    log_revocation_metrics,
 )
 
 from .error import IndyErrorHandler
@@ -276,31 +278,23 @@ class IndySdkIssuer(IndyIssuer):
             Tuple with the combined revocation delta, list of cred rev ids not revoked
 
         """
+        start = time.perf_counter()
         failed_crids = []
+        revoked_crids = []
+        deltas = []
         tails_reader_handle = await create_tails_reader(tails_file_path)
 
-        result_json = None
         for cred_rev_id in cred_rev_ids:
             with IndyErrorHandler(
                 "Exception when revoking credential", IndyIssuerError
             ):
                 try:
-                    session = await self.profile.session()
                     delta_json = await indy.anoncreds.issuer_revoke_credential(
                         self.profile.wallet.handle,
                         tails_reader_handle,
                         rev_reg_id,
                         cred_rev_id,
                     )
-                    issuer_cr_rec = await IssuerCredRevRecord.retrieve_by_ids(
-                        session,
-                        rev_reg_id,
-                        cred_rev_id,
-                    )
-                    await issuer_cr_rec.set_state(
-                        session, IssuerCredRevRecord.STATE_REVOKED
-                    )
-
                 except IndyError as err:
                     if err.error_code == ErrorCode.AnoncredsInvalidUserRevocId:
                         LOGGER.error(
@@ -320,27 +314,70 @@ class IndySdkIssuer(IndyIssuer):
                         )
                     failed_crids.append(cred_rev_id)
                     continue
-                except StorageError as err:
-                    LOGGER.warning(
-                        (
-                            "Revoked credential on rev reg id %s, cred rev id %s "
-                            "without corresponding issuer cred rev record: %s"
-                        ),
-                        rev_reg_id,
-                        cred_rev_id,
-                        err.roll_up,
-                    )
-                    # carry on with delta merge; record is best-effort
+                revoked_crids.append(cred_rev_id)
+                deltas.append(delta_json)
 
-                if result_json:
-                    result_json = await self.merge_revocation_registry_deltas(
-                        result_json, delta_json
-                    )
-                else:
-                    result_json = delta_json
+        if revoked_crids:
+            await self._mark_revoked(rev_reg_id, revoked_crids)
+        result_json = await self._merge_deltas(deltas)
 
+        log_revocation_metrics(
+            LOGGER, rev_reg_id, len(revoked_crids), len(failed_crids), start
+        )
         return (result_json, failed_crids)
 
+    async def _mark_revoked(self, rev_reg_id: str, cred_rev_ids: Sequence[str]):
+        """Mark the issuer cred rev records of revoked credentials in one transaction.
+
+        The records are best-effort: credentials are revoked even without one.
+        """
+        try:
+            async with self.profile.transaction() as txn:
+                recs = await IssuerCredRevRecord.query_by_cred_rev_ids(
+                    txn, rev_reg_id, cred_rev_ids
+                )
+                for rec in recs:
+                    rec.state = IssuerCredRevRecord.STATE_REVOKED
+                    await rec.save(txn, reason="Marked revoked")
+                await txn.commit()
+        except StorageError as err:
+            LOGGER.warning(
+                "Error marking revoked credentials on rev reg id %s: %s",
+                rev_reg_id,
+                err.roll_up,
+            )
+            return
+
+        missing = set(cred_rev_ids) - set(rec.cred_rev_id for rec in recs)
+        if missing:
+            LOGGER.warning(
+                (
+                    "Revoked credentials on rev reg id %s, cred rev ids %s "
+                    "without corresponding issuer cred rev records"
+                ),
+                rev_reg_id,
+                sorted(missing),
+            )
+
+    async def _merge_deltas(self, deltas: Sequence[str]) -> str:
+        """Merge consecutive revocation registry deltas, pairing neighbours.
+
+        Each round merges adjacent deltas, keeping the accumulator chain intact
+        while merging every delta O(log n) times rather than once per revocation.
+        """
+        while len(deltas) > 1:
+            merged = []
+            for idx in range(0, len(deltas) - 1, 2):
+                merged.append(
+                    await self.merge_revocation_registry_deltas(
+                        deltas[idx], deltas[idx + 1]
+                    )
+                )
+            if len(deltas) % 2:
+                merged.append(deltas[-1])
+            deltas = merged
+        return deltas[0] if deltas else None
+
     async def merge_revocation_registry_deltas(
         self, fro_delta: str, to_delta: str
     ) -> str:
@@ -178,10 +178,13 @@ class TestIndySdkIssuer(AsyncTestCase):
             test_module, "IssuerCredRevRecord", async_mock.MagicMock()
         ) as mock_issuer_cr_rec:
             mock_issuer_cr_rec.return_value.save = async_mock.CoroutineMock()
-            mock_issuer_cr_rec.retrieve_by_ids = async_mock.CoroutineMock(
-                return_value=async_mock.MagicMock(
-                    set_state=async_mock.CoroutineMock(),
-                )
+            mock_issuer_cr_rec.query_by_cred_rev_ids = async_mock.CoroutineMock(
+                return_value=[
+                    async_mock.MagicMock(
+                        cred_rev_id="42",
+                        save=async_mock.CoroutineMock(),
+                    )
+                ]
             )
 
             with self.assertRaises(test_module.IndyIssuerError):  # missing attribute
@@ -226,6 +229,10 @@ class TestIndySdkIssuer(AsyncTestCase):
             assert not failed
             assert mock_indy_revoke_credential.call_count == 2
             mock_indy_merge_rr_deltas.assert_called_once()
+            mock_issuer_cr_rec.query_by_cred_rev_ids.assert_awaited_once()
+            rec = mock_issuer_cr_rec.query_by_cred_rev_ids.return_value[0]
+            assert rec.state == mock_issuer_cr_rec.STATE_REVOKED
+            rec.save.assert_awaited_once()
 
     @async_mock.patch("indy.anoncreds.issuer_create_credential")
     @async_mock.patch.object(test_module, "create_tails_reader", autospec=True)
@@ -285,13 +292,9 @@ class TestIndySdkIssuer(AsyncTestCase):
                     "could not store"  # not fatal; maximize coverage
                 )
             )
-            mock_issuer_cr_rec.retrieve_by_ids = async_mock.CoroutineMock(
-                return_value=async_mock.MagicMock(
-                    set_state=async_mock.CoroutineMock(
-                        side_effect=test_module.StorageError(
-                            "could not store"  # not fatal; maximize coverage
-                        )
-                    ),
+            mock_issuer_cr_rec.query_by_cred_rev_ids = async_mock.CoroutineMock(
+                side_effect=test_module.StorageError(
+                    "could not store"  # not fatal; maximize coverage
                 )
             )
 
@@ -0,0 +1,105 @@
+"""Concurrent fetching of ledger artifacts."""
+
+import asyncio
+
+from typing import Awaitable, Callable, Iterable, NamedTuple, Sequence, Tuple
+
+from .base import BaseLedger
+
+DEFAULT_MAX_CONCURRENT = 10
+
+
+class LedgerArtifacts(NamedTuple):
+    """Ledger artifacts fetched by a `LedgerArtifactFetcher`."""
+
+    # schemas by schema id
+    schemas: dict
+    # credential definitions by credential definition id
+    cred_defs: dict
+    # revocation registry definitions by registry id
+    rev_reg_defs: dict
+    # (delta, timestamp) by (registry id, timestamp from, timestamp to)
+    rev_reg_deltas: dict
+    # (entry, timestamp) by (registry id, timestamp)
+    rev_reg_entries: dict
+
+
+class LedgerArtifactFetcher:
+    """
+    Fetcher of the ledger artifacts used in a presentation.
+
+    Identifiers are deduplicated and all artifacts are fetched concurrently,
+    with at most `max_concurrent` ledger lookups outstanding at once, instead
+    of making one round trip to the ledger after another.
+    """
+
+    def __init__(self, ledger: BaseLedger, max_concurrent: int = None):
+        """
+        Initialize the fetcher.
+
+        Args:
+            ledger: The ledger to fetch from, which must be open while fetching
+            max_concurrent: The maximum number of concurrent ledger lookups
+
+        """
+        self.ledger = ledger
+        self.max_concurrent = max_concurrent or DEFAULT_MAX_CONCURRENT
+
+    async def fetch(
+        self,
+        schema_ids: Iterable[str] = (),
+        cred_def_ids: Iterable[str] = (),
+        rev_reg_def_ids: Iterable[str] = (),
+        rev_reg_deltas: Iterable[Tuple[str, int, int]] = (),
+        rev_reg_entries: Iterable[Tuple[str, int]] = (),
+    ) -> LedgerArtifacts:
+        """
+        Fetch ledger artifacts concurrently.
+
+        Args:
+            schema_ids: The schemas to fetch
+            cred_def_ids: The credential definitions to fetch
+            rev_reg_def_ids: The revocation registry definitions to fetch
+            rev_reg_deltas: The revocation registry deltas to fetch, as tuples
+                of (registry id, timestamp from, timestamp to)
+            rev_reg_entries: The revocation registry entries to fetch, as
+                tuples of (registry id, timestamp)
+
+        Raises:
+            The first error raised by a lookup; other lookups are cancelled
+
+        """
+        ledger = self.ledger
+        results = LedgerArtifacts({}, {}, {}, {}, {})
+        lookups = []
+        for found, keys, lookup in (
+            (results.schemas, schema_ids, ledger.get_schema),
+            (results.cred_defs, cred_def_ids, ledger.get_credential_definition),
+            (results.rev_reg_defs, rev_reg_def_ids, ledger.get_revoc_reg_def),
+            (results.rev_reg_deltas, rev_reg_deltas, ledger.get_revoc_reg_delta),
+            (results.rev_reg_entries, rev_reg_entries, ledger.get_revoc_reg_entry),
+        ):
+            for key in keys:
+                if key not in found:
+                    found[key] = None
+                    args = key if isinstance(key, tuple) else (key,)
+                    lookups.append((found, key, lookup, args))
+        await self._run(lookups)
+        return results
+
+    async def _run(self, lookups: Sequence[tuple]):
+        """Run the lookups with bounded concurrency, storing their results."""
+        if not lookups:
+            return
+        limit = asyncio.Semaphore(self.max_concurrent)
+
+        async def run(found: dict, key, lookup: Callable[..., Awaitable], args):
+            async with limit:
+                found[key] = await lookup(*args)
+
+        tasks = [asyncio.ensure_future(run(*lookup)) for lookup in lookups]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
@@ -0,0 +1,73 @@
+import asyncio
+
+from asynctest import TestCase as AsyncTestCase, mock as async_mock
+
+from ..base import BaseLedger
+from ..fetcher import LedgerArtifactFetcher
+
+
+class TestLedgerArtifactFetcher(AsyncTestCase):
+    def setUp(self):
+        self.active = 0
+        self.max_active = 0
+        self.ledger = async_mock.MagicMock(BaseLedger, autospec=True)
+        self.ledger.get_schema = async_mock.CoroutineMock(
+            side_effect=self.lookup("schema")
+        )
+        self.ledger.get_credential_definition = async_mock.CoroutineMock(
+            side_effect=self.lookup("cred_def")
+        )
+        self.ledger.get_revoc_reg_def = async_mock.CoroutineMock(
+            side_effect=self.lookup("rev_reg_def")
+        )
+        self.ledger.get_revoc_reg_delta = async_mock.CoroutineMock(
+            side_effect=self.lookup("delta")
+        )
+        self.ledger.get_revoc_reg_entry = async_mock.CoroutineMock(
+            side_effect=self.lookup("entry")
+        )
+
+    def lookup(self, kind):
+        async def lookup(*args):
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            await asyncio.sleep(0.01)
+            self.active -= 1
+            return (kind, *args)
+
+        return lookup
+
+    async def test_fetch(self):
+        fetcher = LedgerArtifactFetcher(self.ledger, max_concurrent=3)
+        result = await fetcher.fetch(
+            schema_ids=["s1", "s2", "s1"],
+            cred_def_ids=["c1", "c1"],
+            rev_reg_def_ids=["r1"],
+            rev_reg_deltas=[("r1", 0, 10), ("r1", 0, 10), ("r1", 5, 10)],
+            rev_reg_entries=[("r1", 10)],
+        )
+        assert result.schemas == {"s1": ("schema", "s1"), "s2": ("schema", "s2")}
+        assert result.cred_defs == {"c1": ("cred_def", "c1")}
+        assert result.rev_reg_defs == {"r1": ("rev_reg_def", "r1")}
+        assert result.rev_reg_deltas == {
+            ("r1", 0, 10): ("delta", "r1", 0, 10),
+            ("r1", 5, 10): ("delta", "r1", 5, 10),
+        }
+        assert result.rev_reg_entries == {("r1", 10): ("entry", "r1", 10)}
+        assert self.ledger.get_schema.await_count == 2
+        assert self.ledger.get_revoc_reg_delta.await_count == 2
+        assert self.max_active == 3
+
+    async def test_fetch_empty(self):
+        result = await LedgerArtifactFetcher(self.ledger).fetch()
+        assert result.schemas == {}
+        self.ledger.get_schema.assert_not_called()
+
+    async def test_fetch_error(self):
+        self.ledger.get_schema.side_effect = ValueError("Not this time")
+        fetcher = LedgerArtifactFetcher(self.ledger, max_concurrent=1)
+        with self.assertRaises(ValueError):
+            await fetcher.fetch(schema_ids=["s1"], cred_def_ids=["c1", "c2"])
+        await asyncio.sleep(0.05)
+        # remaining lookups are cancelled
+        assert self.ledger.get_credential_definition.await_count < 2
@@ -5,8 +5,9 @@ import logging
 import sys
 import uuid
 
+from base64 import urlsafe_b64decode, urlsafe_b64encode
 from datetime import datetime
-from typing import Any, Mapping, Optional, Sequence, Union
+from typing import Any, AsyncIterator, Mapping, Optional, Sequence, Tuple, Union
 
 from marshmallow import fields
 
@@ -19,7 +20,7 @@ from ...storage.record import StorageRecord
 from ..util import datetime_to_str, time_now
 from ..valid import INDY_ISO8601_DATETIME
 
-from .base import BaseModel, BaseModelSchema
+from .base import BaseModel, BaseModelError, BaseModelSchema
 
 LOGGER = logging.getLogger(__name__)
 
@@ -65,6 +66,30 @@ def match_post_filter(
     return positive
 
 
+def encode_query_cursor(offset: int) -> str:
+    """Encode a storage row offset as an opaque query continuation cursor."""
+    return urlsafe_b64encode(json.dumps({"offset": offset}).encode()).decode()
+
+
+def decode_query_cursor(cursor: str) -> int:
+    """
+    Decode an opaque query continuation cursor to a storage row offset.
+
+    Raises:
+        BaseModelError: If the cursor is malformed
+
+    """
+    if not cursor:
+        return 0
+    try:
+        offset = json.loads(urlsafe_b64decode(cursor.encode()))["offset"]
+    except (ValueError, TypeError, KeyError) as err:
+        raise BaseModelError(f"Invalid query cursor: {cursor}") from err
+    if not isinstance(offset, int) or offset < 0:
+        raise BaseModelError(f"Invalid query cursor: {cursor}")
+    return offset
+
+
 class BaseRecord(BaseModel):
     """Represents a single storage record."""
 
@@ -318,6 +343,158 @@ class BaseRecord(BaseModel):
                 result.append(cls.from_storage(record.id, vals))
         return result
 
+    @classmethod
+    async def _query_rows(
+        cls,
+        session: ProfileSession,
+        tag_filter: dict = None,
+        *,
+        post_filter_positive: dict = None,
+        post_filter_negative: dict = None,
+        alt: bool = False,
+        offset: int = 0,
+        page_size: int = None,
+    ) -> AsyncIterator[Tuple[int, "BaseRecord"]]:
+        """
+        Iterate stored records matching a query along with their row positions.
+
+        Storage rows before the given offset are skipped without being parsed.
+        """
+
+        storage = session.inject(BaseStorage)
+        search = storage.search_records(
+            cls.RECORD_TYPE,
+            cls.prefix_tag_filter(tag_filter),
+            page_size,
+            {"retrieveTags": False},
+        )
+        position = 0
+        try:
+            while True:
+                rows = await search.fetch(page_size)
+                if not rows:
+                    break
+                for record in rows:
+                    position += 1
+                    if position <= offset:
+                        continue
+                    vals = json.loads(record.value)
+                    if match_post_filter(
+                        vals,
+                        post_filter_positive,
+                        positive=True,
+                        alt=alt,
+                    ) and match_post_filter(
+                        vals,
+                        post_filter_negative,
+                        positive=False,
+                        alt=alt,
+                    ):
+                        yield position, cls.from_storage(record.id, vals)
+        finally:
+            await search.close()
+
+    @classmethod
+    async def query_iter(
+        cls,
+        session: ProfileSession,
+        tag_filter: dict = None,
+        *,
+        post_filter_positive: dict = None,
+        post_filter_negative: dict = None,
+        alt: bool = False,
+        cursor: str = None,
+        page_size: int = None,
+    ) -> AsyncIterator["BaseRecord"]:
+        """
+        Iterate over stored records, fetching them from storage page by page.
+
+        Args:
+            session: The profile session to use
+            tag_filter: An optional dictionary of tag filter clauses
+            post_filter_positive: Additional value filters to apply matching positively
+            post_filter_negative: Additional value filters to apply matching negatively
+            alt: set to match any (positive=True) value or miss all (positive=False)
+                values in post_filter
+            cursor: An optional continuation cursor returned by `query_page`
+            page_size: The number of storage rows to fetch at a time
+        """
+
+        rows = cls._query_rows(
+            session,
+            tag_filter,
+            post_filter_positive=post_filter_positive,
+            post_filter_negative=post_filter_negative,
+            alt=alt,
+            offset=decode_query_cursor(cursor),
+            page_size=page_size,
+        )
+        try:
+            async for _, record in rows:
+                yield record
+        finally:
+            await rows.aclose()
+
+    @classmethod
+    async def query_page(
+        cls,
+        session: ProfileSession,
+        tag_filter: dict = None,
+        *,
+        limit: int = None,
+        cursor: str = None,
+        post_filter_positive: dict = None,
+        post_filter_negative: dict = None,
+        alt: bool = False,
+    ) -> Tuple[Sequence["BaseRecord"], Optional[str]]:
+        """
+        Query a single page of stored records.
+
+        The cursor records an offset into the storage rows matching the tag
+        filter, as storage offers no stable position to resume from. Each page
+        rescans the rows before its offset, so walking all the pages of a large
+        result is quadratic in its size; and records added or removed between
+        pages shift the offset, so results may be skipped or repeated.
+
+        Args:
+            session: The profile session to use
+            tag_filter: An optional dictionary of tag filter clauses
+            limit: The maximum number of records to return, or None for all
+            cursor: An optional continuation cursor returned by a previous call
+            post_filter_positive: Additional value filters to apply matching positively
+            post_filter_negative: Additional value filters to apply matching negatively
+            alt: set to match any (positive=True) value or miss all (positive=False)
+                values in post_filter
+
+        Returns:
+            A tuple of the matching records and the cursor to pass to retrieve
+            the next page, which is None once the results are exhausted
+
+        """
+
+        if limit is not None and limit < 1:
+            raise BaseModelError("Query limit must be a positive integer")
+        rows = cls._query_rows(
+            session,
+            tag_filter,
+            post_filter_positive=post_filter_positive,
+            post_filter_negative=post_filter_negative,
+            alt=alt,
+            offset=decode_query_cursor(cursor),
+            page_size=limit,
+        )
+        result = []
+        next_cursor = None
+        try:
+            async for position, record in rows:
+                result.append(record)
+                if limit and len(result) >= limit:
+                    next_cursor = encode_query_cursor(position)
+                    break
+        finally:
+            await rows.aclose()
+        return result, next_cursor
+
     async def save(
         self,
         session: ProfileSession,
@@ -1,6 +1,8 @@
 """Base class for OpenAPI artifact schema."""
 
-from marshmallow import Schema, EXCLUDE
+from marshmallow import Schema, EXCLUDE, fields
+
+from ..valid import NATURAL_NUM
 
 
 class OpenAPISchema(Schema):
@@ -11,3 +13,17 @@ class OpenAPISchema(Schema):
 
         model_class = None
         unknown = EXCLUDE
+
+
+class PaginatedQuerySchema(OpenAPISchema):
+    """Parameters and validators for paginated record list query string."""
+
+    limit = fields.Int(
+        description="Maximum number of records to return (default all)",
+        required=False,
+        **NATURAL_NUM,
+    )
+    cursor = fields.Str(
+        description="Continuation cursor returned by a previous paginated query",
+        required=False,
+    )
@@ -15,7 +15,13 @@ from ....storage.base import (
 
 from ...util import time_now
 
-from ..base_record import BaseRecord, BaseRecordSchema, LOGGER
+from ..base import BaseModelError
+from ..base_record import (
+    BaseRecord,
+    BaseRecordSchema,
+    LOGGER,
+    encode_query_cursor,
+)
 
 
 class BaseRecordImpl(BaseRecord):
@@ -239,6 +245,78 @@ class TestBaseRecord(AsyncTestCase):
         )
         assert not result
 
+    async def test_query_page(self):
+        session = InMemoryProfile.test_session()
+        for i in range(5):
+            await ARecordImpl(
+                a=str(i), b="even" if i % 2 == 0 else "odd", code="red"
+            ).save(session)
+        await ARecordImpl(a="5", b="odd", code="blue").save(session)
+
+        result, cursor = await ARecordImpl.query_page(session, {"code": "red"}, limit=2)
+        assert [rec.a for rec in result] == ["0", "1"]
+        assert cursor
+        result, cursor = await ARecordImpl.query_page(
+            session, {"code": "red"}, limit=2, cursor=cursor
+        )
+        assert [rec.a for rec in result] == ["2", "3"]
+        result, cursor = await ARecordImpl.query_page(
+            session, {"code": "red"}, limit=2, cursor=cursor
+        )
+        assert [rec.a for rec in result] == ["4"]
+        assert cursor is None
+
+        # post-filtered rows do not count against the limit
+        result, cursor = await ARecordImpl.query_page(
+            session, {"code": "red"}, limit=2, post_filter_positive={"b": "even"}
+        )
+        assert [rec.a for rec in result] == ["0", "2"]
+        result, cursor = await ARecordImpl.query_page(
+            session,
+            {"code": "red"},
+            limit=2,
+            cursor=cursor,
+            post_filter_positive={"b": "even"},
+        )
+        assert [rec.a for rec in result] == ["4"]
+        assert cursor is None
+
+        # no limit returns all remaining
+        result, cursor = await ARecordImpl.query_page(session)
+        assert len(result) == 6 and cursor is None
+
+        with self.assertRaises(BaseModelError):
+            await ARecordImpl.query_page(session, limit=0)
+        with self.assertRaises(BaseModelError):
+            await ARecordImpl.query_page(session, limit=1, cursor="not-a-cursor")
+        with self.assertRaises(BaseModelError):
+            await ARecordImpl.query_page(
+                session, limit=1, cursor=encode_query_cursor(-1)
+            )
+
+    async def test_query_iter(self):
+        session = InMemoryProfile.test_session()
+        for i in range(5):
+            await ARecordImpl(a=str(i), b="b", code="red").save(session)
+
+        found = [
+            rec.a
+            async for rec in ARecordImpl.query_iter(
+                session, {"code": "red"}, page_size=2
+            )
+        ]
+        assert found == ["0", "1", "2", "3", "4"]
+
+        found = [
+            rec.a
+            async for rec in ARecordImpl.query_iter(
+                session,
+                post_filter_negative={"a": "3"},
+                cursor=encode_query_cursor(2),
+            )
+        ]
+        assert found == ["2", "4"]
+
     @async_mock.patch("builtins.print")
     def test_log_state(self, mock_print):
         test_param = "test.log"
@@ -10,6 +10,7 @@ from ..util import (
     encode,
     epoch_to_str,
     I32_BOUND,
+    raw_json_value,
     str_to_datetime,
     str_to_epoch,
     time_now,
@@ -17,6 +18,28 @@ from ..util import (
 
 
 class TestUtil(TestCase):
+    def test_raw_json_value(self):
+        raw = '{"@type": "forward", "msg" : {"a": [1, 2],  "b": null} , "to":"x"}'
+        assert raw_json_value(raw, "msg") == '{"a": [1, 2],  "b": null}'
+        assert raw_json_value(raw.encode("utf-8"), "to") == '"x"'
+        assert raw_json_value(raw, "missing") is None
+        assert raw_json_value('{"msg": 1, "msg": 2}', "msg") == "2"
+        raw = '{"m\\u0073g": {"a": "}]\\"{", "b": [[], {}]}, "to": "x"}'
+        assert raw_json_value(raw, "msg") == '{"a": "}]\\"{", "b": [[], {}]}'
+
+        for bad in (
+            "",
+            "{}",
+            "[1]",
+            '{"msg": 1',
+            '{"msg" 1}',
+            '{"a": 1 "b": 2}',
+            '{"msg": {"a": 1}',
+            "{1: 2}",
+        ):
+            assert raw_json_value(bad, "msg") is None
+        assert raw_json_value(b"\xff", "msg") is None
+
     def test_parse(self):
         now = datetime_now()
         assert isinstance(now, datetime)
@@ -1,18 +1,23 @@
 """Utils for messages."""
 
 
+import json
 import logging
 import re
 
 from datetime import datetime, timedelta, timezone
 from hashlib import sha256
 from math import floor
-from typing import Any, Union
+from typing import Any, Optional, Union
 
 
 LOGGER = logging.getLogger(__name__)
 I32_BOUND = 2 ** 31
 
+JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+JSON_DELIMITER = re.compile(r'["{}\[\]]')
+JSON_LITERAL = re.compile(r"[^,}\]\s]+")
+
 
 def datetime_to_str(dt: Union[str, datetime]) -> str:
     """Convert a datetime object to an indy-standard datetime string.
@@ -150,3 +155,102 @@ def canon(raw_attr_name: str) -> str:
     if raw_attr_name:  # do not dereference None, and "" is already canonical
         return raw_attr_name.replace(" ", "").lower()
     return raw_attr_name
+
+
+def _json_string_end(raw: str, start: int) -> Optional[int]:
+    """Find the end of the JSON string opening at an offset."""
+    idx = start + 1
+    while True:
+        idx = raw.find('"', idx)
+        if idx < 0:
+            return None
+        escape = idx - 1
+        while raw[escape] == "\\":
+            escape -= 1
+        idx += 1
+        # the quote is escaped by an odd number of backslashes
+        if (idx - escape) % 2 == 0:
+            return idx
+
+
+def _json_value_end(raw: str, start: int) -> Optional[int]:
+    """Find the end of the JSON value at an offset, without decoding it."""
+    if raw.startswith('"', start):
+        return _json_string_end(raw, start)
+    if raw.startswith(("{", "["), start):
+        depth = 0
+        idx = start
+        while True:
+            match = JSON_DELIMITER.search(raw, idx)
+            if not match:
+                return None
+            idx = match.start()
+            if raw[idx] == '"':
+                idx = _json_string_end(raw, idx)
+                if not idx:
+                    return None
+                continue
+            depth += 1 if raw[idx] in "{[" else -1
+            idx += 1
+            if not depth:
+                return idx
+    match = JSON_LITERAL.match(raw, start)
+    return match and match.end()
+
+
+def raw_json_value(raw: Union[str, bytes], key: str) -> Optional[str]:
+    """
+    Get the original JSON text of a top-level value in a JSON object.
+
+    The text is sliced from the input rather than re-serialized, so that it
+    can be passed on byte-for-byte. Values are delimited by scanning for their
+    closing quote or bracket, without decoding them: the input is expected to
+    be valid JSON, as already parsed by the caller.
+
+    Args:
+        raw: The JSON object text
+        key: The name of the top-level property
+
+    Returns:
+        The JSON text of the (last) value for the key, or None if the key is
+        missing or the input is not a JSON object
+
+    """
+    if isinstance(raw, bytes):
+        try:
+            raw = raw.decode("utf-8")
+        except UnicodeDecodeError:
+            return None
+
+    found = None
+    idx = JSON_WHITESPACE.match(raw).end()
+    if not raw.startswith("{", idx):
+        return None
+    idx = JSON_WHITESPACE.match(raw, idx + 1).end()
+    if raw.startswith("}", idx):
+        return None
+
+    while True:
+        end = raw.startswith('"', idx) and _json_string_end(raw, idx)
+        if not end:
+            return None
+        name = raw[idx:end]
+        try:
+            name = json.loads(name) if "\\" in name else name[1:-1]
+        except ValueError:
+            return None
+        idx = JSON_WHITESPACE.match(raw, end).end()
+        if not raw.startswith(":", idx):
+            return None
+        start = JSON_WHITESPACE.match(raw, idx + 1).end()
+        end = _json_value_end(raw, start)
+        if not end:
+            return None
+        if name == key:
+            found = raw[start:end]
+        idx = JSON_WHITESPACE.match(raw, end).end()
+        if raw.startswith("}", idx):
+            return found
+        if not raw.startswith(",", idx):
+            return None
+        idx = JSON_WHITESPACE.match(raw, idx + 1).end()
@@ -0,0 +1,342 @@
+"""Caches of open multitenant wallet profiles and subwallet routes."""
+
+import asyncio
+import logging
+import time
+
+from collections import OrderedDict
+from typing import Optional
+
+from ..core.profile import Profile
+from ..wallet.models.wallet_record import WalletRecord
+
+LOGGER = logging.getLogger(__name__)
+
+
+class ProfileCache:
+    """
+    Bounded cache of open subwallet profiles.
+
+    Profiles are evicted in least-recently-used order once the cache holds
+    more than `capacity` entries, and after `idle_timeout` seconds without
+    being accessed. Evicted profiles are closed, but a profile leased with
+    `acquire` is only closed once every lease on it has been released, so
+    that requests and messages still using it are not cut off.
+    """
+
+    def __init__(self, capacity: int = None, idle_timeout: float = None):
+        """
+        Initialize a `ProfileCache` instance.
+
+        Args:
+            capacity: Maximum number of open profiles to keep (None for no limit)
+            idle_timeout: Seconds after which unused profiles are closed
+                (None to keep them until evicted for capacity)
+
+        """
+        if capacity is not None and capacity < 1:
+            raise ValueError("Profile cache capacity must be a positive integer")
+        self.capacity = capacity
+        self.idle_timeout = idle_timeout
+        # wallet id -> (profile, last access time), least recently used first
+        self._profiles = OrderedDict()
+        # id of leased profile -> [profile, number of leases]
+        self._leases = {}
+        # id of leased profile removed from the cache -> wallet id, to close
+        # once released
+        self._retired = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        """Get the number of cached profiles."""
+        return len(self._profiles)
+
+    def has(self, key: str) -> bool:
+        """Check whether a profile is cached for the key, without touching it."""
+        return key in self._profiles
+
+    def get(self, key: str) -> Optional[Profile]:
+        """
+        Get a cached profile, marking it as recently used.
+
+        A profile evicted while still in use is returned to the cache, rather
+        than opening the wallet a second time.
+
+        Args:
+            key: The wallet id
+
+        Returns:
+            The cached profile, or None if not found
+
+        """
+        entry = self._profiles.get(key)
+        profile = entry[0] if entry else self._revive(key)
+        if not profile:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._profiles[key] = (profile, time.perf_counter())
+        self._profiles.move_to_end(key)
+        return profile
+
+    def _revive(self, key: str) -> Optional[Profile]:
+        """Take back a profile evicted while in use, which is not yet closed."""
+        for profile_id, retired_key in self._retired.items():
+            if retired_key == key:
+                del self._retired[profile_id]
+                return self._leases[profile_id][0]
+        return None
+
+    def peek(self, key: str) -> Optional[Profile]:
+        """Get a cached profile without updating its usage or the statistics."""
+        entry = self._profiles.get(key)
+        return entry[0] if entry else None
+
+    async def put(self, key: str, profile: Profile) -> Profile:
+        """
+        Add a profile to the cache, evicting idle or surplus profiles.
+
+        If a different profile is already cached for the key, it is kept, as
+        it may be in use, and the given profile is closed instead.
+
+        Args:
+            key: The wallet id
+            profile: The open profile
+
+        Returns:
+            The cached profile
+
+        """
+        entry = self._profiles.get(key)
+        if entry and entry[0] is not profile:
+            await self._close(key, profile)
+            profile = entry[0]
+        self._profiles[key] = (profile, time.perf_counter())
+        self._profiles.move_to_end(key)
+        await self.evict()
+        return profile
+
+    async def remove(self, key: str, close: bool = False) -> Optional[Profile]:
+        """
+        Remove a profile from the cache.
+
+        Args:
+            key: The wallet id
+            close: Whether to close the removed profile, once released
+
+        Returns:
+            The removed profile, or None if not found
+
+        """
+        entry = self._profiles.pop(key, None)
+        if not entry:
+            return None
+        if close:
+            await self._close(key, entry[0])
+        return entry[0]
+
+    def acquire(self, profile: Profile):
+        """
+        Lease a profile, deferring its closing until released.
+
+        Args:
+            profile: The profile in use
+
+        """
+        lease = self._leases.setdefault(id(profile), [profile, 0])
+        lease[1] += 1
+
+    def release(self, profile: Profile) -> Optional[asyncio.Future]:
+        """
+        Release a lease on a profile, closing it if evicted and no longer in use.
+
+        Args:
+            profile: The profile no longer in use
+
+        Returns:
+            The task closing the profile, if it was closed
+
+        """
+        lease = self._leases.get(id(profile))
+        if not lease:
+            return None
+        lease[1] -= 1
+        if lease[1] > 0:
+            return None
+        del self._leases[id(profile)]
+        key = self._retired.pop(id(profile), None)
+        if key is None:
+            return None
+        return asyncio.ensure_future(self._close(key, profile))
+
+    async def evict(self):
+        """Close and remove idle profiles and profiles exceeding the capacity."""
+        if self.idle_timeout is not None:
+            cutoff = time.perf_counter() - self.idle_timeout
+            # entries are kept in access order, so stop at the first recent one
+            while self._profiles:
+                key, (profile, accessed) = next(iter(self._profiles.items()))
+                if accessed > cutoff:
+                    break
+                del self._profiles[key]
+                self.evictions += 1
+                await self._close(key, profile)
+        if self.capacity is not None:
+            while len(self._profiles) > self.capacity:
+                key, (profile, _) = self._profiles.popitem(last=False)
+                self.evictions += 1
+                await self._close(key, profile)
+
+    async def clear(self):
+        """Close and remove all profiles, whether or not they are in use."""
+        while self._profiles:
+            key, (profile, _) = self._profiles.popitem(last=False)
+            self._leases.pop(id(profile), None)
+            await self._close(key, profile)
+        while self._retired:
+            profile_id, key = self._retired.popitem()
+            lease = self._leases.pop(profile_id, None)
+            if lease:
+                await self._close(key, lease[0])
+
+    async def _close(self, key: str, profile: Profile):
+        """Close an evicted profile, logging rather than raising on failure."""
+        if id(profile) in self._leases:
+            LOGGER.debug("Deferring close of profile in use for wallet %s", key)
+            self._retired[id(profile)] = key
+            return
+        LOGGER.debug("Closing profile for wallet %s", key)
+        try:
+            await profile.close()
+        except Exception:
+            LOGGER.exception("Error closing profile for wallet %s", key)
+
+    @property
+    def stats(self) -> dict:
+        """Get the cache statistics."""
+        return {
+            "size": len(self._profiles),
+            "capacity": self.capacity,
+            "in_use": len(self._leases),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+class RouteCache:
+    """
+    Bounded mapping of recipient verkeys to the subwallets they route to.
+
+    Keeps the wallet record for each wallet having at least one cached key,
+    so that inbound messages can be routed without storage lookups. Keys are
+    evicted in least-recently-used order once more than `capacity` are held.
+    """
+
+    def __init__(self, capacity: int = None):
+        """
+        Initialize a `RouteCache` instance.
+
+        Args:
+            capacity: Maximum number of recipient keys to keep (None for no limit)
+
+        """
+        if capacity is not None and capacity < 1:
+            raise ValueError("Route cache capacity must be a positive integer")
+        self.capacity = capacity
+        # recipient key -> wallet id, least recently used first
+        self._routes = OrderedDict()
+        # wallet id -> (wallet record, set of recipient keys)
+        self._wallets = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        """Get the number of cached recipient keys."""
+        return len(self._routes)
+
+    def get(self, recipient_key: str) -> Optional[WalletRecord]:
+        """
+        Get the wallet record a recipient key routes to.
+
+        Args:
+            recipient_key: The recipient verkey
+
+        Returns:
+            The wallet record, or None if the key is not cached
+
+        """
+        wallet_id = self._routes.get(recipient_key)
+        if not wallet_id:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._routes.move_to_end(recipient_key)
+        return self._wallets[wallet_id][0]
+
+    def get_wallet(self, wallet_id: str) -> Optional[WalletRecord]:
+        """Get a cached wallet record by wallet id."""
+        entry = self._wallets.get(wallet_id)
+        return entry[0] if entry else None
+
+    def put(self, recipient_key: str, wallet: WalletRecord):
+        """
+        Add or replace the route for a recipient key.
+
+        Args:
+            recipient_key: The recipient verkey
+            wallet: The wallet record the key routes to
+
+        """
+        self.remove(recipient_key)
+        wallet_id = wallet.wallet_id
+        entry = self._wallets.get(wallet_id)
+        self._wallets[wallet_id] = (wallet, entry[1] if entry else set())
+        self._wallets[wallet_id][1].add(recipient_key)
+        self._routes[recipient_key] = wallet_id
+        if self.capacity is not None:
+            while len(self._routes) > self.capacity:
+                key, _ = next(iter(self._routes.items()))
+                self.remove(key)
+                self.evictions += 1
+
+    def update_wallet(self, wallet: WalletRecord):
+        """Replace a cached wallet record, if present."""
+        entry = self._wallets.get(wallet.wallet_id)
+        if entry:
+            self._wallets[wallet.wallet_id] = (wallet, entry[1])
+
+    def remove(self, recipient_key: str):
+        """Remove the route for a recipient key, if present."""
+        wallet_id = self._routes.pop(recipient_key, None)
+        if wallet_id:
+            keys = self._wallets[wallet_id][1]
+            keys.discard(recipient_key)
+            if not keys:
+                del self._wallets[wallet_id]
+
+    def remove_wallet(self, wallet_id: str):
+        """Remove all routes to a wallet."""
+        entry = self._wallets.pop(wallet_id, None)
+        if entry:
+            for key in entry[1]:
+                del self._routes[key]
+
+    def clear(self):
+        """Remove all routes."""
+        self._routes.clear()
+        self._wallets.clear()
+
+    @property
+    def stats(self) -> dict:
+        """Get the cache statistics."""
+        return {
+            "size": len(self._routes),
+            "capacity": self.capacity,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
@@ -1,6 +1,8 @@
 """Manager for multitenancy."""
 
+import asyncio
 import logging
+import re
 import jwt
 from typing import List, Optional, cast
 
@@ -14,7 +16,13 @@ from ..config.injection_context import InjectionContext
 from ..wallet.models.wallet_record import WalletRecord
 from ..wallet.base import BaseWallet
 from ..core.error import BaseError
-from ..protocols.routing.v1_0.manager import RouteNotFoundError, RoutingManager
+from ..core.event_bus import Event, EventBus
+from ..protocols.routing.v1_0.manager import (
+    ROUTE_CREATED_EVENT,
+    ROUTE_DELETED_EVENT,
+    RouteNotFoundError,
+    RoutingManager,
+)
 from ..protocols.routing.v1_0.models.route_record import RouteRecord
 from ..transport.wire_format import BaseWireFormat
 from ..storage.base import BaseStorage
@@ -24,10 +32,17 @@ from ..protocols.coordinate_mediation.v1_0.manager import (
     MediationRecord,
 )
 
+from .cache import ProfileCache, RouteCache
 from .error import WalletKeyMissingError
 
 LOGGER = logging.getLogger(__name__)
 
+DEFAULT_ROUTE_CACHE_SIZE = 10000
+
+EVENT_PATTERN_ROUTE = re.compile(
+    f"^({re.escape(ROUTE_CREATED_EVENT)}|{re.escape(ROUTE_DELETED_EVENT)})$"
+)
+
 
 class MultitenantManagerError(BaseError):
     """Generic multitenant error."""
@@ -46,7 +61,76 @@ class MultitenantManager:
         if not profile:
             raise MultitenantManagerError("Missing profile")
 
-        self._instances: dict[str, Profile] = {}
+        self._profiles = ProfileCache(
+            profile.settings.get("multitenant.cache_size"),
+            profile.settings.get("multitenant.cache_idle_timeout"),
+        )
+        # wallet id -> task opening its profile, shared by concurrent callers
+        self._opening = {}
+        self._routes = RouteCache(
+            profile.settings.get(
+                "multitenant.route_cache_size", DEFAULT_ROUTE_CACHE_SIZE
+            )
+        )
+
+        event_bus = profile.inject(EventBus, required=False)
+        if event_bus:
+            event_bus.subscribe(EVENT_PATTERN_ROUTE, self._on_route_event)
+
+    @property
+    def profile_cache(self) -> ProfileCache:
+        """Accessor for the cache of open subwallet profiles."""
+        return self._profiles
+
+    @property
+    def route_cache(self) -> RouteCache:
+        """Accessor for the cache of recipient key to subwallet routes."""
+        return self._routes
+
+    @property
+    def stats(self) -> dict:
+        """Get the profile and route cache statistics."""
+        stats = {}
+        for prefix, cache in (
+            ("profile_cache", self._profiles),
+            ("route_cache", self._routes),
+        ):
+            for name, value in cache.stats.items():
+                stats[f"{prefix}_{name}"] = value
+        return stats
+
+    async def load_routes(self):
+        """Warm the route cache from the stored subwallet route records."""
+        async with self._profile.session() as session:
+            async for route in RouteRecord.query_iter(
+                session, {"role": RouteRecord.ROLE_SERVER}
+            ):
+                if not route.wallet_id:
+                    continue
+                if self._routes.capacity and len(self._routes) >= self._routes.capacity:
+                    break
+                wallet = self._routes.get_wallet(route.wallet_id)
+                if not wallet:
+                    try:
+                        wallet = await WalletRecord.retrieve_by_id(
+                            session, route.wallet_id
+                        )
+                    except StorageNotFoundError:
+                        continue
+                self._routes.put(route.recipient_key, wallet)
+        LOGGER.debug("Loaded %d subwallet routes", len(self._routes))
+
+    async def _on_route_event(self, profile: Profile, event: Event):
+        """Keep the route cache consistent with route record changes."""
+        if profile is not self._profile:
+            return
+        recipient_key = event.payload.get("recipient_key")
+        wallet_id = event.payload.get("wallet_id")
+        wallet = self._routes.get_wallet(wallet_id) if wallet_id else None
+        if event.topic == ROUTE_CREATED_EVENT and wallet:
+            self._routes.put(recipient_key, wallet)
+        else:
+            self._routes.remove(recipient_key)
 
     async def get_default_mediator(self) -> Optional[MediationRecord]:
         """Retrieve the default mediator used for subwallet routing.
@@ -142,37 +226,59 @@ class MultitenantManager:
 
         """
         wallet_id = wallet_record.wallet_id
-        if wallet_id not in self._instances:
-            # Extend base context
-            context = base_context.copy()
-
-            # Settings we don't want to use from base wallet
-            reset_settings = {
-                "wallet.recreate": False,
-                "wallet.seed": None,
-                "wallet.rekey": None,
-                "wallet.name": None,
-                "wallet.type": None,
-                "mediation.open": None,
-                "mediation.invite": None,
-                "mediation.default_id": None,
-                "mediation.clear": None,
-            }
-            extra_settings["admin.webhook_urls"] = self.get_webhook_urls(
-                base_context, wallet_record
-            )
+        await self._profiles.evict()
+        profile = self._profiles.get(wallet_id)
+        if profile:
+            return profile
 
-            context.settings = (
-                context.settings.extend(reset_settings)
-                .extend(wallet_record.settings)
-                .extend(extra_settings)
+        # concurrent callers share a single open of the wallet
+        opening = self._opening.get(wallet_id)
+        if not opening:
+            opening = asyncio.ensure_future(
+                self._open_profile(
+                    base_context, wallet_record, extra_settings, provision
+                )
             )
+            self._opening[wallet_id] = opening
+            opening.add_done_callback(lambda _: self._opening.pop(wallet_id, None))
+        return await asyncio.shield(opening)
+
+    async def _open_profile(
+        self,
+        base_context: InjectionContext,
+        wallet_record: WalletRecord,
+        extra_settings: dict,
+        provision: bool,
+    ) -> Profile:
+        """Open the profile for a wallet record and add it to the cache."""
+        # Extend base context
+        context = base_context.copy()
+
+        # Settings we don't want to use from base wallet
+        reset_settings = {
+            "wallet.recreate": False,
+            "wallet.seed": None,
+            "wallet.rekey": None,
+            "wallet.name": None,
+            "wallet.type": None,
+            "mediation.open": None,
+            "mediation.invite": None,
+            "mediation.default_id": None,
+            "mediation.clear": None,
+        }
+        extra_settings["admin.webhook_urls"] = self.get_webhook_urls(
+            base_context, wallet_record
+        )
 
-            # MTODO: add ledger config
-            profile, _ = await wallet_config(context, provision=provision)
-            self._instances[wallet_id] = profile
+        context.settings = (
+            context.settings.extend(reset_settings)
+            .extend(wallet_record.settings)
+            .extend(extra_settings)
+        )
 
-        return self._instances[wallet_id]
+        # MTODO: add ledger config
+        profile, _ = await wallet_config(context, provision=provision)
+        return await self._profiles.put(wallet_record.wallet_id, profile)
 
     async def create_wallet(
         self,
@@ -257,9 +363,11 @@ class MultitenantManager:
             wallet_record.update_settings(new_settings)
             await wallet_record.save(session)
 
+        self._routes.update_wallet(wallet_record)
+
         # update profile only if loaded
-        if wallet_id in self._instances:
-            profile = self._instances[wallet_id]
+        profile = self._profiles.peek(wallet_id)
+        if profile:
             profile.settings.update(wallet_record.settings)
 
             extra_settings = {
@@ -300,14 +408,19 @@ class MultitenantManager:
                 {"wallet.key": wallet_key},
             )
 
-            del self._instances[wallet_id]
+            await self._profiles.remove(wallet_id)
             await profile.remove()
 
             # Remove all routing records associated with wallet
             storage = session.inject(BaseStorage)
+            routes = await RouteRecord.query(session, {"wallet_id": wallet.wallet_id})
             await storage.delete_all_records(
                 RouteRecord.RECORD_TYPE, {"wallet_id": wallet.wallet_id}
             )
+            await RoutingManager(self._profile).clear_recipient_cache(
+                *(route.recipient_key for route in routes)
+            )
+            self._routes.remove_wallet(wallet.wallet_id)
 
             await wallet.delete_record(session)
 
@@ -432,6 +545,10 @@ class MultitenantManager:
         Returns:
             Wallet record associated with the recipient key
         """
+        wallet = self._routes.get(recipient_key)
+        if wallet:
+            return wallet
+
         routing_mgr = RoutingManager(self._profile)
 
         try:
@@ -441,8 +558,10 @@ class MultitenantManager:
                     session, routing_record.wallet_id
                 )
 
+            self._routes.put(recipient_key, wallet)
             return wallet
-        except (RouteNotFoundError):
+        except (RouteNotFoundError, StorageNotFoundError):
+            # the wallet may have been removed since its route was cached
             pass
 
     async def get_wallets_by_message(
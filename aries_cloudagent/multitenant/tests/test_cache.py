@@ -0,0 +1,198 @@
+from asynctest import TestCase as AsyncTestCase
+from asynctest import mock as async_mock
+
+from ...core.in_memory import InMemoryProfile
+from ...wallet.models.wallet_record import WalletRecord
+from ..cache import ProfileCache, RouteCache
+
+
+def mock_profile():
+    profile = InMemoryProfile.test_profile()
+    profile.close = async_mock.CoroutineMock()
+    return profile
+
+
+class TestProfileCache(AsyncTestCase):
+    async def test_init_x(self):
+        with self.assertRaises(ValueError):
+            ProfileCache(0)
+
+    async def test_get_put(self):
+        cache = ProfileCache(2)
+        profile = mock_profile()
+
+        assert cache.get("one") is None
+        await cache.put("one", profile)
+        assert cache.has("one")
+        assert cache.get("one") is profile
+        assert cache.stats == {
+            "size": 1,
+            "capacity": 2,
+            "in_use": 0,
+            "hits": 1,
+            "misses": 1,
+            "evictions": 0,
+        }
+
+        # the cached profile is kept over another opened for the same wallet
+        other = mock_profile()
+        assert await cache.put("one", other) is profile
+        other.close.assert_awaited_once_with()
+        profile.close.assert_not_called()
+        assert cache.peek("one") is profile
+
+    async def test_evict_lru(self):
+        cache = ProfileCache(2)
+        profiles = [mock_profile() for _ in range(3)]
+        await cache.put("0", profiles[0])
+        await cache.put("1", profiles[1])
+        cache.get("0")
+        await cache.put("2", profiles[2])
+
+        assert len(cache) == 2
+        assert cache.has("0") and cache.has("2")
+        assert not cache.has("1")
+        profiles[1].close.assert_awaited_once_with()
+        profiles[0].close.assert_not_called()
+        assert cache.evictions == 1
+
+    async def test_evict_idle(self):
+        cache = ProfileCache(idle_timeout=10)
+        profiles = [mock_profile() for _ in range(2)]
+        with async_mock.patch("time.perf_counter") as mock_time:
+            mock_time.return_value = 100
+            await cache.put("0", profiles[0])
+            mock_time.return_value = 105
+            await cache.put("1", profiles[1])
+
+            mock_time.return_value = 112
+            await cache.evict()
+            assert not cache.has("0")
+            assert cache.has("1")
+            profiles[0].close.assert_awaited_once_with()
+
+            cache.get("1")
+            mock_time.return_value = 120
+            await cache.evict()
+            assert cache.has("1")
+
+    async def test_evict_leased(self):
+        cache = ProfileCache(1)
+        profiles = [mock_profile() for _ in range(2)]
+        await cache.put("0", profiles[0])
+        cache.acquire(profiles[0])
+        cache.acquire(profiles[0])
+        await cache.put("1", profiles[1])
+
+        # evicted, but closed only once released by every user
+        assert not cache.has("0")
+        assert cache.stats["in_use"] == 1
+        assert cache.release(profiles[0]) is None
+        profiles[0].close.assert_not_called()
+        await cache.release(profiles[0])
+        profiles[0].close.assert_awaited_once_with()
+        assert cache.release(profiles[0]) is None
+
+        # released without having been evicted
+        cache.acquire(profiles[1])
+        assert cache.release(profiles[1]) is None
+        profiles[1].close.assert_not_called()
+
+    async def test_get_revives_leased(self):
+        cache = ProfileCache(1)
+        profiles = [mock_profile() for _ in range(2)]
+        await cache.put("0", profiles[0])
+        cache.acquire(profiles[0])
+        await cache.put("1", profiles[1])
+        assert not cache.has("0")
+
+        # still open, so taken back rather than opened again
+        assert cache.get("0") is profiles[0]
+        assert cache.has("0")
+        assert cache.release(profiles[0]) is None
+        profiles[0].close.assert_not_called()
+
+    async def test_remove_clear(self):
+        cache = ProfileCache()
+        profiles = [mock_profile() for _ in range(3)]
+        for i, profile in enumerate(profiles):
+            await cache.put(str(i), profile)
+
+        assert await cache.remove("0") is profiles[0]
+        profiles[0].close.assert_not_called()
+        assert await cache.remove("1", close=True) is profiles[1]
+        profiles[1].close.assert_awaited_once_with()
+        assert await cache.remove("missing") is None
+
+        profiles[2].close.side_effect = Exception("close failed")
+        await cache.clear()
+        assert not len(cache)
+
+    async def test_clear_leased(self):
+        cache = ProfileCache()
+        profiles = [mock_profile() for _ in range(2)]
+        for i, profile in enumerate(profiles):
+            await cache.put(str(i), profile)
+            cache.acquire(profile)
+        await cache.remove("1", close=True)
+        profiles[1].close.assert_not_called()
+
+        # shutdown closes profiles still in use
+        await cache.clear()
+        for profile in profiles:
+            profile.close.assert_awaited_once_with()
+        assert cache.stats["in_use"] == 0
+
+
+class TestRouteCache(AsyncTestCase):
+    async def test_init_x(self):
+        with self.assertRaises(ValueError):
+            RouteCache(0)
+
+    async def test_get_put_remove(self):
+        cache = RouteCache()
+        wallet = WalletRecord(wallet_id="wallet-1")
+
+        assert cache.get("key-1") is None
+        cache.put("key-1", wallet)
+        cache.put("key-2", wallet)
+        assert cache.get("key-1") is wallet
+        assert cache.get_wallet("wallet-1") is wallet
+        assert cache.stats["hits"] == 1 and cache.stats["misses"] == 1
+
+        updated = WalletRecord(wallet_id="wallet-1")
+        cache.update_wallet(updated)
+        assert cache.get("key-2") is updated
+        cache.update_wallet(WalletRecord(wallet_id="wallet-2"))
+        assert cache.get_wallet("wallet-2") is None
+
+        # moving a key to another wallet
+        other = WalletRecord(wallet_id="wallet-2")
+        cache.put("key-2", other)
+        assert cache.get("key-2") is other
+
+        cache.remove("key-1")
+        assert cache.get_wallet("wallet-1") is None
+        cache.remove("key-1")
+
+        cache.put("key-3", other)
+        cache.remove_wallet("wallet-2")
+        assert not len(cache)
+        cache.remove_wallet("wallet-2")
+
+        cache.put("key-1", wallet)
+        cache.clear()
+        assert cache.get("key-1") is None
+
+    async def test_evict_lru(self):
+        cache = RouteCache(2)
+        wallet = WalletRecord(wallet_id="wallet-1")
+        cache.put("key-1", wallet)
+        cache.put("key-2", wallet)
+        cache.get("key-1")
+        cache.put("key-3", wallet)
+
+        assert cache.get("key-2") is None
+        assert cache.get("key-1") is wallet
+        assert cache.get("key-3") is wallet
+        assert cache.evictions == 1
@@ -1,8 +1,12 @@
+import asyncio
 from asynctest import TestCase as AsyncTestCase
 from asynctest import mock as async_mock
 
 import jwt
 
+from ...cache.base import BaseCache
+from ...cache.in_memory import InMemoryCache
+from ...core.event_bus import Event, EventBus
 from ...core.in_memory import InMemoryProfile
 from ...config.base import InjectionError
 from ...messaging.responder import BaseResponder
@@ -11,7 +15,7 @@ from ...wallet.in_memory import InMemoryWallet
 from ...wallet.did_info import DIDInfo
 from ...storage.error import StorageNotFoundError
 from ...storage.in_memory import InMemoryStorage
-from ...protocols.routing.v1_0.manager import RoutingManager
+from ...protocols.routing.v1_0.manager import ROUTE_DELETED_EVENT, RoutingManager
 from ...protocols.routing.v1_0.models.route_record import RouteRecord
 from ...protocols.coordinate_mediation.v1_0.manager import (
     MediationRecord,
@@ -89,7 +93,7 @@ class TestMultitenantManager(AsyncTestCase):
 
     async def test_get_wallet_profile_returns_from_cache(self):
         wallet_record = WalletRecord(wallet_id="test")
-        self.manager._instances["test"] = InMemoryProfile.test_profile()
+        await self.manager.profile_cache.put("test", InMemoryProfile.test_profile())
 
         with async_mock.patch(
             "aries_cloudagent.config.wallet.wallet_config"
@@ -97,12 +101,12 @@ class TestMultitenantManager(AsyncTestCase):
             profile = await self.manager.get_wallet_profile(
                 self.profile.context, wallet_record
             )
-            assert profile is self.manager._instances["test"]
+            assert profile is self.manager.profile_cache.peek("test")
             wallet_config.assert_not_called()
 
     async def test_get_wallet_profile_not_in_cache(self):
         wallet_record = WalletRecord(wallet_id="test", settings={})
-        self.manager._instances["test"] = InMemoryProfile.test_profile()
+        await self.manager.profile_cache.put("test", InMemoryProfile.test_profile())
         self.profile.context.update_settings(
             {"admin.webhook_urls": ["http://localhost:8020"]}
         )
@@ -113,9 +117,42 @@ class TestMultitenantManager(AsyncTestCase):
             profile = await self.manager.get_wallet_profile(
                 self.profile.context, wallet_record
             )
-            assert profile is self.manager._instances["test"]
+            assert profile is self.manager.profile_cache.peek("test")
             wallet_config.assert_not_called()
 
+    async def test_get_wallet_profile_single_flight(self):
+        wallet_record = WalletRecord(wallet_id="test", settings={})
+        opened = asyncio.Event()
+
+        async def side_effect(context, provision):
+            await opened.wait()
+            return (InMemoryProfile(context=context), None)
+
+        with async_mock.patch(
+            "aries_cloudagent.multitenant.manager.wallet_config"
+        ) as wallet_config:
+            wallet_config.side_effect = side_effect
+            pending = [
+                asyncio.ensure_future(
+                    self.manager.get_wallet_profile(self.profile.context, wallet_record)
+                )
+                for _ in range(2)
+            ]
+            await asyncio.sleep(0)
+            opened.set()
+            first, second = await asyncio.gather(*pending)
+
+            assert first is second
+            assert first is self.manager.profile_cache.peek("test")
+            wallet_config.assert_called_once()
+
+    async def test_stats(self):
+        await self.manager.profile_cache.put("test", InMemoryProfile.test_profile())
+        stats = self.manager.stats
+        assert stats["profile_cache_size"] == 1
+        assert stats["profile_cache_capacity"] is None
+        assert stats["route_cache_size"] == 0
+
     async def test_get_wallet_profile_settings(self):
         extra_settings = {"extra_settings": "extra_settings"}
         all_wallet_record_settings = [
@@ -294,8 +331,8 @@ class TestMultitenantManager(AsyncTestCase):
         async with self.profile.session() as session:
             await route_record.save(session)
 
-        with self.assertRaises(StorageNotFoundError):
-            await self.manager._get_wallet_by_key(recipient_key)
+        # a route left behind by a removed wallet
+        assert await self.manager._get_wallet_by_key(recipient_key) is None
 
     async def test_get_wallet_by_key(self):
         recipient_key = "test-recipient-key"
@@ -313,6 +350,58 @@ class TestMultitenantManager(AsyncTestCase):
 
         assert isinstance(wallet, WalletRecord)
 
+        # subsequent lookups are served from the route cache
+        with async_mock.patch.object(
+            RoutingManager, "get_recipient", async_mock.CoroutineMock()
+        ) as get_recipient:
+            assert await self.manager._get_wallet_by_key(recipient_key) is wallet
+            get_recipient.assert_not_called()
+
+    async def test_load_routes(self):
+        wallet_record = WalletRecord(settings={})
+        async with self.profile.session() as session:
+            await wallet_record.save(session)
+            for key in ("key-1", "key-2"):
+                await RouteRecord(
+                    wallet_id=wallet_record.wallet_id, recipient_key=key
+                ).save(session)
+            await RouteRecord(connection_id="conn-id", recipient_key="conn-key").save(
+                session
+            )
+            await RouteRecord(wallet_id="missing", recipient_key="key-3").save(session)
+
+        await self.manager.load_routes()
+
+        assert len(self.manager.route_cache) == 2
+        assert (
+            self.manager.route_cache.get("key-1").wallet_id == wallet_record.wallet_id
+        )
+        assert self.manager.route_cache.get("conn-key") is None
+
+    async def test_route_events(self):
+        event_bus = EventBus()
+        self.profile.context.injector.bind_instance(EventBus, event_bus)
+        manager = MultitenantManager(self.profile)
+        wallet_record = WalletRecord(wallet_id="test-wallet", settings={})
+        manager.route_cache.put("key-1", wallet_record)
+
+        routing_mgr = RoutingManager(self.profile)
+        route = await routing_mgr.create_route_record(
+            recipient_key="key-2", internal_wallet_id="test-wallet"
+        )
+        assert manager.route_cache.get("key-2") is wallet_record
+
+        await routing_mgr.delete_route_record(route)
+        assert manager.route_cache.get("key-2") is None
+        assert manager.route_cache.get("key-1") is wallet_record
+
+        # events for other profiles are ignored
+        await event_bus.notify(
+            InMemoryProfile.test_profile(),
+            Event(ROUTE_DELETED_EVENT, {"recipient_key": "key-1"}),
+        )
+        assert manager.route_cache.get("key-1") is wallet_record
+
     async def test_create_wallet_removes_key_only_unmanaged_mode(self):
         with async_mock.patch.object(
             MultitenantManager, "get_wallet_profile"
@@ -422,7 +511,7 @@ class TestMultitenantManager(AsyncTestCase):
         ) as wallet_record_save:
             wallet_id = "test-wallet-id"
             wallet_profile = InMemoryProfile.test_profile()
-            self.manager._instances["test-wallet-id"] = wallet_profile
+            await self.manager.profile_cache.put("test-wallet-id", wallet_profile)
             retrieve_by_id.return_value = WalletRecord(
                 wallet_id=wallet_id,
                 settings={
@@ -477,13 +566,13 @@ class TestMultitenantManager(AsyncTestCase):
             )
             wallet_profile = InMemoryProfile.test_profile()
 
-            self.manager._instances["test"] = wallet_profile
+            await self.manager.profile_cache.put("test", wallet_profile)
             retrieve_by_id.return_value = wallet_record
             get_wallet_profile.return_value = wallet_profile
 
             await self.manager.remove_wallet("test")
 
-            assert "test" not in self.manager._instances
+            assert not self.manager.profile_cache.has("test")
             get_wallet_profile.assert_called_once_with(
                 self.profile.context, wallet_record, {"wallet.key": "test_key"}
             )
@@ -493,6 +582,30 @@ class TestMultitenantManager(AsyncTestCase):
                 RouteRecord.RECORD_TYPE, {"wallet_id": "test"}
             )
 
+    async def test_remove_wallet_clears_recipient_cache(self):
+        cache = InMemoryCache()
+        self.context.injector.bind_instance(BaseCache, cache)
+        wallet_record = WalletRecord(
+            key_management_mode=WalletRecord.MODE_UNMANAGED,
+            settings={"wallet.type": "indy", "wallet.key": "test_key"},
+        )
+        async with self.profile.session() as session:
+            await wallet_record.save(session)
+        await RoutingManager(self.profile).create_route_record(
+            recipient_key="test-key", internal_wallet_id=wallet_record.wallet_id
+        )
+        assert await self.manager._get_wallet_by_key("test-key")
+        assert await cache.get("routing::recipient::test-key")
+
+        with async_mock.patch.object(
+            MultitenantManager, "get_wallet_profile"
+        ) as get_wallet_profile, async_mock.patch.object(InMemoryProfile, "remove"):
+            get_wallet_profile.return_value = InMemoryProfile.test_profile()
+            await self.manager.remove_wallet(wallet_record.wallet_id)
+
+        assert not await cache.get("routing::recipient::test-key")
+        assert await self.manager._get_wallet_by_key("test-key") is None
+
     async def test_add_key_no_mediation(self):
         with async_mock.patch.object(
             RoutingManager, "create_route_record"
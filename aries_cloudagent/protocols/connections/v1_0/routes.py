@@ -16,7 +16,7 @@ from marshmallow import fields, validate, validates_schema
 from ....admin.request_context import AdminRequestContext
 from ....connections.models.conn_record import ConnRecord, ConnRecordSchema
 from ....messaging.models.base import BaseModelError
-from ....messaging.models.openapi import OpenAPISchema
+from ....messaging.models.openapi import OpenAPISchema, PaginatedQuerySchema
 from ....messaging.valid import (
     ENDPOINT,
     INDY_DID,
@@ -45,6 +45,10 @@ class ConnectionListSchema(OpenAPISchema):
         fields.Nested(ConnRecordSchema()),
         description="List of connection records",
     )
+    next_cursor = fields.Str(
+        description="Cursor to retrieve the next page of results, if any",
+        required=False,
+    )
 
 
 class ConnectionMetadataSchema(OpenAPISchema):
@@ -166,7 +170,7 @@ class ConnectionStaticResultSchema(OpenAPISchema):
     record = fields.Nested(ConnRecordSchema, required=True)
 
 
-class ConnectionsListQueryStringSchema(OpenAPISchema):
+class ConnectionsListQueryStringSchema(PaginatedQuerySchema):
     """Parameters and validators for connections list request query string."""
 
     alias = fields.Str(
@@ -339,17 +343,29 @@ async def connections_list(request: web.BaseRequest):
             v for v in ConnRecord.Role.get(request.query["their_role"]).value
         ]
 
+    limit = request.query.get("limit")
+
     session = await context.session()
     try:
-        records = await ConnRecord.query(
-            session, tag_filter, post_filter_positive=post_filter, alt=True
+        records, next_cursor = await ConnRecord.query_page(
+            session,
+            tag_filter,
+            limit=int(limit) if limit else None,
+            cursor=request.query.get("cursor"),
+            post_filter_positive=post_filter,
+            alt=True,
         )
         results = [record.serialize() for record in records]
-        results.sort(key=connection_sort_key)
+        if not limit:
+            # pages are left in storage order, which is consistent across pages
+            results.sort(key=connection_sort_key)
     except (StorageError, BaseModelError) as err:
         raise web.HTTPBadRequest(reason=err.roll_up) from err
 
-    return web.json_response({"results": results})
+    response = {"results": results}
+    if next_cursor:
+        response["next_cursor"] = next_cursor
+    return web.json_response(response)
 
 
 @docs(tags=["connection"], summary="Fetch a single connection record")
@@ -38,7 +38,7 @@ class TestConnectionRoutes(AsyncTestCase):
         with async_mock.patch.object(
             test_module, "ConnRecord", autospec=True
         ) as mock_conn_rec:
-            mock_conn_rec.query = async_mock.CoroutineMock()
+            mock_conn_rec.query_page = async_mock.CoroutineMock()
             mock_conn_rec.Role = async_mock.MagicMock(return_value=ROLE_REQUESTER)
             mock_conn_rec.State = async_mock.MagicMock(
                 COMPLETED=STATE_COMPLETED,
@@ -78,7 +78,10 @@ class TestConnectionRoutes(AsyncTestCase):
                     )
                 ),
             ]
-            mock_conn_rec.query.return_value = [conns[2], conns[0], conns[1]]  # jumbled
+            mock_conn_rec.query_page.return_value = (
+                [conns[2], conns[0], conns[1]],  # jumbled
+                None,
+            )
 
             with async_mock.patch.object(
                 test_module.web, "json_response"
@@ -113,13 +116,51 @@ class TestConnectionRoutes(AsyncTestCase):
                 COMPLETED=STATE_COMPLETED,
                 get=async_mock.MagicMock(return_value=ConnRecord.State.COMPLETED),
             )
-            mock_conn_rec.query = async_mock.CoroutineMock(
+            mock_conn_rec.query_page = async_mock.CoroutineMock(
                 side_effect=test_module.StorageError()
             )
 
             with self.assertRaises(test_module.web.HTTPBadRequest):
                 await test_module.connections_list(self.request)
 
+    async def test_connections_list_paginated(self):
+        self.request.query = {"limit": "1", "cursor": "dummy"}
+
+        with async_mock.patch.object(
+            test_module, "ConnRecord", autospec=True
+        ) as mock_conn_rec:
+            mock_conn_rec.State = ConnRecord.State
+            conn = async_mock.MagicMock(
+                serialize=async_mock.MagicMock(
+                    return_value={
+                        "state": ConnRecord.State.COMPLETED.rfc23,
+                        "created_at": "1234567890",
+                    }
+                )
+            )
+            mock_conn_rec.query_page = async_mock.CoroutineMock(
+                return_value=([conn], "next")
+            )
+
+            with async_mock.patch.object(
+                test_module.web, "json_response"
+            ) as mock_response:
+                await test_module.connections_list(self.request)
+                mock_conn_rec.query_page.assert_awaited_once_with(
+                    async_mock.ANY,
+                    {},
+                    limit=1,
+                    cursor="dummy",
+                    post_filter_positive={},
+                    alt=True,
+                )
+                mock_response.assert_called_once_with(
+                    {
+                        "results": [conn.serialize.return_value],
+                        "next_cursor": "next",
+                    }
+                )
+
     async def test_connections_retrieve(self):
         self.request.match_info = {"conn_id": "dummy"}
         mock_conn_rec = async_mock.MagicMock()
@@ -589,6 +589,9 @@ class MediationManager:
             await record_for_saving.save(session, reason="Route successfully added.")
         for record_for_removal in to_remove:
             await record_for_removal.delete_record(session)
+        await RoutingManager(self._profile).clear_recipient_cache(
+            *(record.recipient_key for record in to_save + to_remove)
+        )
 
     async def get_my_keylist(
         self, connection_id: Optional[str] = None
@@ -382,7 +382,13 @@ class TestMediationManager:  # pylint: disable=R0904,W0621
                 result=KeylistUpdated.RESULT_SUCCESS,
             ),
         ]
-        await manager.store_update_results(TEST_CONN_ID, results)
+        with async_mock.patch.object(
+            test_module.RoutingManager,
+            "clear_recipient_cache",
+            async_mock.CoroutineMock(),
+        ) as mock_clear_cache:
+            await manager.store_update_results(TEST_CONN_ID, results)
+            mock_clear_cache.assert_awaited_once_with(TEST_ROUTE_VERKEY, TEST_VERKEY)
         routes = await RouteRecord.query(session)
 
         assert len(routes) == 1
@@ -537,7 +537,7 @@ class CredentialManager:
                     cred_ex_record.revoc_reg_id = active_rev_reg_rec.revoc_reg_id
 
                     tails_path = rev_reg.tails_local_path
-                    await rev_reg.get_or_fetch_local_tails_path()
+                    await rev_reg.get_or_fetch_local_tails_path(self._profile)
 
                 except StorageNotFoundError:
                     async with self._profile.session() as session:
@@ -703,6 +703,10 @@ class CredentialManager:
             cred_ex_record.state = V10CredentialExchange.STATE_CREDENTIAL_RECEIVED
 
             await cred_ex_record.save(session, reason="receive credential")
+
+        if raw_credential.get("rev_reg_id"):
+            # fetch the tails file before the credential is stored
+            IndyRevocation(self._profile).prefetch_tails(raw_credential["rev_reg_id"])
         return cred_ex_record
 
     async def store_credential(
@@ -752,7 +756,7 @@ class CredentialManager:
 
         if revoc_reg_def:
             revoc_reg = RevocationRegistry.from_definition(revoc_reg_def, True)
-            await revoc_reg.get_or_fetch_local_tails_path()
+            await revoc_reg.get_or_fetch_local_tails_path(self._profile)
         try:
             credential_id = await holder.store_credential(
                 credential_definition,
@@ -330,7 +330,7 @@ class IndyCredFormatHandler(V20CredFormatHandler):
                 rev_reg_id = active_rev_reg_rec.revoc_reg_id
 
                 tails_path = rev_reg.tails_local_path
-                await rev_reg.get_or_fetch_local_tails_path()
+                await rev_reg.get_or_fetch_local_tails_path(self.profile)
 
             except StorageNotFoundError:
                 async with self.profile.session() as session:
@@ -455,6 +455,10 @@ class IndyCredFormatHandler(V20CredFormatHandler):
 
         Validation is done in the store credential step.
         """
+        cred = cred_issue_message.attachment(IndyCredFormatHandler.format)
+        if cred.get("rev_reg_id"):
+            # fetch the tails file before the credential is stored
+            IndyRevocation(self.profile).prefetch_tails(cred["rev_reg_id"])
 
     async def store_credential(
         self, cred_ex_record: V20CredExRecord, cred_id: str = None
@@ -477,7 +481,7 @@ class IndyCredFormatHandler(V20CredFormatHandler):
 
         if rev_reg_def:
             rev_reg = RevocationRegistry.from_definition(rev_reg_def, True)
-            await rev_reg.get_or_fetch_local_tails_path()
+            await rev_reg.get_or_fetch_local_tails_path(self.profile)
         try:
             detail_record = await self.get_detail_record(cred_ex_record.cred_ex_id)
             if detail_record is None:
@@ -21,7 +21,7 @@ from ....indy.issuer import IndyIssuerError
 from ....ledger.error import LedgerError
 from ....messaging.decorators.attach_decorator import AttachDecorator
 from ....messaging.models.base import BaseModelError
-from ....messaging.models.openapi import OpenAPISchema
+from ....messaging.models.openapi import OpenAPISchema, PaginatedQuerySchema
 from ....messaging.valid import (
     ENDPOINT,
     INDY_CRED_DEF_ID,
@@ -55,7 +55,7 @@ class V20IssueCredentialModuleResponseSchema(OpenAPISchema):
     """Response schema for v2.0 Issue Credential Module."""
 
 
-class V20CredExRecordListQueryStringSchema(OpenAPISchema):
+class V20CredExRecordListQueryStringSchema(PaginatedQuerySchema):
     """Parameters and validators for credential exchange record list query."""
 
     connection_id = fields.UUID(
@@ -118,6 +118,10 @@ class V20CredExRecordListResultSchema(OpenAPISchema):
         fields.Nested(V20CredExRecordDetailSchema),
         description="Credential exchange records and corresponding detail records",
     )
+    next_cursor = fields.Str(
+        description="Cursor to retrieve the next page of results, if any",
+        required=False,
+    )
 
 
 class V20CredStoreRequestSchema(OpenAPISchema):
@@ -421,11 +425,15 @@ async def credential_exchange_list(request: web.BaseRequest):
         if request.query.get(k, "") != ""
     }
 
+    limit = request.query.get("limit")
+
     try:
         async with context.session() as session:
-            cred_ex_records = await V20CredExRecord.query(
+            cred_ex_records, next_cursor = await V20CredExRecord.query_page(
                 session=session,
                 tag_filter=tag_filter,
+                limit=int(limit) if limit else None,
+                cursor=request.query.get("cursor"),
                 post_filter_positive=post_filter,
             )
 
@@ -437,7 +445,10 @@ async def credential_exchange_list(request: web.BaseRequest):
     except (StorageError, BaseModelError) as err:
         raise web.HTTPBadRequest(reason=err.roll_up) from err
 
-    return web.json_response({"results": results})
+    response = {"results": results}
+    if next_cursor:
+        response["next_cursor"] = next_cursor
+    return web.json_response(response)
 
 
 @docs(
@@ -91,7 +91,9 @@ class TestV20CredRoutes(AsyncTestCase):
         with async_mock.patch.object(
             test_module, "V20CredExRecord", autospec=True
         ) as mock_cx_rec:
-            mock_cx_rec.query = async_mock.CoroutineMock(return_value=[mock_cx_rec])
+            mock_cx_rec.query_page = async_mock.CoroutineMock(
+                return_value=([mock_cx_rec], None)
+            )
             mock_cx_rec.serialize = async_mock.MagicMock(
                 return_value={"hello": "world"}
             )
@@ -125,12 +127,48 @@ class TestV20CredRoutes(AsyncTestCase):
         ) as mock_cx_rec:
             mock_cx_rec.connection_id = "conn-123"
             mock_cx_rec.thread_id = "conn-123"
-            mock_cx_rec.query = async_mock.CoroutineMock(
+            mock_cx_rec.query_page = async_mock.CoroutineMock(
                 side_effect=test_module.StorageError()
             )
             with self.assertRaises(test_module.web.HTTPBadRequest):
                 await test_module.credential_exchange_list(self.request)
 
+    async def test_credential_exchange_list_paginated(self):
+        self.request.query = {"limit": "1", "cursor": "dummy"}
+
+        with async_mock.patch.object(
+            test_module, "V20CredExRecord", autospec=True
+        ) as mock_cx_rec, async_mock.patch.object(
+            test_module.web, "json_response"
+        ) as mock_response:
+            mock_cx_rec.query_page = async_mock.CoroutineMock(
+                return_value=([mock_cx_rec], "next")
+            )
+            mock_cx_rec.serialize = async_mock.MagicMock(
+                return_value={"hello": "world"}
+            )
+
+            await test_module.credential_exchange_list(self.request)
+            mock_cx_rec.query_page.assert_awaited_once_with(
+                session=async_mock.ANY,
+                tag_filter={},
+                limit=1,
+                cursor="dummy",
+                post_filter_positive={},
+            )
+            mock_response.assert_called_once_with(
+                {
+                    "results": [
+                        {
+                            "cred_ex_record": mock_cx_rec.serialize.return_value,
+                            "indy": None,
+                            "ld_proof": None,
+                        }
+                    ],
+                    "next_cursor": "next",
+                }
+            )
+
     async def test_credential_exchange_retrieve(self):
         self.request.match_info = {"cred_ex_id": "dummy"}
 
@@ -10,7 +10,9 @@ from ....core.profile import Profile
 from ....indy.holder import IndyHolder, IndyHolderError
 from ....indy.models.xform import indy_proof_req2non_revoc_intervals
 from ....ledger.base import BaseLedger
+from ....ledger.fetcher import LedgerArtifactFetcher
 from ....revocation.models.revocation_registry import RevocationRegistry
+from ....revocation.models.revocation_state_cache import RevocationStateCache
 
 from ..v1_0.models.presentation_exchange import V10PresentationExchange
 from ..v2_0.messages.pres_format import V20PresFormat
@@ -34,6 +36,12 @@ class IndyPresExchHandler:
         super().__init__()
         self._profile = profile
 
+    def _ledger_fetcher(self, ledger: BaseLedger) -> LedgerArtifactFetcher:
+        """Get a fetcher for the ledger artifacts of a presentation."""
+        return LedgerArtifactFetcher(
+            ledger, self._profile.settings.get("ledger.max_concurrent_fetches")
+        )
+
     async def return_presentation(
         self,
         pres_ex_record: Union[V10PresentationExchange, V20PresExRecord],
@@ -82,65 +90,61 @@ class IndyPresExchHandler:
                         f"Removed superfluous timestamp from requested_credentials {r} "
                         f"{reft} for non-revocable credential {req_item['cred_id']}"
                     )
-        # Get all schemas, credential definitions, and revocation registries in use
-        ledger = self._profile.inject(BaseLedger)
-        schemas = {}
-        cred_defs = {}
-        revocation_registries = {}
-        async with ledger:
-            for credential in credentials.values():
-                schema_id = credential["schema_id"]
-                if schema_id not in schemas:
-                    schemas[schema_id] = await ledger.get_schema(schema_id)
-                cred_def_id = credential["cred_def_id"]
-                if cred_def_id not in cred_defs:
-                    cred_defs[cred_def_id] = await ledger.get_credential_definition(
-                        cred_def_id
-                    )
-                if credential.get("rev_reg_id"):
-                    revocation_registry_id = credential["rev_reg_id"]
-                    if revocation_registry_id not in revocation_registries:
-                        revocation_registries[
-                            revocation_registry_id
-                        ] = RevocationRegistry.from_definition(
-                            await ledger.get_revoc_reg_def(revocation_registry_id), True
-                        )
-        # Get delta with non-revocation interval defined in "non_revoked"
+        # Find the non-revocation interval defined in "non_revoked"
         # of the presentation request or attributes
         epoch_now = int(time.time())
-        revoc_reg_deltas = {}
+        cred_intervals = {}
+        for precis in requested_referents.values():  # cred_id, non-revoc interval
+            credential_id = precis["cred_id"]
+            rev_reg_id = credentials[credential_id].get("rev_reg_id")
+            reft_non_revoc_interval = precis.get("non_revoked")
+            # often one cred satisfies many requested attrs/preds:
+            # the first non-revocation interval found applies to all
+            if (
+                rev_reg_id
+                and reft_non_revoc_interval
+                and credential_id not in cred_intervals
+            ):
+                cred_intervals[credential_id] = (
+                    rev_reg_id,
+                    reft_non_revoc_interval.get("from", 0),
+                    reft_non_revoc_interval.get("to", epoch_now),
+                )
+        # Get all schemas, credential definitions, revocation registries and
+        # deltas in use, concurrently
+        ledger = self._profile.inject(BaseLedger)
         async with ledger:
-            for precis in requested_referents.values():  # cred_id, non-revoc interval
-                credential_id = precis["cred_id"]
-                if not credentials[credential_id].get("rev_reg_id"):
-                    continue
-                if "timestamp" in precis:
-                    continue
-                rev_reg_id = credentials[credential_id]["rev_reg_id"]
-                reft_non_revoc_interval = precis.get("non_revoked")
-                if reft_non_revoc_interval:
-                    key = (
-                        f"{rev_reg_id}_"
-                        f"{reft_non_revoc_interval.get('from', 0)}_"
-                        f"{reft_non_revoc_interval.get('to', epoch_now)}"
-                    )
-                    if key not in revoc_reg_deltas:
-                        (delta, delta_timestamp) = await ledger.get_revoc_reg_delta(
-                            rev_reg_id,
-                            reft_non_revoc_interval.get("from", 0),
-                            reft_non_revoc_interval.get("to", epoch_now),
-                        )
-                        revoc_reg_deltas[key] = (
-                            rev_reg_id,
-                            credential_id,
-                            delta,
-                            delta_timestamp,
-                        )
-                    for stamp_me in requested_referents.values():
-                        # often one cred satisfies many requested attrs/preds
-                        if stamp_me["cred_id"] == credential_id:
-                            stamp_me["timestamp"] = revoc_reg_deltas[key][3]
+            artifacts = await self._ledger_fetcher(ledger).fetch(
+                schema_ids=[cred["schema_id"] for cred in credentials.values()],
+                cred_def_ids=[cred["cred_def_id"] for cred in credentials.values()],
+                rev_reg_def_ids=[
+                    cred["rev_reg_id"]
+                    for cred in credentials.values()
+                    if cred.get("rev_reg_id")
+                ],
+                rev_reg_deltas=cred_intervals.values(),
+            )
+        schemas = artifacts.schemas
+        cred_defs = artifacts.cred_defs
+        revocation_registries = {
+            rev_reg_id: RevocationRegistry.from_definition(rev_reg_def, True)
+            for rev_reg_id, rev_reg_def in artifacts.rev_reg_defs.items()
+        }
+        revoc_reg_deltas = {}
+        for credential_id, interval in cred_intervals.items():
+            (delta, delta_timestamp) = artifacts.rev_reg_deltas[interval]
+            if interval not in revoc_reg_deltas:
+                revoc_reg_deltas[interval] = (
+                    interval[0],
+                    credential_id,
+                    delta,
+                    delta_timestamp,
+                )
+            for stamp_me in requested_referents.values():
+                if stamp_me["cred_id"] == credential_id:
+                    stamp_me["timestamp"] = delta_timestamp
         # Get revocation states to prove non-revoked
+        rev_state_cache = self._profile.inject(RevocationStateCache, required=False)
         revocation_states = {}
         for (
             rev_reg_id,
@@ -151,17 +155,21 @@ class IndyPresExchHandler:
             if rev_reg_id not in revocation_states:
                 revocation_states[rev_reg_id] = {}
             rev_reg = revocation_registries[rev_reg_id]
-            tails_local_path = await rev_reg.get_or_fetch_local_tails_path()
+            cred_rev_id = credentials[credential_id]["cred_rev_id"]
             try:
-                revocation_states[rev_reg_id][delta_timestamp] = json.loads(
-                    await holder.create_revocation_state(
-                        credentials[credential_id]["cred_rev_id"],
+                if rev_state_cache:
+                    rev_state = await rev_state_cache.get_state(
+                        self._profile, rev_reg, cred_rev_id, delta, delta_timestamp
+                    )
+                else:
+                    rev_state = await holder.create_revocation_state(
+                        cred_rev_id,
                         rev_reg.reg_def,
                         delta,
                         delta_timestamp,
-                        tails_local_path,
+                        await rev_reg.get_or_fetch_local_tails_path(self._profile),
                     )
-                )
+                revocation_states[rev_reg_id][delta_timestamp] = json.loads(rev_state)
             except IndyHolderError as e:
                 LOGGER.error(
                     f"Failed to create revocation state: {e.error_code}, {e.message}"
@@ -193,55 +201,29 @@ class IndyPresExchHandler:
         identifiers: list,
     ) -> Tuple[dict, dict, dict, dict]:
         """Return schemas, cred_defs, rev_reg_defs, rev_reg_entries."""
-        schema_ids = []
-        cred_def_ids = []
-
-        schemas = {}
-        cred_defs = {}
-        rev_reg_defs = {}
-        rev_reg_entries = {}
-
         ledger = self._profile.inject(BaseLedger)
         async with ledger:
-            for identifier in identifiers:
-                schema_ids.append(identifier["schema_id"])
-                cred_def_ids.append(identifier["cred_def_id"])
-
-                # Build schemas for anoncreds
-                if identifier["schema_id"] not in schemas:
-                    schemas[identifier["schema_id"]] = await ledger.get_schema(
-                        identifier["schema_id"]
-                    )
-
-                if identifier["cred_def_id"] not in cred_defs:
-                    cred_defs[
-                        identifier["cred_def_id"]
-                    ] = await ledger.get_credential_definition(
-                        identifier["cred_def_id"]
-                    )
-
-                if identifier.get("rev_reg_id"):
-                    if identifier["rev_reg_id"] not in rev_reg_defs:
-                        rev_reg_defs[
-                            identifier["rev_reg_id"]
-                        ] = await ledger.get_revoc_reg_def(identifier["rev_reg_id"])
-
-                    if identifier.get("timestamp"):
-                        rev_reg_entries.setdefault(identifier["rev_reg_id"], {})
-
-                        if (
-                            identifier["timestamp"]
-                            not in rev_reg_entries[identifier["rev_reg_id"]]
-                        ):
-                            (
-                                found_rev_reg_entry,
-                                _found_timestamp,
-                            ) = await ledger.get_revoc_reg_entry(
-                                identifier["rev_reg_id"], identifier["timestamp"]
-                            )
-                            rev_reg_entries[identifier["rev_reg_id"]][
-                                identifier["timestamp"]
-                            ] = found_rev_reg_entry
+            artifacts = await self._ledger_fetcher(ledger).fetch(
+                schema_ids=[ident["schema_id"] for ident in identifiers],
+                cred_def_ids=[ident["cred_def_id"] for ident in identifiers],
+                rev_reg_def_ids=[
+                    ident["rev_reg_id"]
+                    for ident in identifiers
+                    if ident.get("rev_reg_id")
+                ],
+                rev_reg_entries=[
+                    (ident["rev_reg_id"], ident["timestamp"])
+                    for ident in identifiers
+                    if ident.get("rev_reg_id") and ident.get("timestamp")
+                ],
+            )
+        schemas = artifacts.schemas
+        cred_defs = artifacts.cred_defs
+        rev_reg_defs = artifacts.rev_reg_defs
+        rev_reg_entries = {}
+        for (rev_reg_id, timestamp), found in artifacts.rev_reg_entries.items():
+            # found is the entry and the timestamp found on the ledger
+            rev_reg_entries.setdefault(rev_reg_id, {})[timestamp] = found[0]
         return (
             schemas,
             cred_defs,
@@ -20,6 +20,7 @@ from .....ledger.base import BaseLedger
 from .....messaging.decorators.attach_decorator import AttachDecorator
 from .....messaging.request_context import RequestContext
 from .....messaging.responder import BaseResponder, MockResponder
+from .....revocation.models.revocation_state_cache import RevocationStateCache
 from .....storage.error import StorageNotFoundError
 
 from ....didcomm_prefix import DIDCommPrefix
@@ -471,6 +472,54 @@ class TestPresentationManager(AsyncTestCase):
             save_ex.assert_called_once()
             assert exchange_out.state == V10PresentationExchange.STATE_PRESENTATION_SENT
 
+    async def test_create_presentation_rev_state_cache(self):
+        exchange_in = V10PresentationExchange()
+        indy_proof_req = await PRES_PREVIEW.indy_proof_request(
+            name=PROOF_REQ_NAME,
+            version=PROOF_REQ_VERSION,
+            nonce=PROOF_REQ_NONCE,
+            ledger=self.ledger,
+        )
+
+        exchange_in.presentation_request = indy_proof_req
+
+        rev_state_cache = async_mock.MagicMock(
+            RevocationStateCache,
+            autospec=True,
+            get_state=async_mock.CoroutineMock(
+                return_value=json.dumps({"timestamp": NOW})
+            ),
+        )
+        self.profile.context.injector.bind_instance(
+            RevocationStateCache, rev_state_cache
+        )
+        more_magic_rr = async_mock.MagicMock(
+            get_or_fetch_local_tails_path=async_mock.CoroutineMock(
+                return_value="/tmp/sample/tails/path"
+            )
+        )
+        with async_mock.patch.object(
+            V10PresentationExchange, "save", autospec=True
+        ), async_mock.patch.object(
+            test_module, "AttachDecorator", autospec=True
+        ) as mock_attach_decorator, async_mock.patch.object(
+            test_indy_util_module, "RevocationRegistry", autospec=True
+        ) as mock_rr:
+            mock_rr.from_definition = async_mock.MagicMock(return_value=more_magic_rr)
+
+            mock_attach_decorator.data_base64 = async_mock.MagicMock(
+                return_value=mock_attach_decorator
+            )
+
+            req_creds = await indy_proof_req_preview2indy_requested_creds(
+                indy_proof_req, holder=self.holder
+            )
+            await self.manager.create_presentation(exchange_in, req_creds)
+
+        rev_state_cache.get_state.assert_awaited_once()
+        self.holder.create_revocation_state.assert_not_called()
+        more_magic_rr.get_or_fetch_local_tails_path.assert_not_called()
+
     async def test_create_presentation_proof_req_non_revoc_interval_none(self):
         exchange_in = V10PresentationExchange()
         indy_proof_req = await PRES_PREVIEW.indy_proof_request(
@@ -24,7 +24,7 @@ from ....indy.util import generate_pr_nonce
 from ....ledger.error import LedgerError
 from ....messaging.decorators.attach_decorator import AttachDecorator
 from ....messaging.models.base import BaseModelError
-from ....messaging.models.openapi import OpenAPISchema
+from ....messaging.models.openapi import OpenAPISchema, PaginatedQuerySchema
 from ....messaging.valid import (
     INDY_EXTRA_WQL,
     NUM_STR_NATURAL,
@@ -66,7 +66,7 @@ class V20PresentProofModuleResponseSchema(OpenAPISchema):
     """Response schema for Present Proof Module."""
 
 
-class V20PresExRecordListQueryStringSchema(OpenAPISchema):
+class V20PresExRecordListQueryStringSchema(PaginatedQuerySchema):
     """Parameters and validators for presentation exchange list query."""
 
     connection_id = fields.UUID(
@@ -110,6 +110,10 @@ class V20PresExRecordListSchema(OpenAPISchema):
         fields.Nested(V20PresExRecordSchema()),
         description="Presentation exchange records",
     )
+    next_cursor = fields.Str(
+        description="Cursor to retrieve the next page of results, if any",
+        required=False,
+    )
 
 
 class V20PresProposalByFormatSchema(OpenAPISchema):
@@ -354,18 +358,25 @@ async def present_proof_list(request: web.BaseRequest):
         if request.query.get(k, "") != ""
     }
 
+    limit = request.query.get("limit")
+
     try:
         async with context.session() as session:
-            records = await V20PresExRecord.query(
+            records, next_cursor = await V20PresExRecord.query_page(
                 session=session,
                 tag_filter=tag_filter,
+                limit=int(limit) if limit else None,
+                cursor=request.query.get("cursor"),
                 post_filter_positive=post_filter,
             )
         results = [record.serialize() for record in records]
     except (StorageError, BaseModelError) as err:
         raise web.HTTPBadRequest(reason=err.roll_up) from err
 
-    return web.json_response({"results": results})
+    response = {"results": results}
+    if next_cursor:
+        response["next_cursor"] = next_cursor
+    return web.json_response(response)
 
 
 @docs(
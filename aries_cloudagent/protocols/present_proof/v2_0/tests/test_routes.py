@@ -257,8 +257,8 @@ class TestPresentProofRoutes(AsyncTestCase):
         ) as mock_pres_ex_rec_cls, async_mock.patch.object(
             test_module.web, "json_response", async_mock.MagicMock()
         ) as mock_response:
-            mock_pres_ex_rec_cls.query = async_mock.CoroutineMock(
-                return_value=[mock_pres_ex_rec_inst]
+            mock_pres_ex_rec_cls.query_page = async_mock.CoroutineMock(
+                return_value=([mock_pres_ex_rec_inst], None)
             )
 
             await test_module.present_proof_list(self.request)
@@ -277,13 +277,45 @@ class TestPresentProofRoutes(AsyncTestCase):
         with async_mock.patch.object(
             test_module, "V20PresExRecord", autospec=True
         ) as mock_pres_ex_rec_cls:
-            mock_pres_ex_rec_cls.query = async_mock.CoroutineMock(
+            mock_pres_ex_rec_cls.query_page = async_mock.CoroutineMock(
                 side_effect=test_module.StorageError()
             )
 
             with self.assertRaises(test_module.web.HTTPBadRequest):
                 await test_module.present_proof_list(self.request)
 
+    async def test_present_proof_list_paginated(self):
+        self.request.query = {"limit": "1", "cursor": "dummy"}
+
+        mock_pres_ex_rec_inst = async_mock.MagicMock(
+            serialize=async_mock.MagicMock(
+                return_value={"thread_id": "sample-thread-id"}
+            )
+        )
+        with async_mock.patch.object(
+            test_module, "V20PresExRecord", autospec=True
+        ) as mock_pres_ex_rec_cls, async_mock.patch.object(
+            test_module.web, "json_response", async_mock.MagicMock()
+        ) as mock_response:
+            mock_pres_ex_rec_cls.query_page = async_mock.CoroutineMock(
+                return_value=([mock_pres_ex_rec_inst], "next")
+            )
+
+            await test_module.present_proof_list(self.request)
+            mock_pres_ex_rec_cls.query_page.assert_awaited_once_with(
+                session=async_mock.ANY,
+                tag_filter={},
+                limit=1,
+                cursor="dummy",
+                post_filter_positive={},
+            )
+            mock_response.assert_called_once_with(
+                {
+                    "results": [mock_pres_ex_rec_inst.serialize.return_value],
+                    "next_cursor": "next",
+                }
+            )
+
     async def test_present_proof_credentials_list_not_found(self):
         self.request.match_info = {"pres_ex_id": "dummy"}
 
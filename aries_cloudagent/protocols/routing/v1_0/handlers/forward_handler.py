@@ -8,6 +8,7 @@ from .....messaging.base_handler import (
     HandlerException,
     RequestContext,
 )
+from .....messaging.util import raw_json_value
 from .....protocols.connections.v1_0.manager import ConnectionManager
 from ..manager import RoutingManager, RoutingManagerError
 from ..messages.forward import Forward
@@ -16,6 +17,19 @@ from ..messages.forward import Forward
 class ForwardHandler(BaseHandler):
     """Handler for incoming forward messages."""
 
+    @staticmethod
+    def _packed_payload(context: RequestContext) -> bytes:
+        """Get the payload to forward.
+
+        The inner message is relayed exactly as it appeared in the received
+        message, falling back to re-serializing the parsed message.
+        """
+        raw_message = context.message_receipt.raw_message
+        raw_msg = raw_message and raw_json_value(raw_message, "msg")
+        if raw_msg and raw_msg.startswith("{"):
+            return raw_msg.encode("utf-8")
+        return json.dumps(context.message.msg).encode("ascii")
+
     async def handle(self, context: RequestContext, responder: BaseResponder):
         """Message handler implementation."""
         self._logger.debug("ForwardHandler called with context %s", context)
@@ -27,8 +41,7 @@ class ForwardHandler(BaseHandler):
             "Received forward for: %s", context.message_receipt.recipient_verkey
         )
 
-        packed = context.message.msg
-        packed = json.dumps(packed).encode("ascii")
+        packed = self._packed_payload(context)
         rt_mgr = RoutingManager(context.profile)
         target = context.message.to
 
@@ -2,6 +2,7 @@
 
 from typing import Coroutine, Sequence
 
+from ....cache.base import BaseCache
 from ....core.error import BaseError
 from ....core.profile import Profile
 from ....storage.error import (
@@ -16,6 +17,12 @@ from .models.route_update import RouteUpdate
 from .models.route_updated import RouteUpdated
 
 
+ROUTE_CREATED_EVENT = "acapy::routing::route_created"
+ROUTE_DELETED_EVENT = "acapy::routing::route_deleted"
+
+RECIPIENT_CACHE_TTL = 60
+
+
 class RoutingManagerError(BaseError):
     """Generic routing error."""
 
@@ -54,6 +61,13 @@ class RoutingManager:
         if not recip_verkey:
             raise RoutingManagerError("Must pass non-empty recip_verkey")
 
+        cache = self._profile.inject(BaseCache, required=False)
+        cache_key = self._recipient_cache_key(recip_verkey)
+        if cache:
+            cached = await cache.get(cache_key)
+            if cached:
+                return RouteRecord.from_storage(cached["id"], cached["value"])
+
         try:
             async with self._profile.session() as session:
                 record = await RouteRecord.retrieve_by_recipient_key(
@@ -68,8 +82,35 @@ class RoutingManager:
                 f"No route found with recipient key: {recip_verkey}"
             )
 
+        if cache:
+            await cache.set(
+                cache_key,
+                {"id": record.record_id, "value": record.value},
+                RECIPIENT_CACHE_TTL,
+            )
         return record
 
+    @staticmethod
+    def _recipient_cache_key(recip_verkey: str) -> str:
+        return f"routing::recipient::{recip_verkey}"
+
+    async def clear_recipient_cache(self, *recip_verkeys: str):
+        """
+        Forget the cached routes of recipient verkeys.
+
+        Must be called after route records are saved or deleted other than
+        through this manager.
+
+        Args:
+            recip_verkeys: The recipient verkeys of the changed routes
+
+        """
+        cache = self._profile.inject(BaseCache, required=False)
+        if cache:
+            for recip_verkey in recip_verkeys:
+                if recip_verkey:
+                    await cache.clear(self._recipient_cache_key(recip_verkey))
+
     async def get_routes(
         self, client_connection_id: str = None, tag_filter: dict = None
     ) -> Sequence[RouteRecord]:
@@ -111,6 +152,8 @@ class RoutingManager:
         """Remove an existing route record."""
         async with self._profile.session() as session:
             await route.delete_record(session)
+        await self.clear_recipient_cache(route.recipient_key)
+        await self._profile.notify(ROUTE_DELETED_EVENT, route.serialize())
 
     async def create_route_record(
         self,
@@ -143,6 +186,8 @@ class RoutingManager:
         )
         async with self._profile.session() as session:
             await route.save(session, reason="Created new route")
+        await self.clear_recipient_cache(recipient_key)
+        await self._profile.notify(ROUTE_CREATED_EVENT, route.serialize())
         return route
 
     async def update_routes(
@@ -12,6 +12,9 @@ from ..message_types import FORWARD, PROTOCOL_PACKAGE
 
 HANDLER_CLASS = f"{PROTOCOL_PACKAGE}.handlers.forward_handler.ForwardHandler"
 
+# properties of a forward message which can be loaded without the schema
+PLAIN_FORWARD_KEYS = {"@type", "@id", "to", "msg"}
+
 
 class Forward(AgentMessage):
     """Represents a request to forward a message to a connected agent."""
@@ -37,6 +40,25 @@ class Forward(AgentMessage):
             msg = json.loads(msg)
         self.msg = msg
 
+    @classmethod
+    def deserialize(cls, obj, unknown: str = None, none2none: str = False):
+        """
+        Convert from JSON representation to a forward message.
+
+        Forward messages without decorators are constructed directly, as they
+        are relayed far more often than they are otherwise inspected. Any other
+        form is validated against the schema.
+        """
+        if (
+            isinstance(obj, dict)
+            and obj.keys() <= PLAIN_FORWARD_KEYS
+            and isinstance(obj.get("to"), str)
+            and isinstance(obj.get("msg"), dict)
+            and isinstance(obj.get("@id", ""), str)
+        ):
+            return cls(_id=obj.get("@id"), to=obj["to"], msg=obj["msg"])
+        return super().deserialize(obj, unknown=unknown, none2none=none2none)
+
 
 class ForwardSchema(AgentMessageSchema):
     """Forward message schema used in serialization/deserialization."""
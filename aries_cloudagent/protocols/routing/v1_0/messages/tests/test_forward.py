@@ -31,6 +31,23 @@ class TestForward(TestCase):
 
         assert message is message_schema_load.return_value
 
+    @mock.patch(f"{PROTOCOL_PACKAGE}.messages.forward.ForwardSchema.load")
+    def test_deserialize_plain(self, message_schema_load):
+        obj = {
+            "@type": DIDCommPrefix.qualify_current(FORWARD),
+            "@id": "forward-id",
+            "to": self.to,
+            "msg": self.msg,
+        }
+
+        message = Forward.deserialize(obj)
+        message_schema_load.assert_not_called()
+
+        assert isinstance(message, Forward)
+        assert message._id == "forward-id"
+        assert message.to == self.to
+        assert message.msg == self.msg
+
     @mock.patch(f"{PROTOCOL_PACKAGE}.messages.forward.ForwardSchema.dump")
     def test_serialize(self, message_schema_dump):
         message_dict = self.message.serialize()
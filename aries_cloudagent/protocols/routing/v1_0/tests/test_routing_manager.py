@@ -3,6 +3,9 @@ from asynctest import mock as async_mock
 
 from marshmallow import ValidationError
 
+from .....cache.base import BaseCache
+from .....cache.in_memory import InMemoryCache
+from .....core.event_bus import EventBus, MockEventBus
 from .....messaging.request_context import RequestContext
 from .....storage.error import (
     StorageDuplicateError,
@@ -12,7 +15,13 @@ from .....storage.error import (
 from .....storage.in_memory import InMemoryStorage
 from .....transport.inbound.receipt import MessageReceipt
 
-from ..manager import RoutingManager, RoutingManagerError, RouteNotFoundError
+from ..manager import (
+    ROUTE_CREATED_EVENT,
+    ROUTE_DELETED_EVENT,
+    RoutingManager,
+    RoutingManagerError,
+    RouteNotFoundError,
+)
 from ..models.route_record import RouteRecord, RouteRecordSchema
 from ..models.route_update import RouteUpdate
 from ..models.route_updated import RouteUpdated
@@ -46,6 +55,24 @@ class TestRoutingManager(AsyncTestCase):
         assert results[0].connection_id == TEST_CONN_ID
         assert results[0].recipient_key == TEST_ROUTE_VERKEY
 
+    async def test_get_recipient_cached(self):
+        self.profile.context.injector.bind_instance(BaseCache, InMemoryCache())
+        await self.manager.create_route_record(TEST_CONN_ID, TEST_ROUTE_VERKEY)
+        record = await self.manager.get_recipient(TEST_ROUTE_VERKEY)
+
+        with async_mock.patch.object(
+            RouteRecord, "retrieve_by_recipient_key", async_mock.CoroutineMock()
+        ) as mock_retrieve:
+            cached = await self.manager.get_recipient(TEST_ROUTE_VERKEY)
+            mock_retrieve.assert_not_called()
+        assert cached == record
+        assert cached.record_id == record.record_id
+
+        # deleting the route clears the cached lookup
+        await self.manager.delete_route_record(record)
+        with self.assertRaises(RouteNotFoundError):
+            await self.manager.get_recipient(TEST_ROUTE_VERKEY)
+
     async def test_route_record_schema_validate(self):
         route_rec_schema = RouteRecordSchema()
         with self.assertRaises(ValidationError):
@@ -63,10 +90,17 @@ class TestRoutingManager(AsyncTestCase):
             await self.manager.create_route_record(TEST_CONN_ID, None)
 
     async def test_create_delete(self):
+        event_bus = MockEventBus()
+        self.profile.context.injector.bind_instance(EventBus, event_bus)
         record = await self.manager.create_route_record(TEST_CONN_ID, TEST_ROUTE_VERKEY)
         await self.manager.delete_route_record(record)
         results = await self.manager.get_routes()
         assert not results
+        assert [event.topic for _, event in event_bus.events] == [
+            ROUTE_CREATED_EVENT,
+            ROUTE_DELETED_EVENT,
+        ]
+        assert event_bus.events[0][1].payload["recipient_key"] == TEST_ROUTE_VERKEY
 
     async def test_get_recipient_no_verkey(self):
         with self.assertRaises(RoutingManagerError) as context:
@@ -4,13 +4,12 @@ import urllib.parse
 
 from typing import Sequence, Pattern
 
-import aiohttp
-
 from pydid import DID, DIDDocument
 
 from ...config.injection_context import InjectionContext
 from ...core.profile import Profile
 from ...messaging.valid import DIDWeb
+from ...utils.http import HttpClient
 
 from ..base import (
     BaseDIDResolver,
@@ -65,8 +64,13 @@ class WebDIDResolver(BaseDIDResolver):
         """Resolve did:web DIDs."""
 
         url = self.__transform_to_url(did)
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as response:
+        # reuse pooled connections when the agent provides a client
+        client = profile.inject(HttpClient, required=False)
+        owned = not client
+        if owned:
+            client = HttpClient()
+        try:
+            async with client.session.get(url) as response:
                 if response.status == 200:
                     try:
                         # Validate DIDDoc with pyDID
@@ -81,3 +85,6 @@ class WebDIDResolver(BaseDIDResolver):
                 raise ResolverError(
                     "Could not find doc for {}: {}".format(did, await response.text())
                 )
+        finally:
+            if owned:
+                await client.close()
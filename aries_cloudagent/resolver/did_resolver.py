@@ -5,10 +5,16 @@ responsible for keeping track of all resolvers. more importantly
 retrieving did's from different sources provided by the method type.
 """
 
+import asyncio
+from collections import OrderedDict
+from copy import deepcopy
 from datetime import datetime
 from itertools import chain
 import logging
-from typing import Sequence, Tuple, Union
+import re
+import threading
+import time
+from typing import Mapping, NamedTuple, Optional, Sequence, Set, Tuple, Union
 
 from pydid import DID, DIDError, DIDUrl, Resource
 import pydid
@@ -26,23 +32,193 @@ from .did_resolver_registry import DIDResolverRegistry
 
 LOGGER = logging.getLogger(__name__)
 
+DEFAULT_CACHE_TTL = 300
+DEFAULT_NEGATIVE_CACHE_TTL = 30
+DEFAULT_CACHE_SIZE = 1000
+
+# the DID method a supported DID regex is limited to, if any
+METHOD_REGEX_PREFIX = re.compile(r"^\^\(?did:([a-z0-9]+):")
+
+
+class ResolverCacheEntry(NamedTuple):
+    """A cached resolution result, or DID not found error."""
+
+    expires: float
+    resolver: Optional[BaseDIDResolver]
+    document: Optional[dict]
+    not_found: Optional[str] = None
+
 
 class DIDResolver:
-    """did resolver singleton."""
+    """
+    did resolver singleton.
 
-    def __init__(self, registry: DIDResolverRegistry):
-        """Create DID Resolver."""
+    Resolved documents are cached for a time depending on the DID method, and
+    DIDs which could not be found are remembered for a shorter time. Only one
+    resolution is performed at a time for a given DID on each event loop;
+    concurrent requests wait for its result. The cache is shared by all loops
+    and threads, such as the JSON-LD document loader's background loop.
+    """
+
+    def __init__(
+        self,
+        registry: DIDResolverRegistry,
+        cache_ttl: int = None,
+        method_cache_ttls: Mapping[str, int] = None,
+        negative_cache_ttl: int = None,
+        max_entries: int = None,
+    ):
+        """
+        Create DID Resolver.
+
+        Args:
+            registry: The registry of DID resolvers
+            cache_ttl: Seconds to cache resolved documents, 0 to disable caching
+            method_cache_ttls: Cache times overriding `cache_ttl` by DID method
+            negative_cache_ttl: Seconds to remember that a DID was not found
+            max_entries: The maximum number of cached DIDs
+        """
         self.did_resolver_registry = registry
+        self.cache_ttl = DEFAULT_CACHE_TTL if cache_ttl is None else cache_ttl
+        self.method_cache_ttls = dict(method_cache_ttls or {})
+        self.negative_cache_ttl = (
+            DEFAULT_NEGATIVE_CACHE_TTL
+            if negative_cache_ttl is None
+            else negative_cache_ttl
+        )
+        self.max_entries = max_entries or DEFAULT_CACHE_SIZE
+        self.hits = 0
+        self.misses = 0
+        # did -> ResolverCacheEntry, in least recently used order
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # (event loop, did) -> future for the resolution in progress
+        self._in_flight = {}
+        # did method -> candidate resolvers, in registered order
+        self._method_index = {}
+        self._index_size = 0
+
+    @property
+    def stats(self) -> dict:
+        """Get the resolution cache statistics."""
+        return {
+            "resolver_cached": len(self._cache),
+            "resolver_hits": self.hits,
+            "resolver_misses": self.misses,
+        }
+
+    def method_cache_ttl(self, did: str) -> int:
+        """Get the cache time for documents of a DID."""
+        method = did.split(":", 2)[1]
+        return self.method_cache_ttls.get(method, self.cache_ttl)
+
+    def invalidate(self, did: str = None) -> int:
+        """
+        Remove a DID, or all DIDs, from the resolution cache.
+
+        Args:
+            did: The DID to remove, if not all
+
+        Returns:
+            The number of cache entries removed
+
+        """
+        with self._cache_lock:
+            if did is None:
+                count = len(self._cache)
+                self._cache.clear()
+                return count
+            return 1 if self._cache.pop(did, None) else 0
+
+    def _cache_get(self, did: str) -> Optional[ResolverCacheEntry]:
+        """Get an unexpired cache entry for a DID."""
+        with self._cache_lock:
+            entry: ResolverCacheEntry = self._cache.get(did)
+            if entry and entry.expires <= time.perf_counter():
+                del self._cache[did]
+                entry = None
+            if entry:
+                self._cache.move_to_end(did)
+                self.hits += 1
+            else:
+                self.misses += 1
+            return entry
+
+    def _cache_set(self, did: str, entry: ResolverCacheEntry):
+        """Add a cache entry, evicting the least recently used if full."""
+        with self._cache_lock:
+            self._cache[did] = entry
+            self._cache.move_to_end(did)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
 
     async def _resolve(
         self, profile: Profile, did: Union[str, DID]
     ) -> Tuple[BaseDIDResolver, dict]:
-        """Retrieve doc and return with resolver."""
-        # TODO Cache results
+        """Retrieve doc and return with resolver, using cached results."""
         if isinstance(did, DID):
             did = str(did)
         else:
             DID.validate(did)
+
+        entry = self._cache_get(did)
+        if not entry:
+            # futures can only be awaited on their own loop
+            key = (asyncio.get_event_loop(), did)
+            while key in self._in_flight:
+                in_flight: asyncio.Future = self._in_flight[key]
+                try:
+                    entry = await asyncio.shield(in_flight)
+                    break
+                except asyncio.CancelledError:
+                    # retry if the resolution was cancelled, rather than this task
+                    if not in_flight.cancelled():
+                        raise
+            else:
+                entry = await self._resolve_single(profile, key)
+
+        if entry.not_found:
+            raise DIDNotFound(entry.not_found)
+        return entry.resolver, deepcopy(entry.document)
+
+    async def _resolve_single(
+        self, profile: Profile, key: Tuple[asyncio.AbstractEventLoop, str]
+    ) -> ResolverCacheEntry:
+        """Resolve a DID, sharing the result with concurrent requests."""
+        loop, did = key
+        in_flight = loop.create_future()
+        self._in_flight[key] = in_flight
+        try:
+            try:
+                resolver, document = await self._resolve_uncached(profile, did)
+                ttl = self.method_cache_ttl(did)
+                entry = ResolverCacheEntry(
+                    time.perf_counter() + ttl, resolver, document
+                )
+            except DIDNotFound as err:
+                ttl = self.negative_cache_ttl
+                entry = ResolverCacheEntry(
+                    time.perf_counter() + ttl, None, None, str(err)
+                )
+            if ttl:
+                self._cache_set(did, entry)
+            in_flight.set_result(entry)
+        except asyncio.CancelledError:
+            in_flight.cancel()
+            raise
+        except Exception as err:
+            in_flight.set_exception(err)
+            # the exception is raised here, not only to waiters
+            in_flight.exception()
+            raise
+        finally:
+            del self._in_flight[key]
+        return entry
+
+    async def _resolve_uncached(
+        self, profile: Profile, did: str
+    ) -> Tuple[BaseDIDResolver, dict]:
+        """Retrieve doc from the matching resolvers and return with resolver."""
         for resolver in await self._match_did_to_resolver(profile, did):
             try:
                 LOGGER.debug("Resolving DID %s with %s", did, resolver)
@@ -77,17 +253,47 @@ class DIDResolver:
         )
         return ResolutionResult(doc, resolver_metadata)
 
+    @staticmethod
+    def _resolver_methods(resolver: BaseDIDResolver) -> Optional[Set[str]]:
+        """Get the DID methods a resolver is limited to, if known in advance."""
+        supports = getattr(resolver.supports, "__func__", None)
+        if supports is not BaseDIDResolver.supports:
+            return None  # custom support check
+        try:
+            match = METHOD_REGEX_PREFIX.match(resolver.supported_did_regex.pattern)
+            return {match.group(1)} if match else None
+        except NotImplementedError:
+            return set(resolver.supported_methods) or None
+
+    def _method_candidates(self, did: str) -> Sequence[BaseDIDResolver]:
+        """Get the resolvers which may support DIDs of the method of a DID."""
+        resolvers = self.did_resolver_registry.resolvers
+        if len(resolvers) != self._index_size:
+            self._method_index = {}
+            self._index_size = len(resolvers)
+        method = did.split(":", 2)[1]
+        candidates = self._method_index.get(method)
+        if candidates is None:
+            candidates = []
+            for resolver in resolvers:
+                methods = self._resolver_methods(resolver)
+                if methods is None or method in methods:
+                    candidates.append(resolver)
+            self._method_index[method] = candidates
+        return candidates
+
     async def _match_did_to_resolver(
         self, profile: Profile, did: str
     ) -> Sequence[BaseDIDResolver]:
         """Generate supported DID Resolvers.
 
         Native resolvers are yielded first, in registered order followed by
-        non-native resolvers in registered order.
+        non-native resolvers in registered order. Resolvers limited to other
+        DID methods are skipped without checking their support for the DID.
         """
         valid_resolvers = [
             resolver
-            for resolver in self.did_resolver_registry.resolvers
+            for resolver in self._method_candidates(did)
             if await resolver.supports(profile, did)
         ]
         native_resolvers = filter(lambda resolver: resolver.native, valid_resolvers)
@@ -101,7 +307,6 @@ class DIDResolver:
 
     async def dereference(self, profile: Profile, did_url: str) -> Resource:
         """Dereference a DID URL to its corresponding DID Doc object."""
-        # TODO Use cached DID Docs when possible
         try:
             parsed = DIDUrl.parse(did_url)
             if not parsed.did:
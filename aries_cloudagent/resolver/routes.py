@@ -30,7 +30,7 @@ Resolve did document admin routes.
 """
 
 from aiohttp import web
-from aiohttp_apispec import docs, match_info_schema, response_schema
+from aiohttp_apispec import docs, match_info_schema, request_schema, response_schema
 from marshmallow import fields, validate
 
 from ..admin.request_context import AdminRequestContext
@@ -71,6 +71,24 @@ class DIDMatchInfoSchema(OpenAPISchema):
     did = fields.Str(description="DID", required=True, **_W3cDID)
 
 
+class CacheInvalidateRequestSchema(OpenAPISchema):
+    """Request schema for invalidating cached DID resolution results."""
+
+    did = fields.Str(
+        description="DID to remove from the cache, or all DIDs if not given",
+        required=False,
+        **_W3cDID,
+    )
+
+
+class CacheInvalidateResultSchema(OpenAPISchema):
+    """Result schema for invalidating cached DID resolution results."""
+
+    invalidated = fields.Int(
+        description="Number of cached resolution results removed", example=1
+    )
+
+
 @docs(tags=["resolver"], summary="Retrieve doc for requested did")
 @match_info_schema(DIDMatchInfoSchema())
 @response_schema(ResolutionResultSchema(), 200)
@@ -94,6 +112,20 @@ async def resolve_did(request: web.Request):
     return web.json_response(result.serialize())
 
 
+@docs(tags=["resolver"], summary="Remove cached DID resolution results")
+@request_schema(CacheInvalidateRequestSchema())
+@response_schema(CacheInvalidateResultSchema(), 200)
+async def invalidate_cache(request: web.Request):
+    """Remove one or all DIDs from the resolution cache."""
+    context: AdminRequestContext = request["context"]
+    body = await request.json() if request.body_exists else {}
+
+    session = await context.session()
+    resolver = session.inject(DIDResolver)
+    invalidated = resolver.invalidate(body.get("did"))
+    return web.json_response({"invalidated": invalidated})
+
+
 async def register(app: web.Application):
     """Register routes."""
 
@@ -104,6 +136,7 @@ async def register(app: web.Application):
                 resolve_did,
                 allow_head=False,
             ),
+            web.post("/resolver/cache/invalidate", invalidate_cache),
         ]
     )
 
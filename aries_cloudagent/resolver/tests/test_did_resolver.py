@@ -1,5 +1,8 @@
 """Test did resolver registry."""
 
+import asyncio
+import time
+
 import pytest
 
 from asynctest import mock as async_mock
@@ -13,6 +16,7 @@ from ..base import (
     ResolverError,
     ResolverType,
 )
+from .. import did_resolver as test_module
 from ..did_resolver import DIDResolver
 from ..did_resolver_registry import DIDResolverRegistry
 
@@ -199,3 +203,177 @@ async def test_resolve_did_x_not_found(profile):
     resolver = DIDResolver(registry)
     with pytest.raises(DIDNotFound):
         await resolver.resolve(profile, py_did)
+
+
+class CountingResolver(MockResolver):
+    def __init__(self, supported_methods, resolved=None, delay: float = 0):
+        super().__init__(supported_methods, resolved)
+        self.delay = delay
+        self.calls = 0
+
+    async def _resolve(self, profile, did):
+        self.calls += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        return await super()._resolve(profile, did)
+
+
+@pytest.mark.asyncio
+async def test_resolve_cached(profile):
+    registry = DIDResolverRegistry()
+    counting = CountingResolver(["sov"], DIDDocument.deserialize(DOC))
+    registry.register(counting)
+    resolver = DIDResolver(registry)
+
+    doc = await resolver.resolve(profile, TEST_DID0)
+    doc["id"] = "changed"
+    result = await resolver.resolve_with_metadata(profile, TEST_DID0)
+    assert result.did_document == counting.resolved.serialize()
+    assert counting.calls == 1
+    assert resolver.stats == {
+        "resolver_cached": 1,
+        "resolver_hits": 1,
+        "resolver_misses": 1,
+    }
+
+    assert resolver.invalidate(TEST_DID0) == 1
+    assert resolver.invalidate(TEST_DID0) == 0
+    await resolver.resolve(profile, TEST_DID0)
+    assert counting.calls == 2
+    assert resolver.invalidate() == 1
+
+
+@pytest.mark.asyncio
+async def test_resolve_cache_ttl(profile):
+    registry = DIDResolverRegistry()
+    counting = CountingResolver(["sov", "key"], DIDDocument.deserialize(DOC))
+    registry.register(counting)
+    resolver = DIDResolver(registry, cache_ttl=0, method_cache_ttls={"key": 60})
+    assert resolver.method_cache_ttl(TEST_DID0) == 0
+    assert resolver.method_cache_ttl(TEST_DID_5) == 60
+
+    await resolver.resolve(profile, TEST_DID0)
+    await resolver.resolve(profile, TEST_DID0)
+    assert counting.calls == 2
+    await resolver.resolve(profile, TEST_DID_5)
+    await resolver.resolve(profile, TEST_DID_5)
+    assert counting.calls == 3
+
+    with async_mock.patch.object(
+        test_module.time, "perf_counter", return_value=time.perf_counter() + 61
+    ):
+        await resolver.resolve(profile, TEST_DID_5)
+    assert counting.calls == 4
+
+
+@pytest.mark.asyncio
+async def test_resolve_cache_evict(profile):
+    registry = DIDResolverRegistry()
+    counting = CountingResolver(["sov", "key"], DIDDocument.deserialize(DOC))
+    registry.register(counting)
+    resolver = DIDResolver(registry, max_entries=1)
+    await resolver.resolve(profile, TEST_DID0)
+    await resolver.resolve(profile, TEST_DID_5)
+    assert list(resolver._cache) == [TEST_DID_5]
+
+
+@pytest.mark.asyncio
+async def test_resolve_not_found_cached(profile):
+    registry = DIDResolverRegistry()
+    counting = CountingResolver(["sov"], DIDNotFound())
+    registry.register(counting)
+    resolver = DIDResolver(registry)
+    for _ in range(2):
+        with pytest.raises(DIDNotFound):
+            await resolver.resolve(profile, TEST_DID0)
+    assert counting.calls == 1
+
+    resolver = DIDResolver(registry, negative_cache_ttl=0)
+    for _ in range(2):
+        with pytest.raises(DIDNotFound):
+            await resolver.resolve(profile, TEST_DID0)
+    assert counting.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_resolve_single_flight(profile):
+    registry = DIDResolverRegistry()
+    counting = CountingResolver(["sov"], DIDDocument.deserialize(DOC), delay=0.01)
+    registry.register(counting)
+    resolver = DIDResolver(registry)
+    docs = await asyncio.gather(
+        *(resolver.resolve(profile, TEST_DID0) for _ in range(3))
+    )
+    assert docs == [counting.resolved.serialize()] * 3
+    assert counting.calls == 1
+    assert not resolver._in_flight
+
+    counting.resolved = ResolverError("failed")
+    resolver.invalidate()
+    results = await asyncio.gather(
+        *(resolver.resolve(profile, TEST_DID0) for _ in range(2)),
+        return_exceptions=True,
+    )
+    assert all(isinstance(result, ResolverError) for result in results)
+    assert counting.calls == 2
+    assert not resolver._cache
+
+
+@pytest.mark.asyncio
+async def test_resolve_single_flight_other_loop(profile):
+    registry = DIDResolverRegistry()
+    counting = CountingResolver(["sov"], DIDDocument.deserialize(DOC), delay=0.05)
+    registry.register(counting)
+    resolver = DIDResolver(registry)
+
+    def resolve_other_loop():
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(resolver.resolve(profile, TEST_DID0))
+        finally:
+            loop.close()
+
+    # a resolution in progress on another loop is not joined
+    first = asyncio.ensure_future(resolver.resolve(profile, TEST_DID0))
+    await asyncio.sleep(0.01)
+    other = asyncio.get_event_loop().run_in_executor(None, resolve_other_loop)
+    docs = await asyncio.gather(first, other)
+    assert docs == [counting.resolved.serialize()] * 2
+    assert counting.calls == 2
+    assert not resolver._in_flight
+    assert list(resolver._cache) == [TEST_DID0]
+
+
+@pytest.mark.asyncio
+async def test_resolve_single_flight_cancelled(profile):
+    registry = DIDResolverRegistry()
+    counting = CountingResolver(["sov"], DIDDocument.deserialize(DOC), delay=0.05)
+    registry.register(counting)
+    resolver = DIDResolver(registry)
+    first = asyncio.ensure_future(resolver.resolve(profile, TEST_DID0))
+    await asyncio.sleep(0.01)
+    second = asyncio.ensure_future(resolver.resolve(profile, TEST_DID0))
+    await asyncio.sleep(0.01)
+    first.cancel()
+    assert await second == counting.resolved.serialize()
+    assert counting.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_match_did_to_resolver_method_index(profile):
+    registry = DIDResolverRegistry()
+    sov = MockResolver(["sov"])
+    key = MockResolver(["key"])
+    custom = MockResolver(["sov"])
+    custom.supports = async_mock.CoroutineMock(return_value=True)
+    registry.register(sov)
+    registry.register(key)
+    resolver = DIDResolver(registry)
+
+    assert [sov] == resolver._method_candidates(TEST_DID0)
+    assert [sov] == await resolver._match_did_to_resolver(profile, TEST_DID0)
+
+    registry.register(custom)
+    assert [sov, custom] == await resolver._match_did_to_resolver(profile, TEST_DID0)
+    assert [key, custom] == await resolver._match_did_to_resolver(profile, TEST_DID_5)
+    assert resolver._method_index == {"sov": [sov, custom], "key": [key, custom]}
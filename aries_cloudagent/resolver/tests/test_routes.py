@@ -100,6 +100,21 @@ async def test_resolver_not_found_error(
         await test_module.resolve_did(mock_request)
 
 
+@pytest.mark.asyncio
+async def test_invalidate_cache(mock_request, mock_resolver, mock_response):
+    mock_resolver.invalidate = async_mock.MagicMock(return_value=1)
+    mock_request.json = async_mock.CoroutineMock(
+        return_value={"did": "did:sov:Kkyqu7CJFuQSvBp468uaDe"}
+    )
+    await test_module.invalidate_cache(mock_request)
+    mock_resolver.invalidate.assert_called_once_with("did:sov:Kkyqu7CJFuQSvBp468uaDe")
+    mock_response.assert_called_once_with({"invalidated": 1})
+
+    mock_request.body_exists = False
+    await test_module.invalidate_cache(mock_request)
+    mock_resolver.invalidate.assert_called_with(None)
+
+
 @pytest.mark.asyncio
 async def test_register():
     mock_app = async_mock.MagicMock()
@@ -1,5 +1,7 @@
 """Indy revocation registry management."""
 
+import asyncio
+
 from typing import Sequence
 
 from ..core.profile import Profile
@@ -9,6 +11,7 @@ from ..storage.base import StorageNotFoundError
 from .error import RevocationNotSupportedError, RevocationRegistryBadSizeError
 from .models.issuer_rev_reg_record import IssuerRevRegRecord
 from .models.revocation_registry import RevocationRegistry
+from .models.tails_cache import TailsCacheManager
 
 
 class IndyRevocation:
@@ -105,3 +108,27 @@ class IndyRevocation:
             )
             IndyRevocation.REV_REG_CACHE[revoc_reg_id] = rev_reg
             return rev_reg
+
+    def prefetch_tails(self, revoc_reg_id: str) -> asyncio.Future:
+        """
+        Start fetching the tails file of a revocation registry in the background.
+
+        Nothing is done unless the profile provides a tails cache manager, or
+        if the registry has been seen before.
+
+        Args:
+            revoc_reg_id: The revocation registry identifier
+
+        Returns:
+            The background task, if started
+
+        """
+        tails_cache = self._profile.inject(TailsCacheManager, required=False)
+        if not tails_cache:
+            return None
+
+        async def fetch():
+            rev_reg = await self.get_ledger_registry(revoc_reg_id)
+            await tails_cache.get_path(rev_reg, self._profile)
+
+        return tails_cache.prefetch(revoc_reg_id, fetch)
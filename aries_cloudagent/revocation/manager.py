@@ -89,7 +89,7 @@ class RevocationManager:
 
         if publish:
             rev_reg = await revoc.get_ledger_registry(rev_reg_id)
-            await rev_reg.get_or_fetch_local_tails_path()
+            await rev_reg.get_or_fetch_local_tails_path(self._profile)
 
             # pick up pending revocations on input revocation registry
             crids = list(set(issuer_rr_rec.pending_pub + [cred_rev_id]))
@@ -96,6 +96,22 @@ class IssuerCredRevRecord(BaseRecord):
             session, {"rev_reg_id": rev_reg_id}, {"cred_rev_id": cred_rev_id}
         )
 
+    @classmethod
+    async def query_by_cred_rev_ids(
+        cls,
+        session: ProfileSession,
+        rev_reg_id: str,
+        cred_rev_ids: Sequence[str],
+    ) -> Sequence["IssuerCredRevRecord"]:
+        """Retrieve the issuer cred rev records for a set of cred rev ids."""
+        return await cls.query(
+            session,
+            {
+                "rev_reg_id": rev_reg_id,
+                "cred_rev_id": {"$in": [str(crid) for crid in cred_rev_ids]},
+            },
+        )
+
     @classmethod
     async def retrieve_by_cred_ex_id(
         cls,
@@ -1,17 +1,19 @@
 """Classes for managing a revocation registry."""
 
 import logging
+import os
 import re
 
 from os.path import join
 from pathlib import Path
+from uuid import uuid4
 
-from requests import Session
-from requests.exceptions import RequestException
-
+from ...core.profile import Profile
 from ...indy.util import indy_client_dir
+from ...utils.http import FetchError, HttpClient
 
 from ..error import RevocationError
+from .tails_cache import TailsCacheManager
 import hashlib
 import base58
 
@@ -153,8 +155,14 @@ class RevocationRegistry:
         tails_file_path = Path(self.get_receiving_tails_local_path())
         return tails_file_path.is_file()
 
-    async def retrieve_tails(self):
-        """Fetch the tails file from the public URI."""
+    async def retrieve_tails(self, profile: Profile = None):
+        """
+        Fetch the tails file from the public URI.
+
+        Args:
+            profile: The profile providing the shared HTTP client, if any
+
+        """
         if not self._tails_public_uri:
             raise RevocationError("Tails file public URI is empty")
 
@@ -168,34 +176,58 @@ class RevocationRegistry:
         if not tails_file_dir.exists():
             tails_file_dir.mkdir(parents=True)
 
-        buffer_size = 65536  # should be multiple of 32 bytes for sha256
-        with open(tails_file_path, "wb", buffer_size) as tails_file:
-            file_hasher = hashlib.sha256()
-
-            with Session() as req_session:
-                try:
-                    resp = req_session.get(self._tails_public_uri, stream=True)
-                    for buf in resp.iter_content(chunk_size=buffer_size):
-                        tails_file.write(buf)
-                        file_hasher.update(buf)
-                except RequestException as rx:
-                    raise RevocationError(f"Error retrieving tails file: {rx}")
+        # download to a temporary file, only moved into place once verified
+        tmp_file_path = tails_file_path.with_name(
+            f"{tails_file_path.name}.{uuid4().hex}.tmp"
+        )
+        client = profile and profile.inject(HttpClient, required=False)
+        owned = not client
+        if owned:
+            client = HttpClient()
+        file_hasher = hashlib.sha256()
+        try:
+            try:
+                await client.download(
+                    self._tails_public_uri,
+                    tmp_file_path,
+                    chunk_size=65536,  # should be multiple of 32 bytes for sha256
+                    digest=file_hasher,
+                )
+            except FetchError as fx:
+                raise RevocationError(f"Error retrieving tails file: {fx}")
+            finally:
+                if owned:
+                    await client.close()
 
             download_tails_hash = base58.b58encode(file_hasher.digest()).decode("utf-8")
             if download_tails_hash != self.tails_hash:
                 raise RevocationError(
                     "The hash of the downloaded tails file does not match."
                 )
+            os.replace(tmp_file_path, tails_file_path)
+        finally:
+            if tmp_file_path.exists():
+                tmp_file_path.unlink()
 
         self.tails_local_path = tails_file_path
         return self.tails_local_path
 
-    async def get_or_fetch_local_tails_path(self):
-        """Get the local tails path, retrieving from the remote if necessary."""
+    async def get_or_fetch_local_tails_path(self, profile: Profile = None):
+        """
+        Get the local tails path, retrieving from the remote if necessary.
+
+        Args:
+            profile: The profile providing the tails cache manager and shared
+                HTTP client, if any
+
+        """
+        tails_cache = profile and profile.inject(TailsCacheManager, required=False)
+        if tails_cache:
+            return await tails_cache.get_path(self, profile)
         tails_file_path = self.get_receiving_tails_local_path()
         if Path(tails_file_path).is_file():
             return tails_file_path
-        return await self.retrieve_tails()
+        return await self.retrieve_tails(profile)
 
     def __repr__(self) -> str:
         """Return a human readable representation of this class."""
@@ -0,0 +1,288 @@
+"""Cache of the revocation states created by a holder."""
+
+import asyncio
+import logging
+import time
+
+from typing import Sequence, Tuple
+
+from ...config.settings import Settings
+from ...core.profile import Profile
+from ...indy.holder import IndyHolder
+from ...ledger.base import BaseLedger
+from ...storage.base import BaseStorage
+from ...storage.record import StorageRecord
+
+from .revocation_registry import RevocationRegistry
+
+LOGGER = logging.getLogger(__name__)
+
+RECORD_TYPE = "holder_revocation_state"
+DEFAULT_MAX_STATES = 2
+DEFAULT_REFRESH_THRESHOLD = 3
+
+
+def _timestamp(record: StorageRecord) -> int:
+    """Get the timestamp of a revocation state record."""
+    return int(record.tags["timestamp"])
+
+
+class RevocationStateCache:
+    """
+    Cache of the revocation states created by a holder for presentations.
+
+    Revocation states are kept in the holder's wallet, by revocation registry,
+    credential revocation id and timestamp. A state for a later timestamp is
+    computed by updating the latest cached state with the registry delta since
+    then, which is much cheaper than computing it from the whole tails file.
+
+    With a refresh interval set, the states of credentials presented at least
+    `refresh_threshold` times in an interval are brought up to date in the
+    background, so that they are already computed when next presented.
+    """
+
+    def __init__(
+        self,
+        max_states: int = None,
+        refresh_interval: int = None,
+        refresh_threshold: int = None,
+    ):
+        """
+        Initialize the revocation state cache.
+
+        Args:
+            max_states: The number of states kept per credential, 2 by default
+            refresh_interval: Seconds between background refreshes, or 0 (the
+                default) to disable them
+            refresh_threshold: The number of presentations in an interval for a
+                credential to be refreshed, 3 by default
+
+        """
+        self.max_states = max_states or DEFAULT_MAX_STATES
+        self.refresh_interval = refresh_interval or 0
+        self.refresh_threshold = refresh_threshold or DEFAULT_REFRESH_THRESHOLD
+        self.hits = 0
+        self.created = 0
+        self.updated = 0
+        self.refreshed = 0
+        self._in_flight = {}
+        self._presented = {}
+        self._refresh_task: asyncio.Future = None
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "RevocationStateCache":
+        """Create a revocation state cache from the configuration settings."""
+        return cls(
+            refresh_interval=settings.get("revocation_state.refresh_interval"),
+            refresh_threshold=settings.get("revocation_state.refresh_threshold"),
+        )
+
+    @property
+    def stats(self) -> dict:
+        """Get the revocation state cache statistics."""
+        return {
+            "rev_state_hits": self.hits,
+            "rev_state_created": self.created,
+            "rev_state_updated": self.updated,
+            "rev_state_refreshed": self.refreshed,
+        }
+
+    async def get_state(
+        self,
+        profile: Profile,
+        rev_reg: RevocationRegistry,
+        cred_rev_id: str,
+        rev_reg_delta: dict,
+        timestamp: int,
+    ) -> str:
+        """
+        Get the revocation state of a credential, computing it if necessary.
+
+        Args:
+            profile: The holder's profile
+            rev_reg: The revocation registry of the credential
+            cred_rev_id: The credential revocation id in the registry
+            rev_reg_delta: The registry delta up to the timestamp
+            timestamp: The delta timestamp
+
+        Returns:
+            The revocation state
+
+        """
+        self._track(profile, rev_reg, cred_rev_id)
+        key = (profile.name, rev_reg.registry_id, cred_rev_id, timestamp)
+        task = self._in_flight.get(key)
+        if not task:
+            task = asyncio.ensure_future(
+                self._get_state(profile, rev_reg, cred_rev_id, rev_reg_delta, timestamp)
+            )
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        # a cancelled caller must not cancel the computation shared with others
+        return await asyncio.shield(task)
+
+    async def _get_state(
+        self,
+        profile: Profile,
+        rev_reg: RevocationRegistry,
+        cred_rev_id: str,
+        rev_reg_delta: dict,
+        timestamp: int,
+    ) -> str:
+        """Find or compute a revocation state."""
+        records = await self._find_states(profile, rev_reg.registry_id, cred_rev_id)
+        for record in records:
+            if _timestamp(record) == timestamp:
+                self.hits += 1
+                return record.value
+
+        state = None
+        earlier = [record for record in records if _timestamp(record) < timestamp]
+        if earlier:
+            updated, updated_timestamp = await self._update_state(
+                profile, rev_reg, cred_rev_id, max(earlier, key=_timestamp), timestamp
+            )
+            if updated_timestamp == timestamp:
+                state = updated
+                self.updated += 1
+        if not state:
+            holder = profile.inject(IndyHolder)
+            state = await holder.create_revocation_state(
+                cred_rev_id,
+                rev_reg.reg_def,
+                rev_reg_delta,
+                timestamp,
+                await rev_reg.get_or_fetch_local_tails_path(profile),
+            )
+            self.created += 1
+        await self._store_state(
+            profile, rev_reg.registry_id, cred_rev_id, timestamp, state, records
+        )
+        return state
+
+    async def _update_state(
+        self,
+        profile: Profile,
+        rev_reg: RevocationRegistry,
+        cred_rev_id: str,
+        record: StorageRecord,
+        timestamp_to: int,
+    ) -> Tuple[str, int]:
+        """Update a cached revocation state with the delta since its timestamp."""
+        ledger = profile.inject(BaseLedger)
+        async with ledger:
+            delta, timestamp = await ledger.get_revoc_reg_delta(
+                rev_reg.registry_id, _timestamp(record), timestamp_to
+            )
+        if timestamp <= _timestamp(record):
+            # no change since the cached state
+            return record.value, _timestamp(record)
+        holder = profile.inject(IndyHolder)
+        state = await holder.update_revocation_state(
+            cred_rev_id,
+            rev_reg.reg_def,
+            record.value,
+            delta,
+            timestamp,
+            await rev_reg.get_or_fetch_local_tails_path(profile),
+        )
+        return state, timestamp
+
+    async def _find_states(
+        self, profile: Profile, rev_reg_id: str, cred_rev_id: str
+    ) -> Sequence[StorageRecord]:
+        """Find the cached revocation states of a credential."""
+        async with profile.session() as session:
+            storage = session.inject(BaseStorage)
+            return await storage.find_all_records(
+                RECORD_TYPE, {"rev_reg_id": rev_reg_id, "cred_rev_id": cred_rev_id}
+            )
+
+    async def _store_state(
+        self,
+        profile: Profile,
+        rev_reg_id: str,
+        cred_rev_id: str,
+        timestamp: int,
+        state: str,
+        records: Sequence[StorageRecord],
+    ):
+        """Store a revocation state, removing the oldest beyond the limit."""
+        if any(_timestamp(record) == timestamp for record in records):
+            return
+        record = StorageRecord(
+            RECORD_TYPE,
+            state,
+            {
+                "rev_reg_id": rev_reg_id,
+                "cred_rev_id": cred_rev_id,
+                "timestamp": str(timestamp),
+            },
+        )
+        expired = sorted([*records, record], key=_timestamp, reverse=True)
+        del expired[: self.max_states]
+        if record in expired:
+            # older than the states kept
+            return
+        async with profile.session() as session:
+            storage = session.inject(BaseStorage)
+            await storage.add_record(record)
+            for old in expired:
+                await storage.delete_record(old)
+
+    def _track(self, profile: Profile, rev_reg: RevocationRegistry, cred_rev_id: str):
+        """Count a presentation of a credential, for background refresh."""
+        if not self.refresh_interval:
+            return
+        key = (profile.name, rev_reg.registry_id, cred_rev_id)
+        if key in self._presented:
+            self._presented[key][0] += 1
+        else:
+            self._presented[key] = [1, profile, rev_reg, cred_rev_id]
+        if not self._refresh_task:
+            self._refresh_task = asyncio.ensure_future(self._refresh_loop())
+
+    async def _refresh_loop(self):
+        """Refresh the states of frequently presented credentials periodically."""
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            await self.refresh()
+
+    async def refresh(self):
+        """Bring the cached states of frequently presented credentials up to date."""
+        presented, self._presented = self._presented, {}
+        for count, profile, rev_reg, cred_rev_id in presented.values():
+            if count < self.refresh_threshold:
+                continue
+            try:
+                records = await self._find_states(
+                    profile, rev_reg.registry_id, cred_rev_id
+                )
+                if not records:
+                    continue
+                latest = max(records, key=_timestamp)
+                state, timestamp = await self._update_state(
+                    profile, rev_reg, cred_rev_id, latest, int(time.time())
+                )
+                if timestamp > _timestamp(latest):
+                    await self._store_state(
+                        profile,
+                        rev_reg.registry_id,
+                        cred_rev_id,
+                        timestamp,
+                        state,
+                        records,
+                    )
+                    self.refreshed += 1
+            except Exception as err:
+                LOGGER.warning(
+                    "Error refreshing revocation state for %s: %s",
+                    rev_reg.registry_id,
+                    err,
+                )
+
+    def close(self):
+        """Stop refreshing revocation states."""
+        if self._refresh_task:
+            self._refresh_task.cancel()
+            self._refresh_task = None
@@ -0,0 +1,203 @@
+"""Cache of tails files downloaded from tails servers."""
+
+import asyncio
+import json
+import logging
+import os
+
+from collections import OrderedDict
+from os.path import join
+from typing import TYPE_CHECKING, Awaitable, Callable
+
+from ...config.settings import Settings
+from ...core.profile import Profile
+from ...indy.util import indy_client_dir
+
+if TYPE_CHECKING:  # To avoid circular import error
+    from .revocation_registry import RevocationRegistry
+
+LOGGER = logging.getLogger(__name__)
+
+INDEX_FILE = ".cache_index.json"
+
+
+class TailsCacheManager:
+    """
+    Manager of the tails files downloaded for revocation registries.
+
+    Concurrent requests for the same tails file share a single download.
+    Downloaded files are recorded in an index, in least recently used order,
+    and if a maximum size is set the least recently used files are removed to
+    stay within it. Only downloaded files are indexed: tails files created by
+    the agent as an issuer are never removed.
+    """
+
+    def __init__(self, max_bytes: int = None, tails_dir: str = None):
+        """
+        Initialize the tails cache manager.
+
+        Args:
+            max_bytes: The maximum total size of the downloaded tails files
+            tails_dir: The directory of the index, by default the tails directory
+
+        """
+        self.max_bytes = max_bytes
+        self.tails_dir = tails_dir
+        self.hits = 0
+        self.misses = 0
+        self.downloads = 0
+        self.download_failed = 0
+        self.bytes_downloaded = 0
+        self.evictions = 0
+        self._index: OrderedDict = None
+        self._in_flight = {}
+        self._prefetched = set()
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "TailsCacheManager":
+        """Create a tails cache manager from the configuration settings."""
+        return cls(max_bytes=settings.get("tails_cache.max_bytes"))
+
+    @property
+    def stats(self) -> dict:
+        """Get the tails cache statistics."""
+        index = self._index or {}
+        return {
+            "tails_cached": len(index),
+            "tails_cached_bytes": sum(index.values()),
+            "tails_hits": self.hits,
+            "tails_misses": self.misses,
+            "tails_downloads": self.downloads,
+            "tails_download_failed": self.download_failed,
+            "tails_bytes_downloaded": self.bytes_downloaded,
+            "tails_evictions": self.evictions,
+        }
+
+    @property
+    def index_path(self) -> str:
+        """Accessor for the path of the index file."""
+        return join(self.tails_dir or indy_client_dir("tails"), INDEX_FILE)
+
+    def _load_index(self) -> OrderedDict:
+        """Get the index of downloaded files, reading it if necessary."""
+        if self._index is None:
+            self._index = OrderedDict()
+            try:
+                with open(self.index_path) as index_file:
+                    entries = json.load(index_file)
+            except FileNotFoundError:
+                entries = []
+            except (OSError, ValueError) as err:
+                LOGGER.warning("Could not read tails cache index: %s", err)
+                entries = []
+            for path, size in entries:
+                if os.path.isfile(path):
+                    self._index[path] = size
+        return self._index
+
+    def _save_index(self):
+        """Write the index of downloaded files."""
+        index_path = self.index_path
+        tmp_path = f"{index_path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(index_path), exist_ok=True)
+            with open(tmp_path, "w") as index_file:
+                json.dump(list(self._index.items()), index_file)
+            os.replace(tmp_path, index_path)
+        except OSError as err:
+            LOGGER.warning("Could not write tails cache index: %s", err)
+
+    def _evict(self):
+        """Remove least recently used files until within the maximum size."""
+        index = self._index
+        total = sum(index.values())
+        for path in list(index):
+            if total <= self.max_bytes:
+                break
+            # files being downloaded, including the newest, are kept
+            if path in self._in_flight:
+                continue
+            total -= index.pop(path)
+            self.evictions += 1
+            LOGGER.info("Removing cached tails file: %s", path)
+            try:
+                os.remove(path)
+                os.rmdir(os.path.dirname(path))
+            except OSError:
+                pass
+
+    async def get_path(
+        self, rev_reg: "RevocationRegistry", profile: Profile = None
+    ) -> str:
+        """
+        Get the local tails path of a registry, downloading the file if necessary.
+
+        Args:
+            rev_reg: The revocation registry
+            profile: The profile providing the shared HTTP client, if any
+
+        """
+        path = str(rev_reg.get_receiving_tails_local_path())
+        index = self._load_index()
+        if path not in self._in_flight and os.path.isfile(path):
+            self.hits += 1
+            if path in index:
+                index.move_to_end(path)
+            return path
+
+        self.misses += 1
+        download = self._in_flight.get(path)
+        if not download:
+            download = asyncio.ensure_future(self._download(rev_reg, profile, path))
+            self._in_flight[path] = download
+            download.add_done_callback(lambda _: self._in_flight.pop(path, None))
+        # a cancelled caller must not cancel the download shared with others
+        return await asyncio.shield(download)
+
+    async def _download(
+        self, rev_reg: "RevocationRegistry", profile: Profile, path: str
+    ) -> str:
+        """Download a tails file and record it in the index."""
+        try:
+            result = await rev_reg.retrieve_tails(profile)
+        except Exception:
+            self.download_failed += 1
+            raise
+        size = os.path.getsize(result)
+        self.downloads += 1
+        self.bytes_downloaded += size
+        self._index[str(result)] = size
+        if self.max_bytes:
+            self._evict()
+        self._save_index()
+        return str(result)
+
+    def prefetch(
+        self, rev_reg_id: str, fetch: Callable[[], Awaitable]
+    ) -> asyncio.Future:
+        """
+        Start fetching the tails file of a newly seen registry in the background.
+
+        Args:
+            rev_reg_id: The revocation registry identifier
+            fetch: Function returning an awaitable which fetches the tails file
+
+        Returns:
+            The background task, or None if the registry was already seen
+
+        """
+        if rev_reg_id in self._prefetched:
+            return None
+        self._prefetched.add(rev_reg_id)
+
+        async def run():
+            try:
+                await fetch()
+            except Exception as err:
+                # the tails file is fetched again when it is needed
+                self._prefetched.discard(rev_reg_id)
+                LOGGER.warning(
+                    "Error prefetching tails file for %s: %s", rev_reg_id, err
+                )
+
+        return asyncio.ensure_future(run())
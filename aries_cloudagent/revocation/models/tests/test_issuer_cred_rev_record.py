@@ -94,3 +94,20 @@ class TestIssuerCredRevRecord(AsyncTestCase):
             await IssuerCredRevRecord.retrieve_by_ids(
                 self.session, rev_reg_id=REV_REG_ID, cred_rev_id="2"
             )
+
+    async def test_query_by_cred_rev_ids(self):
+        for i in range(3):
+            await IssuerCredRevRecord(
+                state=IssuerCredRevRecord.STATE_ISSUED,
+                cred_ex_id=test_module.UUIDFour.EXAMPLE,
+                rev_reg_id=REV_REG_ID,
+                cred_rev_id=str(i + 1),
+            ).save(self.session)
+
+        recs = await IssuerCredRevRecord.query_by_cred_rev_ids(
+            self.session, REV_REG_ID, [1, "3", "4"]
+        )
+        assert sorted(rec.cred_rev_id for rec in recs) == ["1", "3"]
+        assert not await IssuerCredRevRecord.query_by_cred_rev_ids(
+            self.session, "other-rev-reg-id", ["1"]
+        )
@@ -9,11 +9,13 @@ from shutil import rmtree
 
 import base58
 
+from ....core.in_memory import InMemoryProfile
 from ....indy.util import indy_client_dir
 
 from ...error import RevocationError
 
 from ..revocation_registry import RevocationRegistry
+from ..tails_cache import TailsCacheManager
 
 from .. import revocation_registry as test_module
 
@@ -105,69 +107,70 @@ class TestRevocationRegistry(AsyncTestCase):
         rr_def_public["value"]["tailsLocation"] = "http://sample.ca:8088/path"
         rev_reg = RevocationRegistry.from_definition(rr_def_public, public_def=True)
 
-        more_magic = async_mock.MagicMock()
         with async_mock.patch.object(
-            test_module, "Session", autospec=True
-        ) as mock_session:
-            mock_session.return_value.__enter__ = async_mock.MagicMock(
-                return_value=more_magic
-            )
-            more_magic.get = async_mock.MagicMock(
-                side_effect=test_module.RequestException("Not this time")
-            )
-
+            test_module.HttpClient,
+            "download",
+            async_mock.CoroutineMock(
+                side_effect=test_module.FetchError("Not this time")
+            ),
+        ):
             with self.assertRaises(RevocationError) as x_retrieve:
                 await rev_reg.retrieve_tails()
-                assert x_retrieve.message.contains("Error retrieving tails file")
+            assert "Error retrieving tails file" in x_retrieve.exception.message
 
             rmtree(TAILS_DIR, ignore_errors=True)
 
-        more_magic = async_mock.MagicMock()
-        with async_mock.patch.object(
-            test_module, "Session", autospec=True
-        ) as mock_session:
-            mock_session.return_value.__enter__ = async_mock.MagicMock(
-                return_value=more_magic
-            )
-            more_magic.get = async_mock.MagicMock(
-                return_value=async_mock.MagicMock(
-                    iter_content=async_mock.MagicMock(
-                        side_effect=[(b"abcd1234",), (b"",)]
-                    )
-                )
-            )
+        async def download(url, file_path, chunk_size, digest):
+            with open(file_path, "wb") as out:
+                out.write(b"abcd1234")
+            digest.update(b"abcd1234")
 
+        with async_mock.patch.object(
+            test_module.HttpClient,
+            "download",
+            async_mock.CoroutineMock(side_effect=download),
+        ):
             with self.assertRaises(RevocationError) as x_retrieve:
                 await rev_reg.retrieve_tails()
-                assert x_retrieve.message.contains(
-                    "The hash of the downloaded tails file does not match."
-                )
+            assert "does not match" in x_retrieve.exception.message
+            # the unverified download is not kept
+            assert not rev_reg.has_local_tails_file()
+            assert not list(
+                Path(rev_reg.get_receiving_tails_local_path()).parent.iterdir()
+            )
 
             rmtree(TAILS_DIR, ignore_errors=True)
 
-        more_magic = async_mock.MagicMock()
+        # the profile's shared client is used when available
+        http_client = async_mock.MagicMock(
+            download=async_mock.CoroutineMock(side_effect=download)
+        )
+        profile = InMemoryProfile.test_profile()
+        profile.context.injector.bind_instance(test_module.HttpClient, http_client)
         with async_mock.patch.object(
-            test_module, "Session", autospec=True
-        ) as mock_session, async_mock.patch.object(
             base58, "b58encode", async_mock.MagicMock()
         ) as mock_b58enc, async_mock.patch.object(
             Path, "is_file", autospec=True
         ) as mock_is_file:
-            mock_session.return_value.__enter__ = async_mock.MagicMock(
-                return_value=more_magic
-            )
-            more_magic.get = async_mock.MagicMock(
-                return_value=async_mock.MagicMock(
-                    iter_content=async_mock.MagicMock(
-                        side_effect=[(b"abcd1234",), (b"",)]
-                    )
-                )
-            )
             mock_is_file.return_value = False
 
             mock_b58enc.return_value = async_mock.MagicMock(
                 decode=async_mock.MagicMock(return_value=TAILS_HASH)
             )
-            await rev_reg.get_or_fetch_local_tails_path()
+            assert await rev_reg.get_or_fetch_local_tails_path(profile)
+            http_client.download.assert_awaited_once()
+            assert http_client.download.call_args[0][0] == "http://sample.ca:8088/path"
 
             rmtree(TAILS_DIR, ignore_errors=True)
+
+    async def test_get_or_fetch_local_tails_path_cache(self):
+        rev_reg = RevocationRegistry.from_definition(REV_REG_DEF, public_def=True)
+        tails_cache = async_mock.MagicMock(
+            TailsCacheManager,
+            autospec=True,
+            get_path=async_mock.CoroutineMock(return_value="/tmp/tails"),
+        )
+        profile = InMemoryProfile.test_profile()
+        profile.context.injector.bind_instance(TailsCacheManager, tails_cache)
+        assert await rev_reg.get_or_fetch_local_tails_path(profile) == "/tmp/tails"
+        tails_cache.get_path.assert_awaited_once_with(rev_reg, profile)
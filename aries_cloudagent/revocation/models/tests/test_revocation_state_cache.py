@@ -0,0 +1,138 @@
+import asyncio
+import json
+
+from asynctest import TestCase as AsyncTestCase, mock as async_mock
+
+from ....config.settings import Settings
+from ....core.in_memory import InMemoryProfile
+from ....indy.holder import IndyHolder
+from ....ledger.base import BaseLedger
+from ....storage.base import BaseStorage
+
+from .. import revocation_state_cache as test_module
+from ..revocation_state_cache import RECORD_TYPE, RevocationStateCache
+
+REV_REG_ID = "FkjWznKwA4N1JEp2iPiKPG:4:FkjWznKwA4N1JEp2iPiKPG:3:CL:12:tag1:CL_ACCUM:0"
+
+
+class TestRevocationStateCache(AsyncTestCase):
+    async def setUp(self):
+        self.holder = async_mock.MagicMock(IndyHolder, autospec=True)
+        self.holder.create_revocation_state = async_mock.CoroutineMock(
+            side_effect=self.create_state
+        )
+        self.holder.update_revocation_state = async_mock.CoroutineMock(
+            side_effect=self.update_state
+        )
+        self.ledger = async_mock.MagicMock(BaseLedger, autospec=True)
+        self.ledger.get_revoc_reg_delta = async_mock.CoroutineMock(
+            side_effect=lambda rev_reg_id, ts_from, ts_to: ({"to": ts_to}, ts_to)
+        )
+        self.profile = InMemoryProfile.test_profile(
+            bind={IndyHolder: self.holder, BaseLedger: self.ledger}
+        )
+        self.rev_reg = async_mock.MagicMock(
+            registry_id=REV_REG_ID,
+            reg_def={"id": REV_REG_ID},
+            get_or_fetch_local_tails_path=async_mock.CoroutineMock(
+                return_value="/tmp/tails"
+            ),
+        )
+        self.cache = RevocationStateCache()
+
+    async def create_state(self, cred_rev_id, rev_reg_def, delta, timestamp, tails):
+        await asyncio.sleep(0.01)
+        return json.dumps({"timestamp": timestamp, "created": True})
+
+    async def update_state(
+        self, cred_rev_id, rev_reg_def, state, delta, timestamp, tails
+    ):
+        return json.dumps({"timestamp": timestamp, "from": json.loads(state)})
+
+    async def stored_timestamps(self):
+        async with self.profile.session() as session:
+            records = await session.inject(BaseStorage).find_all_records(
+                RECORD_TYPE, {"rev_reg_id": REV_REG_ID, "cred_rev_id": "1"}
+            )
+        return sorted(int(record.tags["timestamp"]) for record in records)
+
+    async def test_get_state(self):
+        results = await asyncio.gather(
+            *(
+                self.cache.get_state(self.profile, self.rev_reg, "1", {}, 100)
+                for _ in range(3)
+            )
+        )
+        assert all(json.loads(result)["created"] for result in results)
+        self.holder.create_revocation_state.assert_awaited_once_with(
+            "1", {"id": REV_REG_ID}, {}, 100, "/tmp/tails"
+        )
+
+        # cached
+        result = await self.cache.get_state(self.profile, self.rev_reg, "1", {}, 100)
+        assert json.loads(result)["timestamp"] == 100
+        assert self.holder.create_revocation_state.await_count == 1
+        assert self.cache.stats["rev_state_hits"] == 1
+
+        # updated from the cached state
+        result = await self.cache.get_state(self.profile, self.rev_reg, "1", {}, 200)
+        assert json.loads(result)["from"]["timestamp"] == 100
+        self.ledger.get_revoc_reg_delta.assert_awaited_once_with(REV_REG_ID, 100, 200)
+        assert self.cache.stats["rev_state_updated"] == 1
+
+        # older states are removed
+        await self.cache.get_state(self.profile, self.rev_reg, "1", {}, 300)
+        assert await self.stored_timestamps() == [200, 300]
+
+        # states older than those kept are not stored
+        await self.cache.get_state(self.profile, self.rev_reg, "1", {}, 50)
+        assert await self.stored_timestamps() == [200, 300]
+        assert self.cache.stats["rev_state_created"] == 2
+
+    async def test_get_state_no_change(self):
+        await self.cache.get_state(self.profile, self.rev_reg, "1", {}, 100)
+        self.ledger.get_revoc_reg_delta.side_effect = None
+        self.ledger.get_revoc_reg_delta.return_value = ({}, 100)
+        await self.cache.get_state(self.profile, self.rev_reg, "1", {}, 200)
+        # created from the full delta instead
+        assert self.holder.create_revocation_state.await_count == 2
+        assert await self.stored_timestamps() == [100, 200]
+
+    async def test_refresh(self):
+        cache = RevocationStateCache(refresh_interval=3600, refresh_threshold=2)
+        other_profile = InMemoryProfile.test_profile(
+            bind={IndyHolder: self.holder, BaseLedger: self.ledger}
+        )
+        await cache.get_state(self.profile, self.rev_reg, "1", {}, 100)
+        await cache.get_state(self.profile, self.rev_reg, "1", {}, 100)
+        await cache.get_state(other_profile, self.rev_reg, "1", {}, 100)
+        assert cache._refresh_task
+
+        with async_mock.patch.object(
+            test_module.time, "time", async_mock.MagicMock(return_value=500)
+        ):
+            await cache.refresh()
+        assert await self.stored_timestamps() == [100, 500]
+        assert cache.stats["rev_state_refreshed"] == 1
+
+        # not presented since
+        await cache.refresh()
+        assert cache.stats["rev_state_refreshed"] == 1
+
+        cache.close()
+        assert not cache._refresh_task
+
+    async def test_refresh_error(self):
+        cache = RevocationStateCache(refresh_interval=3600, refresh_threshold=1)
+        await cache.get_state(self.profile, self.rev_reg, "1", {}, 100)
+        self.ledger.get_revoc_reg_delta.side_effect = ValueError("Not this time")
+        await cache.refresh()
+        assert cache.stats["rev_state_refreshed"] == 0
+        cache.close()
+
+    def test_settings(self):
+        cache = RevocationStateCache.from_settings(
+            Settings({"revocation_state.refresh_interval": 60})
+        )
+        assert cache.refresh_interval == 60
+        assert cache.refresh_threshold == 3
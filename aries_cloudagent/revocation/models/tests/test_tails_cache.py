@@ -0,0 +1,134 @@
+import asyncio
+import json
+import os
+import tempfile
+
+from asynctest import TestCase as AsyncTestCase, mock as async_mock
+
+from ....config.settings import Settings
+
+from ..tails_cache import INDEX_FILE, TailsCacheManager
+
+
+class FakeRegistry:
+    def __init__(self, tails_dir, name, content=b"tails"):
+        self.path = os.path.join(tails_dir, name, "hash")
+        self.content = content
+        self.calls = 0
+        self.fail = False
+
+    def get_receiving_tails_local_path(self):
+        return self.path
+
+    async def retrieve_tails(self, profile=None):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        if self.fail:
+            raise ValueError("Not this time")
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "wb") as tails_file:
+            tails_file.write(self.content)
+        return self.path
+
+
+class TestTailsCacheManager(AsyncTestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.tails_dir = self.tmp_dir.name
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    async def test_get_path_single_flight(self):
+        manager = TailsCacheManager(tails_dir=self.tails_dir)
+        rev_reg = FakeRegistry(self.tails_dir, "reg1")
+        results = await asyncio.gather(*(manager.get_path(rev_reg) for _ in range(5)))
+        assert results == [rev_reg.path] * 5
+        assert rev_reg.calls == 1
+
+        assert await manager.get_path(rev_reg) == rev_reg.path
+        assert rev_reg.calls == 1
+        stats = manager.stats
+        assert stats["tails_hits"] == 1
+        assert stats["tails_misses"] == 5
+        assert stats["tails_downloads"] == 1
+        assert stats["tails_bytes_downloaded"] == len(b"tails")
+        assert stats["tails_cached"] == 1
+
+        with open(os.path.join(self.tails_dir, INDEX_FILE)) as index_file:
+            assert json.load(index_file) == [[rev_reg.path, 5]]
+
+    async def test_get_path_failed(self):
+        manager = TailsCacheManager(tails_dir=self.tails_dir)
+        rev_reg = FakeRegistry(self.tails_dir, "reg1")
+        rev_reg.fail = True
+        with self.assertRaises(ValueError):
+            await manager.get_path(rev_reg)
+        assert manager.stats["tails_download_failed"] == 1
+
+        rev_reg.fail = False
+        assert await manager.get_path(rev_reg) == rev_reg.path
+        assert rev_reg.calls == 2
+
+    async def test_get_path_cancelled_waiter(self):
+        manager = TailsCacheManager(tails_dir=self.tails_dir)
+        rev_reg = FakeRegistry(self.tails_dir, "reg1")
+        first = asyncio.ensure_future(manager.get_path(rev_reg))
+        second = asyncio.ensure_future(manager.get_path(rev_reg))
+        await asyncio.sleep(0)
+        first.cancel()
+        assert await second == rev_reg.path
+        assert rev_reg.calls == 1
+
+    async def test_evict(self):
+        manager = TailsCacheManager(max_bytes=10, tails_dir=self.tails_dir)
+        regs = [FakeRegistry(self.tails_dir, f"reg{i}", b"0123") for i in range(3)]
+        await manager.get_path(regs[0])
+        await manager.get_path(regs[1])
+        # most recently used
+        await manager.get_path(regs[0])
+        await manager.get_path(regs[2])
+
+        assert os.path.isfile(regs[0].path)
+        assert not os.path.exists(os.path.dirname(regs[1].path))
+        assert os.path.isfile(regs[2].path)
+        assert manager.stats["tails_evictions"] == 1
+        assert manager.stats["tails_cached_bytes"] == 8
+
+        # the index is restored, without removed files
+        os.remove(regs[0].path)
+        restored = TailsCacheManager(max_bytes=10, tails_dir=self.tails_dir)
+        assert await restored.get_path(regs[2]) == regs[2].path
+        assert list(restored._index) == [regs[2].path]
+
+    async def test_untracked_file(self):
+        manager = TailsCacheManager(max_bytes=1, tails_dir=self.tails_dir)
+        issuer_reg = FakeRegistry(self.tails_dir, "issuer")
+        await issuer_reg.retrieve_tails()
+        assert await manager.get_path(issuer_reg) == issuer_reg.path
+        assert manager.stats["tails_cached"] == 0
+
+        await manager.get_path(FakeRegistry(self.tails_dir, "reg1"))
+        assert os.path.isfile(issuer_reg.path)
+
+    async def test_bad_index(self):
+        with open(os.path.join(self.tails_dir, INDEX_FILE), "w") as index_file:
+            index_file.write("{")
+        manager = TailsCacheManager(tails_dir=self.tails_dir)
+        rev_reg = FakeRegistry(self.tails_dir, "reg1")
+        assert await manager.get_path(rev_reg) == rev_reg.path
+
+    async def test_prefetch(self):
+        manager = TailsCacheManager(tails_dir=self.tails_dir)
+        fetch = async_mock.CoroutineMock(side_effect=[ValueError("Not yet"), None])
+        await manager.prefetch("reg1", fetch)
+        # a failed prefetch may be repeated
+        await manager.prefetch("reg1", fetch)
+        assert manager.prefetch("reg1", fetch) is None
+        assert fetch.await_count == 2
+
+    def test_settings(self):
+        manager = TailsCacheManager.from_settings(
+            Settings({"tails_cache.max_bytes": 1024})
+        )
+        assert manager.max_bytes == 1024
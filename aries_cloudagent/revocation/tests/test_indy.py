@@ -18,6 +18,7 @@ from ..error import (
 from ..indy import IndyRevocation
 from ..models.issuer_rev_reg_record import DEFAULT_REGISTRY_SIZE, IssuerRevRegRecord
 from ..models.revocation_registry import RevocationRegistry
+from ..models.tails_cache import TailsCacheManager
 
 
 @pytest.mark.indy
@@ -144,3 +145,20 @@ class TestIndyRevocation(AsyncTestCase):
         mock_from_def.assert_called_once_with(
             self.ledger.get_revoc_reg_def.return_value, True
         )
+
+    async def test_prefetch_tails(self):
+        assert self.revoc.prefetch_tails("dummy") is None
+
+        tails_cache = async_mock.MagicMock(
+            TailsCacheManager, autospec=True, get_path=async_mock.CoroutineMock()
+        )
+        tails_cache.prefetch.side_effect = lambda _, fetch: fetch()
+        self.profile.context.injector.bind_instance(TailsCacheManager, tails_cache)
+        with async_mock.patch.object(
+            self.revoc, "get_ledger_registry", async_mock.CoroutineMock()
+        ) as mock_get_reg:
+            await self.revoc.prefetch_tails("dummy")
+        mock_get_reg.assert_awaited_once_with("dummy")
+        tails_cache.get_path.assert_awaited_once_with(
+            mock_get_reg.return_value, self.profile
+        )
@@ -1,6 +1,7 @@
 """Basic in-memory storage implementation (non-wallet)."""
 
-from typing import Mapping, Sequence
+from itertools import islice
+from typing import Iterator, Mapping, Sequence
 
 from ..core.in_memory import InMemoryProfile
 
@@ -17,6 +18,7 @@ from .error import (
     StorageSearchError,
 )
 from .record import StorageRecord
+from .record_index import RecordIndex
 
 
 class InMemoryStorage(BaseStorage, BaseStorageSearch):
@@ -115,11 +117,7 @@ class InMemoryStorage(BaseStorage, BaseStorageSearch):
         options: Mapping = None,
     ):
         """Retrieve all records matching a particular type filter and tag query."""
-        results = []
-        for record in self.profile.records.values():
-            if record.type == type_filter and tag_query_match(record.tags, tag_query):
-                results.append(record)
-        return results
+        return list(_match_records(self.profile.records, type_filter, tag_query))
 
     async def delete_all_records(
         self,
@@ -127,12 +125,9 @@ class InMemoryStorage(BaseStorage, BaseStorageSearch):
         tag_query: Mapping = None,
     ):
         """Remove all records matching a particular type filter and tag query."""
-        ids = []
-        for record_id, record in self.profile.records.items():
-            if record.type == type_filter and tag_query_match(record.tags, tag_query):
-                ids.append(record_id)
-        for record_id in ids:
-            del self.profile.records[record_id]
+        records = self.profile.records
+        for record in list(_match_records(records, type_filter, tag_query)):
+            del records[record.id]
 
     def search_records(
         self,
@@ -228,6 +223,27 @@ def tag_query_match(tags: dict, tag_query: dict) -> bool:
     return result
 
 
+def _match_records(
+    records: Mapping, type_filter: str, tag_query: Mapping = None
+) -> Iterator[StorageRecord]:
+    """Lazily iterate the records matching a type filter and tag query."""
+    if isinstance(records, RecordIndex):
+        ids, exact = records.candidates(type_filter, tag_query)
+        for record_id in ids:
+            record = records.get(record_id)
+            # records may be removed or updated while iterating
+            if (
+                record
+                and record.type == type_filter
+                and (exact or tag_query_match(record.tags, tag_query))
+            ):
+                yield record
+    else:
+        for record in list(records.values()):
+            if record.type == type_filter and tag_query_match(record.tags, tag_query):
+                yield record
+
+
 class InMemoryStorageSearch(BaseStorageSearchSession):
     """Represent an active stored records search."""
 
@@ -250,8 +266,7 @@ class InMemoryStorageSearch(BaseStorageSearchSession):
             options: Dictionary of backend-specific options
 
         """
-        self._cache = profile.records.copy()
-        self._iter = iter(self._cache)
+        self._iter = _match_records(profile.records, type_filter, tag_query)
         self.page_size = page_size or DEFAULT_PAGE_SIZE
         self.tag_query = tag_query
         self.type_filter = type_filter
@@ -271,30 +286,16 @@ class InMemoryStorageSearch(BaseStorageSearchSession):
             StorageSearchError: If the search query has not been opened
 
         """
-        if self._cache is None:
+        if self._iter is None:
             raise StorageSearchError("Search query is complete")
 
-        ret = []
-        check_type = self.type_filter
-        i = max_count or self.page_size
-
-        while i > 0:
-            try:
-                id = next(self._iter)
-            except StopIteration:
-                break
-            record = self._cache[id]
-            if record.type == check_type and tag_query_match(
-                record.tags, self.tag_query
-            ):
-                ret.append(record)
-                i -= 1
+        ret = list(islice(self._iter, max_count or self.page_size))
 
         if not ret:
-            self._cache = None
+            self._iter = None
 
         return ret
 
     async def close(self):
         """Dispose of the search query."""
-        self._cache = None
+        self._iter = None
@@ -0,0 +1,206 @@
+"""Indexed record mapping used by the in-memory storage implementation."""
+
+from collections.abc import MutableMapping
+from itertools import count
+from typing import Iterator, Mapping, Optional, Sequence, Set, Tuple
+
+from .record import StorageRecord
+
+
+class RecordIndex(MutableMapping):
+    """
+    Mapping of record ID to `StorageRecord` with secondary indexes.
+
+    Maintains a record type to IDs map and an inverted index of tag values
+    per record type, so that tag queries may be resolved to a set of
+    candidate records without visiting every stored record.
+    """
+
+    def __init__(self):
+        """Initialize an empty `RecordIndex` instance."""
+        self._records = {}
+        # record type -> {record id -> insertion sequence}
+        self._types = {}
+        # record type -> tag name -> tag value -> set of record ids
+        self._tags = {}
+        self._seq = count()
+
+    def __getitem__(self, record_id: str) -> StorageRecord:
+        """Fetch a record by ID."""
+        return self._records[record_id]
+
+    def __setitem__(self, record_id: str, record: StorageRecord):
+        """Add or replace a record, updating the indexes."""
+        old = self._records.get(record_id)
+        if old:
+            seq = self._unindex(old)
+        else:
+            seq = next(self._seq)
+        self._records[record_id] = record
+        self._types.setdefault(record.type, {})[record_id] = seq
+        if record.tags:
+            by_name = self._tags.setdefault(record.type, {})
+            for name, value in record.tags.items():
+                if value is None:
+                    continue
+                try:
+                    by_name.setdefault(name, {}).setdefault(value, set()).add(record_id)
+                except TypeError:
+                    # unhashable tag value, leave it out of the index
+                    pass
+
+    def __delitem__(self, record_id: str):
+        """Remove a record and its index entries."""
+        record = self._records.pop(record_id)
+        self._unindex(record)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over all record IDs in insertion order."""
+        return iter(self._records)
+
+    def __len__(self) -> int:
+        """Get the total number of records."""
+        return len(self._records)
+
+    def _unindex(self, record: StorageRecord) -> int:
+        """Remove a record from the indexes, returning its sequence number."""
+        bucket = self._types[record.type]
+        seq = bucket.pop(record.id)
+        if not bucket:
+            del self._types[record.type]
+        by_name = self._tags.get(record.type)
+        if by_name and record.tags:
+            for name, value in record.tags.items():
+                by_value = by_name.get(name)
+                try:
+                    ids = by_value and by_value.get(value)
+                except TypeError:
+                    continue
+                if ids:
+                    ids.discard(record.id)
+                    if not ids:
+                        del by_value[value]
+                        if not by_value:
+                            del by_name[name]
+            if not by_name:
+                del self._tags[record.type]
+        return seq
+
+    def count_type(self, type_filter: str) -> int:
+        """Get the number of records of a given type."""
+        return len(self._types.get(type_filter, ()))
+
+    def candidates(
+        self, type_filter: str, tag_query: Mapping = None
+    ) -> Tuple[Sequence[str], bool]:
+        """
+        Resolve a type filter and tag query to a list of candidate record IDs.
+
+        The IDs are returned in insertion order. The second element of the
+        result indicates whether every candidate is known to match the tag
+        query; when it is False the caller must still apply the full query.
+        Malformed queries are never rejected here, they are left to the
+        caller to report.
+        """
+        bucket = self._types.get(type_filter)
+        if not bucket:
+            return [], True
+        ids, exact = self._plan(type_filter, tag_query)
+        if ids is None:
+            return list(bucket), exact
+        return sorted(ids, key=bucket.__getitem__), exact
+
+    def _tag_ids(self, type_filter: str, name: str, value) -> Set[str]:
+        """Get the IDs of records of a type having a given tag value."""
+        by_value = self._tags.get(type_filter, {}).get(name)
+        return (by_value and by_value.get(value)) or set()
+
+    def _name_ids(self, type_filter: str, name: str) -> Set[str]:
+        """Get the IDs of records of a type having any value for a tag."""
+        by_value = self._tags.get(type_filter, {}).get(name)
+        if not by_value:
+            return set()
+        if len(by_value) == 1:
+            return next(iter(by_value.values()))
+        return set().union(*by_value.values())
+
+    def _plan(
+        self, type_filter: str, tag_query: Optional[Mapping]
+    ) -> Tuple[Optional[Set[str]], bool]:
+        """
+        Compute the candidate ID set for a tag query.
+
+        Returns a tuple of the candidate set (None meaning all records of the
+        type) and a flag indicating whether the set is an exact match.
+        """
+        if not tag_query:
+            return None, True
+        if not isinstance(tag_query, Mapping):
+            return None, False
+        result = None
+        exact = True
+        for name, match in tag_query.items():
+            ids, clause_exact = self._plan_clause(type_filter, name, match)
+            exact = exact and clause_exact
+            if ids is None:
+                continue
+            if result is None:
+                result = ids
+            else:
+                if len(ids) < len(result):
+                    result, ids = ids, result
+                result = result.intersection(ids)
+            if not result:
+                # the exact flag holds vacuously for an empty candidate set
+                return set(), exact
+        return result, exact
+
+    def _plan_clause(
+        self, type_filter: str, name: str, match
+    ) -> Tuple[Optional[Set[str]], bool]:
+        """Compute the candidate ID set for a single tag query clause."""
+        try:
+            if name == "$or":
+                if not isinstance(match, list):
+                    return None, False
+                ids = set()
+                exact = True
+                for sub in match:
+                    sub_ids, sub_exact = self._plan(type_filter, sub)
+                    if sub_ids is None:
+                        return None, False
+                    ids.update(sub_ids)
+                    exact = exact and sub_exact
+                return ids, exact
+            if name == "$not":
+                if not isinstance(match, Mapping) or not match:
+                    return None, False
+                sub_ids, sub_exact = self._plan(type_filter, match)
+                if sub_ids is None or not sub_exact:
+                    return None, False
+                return set(self._types[type_filter]).difference(sub_ids), True
+            if name.startswith("$"):
+                return None, False
+            if isinstance(match, str):
+                return self._tag_ids(type_filter, name, match), True
+            if isinstance(match, Mapping) and len(match) == 1:
+                ((op, cmp_val),) = match.items()
+                if op == "$in" and isinstance(cmp_val, list):
+                    ids = set()
+                    for value in cmp_val:
+                        ids.update(self._tag_ids(type_filter, name, value))
+                    return ids, True
+                if op == "$neq" and isinstance(cmp_val, str):
+                    return (
+                        self._name_ids(type_filter, name).difference(
+                            self._tag_ids(type_filter, name, cmp_val)
+                        ),
+                        True,
+                    )
+                if op in ("$gt", "$gte", "$lt", "$lte"):
+                    # range comparisons are checked by the caller
+                    return set(self._name_ids(type_filter, name)), False
+        except TypeError:
+            # unhashable query value
+            pass
+        return None, False
@@ -0,0 +1,109 @@
+import pytest
+
+from ...storage.in_memory import tag_query_match
+from ...storage.record import StorageRecord
+from ...storage.record_index import RecordIndex
+
+
+def make_index():
+    index = RecordIndex()
+    for i in range(10):
+        record = StorageRecord(
+            type="TYPE",
+            value=str(i),
+            tags={"parity": "even" if i % 2 == 0 else "odd", "num": str(i)},
+            id=f"rec-{i}",
+        )
+        index[record.id] = record
+    other = StorageRecord(type="OTHER", value="x", tags={"parity": "even"}, id="other")
+    index[other.id] = other
+    return index
+
+
+def matching(index, tag_query):
+    ids, exact = index.candidates("TYPE", tag_query)
+    return [
+        record_id
+        for record_id in ids
+        if exact or tag_query_match(index[record_id].tags, tag_query)
+    ]
+
+
+def scanning(index, tag_query):
+    return [
+        record.id
+        for record in index.values()
+        if record.type == "TYPE" and tag_query_match(record.tags, tag_query)
+    ]
+
+
+class TestRecordIndex:
+    def test_mapping(self):
+        index = make_index()
+        assert len(index) == 11
+        assert index.count_type("TYPE") == 10
+        assert index.count_type("MISSING") == 0
+        assert list(index)[0] == "rec-0"
+
+        del index["rec-0"]
+        assert "rec-0" not in index
+        assert index.count_type("TYPE") == 9
+        assert matching(index, {"num": "0"}) == []
+
+        with pytest.raises(KeyError):
+            del index["rec-0"]
+
+    def test_replace_updates_tags(self):
+        index = make_index()
+        record = index["rec-1"]
+        index[record.id] = record._replace(tags={"parity": "even"})
+        assert "rec-1" in matching(index, {"parity": "even"})
+        assert "rec-1" not in matching(index, {"parity": "odd"})
+        assert matching(index, {"num": "1"}) == []
+        # insertion order is preserved on update
+        assert matching(index, {"parity": "even"})[:2] == ["rec-0", "rec-1"]
+
+    def test_change_type(self):
+        index = make_index()
+        index["other"] = index["other"]._replace(type="TYPE", tags={})
+        assert index.count_type("OTHER") == 0
+        assert matching(index, {})[-1] == "other"
+
+    def test_candidates_exact(self):
+        index = make_index()
+        ids, exact = index.candidates("TYPE", {"parity": "odd"})
+        assert exact
+        assert ids == ["rec-1", "rec-3", "rec-5", "rec-7", "rec-9"]
+
+        ids, exact = index.candidates("TYPE", {"num": {"$gt": "5"}})
+        assert not exact
+        assert len(ids) == 10
+
+        ids, exact = index.candidates("MISSING", {"parity": "odd"})
+        assert exact and not ids
+
+    @pytest.mark.parametrize(
+        "tag_query",
+        [
+            None,
+            {},
+            {"parity": "even"},
+            {"parity": "even", "num": "4"},
+            {"parity": "odd", "num": "4"},
+            {"num": {"$in": ["1", "2", "3", "missing"]}},
+            {"num": {"$neq": "3"}},
+            {"num": {"$gte": "7"}},
+            {"parity": "even", "num": {"$lt": "5"}},
+            {"$or": [{"num": "1"}, {"num": "8"}]},
+            {"$or": [{"num": "1"}, {"num": {"$lte": "2"}}]},
+            {"$not": {"parity": "even"}},
+            {"$not": {"num": {"$gt": "3"}}},
+            {"$not": {"$or": [{"num": "1"}, {"parity": "even"}]}},
+            {"parity": "odd", "$not": {"num": {"$in": ["3", "5"]}}},
+            {"missing": "value"},
+            {"missing": {"$neq": "value"}},
+        ],
+    )
+    def test_candidates_match_scan(self, tag_query):
+        index = make_index()
+        assert matching(index, tag_query) == scanning(index, tag_query)
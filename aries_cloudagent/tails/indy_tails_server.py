@@ -2,7 +2,7 @@
 
 from typing import Tuple
 
-from ..utils.http import put_file, PutError
+from ..utils.http import HttpClient, put_file, PutError
 
 from .base import BaseTailsServer
 from .error import TailsServerNotConfiguredError
@@ -39,10 +39,11 @@ class IndyTailsServer(BaseTailsServer):
                 "tails_server_upload_url setting is not set"
             )
 
+        client = context.inject(HttpClient, required=False)
         try:
             return (
                 True,
-                await put_file(
+                await (client.put_file if client else put_file)(
                     f"{tails_server_upload_url}/{rev_reg_id}",
                     {"tails": tails_file_path},
                     {"genesis": genesis_transactions},
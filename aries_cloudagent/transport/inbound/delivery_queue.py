@@ -5,10 +5,21 @@ The delivery queue holds and manages messages that have not yet
 been delivered to their intended destination.
 
 """
+import json
 import time
 
+from abc import ABC, abstractmethod
+from base64 import b64decode, b64encode
+from collections import OrderedDict, deque
+from typing import Iterator, Optional, Union
+
+from ...config.settings import Settings
+from ...connections.models.connection_target import ConnectionTarget
+from ...utils.classloader import ClassLoader
 from ..outbound.message import OutboundMessage
 
+DEFAULT_TTL_SECONDS = 604800  # one week
+
 
 class QueuedMessage:
     """
@@ -38,22 +49,181 @@ class QueuedMessage:
         return self.timestamp < compare_timestamp
 
 
-class DeliveryQueue:
+def _encode_payload(payload: Union[str, bytes, None]):
+    if isinstance(payload, bytes):
+        return {"b64": b64encode(payload).decode("ascii")}
+    return payload
+
+
+def _decode_payload(payload) -> Union[str, bytes, None]:
+    if isinstance(payload, dict):
+        return b64decode(payload["b64"])
+    return payload
+
+
+def encode_message(msg: OutboundMessage) -> str:
+    """Serialize an outbound message for storage."""
+    return json.dumps(
+        {
+            "connection_id": msg.connection_id,
+            "enc_payload": _encode_payload(msg.enc_payload),
+            "endpoint": msg._endpoint,
+            "payload": _encode_payload(msg.payload),
+            "reply_session_id": msg.reply_session_id,
+            "reply_thread_id": msg.reply_thread_id,
+            "reply_to_verkey": msg.reply_to_verkey,
+            "reply_from_verkey": msg.reply_from_verkey,
+            "target": msg.target and msg.target.serialize(),
+            "target_list": [target.serialize() for target in msg.target_list],
+            "to_session_only": msg.to_session_only,
+        },
+        sort_keys=True,
+    )
+
+
+def decode_message(value: str) -> OutboundMessage:
+    """Deserialize a stored outbound message."""
+    params = json.loads(value)
+    params["enc_payload"] = _decode_payload(params["enc_payload"])
+    params["payload"] = _decode_payload(params["payload"])
+    params["target"] = ConnectionTarget.deserialize(params["target"], none2none=True)
+    params["target_list"] = [
+        ConnectionTarget.deserialize(target) for target in params["target_list"]
+    ]
+    return OutboundMessage(**params)
+
+
+class BaseDeliveryQueue(ABC):
+    """
+    Base class for delivery queue backends.
+
+    Messages are queued once per recipient key and delivered in the order
+    they were added.
+    """
+
+    # whether lookups block on I/O, so that they are run in a worker thread
+    # rather than on the event loop
+    blocking_io = False
+
+    def __init__(self, ttl_seconds: int = None) -> None:
+        """
+        Initialize the delivery queue.
+
+        Args:
+            ttl_seconds: Seconds to hold messages before they expire
+
+        """
+        self.ttl_seconds = ttl_seconds or DEFAULT_TTL_SECONDS
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "BaseDeliveryQueue":
+        """Create a delivery queue instance from the transport settings."""
+        return cls(ttl_seconds=settings.get("transport.undelivered_queue_ttl"))
+
+    @staticmethod
+    def message_keys(msg: OutboundMessage) -> set:
+        """Get the recipient keys an outbound message is queued for."""
+        keys = set()
+        if msg.target:
+            keys.update(msg.target.recipient_keys)
+        if msg.reply_to_verkey:
+            keys.add(msg.reply_to_verkey)
+        return keys
+
+    @abstractmethod
+    def expire_messages(self, ttl=None):
+        """
+        Expire messages that are past the time limit.
+
+        Args:
+            ttl: Optional. Allows override of configured ttl
+        """
+
+    @abstractmethod
+    def add_message(self, msg: OutboundMessage):
+        """
+        Add an OutboundMessage to delivery queue.
+
+        The message is added once per recipient key
+
+        Args:
+            msg: The OutboundMessage to add
+        """
+
+    def has_message_for_key(self, key: str) -> bool:
+        """
+        Check for queued messages by key.
+
+        Args:
+            key: The key to use for lookup
+        """
+        return self.message_count_for_key(key) > 0
+
+    @abstractmethod
+    def message_count_for_key(self, key: str) -> int:
+        """
+        Count of queued messages by key.
+
+        Args:
+            key: The key to use for lookup
+        """
+
+    @abstractmethod
+    def get_one_message_for_key(self, key: str) -> Optional[OutboundMessage]:
+        """
+        Remove and return a matching message.
+
+        Args:
+            key: The key to use for lookup
+        """
+
+    @abstractmethod
+    def inspect_all_messages_for_key(self, key: str) -> Iterator[OutboundMessage]:
+        """
+        Return all messages for key.
+
+        Args:
+            key: The key to use for lookup
+        """
+
+    @abstractmethod
+    def remove_message_for_key(self, key: str, msg: OutboundMessage):
+        """
+        Remove specified message from queue for key.
+
+        Args:
+            key: The key to use for lookup
+            msg: The message to remove from the queue
+        """
+
+    def close(self):
+        """Release any resources held by the queue."""
+
+
+class DeliveryQueue(BaseDeliveryQueue):
     """
     DeliveryQueue class.
 
-    Manages undelivered messages.
+    Manages undelivered messages in memory. Each recipient key has its own
+    ordered queue, and all messages are indexed by queue time for expiry.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, ttl_seconds: int = None) -> None:
         """
         Initialize an instance of DeliveryQueue.
 
         This uses an in memory structure to queue messages.
         """
-
+        super().__init__(ttl_seconds)
+        # recipient key -> sequence number -> queued message, oldest first
         self.queue_by_key = {}
-        self.ttl_seconds = 604800  # one week
+        # sequence number -> (queued message, recipient keys still holding it)
+        self._entries = {}
+        # (timestamp, sequence number) in order of queueing
+        self._by_time = deque()
+        # id of queued outbound message -> sequence number
+        self._seq_by_msg = {}
+        self._next_seq = 0
 
     def expire_messages(self, ttl=None):
         """
@@ -62,13 +232,14 @@ class DeliveryQueue:
         Args:
             ttl: Optional. Allows override of configured ttl
         """
-
         ttl_seconds = ttl or self.ttl_seconds
         horizon = time.time() - ttl_seconds
-        for key in self.queue_by_key.keys():
-            self.queue_by_key[key] = [
-                wm for wm in self.queue_by_key[key] if not wm.older_than(horizon)
-            ]
+        while self._by_time and self._by_time[0][0] < horizon:
+            _, seq = self._by_time.popleft()
+            entry = self._entries.get(seq)
+            if entry:
+                for key in list(entry[1]):
+                    self._remove(key, seq)
 
     def add_message(self, msg: OutboundMessage):
         """
@@ -79,51 +250,43 @@ class DeliveryQueue:
         Args:
             msg: The OutboundMessage to add
         """
-        keys = set()
-        if msg.target:
-            keys.update(msg.target.recipient_keys)
-        if msg.reply_to_verkey:
-            keys.add(msg.reply_to_verkey)
+        keys = self.message_keys(msg)
+        if not keys:
+            return
         wrapped_msg = QueuedMessage(msg)
+        seq = self._next_seq
+        self._next_seq += 1
+        self._entries[seq] = (wrapped_msg, keys)
+        self._seq_by_msg[id(msg)] = seq
         for recipient_key in keys:
             if recipient_key not in self.queue_by_key:
-                self.queue_by_key[recipient_key] = []
-            self.queue_by_key[recipient_key].append(wrapped_msg)
-
-    def has_message_for_key(self, key: str):
-        """
-        Check for queued messages by key.
+                self.queue_by_key[recipient_key] = OrderedDict()
+            self.queue_by_key[recipient_key][seq] = wrapped_msg
+        self._by_time.append((wrapped_msg.timestamp, seq))
 
-        Args:
-            key: The key to use for lookup
-        """
-        if key in self.queue_by_key and len(self.queue_by_key[key]):
-            return True
-        return False
-
-    def message_count_for_key(self, key: str):
+    def message_count_for_key(self, key: str) -> int:
         """
         Count of queued messages by key.
 
         Args:
             key: The key to use for lookup
         """
-        if key in self.queue_by_key:
-            return len(self.queue_by_key[key])
-        else:
-            return 0
+        return len(self.queue_by_key.get(key) or ())
 
-    def get_one_message_for_key(self, key: str):
+    def get_one_message_for_key(self, key: str) -> Optional[OutboundMessage]:
         """
         Remove and return a matching message.
 
         Args:
             key: The key to use for lookup
         """
-        if key in self.queue_by_key:
-            return self.queue_by_key[key].pop(0).msg
+        queue = self.queue_by_key.get(key)
+        if queue:
+            seq, wrapped_msg = next(iter(queue.items()))
+            self._remove(key, seq)
+            return wrapped_msg.msg
 
-    def inspect_all_messages_for_key(self, key: str):
+    def inspect_all_messages_for_key(self, key: str) -> Iterator[OutboundMessage]:
         """
         Return all messages for key.
 
@@ -131,7 +294,8 @@ class DeliveryQueue:
             key: The key to use for lookup
         """
         if key in self.queue_by_key:
-            for wrapped_msg in self.queue_by_key[key]:
+            # copy, as messages may be removed while iterating
+            for wrapped_msg in list(self.queue_by_key[key].values()):
                 yield wrapped_msg.msg
 
     def remove_message_for_key(self, key: str, msg: OutboundMessage):
@@ -142,10 +306,44 @@ class DeliveryQueue:
             key: The key to use for lookup
             msg: The message to remove from the queue
         """
-        if key in self.queue_by_key:
-            for wrapped_msg in self.queue_by_key[key]:
-                if wrapped_msg.msg == msg:
-                    self.queue_by_key[key].remove(wrapped_msg)
-                    if not self.queue_by_key[key]:
-                        del self.queue_by_key[key]
-                    break  # exit processing loop
+        seq = self._seq_by_msg.get(id(msg))
+        if seq is not None and self._entries[seq][0].msg is msg:
+            self._remove(key, seq)
+
+    def _remove(self, key: str, seq: int):
+        """Remove a queued message for one recipient key."""
+        queue = self.queue_by_key.get(key)
+        if not queue or queue.pop(seq, None) is None:
+            return
+        if not queue:
+            del self.queue_by_key[key]
+
+        wrapped_msg, keys = self._entries[seq]
+        keys.discard(key)
+        if not keys:
+            del self._entries[seq]
+            if self._seq_by_msg.get(id(wrapped_msg.msg)) == seq:
+                del self._seq_by_msg[id(wrapped_msg.msg)]
+            # drop time index entries of messages no longer queued
+            while self._by_time and self._by_time[0][1] not in self._entries:
+                self._by_time.popleft()
+
+
+def get_delivery_queue(settings: Settings) -> BaseDeliveryQueue:
+    """Create the delivery queue selected by the transport settings."""
+    class_name = settings.get("transport.undelivered_queue_class")
+    if class_name:
+        queue_cls = ClassLoader.load_class(class_name)
+    elif settings.get("transport.undelivered_queue_path"):
+        queue_cls = ClassLoader.load_class(
+            "aries_cloudagent.transport.inbound.delivery_queue_sqlite"
+            ".SqliteDeliveryQueue"
+        )
+    elif settings.get("transport.undelivered_queue_redis"):
+        queue_cls = ClassLoader.load_class(
+            "aries_cloudagent.transport.inbound.delivery_queue_redis"
+            ".RedisDeliveryQueue"
+        )
+    else:
+        queue_cls = DeliveryQueue
+    return queue_cls.from_settings(settings)
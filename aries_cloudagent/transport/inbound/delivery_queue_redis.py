@@ -0,0 +1,299 @@
+"""
+Delivery queue shared through Redis.
+
+Agents connected to the same Redis server share one queue, so that mediator
+replicas on different hosts can deliver messages queued by each other. Queued
+messages survive restarts of the agents.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+import weakref
+
+from concurrent.futures import Future
+from typing import Awaitable, Callable, Iterator, Optional
+from uuid import uuid4
+
+import aioredis
+
+from ...config.settings import Settings
+from ..outbound.message import OutboundMessage
+from .delivery_queue import BaseDeliveryQueue, decode_message, encode_message
+
+INSPECT_PAGE_SIZE = 100
+EXPIRE_BATCH_SIZE = 1000
+
+LOGGER = logging.getLogger(__name__)
+
+
+class RedisDeliveryQueue(BaseDeliveryQueue):
+    """
+    Delivery queue stored in Redis.
+
+    Each recipient key has a list of message ids, so that messages are queued
+    and dequeued in constant time, and counted without a scan. Messages are
+    stored once per recipient key, and indexed by queue time in a sorted set
+    for expiry. Dequeueing pops the list, so that a message is only delivered
+    by one of the agents sharing the queue.
+
+    As the queue interface is synchronous, Redis commands run in order on a
+    background event loop owned by the queue. Additions, removals and expiry
+    return without waiting for the commands to run; lookups wait for their
+    results, and are run off the event loop by the transport manager.
+    """
+
+    blocking_io = True
+
+    def __init__(
+        self, connection: str, prefix: str = None, ttl_seconds: int = None
+    ) -> None:
+        """
+        Initialize an instance of RedisDeliveryQueue.
+
+        Args:
+            connection: The Redis connection string, e.g. 'redis://127.0.0.1:6379'
+            prefix: The prefix for queue keys, 'acapy' by default
+            ttl_seconds: Seconds to hold messages before they expire
+
+        """
+        super().__init__(ttl_seconds)
+        self.connection = connection
+        self.prefix = prefix or "acapy"
+        self.redis = None
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._run_loop, name="DeliveryQueue", daemon=True
+        )
+        self._thread.start()
+        # serializes commands, in the order the operations were submitted
+        self._lock: asyncio.Lock = None
+        # raises ConnectionRefusedError if not available
+        self._call(self._connect)
+        # inspected message instances -> message id, for removal
+        self._msg_ids = weakref.WeakKeyDictionary()
+        self._msg_ids_lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "RedisDeliveryQueue":
+        """Create a delivery queue instance from the transport settings."""
+        return cls(
+            settings["transport.undelivered_queue_redis"],
+            ttl_seconds=settings.get("transport.undelivered_queue_ttl"),
+        )
+
+    def __repr__(self) -> str:
+        """Human readable representation of this instance."""
+        return (
+            f"<RedisDeliveryQueue(connection={self.connection}, "
+            f"prefix={self.prefix})>"
+        )
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._loop.run_forever()
+        finally:
+            self._loop.close()
+
+    async def _connect(self):
+        """Open the Redis connection."""
+        self.redis = await aioredis.create_redis(self.connection)
+
+    async def _serialized(self, operation: Callable[..., Awaitable], *args):
+        """Run the commands of an operation after those submitted before it."""
+        if not self._lock:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            return await operation(*args)
+
+    def _submit(self, operation: Callable[..., Awaitable], *args) -> Future:
+        """Run an operation on the background loop."""
+        return asyncio.run_coroutine_threadsafe(
+            self._serialized(operation, *args), self._loop
+        )
+
+    def _call(self, operation: Callable[..., Awaitable], *args):
+        """Run an operation on the background loop and wait for its result."""
+        return self._submit(operation, *args).result()
+
+    def _write(self, operation: Callable[..., Awaitable], *args):
+        """Run an operation on the background loop, without waiting."""
+        self._submit(operation, *args).add_done_callback(self._write_done)
+
+    async def _command(self, name: str, *args):
+        """Run a single Redis command."""
+        return await getattr(self.redis, name)(*args)
+
+    @staticmethod
+    def _write_done(future: Future):
+        if not future.cancelled() and future.exception():
+            LOGGER.error(
+                "Error writing to the delivery queue", exc_info=future.exception()
+            )
+
+    def _queue_key(self, key: str) -> str:
+        """Get the Redis key of the message id list for a recipient key."""
+        return f"{self.prefix}.delivery_queue:{key}"
+
+    def _message_key(self, msg_id: str) -> str:
+        """Get the Redis key of a queued message."""
+        return f"{self.prefix}.delivery_message:{msg_id}"
+
+    @property
+    def _expiry_key(self) -> str:
+        """Get the Redis key of the queue time index."""
+        return f"{self.prefix}.delivery_expiry"
+
+    def _remove_commands(self, tr, key: str, msg_id: str):
+        """Add the commands removing a queued message to a transaction."""
+        tr.lrem(self._queue_key(key), 1, msg_id)
+        tr.delete(self._message_key(msg_id))
+        tr.zrem(self._expiry_key, f"{msg_id} {key}")
+
+    def expire_messages(self, ttl=None):
+        """
+        Expire messages that are past the time limit.
+
+        Args:
+            ttl: Optional. Allows override of configured ttl
+        """
+        ttl_seconds = ttl or self.ttl_seconds
+        self._write(self._expire, time.time() - ttl_seconds)
+
+    async def _expire(self, horizon: float):
+        while True:
+            members = await self.redis.zrangebyscore(
+                self._expiry_key, max=horizon, offset=0, count=EXPIRE_BATCH_SIZE
+            )
+            if not members:
+                break
+            tr = self.redis.multi_exec()
+            for member in members:
+                msg_id, key = member.decode().split(" ", 1)
+                self._remove_commands(tr, key, msg_id)
+            await tr.execute()
+
+    def add_message(self, msg: OutboundMessage):
+        """
+        Add an OutboundMessage to delivery queue.
+
+        The message is added once per recipient key
+
+        Args:
+            msg: The OutboundMessage to add
+        """
+        keys = self.message_keys(msg)
+        if keys:
+            self._write(self._add, sorted(keys), encode_message(msg), time.time())
+
+    async def _add(self, keys, value: str, queued_at: float):
+        tr = self.redis.multi_exec()
+        for key in keys:
+            msg_id = uuid4().hex
+            tr.set(self._message_key(msg_id), value)
+            tr.rpush(self._queue_key(key), msg_id)
+            tr.zadd(self._expiry_key, queued_at, f"{msg_id} {key}")
+        await tr.execute()
+
+    def message_count_for_key(self, key: str) -> int:
+        """
+        Count of queued messages by key.
+
+        Args:
+            key: The key to use for lookup
+        """
+        return self._call(self._command, "llen", self._queue_key(key))
+
+    def get_one_message_for_key(self, key: str) -> Optional[OutboundMessage]:
+        """
+        Remove and return a matching message.
+
+        Args:
+            key: The key to use for lookup
+        """
+        value = self._call(self._take, key)
+        return decode_message(value) if value else None
+
+    async def _take(self, key: str) -> Optional[bytes]:
+        while True:
+            msg_id = await self.redis.lpop(self._queue_key(key))
+            if not msg_id:
+                return None
+            msg_id = msg_id.decode()
+            tr = self.redis.multi_exec()
+            tr.get(self._message_key(msg_id))
+            self._remove_commands(tr, key, msg_id)
+            value = (await tr.execute())[0]
+            # skip ids of messages removed by another agent
+            if value:
+                return value
+
+    def inspect_all_messages_for_key(self, key: str) -> Iterator[OutboundMessage]:
+        """
+        Return all messages for key.
+
+        Args:
+            key: The key to use for lookup
+        """
+        msg_ids = self._call(self._command, "lrange", self._queue_key(key), 0, -1)
+        for start in range(0, len(msg_ids), INSPECT_PAGE_SIZE):
+            page = [msg_id.decode() for msg_id in msg_ids[start:][:INSPECT_PAGE_SIZE]]
+            values = self._call(
+                self._command, "mget", *(self._message_key(msg_id) for msg_id in page)
+            )
+            for msg_id, value in zip(page, values):
+                if not value:
+                    continue
+                msg = decode_message(value)
+                with self._msg_ids_lock:
+                    self._msg_ids[msg] = msg_id
+                yield msg
+
+    def remove_message_for_key(self, key: str, msg: OutboundMessage):
+        """
+        Remove specified message from queue for key.
+
+        Args:
+            key: The key to use for lookup
+            msg: The message to remove from the queue
+        """
+        with self._msg_ids_lock:
+            msg_id = self._msg_ids.pop(msg, None)
+        if msg_id:
+            self._write(self._remove, key, msg_id)
+        else:
+            # not obtained from this queue, remove the oldest equal message
+            self._write(self._remove_equal, key, encode_message(msg).encode())
+
+    async def _remove(self, key: str, msg_id: str):
+        tr = self.redis.multi_exec()
+        self._remove_commands(tr, key, msg_id)
+        await tr.execute()
+
+    async def _remove_equal(self, key: str, value: bytes):
+        msg_ids = await self.redis.lrange(self._queue_key(key), 0, -1)
+        for start in range(0, len(msg_ids), INSPECT_PAGE_SIZE):
+            page = [msg_id.decode() for msg_id in msg_ids[start:][:INSPECT_PAGE_SIZE]]
+            values = await self.redis.mget(
+                *(self._message_key(msg_id) for msg_id in page)
+            )
+            for msg_id, found in zip(page, values):
+                if found == value:
+                    await self._remove(key, msg_id)
+                    return
+
+    def close(self):
+        """Finish pending writes and close the Redis connection."""
+        if self._loop.is_closed():
+            return
+        self._call(self._close)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+    async def _close(self):
+        if self.redis:
+            redis, self.redis = self.redis, None
+            redis.close()
+            await redis.wait_closed()
@@ -0,0 +1,270 @@
+"""
+Persistent delivery queue backed by SQLite.
+
+Queued messages survive restarts, and the database may be opened by several
+agent processes on the same host (WAL mode), so that mediator replicas on one
+host share one queue. WAL mode does not work on network file systems, so the
+queue cannot be shared by replicas on different hosts: these need a networked
+backend such as the Redis delivery queue.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+import weakref
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Iterator, Optional
+
+from ...config.settings import Settings
+from ..outbound.message import OutboundMessage
+from .delivery_queue import BaseDeliveryQueue, decode_message, encode_message
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS queued_message (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    recipient_key TEXT NOT NULL,
+    queued_at REAL NOT NULL,
+    message TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_queued_message_key
+    ON queued_message (recipient_key, id);
+CREATE INDEX IF NOT EXISTS ix_queued_message_time
+    ON queued_message (queued_at);
+CREATE TABLE IF NOT EXISTS queued_count (
+    recipient_key TEXT PRIMARY KEY,
+    count INTEGER NOT NULL
+);
+CREATE TRIGGER IF NOT EXISTS queued_message_insert
+AFTER INSERT ON queued_message BEGIN
+    INSERT OR IGNORE INTO queued_count (recipient_key, count)
+        VALUES (NEW.recipient_key, 0);
+    UPDATE queued_count SET count = count + 1
+        WHERE recipient_key = NEW.recipient_key;
+END;
+CREATE TRIGGER IF NOT EXISTS queued_message_delete
+AFTER DELETE ON queued_message BEGIN
+    UPDATE queued_count SET count = count - 1
+        WHERE recipient_key = OLD.recipient_key;
+    DELETE FROM queued_count
+        WHERE recipient_key = OLD.recipient_key AND count <= 0;
+END;
+"""
+
+INSPECT_PAGE_SIZE = 100
+
+LOGGER = logging.getLogger(__name__)
+
+
+class SqliteDeliveryQueue(BaseDeliveryQueue):
+    """
+    Delivery queue persisted to an SQLite database.
+
+    Messages are stored once per recipient key, indexed by key and queue order
+    for dequeueing and by queue time for expiry. Per-key counts are kept up to
+    date by triggers, so they can be read without scanning the queue.
+
+    All database access runs in order on a dedicated thread, as statements may
+    wait on other processes holding the database lock. Additions, removals and
+    expiry return without waiting for the statements to run; lookups wait for
+    their results, and are run off the event loop by the transport manager.
+    """
+
+    blocking_io = True
+
+    def __init__(self, path: str, ttl_seconds: int = None) -> None:
+        """
+        Initialize an instance of SqliteDeliveryQueue.
+
+        Args:
+            path: The database file path
+            ttl_seconds: Seconds to hold messages before they expire
+
+        """
+        super().__init__(ttl_seconds)
+        self.path = path
+        self._executor = ThreadPoolExecutor(1, thread_name_prefix="DeliveryQueue")
+        self._conn: sqlite3.Connection = None
+        self._call(self._connect)
+        # inspected message instances -> row id, for removal
+        self._row_ids = weakref.WeakKeyDictionary()
+        self._row_ids_lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "SqliteDeliveryQueue":
+        """Create a delivery queue instance from the transport settings."""
+        return cls(
+            settings["transport.undelivered_queue_path"],
+            ttl_seconds=settings.get("transport.undelivered_queue_ttl"),
+        )
+
+    def _connect(self):
+        """Open the database, creating the schema if necessary."""
+        self._conn = sqlite3.connect(
+            self.path, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+
+    def _submit(self, fn: Callable, *args) -> Future:
+        """Run a function on the database thread."""
+        return self._executor.submit(fn, *args)
+
+    def _call(self, fn: Callable, *args):
+        """Run a function on the database thread and wait for its result."""
+        return self._submit(fn, *args).result()
+
+    def _write(self, fn: Callable, *args):
+        """Run a write transaction on the database thread, without waiting."""
+        future = self._submit(self._transaction, fn, *args)
+        future.add_done_callback(self._write_done)
+
+    @staticmethod
+    def _write_done(future: Future):
+        if not future.cancelled() and future.exception():
+            LOGGER.error(
+                "Error writing to the delivery queue", exc_info=future.exception()
+            )
+
+    def _transaction(self, fn: Callable, *args):
+        """Run statements in a write transaction, locking out other processes."""
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            result = fn(self._conn, *args)
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+        return result
+
+    def expire_messages(self, ttl=None):
+        """
+        Expire messages that are past the time limit.
+
+        Args:
+            ttl: Optional. Allows override of configured ttl
+        """
+        ttl_seconds = ttl or self.ttl_seconds
+        horizon = time.time() - ttl_seconds
+        self._write(
+            lambda conn: conn.execute(
+                "DELETE FROM queued_message WHERE queued_at < ?", (horizon,)
+            )
+        )
+
+    def add_message(self, msg: OutboundMessage):
+        """
+        Add an OutboundMessage to delivery queue.
+
+        The message is added once per recipient key
+
+        Args:
+            msg: The OutboundMessage to add
+        """
+        keys = self.message_keys(msg)
+        if not keys:
+            return
+        value = encode_message(msg)
+        queued_at = time.time()
+        self._write(
+            lambda conn: conn.executemany(
+                "INSERT INTO queued_message (recipient_key, queued_at, message) "
+                "VALUES (?, ?, ?)",
+                [(key, queued_at, value) for key in sorted(keys)],
+            )
+        )
+
+    def message_count_for_key(self, key: str) -> int:
+        """
+        Count of queued messages by key.
+
+        Args:
+            key: The key to use for lookup
+        """
+        row = self._call(
+            lambda: self._conn.execute(
+                "SELECT count FROM queued_count WHERE recipient_key = ?", (key,)
+            ).fetchone()
+        )
+        return row[0] if row else 0
+
+    def get_one_message_for_key(self, key: str) -> Optional[OutboundMessage]:
+        """
+        Remove and return a matching message.
+
+        Args:
+            key: The key to use for lookup
+        """
+
+        def take(conn: sqlite3.Connection):
+            row = conn.execute(
+                "SELECT id, message FROM queued_message WHERE recipient_key = ? "
+                "ORDER BY id LIMIT 1",
+                (key,),
+            ).fetchone()
+            if row:
+                conn.execute("DELETE FROM queued_message WHERE id = ?", (row[0],))
+            return row
+
+        row = self._call(self._transaction, take)
+        return decode_message(row[1]) if row else None
+
+    def inspect_all_messages_for_key(self, key: str) -> Iterator[OutboundMessage]:
+        """
+        Return all messages for key.
+
+        Args:
+            key: The key to use for lookup
+        """
+        last_id = 0
+        while True:
+            rows = self._call(
+                lambda: self._conn.execute(
+                    "SELECT id, message FROM queued_message "
+                    "WHERE recipient_key = ? AND id > ? ORDER BY id LIMIT ?",
+                    (key, last_id, INSPECT_PAGE_SIZE),
+                ).fetchall()
+            )
+            for row_id, value in rows:
+                msg = decode_message(value)
+                with self._row_ids_lock:
+                    self._row_ids[msg] = row_id
+                yield msg
+            if len(rows) < INSPECT_PAGE_SIZE:
+                break
+            last_id = rows[-1][0]
+
+    def remove_message_for_key(self, key: str, msg: OutboundMessage):
+        """
+        Remove specified message from queue for key.
+
+        Args:
+            key: The key to use for lookup
+            msg: The message to remove from the queue
+        """
+        with self._row_ids_lock:
+            row_id = self._row_ids.pop(msg, None)
+        if row_id:
+            self._write(
+                lambda conn: conn.execute(
+                    "DELETE FROM queued_message WHERE id = ? AND recipient_key = ?",
+                    (row_id, key),
+                )
+            )
+        else:
+            # not obtained from this queue, remove the oldest equal message
+            value = encode_message(msg)
+            self._write(
+                lambda conn: conn.execute(
+                    "DELETE FROM queued_message WHERE id = ("
+                    "SELECT id FROM queued_message WHERE recipient_key = ? "
+                    "AND message = ? ORDER BY id LIMIT 1)",
+                    (key, value),
+                )
+            )
+
+    def close(self):
+        """Finish pending writes and close the database connection."""
+        self._submit(self._conn.close)
+        self._executor.shutdown(wait=True)
@@ -18,12 +18,13 @@ from .base import (
     InboundTransportConfiguration,
     InboundTransportRegistrationError,
 )
-from .delivery_queue import DeliveryQueue
+from .delivery_queue import BaseDeliveryQueue, get_delivery_queue
 from .message import InboundMessage
 from .session import InboundSession
 
 LOGGER = logging.getLogger(__name__)
 MODULE_BASE_PATH = "aries_cloudagent.transport.inbound"
+UNDELIVERED_EXPIRY_INTERVAL = 60  # seconds between expiry runs
 
 
 class InboundTransportManager:
@@ -45,7 +46,8 @@ class InboundTransportManager:
         self.sessions = OrderedDict()
         self.session_limit: asyncio.Semaphore = None
         self.task_queue = TaskQueue()
-        self.undelivered_queue: DeliveryQueue = None
+        self.undelivered_queue: BaseDeliveryQueue = None
+        self._expiry_task: asyncio.Task = None
 
     async def setup(self):
         """Perform setup operations."""
@@ -66,7 +68,7 @@ class InboundTransportManager:
 
         # Setup queue for undelivered messages
         if self.profile.context.settings.get("transport.enable_undelivered_queue"):
-            self.undelivered_queue = DeliveryQueue()
+            self.undelivered_queue = get_delivery_queue(self.profile.context.settings)
 
         # self.session_limit = asyncio.Semaphore(50)
 
@@ -136,12 +138,37 @@ class InboundTransportManager:
         """Start all registered transports."""
         for transport_id in self.registered_transports:
             self.task_queue.run(self.start_transport(transport_id))
+        if self.undelivered_queue and not self._expiry_task:
+            self._expiry_task = asyncio.ensure_future(self._expire_undelivered())
+
+    async def _expire_undelivered(self):
+        """Periodically remove undelivered messages past the time limit."""
+        loop = asyncio.get_event_loop()
+        queue = self.undelivered_queue
+        while True:
+            try:
+                if queue.blocking_io:
+                    await loop.run_in_executor(None, queue.expire_messages)
+                else:
+                    queue.expire_messages()
+            except Exception:
+                LOGGER.exception("Error expiring undelivered messages")
+            await asyncio.sleep(UNDELIVERED_EXPIRY_INTERVAL)
 
     async def stop(self, wait: bool = True):
         """Stop all registered transports."""
+        if self._expiry_task:
+            task, self._expiry_task = self._expiry_task, None
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
         await self.task_queue.complete(None if wait else 0)
         for transport in self.running_transports.values():
             await transport.stop()
+        if self.undelivered_queue:
+            self.undelivered_queue.close()
 
     async def create_session(
         self,
@@ -242,6 +269,9 @@ class InboundTransportManager:
             session: The inbound session
         """
         if session and session.can_respond and self.undelivered_queue:
+            if self.undelivered_queue.blocking_io:
+                self.task_queue.run(self._process_undelivered_async(session))
+                return
             for key in session.reply_verkeys:
                 for (
                     undelivered_message
@@ -253,3 +283,18 @@ class InboundTransportManager:
                         self.undelivered_queue.remove_message_for_key(
                             key, undelivered_message
                         )
+
+    async def _process_undelivered_async(self, session: InboundSession):
+        """Deliver queued messages, looking them up in a worker thread."""
+        loop = asyncio.get_event_loop()
+        queue = self.undelivered_queue
+        for key in session.reply_verkeys:
+            undelivered = await loop.run_in_executor(
+                None, lambda: list(queue.inspect_all_messages_for_key(key))
+            )
+            for undelivered_message in undelivered:
+                if session.accept_response(undelivered_message):
+                    LOGGER.debug(
+                        "Sending previously undelivered message via inbound session"
+                    )
+                    queue.remove_message_for_key(key, undelivered_message)
@@ -69,6 +69,7 @@ class InboundSession:
         self._reply_mode = None
         self._reply_verkeys = None
         self._reply_thread_ids = None
+        self._profile_cache = None
 
         # If multitenancy is enabled we need to relay the message by changing
         # the context/profile to the wallet associated with the message.
@@ -101,6 +102,9 @@ class InboundSession:
         """Setter for the session closed state."""
         self._closed = True
         self.response_event.set()  # end wait_response if blocked
+        if self._profile_cache is not None:
+            self._profile_cache.release(self.profile)
+            self._profile_cache = None
         if self.close_handler:
             self.close_handler(self)
 
@@ -170,6 +174,9 @@ class InboundSession:
                 profile = await multitenant_mgr.get_wallet_profile(
                     self.profile.context, wallet
                 )
+                # keep the subwallet profile open until the session is closed
+                self._profile_cache = multitenant_mgr.profile_cache
+                self._profile_cache.acquire(profile)
 
                 base_responder: AdminResponder = profile.inject(BaseResponder)
 
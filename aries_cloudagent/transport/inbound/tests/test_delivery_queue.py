@@ -4,10 +4,13 @@ from unittest import mock, TestCase
 from asynctest import TestCase as AsyncTestCase
 from asynctest import mock as async_mock
 
+from ....config.settings import Settings
 from ....connections.models.connection_target import ConnectionTarget
 from ....transport.outbound.message import OutboundMessage
 
+from .. import delivery_queue as test_module
 from ..delivery_queue import DeliveryQueue
+from ..delivery_queue_sqlite import SqliteDeliveryQueue
 
 
 class TestDeliveryQueue(AsyncTestCase):
@@ -64,3 +67,64 @@ class TestDeliveryQueue(AsyncTestCase):
     async def test_count_zero_with_no_items(self):
         queue = DeliveryQueue()
         assert queue.message_count_for_key("aaa") == 0
+
+    async def test_fifo_multiple_keys(self):
+        queue = DeliveryQueue()
+
+        msgs = [
+            OutboundMessage(
+                payload=str(i),
+                target=ConnectionTarget(recipient_keys=["aaa"]),
+                reply_to_verkey="bbb" if i % 2 else None,
+            )
+            for i in range(4)
+        ]
+        for msg in msgs:
+            queue.add_message(msg)
+        assert queue.message_count_for_key("aaa") == 4
+        assert queue.message_count_for_key("bbb") == 2
+
+        assert queue.get_one_message_for_key("bbb") is msgs[1]
+        assert queue.get_one_message_for_key("aaa") is msgs[0]
+        assert queue.get_one_message_for_key("aaa") is msgs[1]
+        queue.remove_message_for_key("aaa", msgs[3])
+        queue.remove_message_for_key("aaa", msgs[3])
+        assert list(queue.inspect_all_messages_for_key("aaa")) == [msgs[2]]
+        assert list(queue.inspect_all_messages_for_key("bbb")) == [msgs[3]]
+        assert queue.get_one_message_for_key("ccc") is None
+
+    async def test_message_ttl_partial(self):
+        queue = DeliveryQueue()
+
+        t = ConnectionTarget(recipient_keys=["aaa"])
+        old = OutboundMessage(payload="old", target=t)
+        new = OutboundMessage(payload="new", target=t)
+        with mock.patch.object(test_module.time, "time", return_value=1000):
+            queue.add_message(old)
+        with mock.patch.object(test_module.time, "time", return_value=2000):
+            queue.add_message(new)
+            queue.expire_messages(ttl=500)
+
+        assert list(queue.inspect_all_messages_for_key("aaa")) == [new]
+        assert queue.get_one_message_for_key("aaa") is new
+        assert not queue._entries and not queue._by_time and not queue._seq_by_msg
+
+    async def test_get_delivery_queue(self):
+        assert isinstance(
+            test_module.get_delivery_queue(Settings()), test_module.DeliveryQueue
+        )
+        queue = test_module.get_delivery_queue(
+            Settings(
+                {
+                    "transport.undelivered_queue_class": (
+                        "aries_cloudagent.transport.inbound.delivery_queue_sqlite"
+                        ".SqliteDeliveryQueue"
+                    ),
+                    "transport.undelivered_queue_path": ":memory:",
+                    "transport.undelivered_queue_ttl": 60,
+                }
+            )
+        )
+        assert isinstance(queue, SqliteDeliveryQueue)
+        assert queue.ttl_seconds == 60
+        queue.close()
@@ -0,0 +1,221 @@
+import os
+import unittest
+
+from unittest import mock, TestCase
+
+from ....config.settings import Settings
+from ....connections.models.connection_target import ConnectionTarget
+from ....transport.outbound.message import OutboundMessage
+
+from .. import delivery_queue_redis as test_module
+from ..delivery_queue import get_delivery_queue
+from ..delivery_queue_redis import RedisDeliveryQueue
+
+REDIS_CONF = os.environ.get("TEST_REDIS_CONFIG", None)
+VERKEY = "3Dn1SJNPaCXcvvJvSbsFWP2xaCjMom3can8CQNhWrTRx"
+
+
+class FakeTransaction:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def __getattr__(self, name):
+        def command(*args):
+            self.commands.append((name, args))
+
+        return command
+
+    async def execute(self):
+        return [await getattr(self.redis, name)(*args) for name, args in self.commands]
+
+
+class FakeRedis:
+    """Minimal stand-in for an aioredis connection."""
+
+    def __init__(self):
+        self.data = {}
+        self.closed = False
+
+    def multi_exec(self):
+        return FakeTransaction(self)
+
+    async def set(self, key, value):
+        self.data[key] = value.encode() if isinstance(value, str) else value
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def mget(self, *keys):
+        return [self.data.get(key) for key in keys]
+
+    async def delete(self, key):
+        self.data.pop(key, None)
+
+    async def rpush(self, key, value):
+        self.data.setdefault(key, []).append(value.encode())
+
+    async def lpop(self, key):
+        values = self.data.get(key)
+        return values.pop(0) if values else None
+
+    async def llen(self, key):
+        return len(self.data.get(key, []))
+
+    async def lrange(self, key, start, stop):
+        return list(self.data.get(key, []))
+
+    async def lrem(self, key, count, value):
+        values = self.data.get(key, [])
+        if value.encode() in values:
+            values.remove(value.encode())
+
+    async def zadd(self, key, score, member):
+        self.data.setdefault(key, {})[member.encode()] = score
+
+    async def zrem(self, key, member):
+        self.data.get(key, {}).pop(member.encode(), None)
+
+    async def zrangebyscore(self, key, max, offset, count):
+        members = sorted(self.data.get(key, {}).items(), key=lambda item: item[1])
+        return [member for member, score in members if score <= max][
+            offset : offset + count
+        ]
+
+    def close(self):
+        self.closed = True
+
+    async def wait_closed(self):
+        pass
+
+
+class TestRedisDeliveryQueue(TestCase):
+    def setUp(self):
+        self.redis = FakeRedis()
+
+        async def create_redis(connection):
+            return self.redis
+
+        patcher = mock.patch.object(
+            test_module.aioredis, "create_redis", side_effect=create_redis
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.queue = RedisDeliveryQueue("redis://test")
+
+    def tearDown(self):
+        self.queue.close()
+
+    def test_add_get(self):
+        msg = OutboundMessage(
+            payload=b"\x00bytes",
+            enc_payload="packed",
+            target=ConnectionTarget(recipient_keys=[VERKEY], endpoint="http://x"),
+            reply_to_verkey="bbb",
+        )
+        self.queue.add_message(msg)
+        self.queue.add_message(
+            OutboundMessage(payload="second", reply_to_verkey=VERKEY)
+        )
+        self.queue.add_message(OutboundMessage(payload="no keys"))
+        assert self.queue.message_count_for_key(VERKEY) == 2
+        assert self.queue.message_count_for_key("bbb") == 1
+        assert not self.queue.has_message_for_key("ccc")
+
+        first = self.queue.get_one_message_for_key(VERKEY)
+        assert first.payload == b"\x00bytes"
+        assert first.enc_payload == "packed"
+        assert first.target.endpoint == "http://x"
+        assert first.reply_to_verkey == "bbb"
+        assert self.queue.get_one_message_for_key(VERKEY).payload == "second"
+        assert self.queue.get_one_message_for_key(VERKEY) is None
+        assert self.queue.has_message_for_key("bbb")
+
+    def test_shared(self):
+        other = RedisDeliveryQueue("redis://test")
+        try:
+            self.queue.add_message(OutboundMessage(payload="x", reply_to_verkey="a"))
+            # lookups run after the writes submitted before them
+            assert self.queue.message_count_for_key("a") == 1
+            assert other.message_count_for_key("a") == 1
+            assert other.get_one_message_for_key("a").payload == "x"
+            assert self.queue.get_one_message_for_key("a") is None
+        finally:
+            other.close()
+
+    def test_inspect_remove(self):
+        with mock.patch.object(test_module, "INSPECT_PAGE_SIZE", 2):
+            for i in range(5):
+                self.queue.add_message(
+                    OutboundMessage(payload=str(i), reply_to_verkey="aaa")
+                )
+            msgs = list(self.queue.inspect_all_messages_for_key("aaa"))
+            assert [msg.payload for msg in msgs] == ["0", "1", "2", "3", "4"]
+
+            self.queue.remove_message_for_key("aaa", msgs[1])
+            # an equal message not obtained from the queue
+            self.queue.remove_message_for_key(
+                "aaa", OutboundMessage(payload="3", reply_to_verkey="aaa")
+            )
+            assert [
+                msg.payload for msg in self.queue.inspect_all_messages_for_key("aaa")
+            ] == ["0", "2", "4"]
+        assert self.queue.message_count_for_key("aaa") == 3
+
+    def test_expire(self):
+        with mock.patch.object(test_module.time, "time", return_value=1000):
+            self.queue.add_message(
+                OutboundMessage(
+                    payload="old", target=ConnectionTarget(recipient_keys=["a", "b"])
+                )
+            )
+        self.queue.add_message(OutboundMessage(payload="new", reply_to_verkey="a"))
+        self.queue.expire_messages(ttl=60)
+
+        assert self.queue.message_count_for_key("a") == 1
+        assert not self.queue.has_message_for_key("b")
+        assert self.queue.get_one_message_for_key("a").payload == "new"
+        assert self.redis.data == {
+            "acapy.delivery_queue:a": [],
+            "acapy.delivery_queue:b": [],
+            "acapy.delivery_expiry": {},
+        }
+
+    def test_write_error(self):
+        with mock.patch.object(
+            self.redis, "multi_exec", side_effect=Exception("down")
+        ), mock.patch.object(test_module.LOGGER, "error") as mock_error:
+            self.queue.add_message(OutboundMessage(payload="x", reply_to_verkey="a"))
+            assert self.queue.message_count_for_key("a") == 0
+        mock_error.assert_called_once()
+
+    def test_get_delivery_queue(self):
+        queue = get_delivery_queue(
+            Settings(
+                {
+                    "transport.undelivered_queue_redis": "redis://test",
+                    "transport.undelivered_queue_ttl": 60,
+                }
+            )
+        )
+        assert isinstance(queue, RedisDeliveryQueue)
+        assert queue.ttl_seconds == 60
+        assert repr(queue)
+        queue.close()
+        queue.close()
+
+
+@unittest.skipUnless(REDIS_CONF, "Redis config not set")
+class TestRedisDeliveryQueueServer(TestCase):
+    def setUp(self):
+        self.queue = RedisDeliveryQueue(REDIS_CONF, prefix="acapy-test")
+
+    def tearDown(self):
+        self.queue.expire_messages(ttl=-1)
+        self.queue.close()
+
+    def test_add_get(self):
+        self.queue.add_message(OutboundMessage(payload="x", reply_to_verkey="a"))
+        assert self.queue.message_count_for_key("a") == 1
+        assert self.queue.get_one_message_for_key("a").payload == "x"
+        assert self.queue.get_one_message_for_key("a") is None
@@ -0,0 +1,96 @@
+import os
+import tempfile
+
+from unittest import mock, TestCase
+
+from ....connections.models.connection_target import ConnectionTarget
+from ....transport.outbound.message import OutboundMessage
+
+from .. import delivery_queue_sqlite as test_module
+from ..delivery_queue_sqlite import SqliteDeliveryQueue
+
+VERKEY = "3Dn1SJNPaCXcvvJvSbsFWP2xaCjMom3can8CQNhWrTRx"
+
+
+class TestSqliteDeliveryQueue(TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, "queue.db")
+        self.queue = SqliteDeliveryQueue(self.path)
+
+    def tearDown(self):
+        self.queue.close()
+        self.dir.cleanup()
+
+    def test_add_get(self):
+        msg = OutboundMessage(
+            payload=b"\x00bytes",
+            enc_payload="packed",
+            target=ConnectionTarget(recipient_keys=[VERKEY], endpoint="http://x"),
+            reply_to_verkey="bbb",
+        )
+        self.queue.add_message(msg)
+        self.queue.add_message(
+            OutboundMessage(payload="second", reply_to_verkey=VERKEY)
+        )
+        self.queue.add_message(OutboundMessage(payload="no keys"))
+        assert self.queue.message_count_for_key(VERKEY) == 2
+        assert self.queue.message_count_for_key("bbb") == 1
+        assert not self.queue.has_message_for_key("ccc")
+
+        first = self.queue.get_one_message_for_key(VERKEY)
+        assert first.payload == b"\x00bytes"
+        assert first.enc_payload == "packed"
+        assert first.target.recipient_keys == [VERKEY]
+        assert first.target.endpoint == "http://x"
+        assert first.reply_to_verkey == "bbb"
+        assert self.queue.get_one_message_for_key(VERKEY).payload == "second"
+        assert self.queue.get_one_message_for_key(VERKEY) is None
+        assert self.queue.has_message_for_key("bbb")
+
+    def test_persistent(self):
+        self.queue.add_message(OutboundMessage(payload="x", reply_to_verkey="aaa"))
+        self.queue.close()
+
+        self.queue = SqliteDeliveryQueue(self.path)
+        assert self.queue.message_count_for_key("aaa") == 1
+        assert self.queue.get_one_message_for_key("aaa").payload == "x"
+
+    def test_inspect_remove(self):
+        with mock.patch.object(test_module, "INSPECT_PAGE_SIZE", 2):
+            for i in range(5):
+                self.queue.add_message(
+                    OutboundMessage(payload=str(i), reply_to_verkey="aaa")
+                )
+            msgs = list(self.queue.inspect_all_messages_for_key("aaa"))
+        assert [msg.payload for msg in msgs] == ["0", "1", "2", "3", "4"]
+
+        self.queue.remove_message_for_key("aaa", msgs[1])
+        # an equal message not obtained from the queue
+        self.queue.remove_message_for_key(
+            "aaa", OutboundMessage(payload="3", reply_to_verkey="aaa")
+        )
+        assert [
+            msg.payload for msg in self.queue.inspect_all_messages_for_key("aaa")
+        ] == ["0", "2", "4"]
+        assert self.queue.message_count_for_key("aaa") == 3
+
+    def test_expire(self):
+        with mock.patch.object(test_module.time, "time", return_value=1000):
+            self.queue.add_message(OutboundMessage(payload="old", reply_to_verkey="a"))
+        with mock.patch.object(test_module.time, "time", return_value=2000):
+            self.queue.add_message(OutboundMessage(payload="new", reply_to_verkey="a"))
+            self.queue.expire_messages(ttl=500)
+        assert self.queue.message_count_for_key("a") == 1
+        assert self.queue.get_one_message_for_key("a").payload == "new"
+
+        self.queue.add_message(OutboundMessage(payload="x", reply_to_verkey="a"))
+        self.queue.expire_messages(ttl=-10)
+        assert not self.queue.has_message_for_key("a")
+
+    def test_write_error(self):
+        with mock.patch.object(test_module.LOGGER, "error") as mock_error:
+            self.queue.add_message(OutboundMessage(payload="x", reply_to_verkey="a"))
+            self.queue._write(mock.MagicMock(side_effect=ValueError()))
+            assert self.queue.message_count_for_key("a") == 1
+        mock_error.assert_called_once()
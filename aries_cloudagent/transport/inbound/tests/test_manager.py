@@ -7,6 +7,7 @@ from ....core.in_memory import InMemoryProfile
 from ...outbound.message import OutboundMessage
 
 from ...wire_format import BaseWireFormat
+from .. import manager as test_module
 from ..base import InboundTransportConfiguration, InboundTransportRegistrationError
 from ..manager import InboundTransportManager
 
@@ -33,6 +34,38 @@ class TestInboundTransportManager(AsyncTestCase):
         with self.assertRaises(InboundTransportRegistrationError):
             mgr.register(config)
 
+    async def test_expire_undelivered(self):
+        self.profile.context.update_settings(
+            {
+                "transport.enable_undelivered_queue": True,
+                "transport.undelivered_queue_ttl": 1,
+            }
+        )
+        mgr = InboundTransportManager(self.profile, None)
+        await mgr.setup()
+        old_message = OutboundMessage(payload="old", reply_to_verkey="test-verkey")
+        with async_mock.patch(
+            "aries_cloudagent.transport.inbound.delivery_queue.time.time",
+            return_value=0,
+        ):
+            mgr.return_undelivered(old_message)
+        mgr.return_undelivered(OutboundMessage(payload="new", reply_to_verkey="k2"))
+
+        with async_mock.patch.object(
+            test_module, "UNDELIVERED_EXPIRY_INTERVAL", 0.01
+        ), async_mock.patch.object(
+            mgr.undelivered_queue,
+            "expire_messages",
+            wraps=mgr.undelivered_queue.expire_messages,
+        ) as mock_expire:
+            await mgr.start()
+            await asyncio.sleep(0.05)
+            assert mock_expire.call_count > 1
+            await mgr.stop()
+        assert mgr._expiry_task is None
+        assert not mgr.undelivered_queue.has_message_for_key("test-verkey")
+        assert mgr.undelivered_queue.has_message_for_key("k2")
+
     async def test_setup(self):
         test_module = "http"
         test_host = "host"
@@ -189,6 +222,38 @@ class TestInboundTransportManager(AsyncTestCase):
             mock_accept.assert_called_once_with(test_outbound)
         assert not mgr.undelivered_queue.has_message_for_key(test_verkey)
 
+    async def test_process_undelivered_blocking(self):
+        self.profile.context.update_settings(
+            {
+                "transport.enable_undelivered_queue": True,
+                "transport.undelivered_queue_path": ":memory:",
+            }
+        )
+        test_verkey = "test-verkey"
+        test_wire_format = async_mock.MagicMock()
+        mgr = InboundTransportManager(self.profile, None)
+        await mgr.setup()
+        assert mgr.undelivered_queue.blocking_io
+
+        test_outbound = OutboundMessage(payload="payload")
+        test_outbound.reply_to_verkey = test_verkey
+        assert mgr.return_undelivered(test_outbound)
+
+        session = await mgr.create_session(
+            "http", can_respond=True, wire_format=test_wire_format
+        )
+        session.add_reply_verkeys(test_verkey)
+
+        with async_mock.patch.object(
+            session, "accept_response", return_value=True
+        ) as mock_accept:
+            mgr.process_undelivered(session)
+            await mgr.task_queue.complete()
+            mock_accept.assert_called_once()
+            assert mock_accept.call_args[0][0].payload == "payload"
+        assert not mgr.undelivered_queue.has_message_for_key(test_verkey)
+        await mgr.stop()
+
     async def test_return_undelivered_false(self):
         self.profile.context.update_settings(
             {"transport.enable_undelivered_queue": False}
@@ -144,6 +144,13 @@ class TestInboundSession(TestCase):
             receive.assert_called_once_with(encode.return_value)
             assert result is encode.return_value
 
+        # the subwallet profile is leased until the session is closed
+        profile_cache = self.multitenant_mgr.profile_cache
+        profile_cache.acquire.assert_called_once_with(self.profile)
+        profile_cache.release.assert_not_called()
+        sess.close()
+        profile_cache.release.assert_called_once_with(self.profile)
+
     async def test_receive_no_wallet_found(self):
         self.multitenant_mgr = async_mock.MagicMock(MultitenantManager, autospec=True)
         self.multitenant_mgr.get_wallets_by_message = async_mock.CoroutineMock(
@@ -64,7 +64,7 @@ class HttpTransport(BaseOutboundTransport):
         """
         if not endpoint:
             raise OutboundTransportError("No endpoint provided")
-        headers = metadata or {}
+        headers = dict(metadata or {})
         if api_key is not None:
             headers["x-api-key"] = api_key
         if isinstance(payload, bytes):
@@ -1,10 +1,14 @@
 """Outbound transport manager."""
 
 import asyncio
+import heapq
 import json
 import logging
+import random
 import time
 
+from collections import deque
+from itertools import count
 from typing import Callable, Type, Union
 from urllib.parse import urlparse
 
@@ -28,6 +32,8 @@ from .message import OutboundMessage
 
 LOGGER = logging.getLogger(__name__)
 MODULE_BASE_PATH = "aries_cloudagent.transport.outbound"
+# webhook metadata header carrying the webhook outbox sequence number
+WEBHOOK_SEQ_HEADER = "x-webhook-seq"
 
 
 class QueuedOutboundMessage:
@@ -38,6 +44,7 @@ class QueuedOutboundMessage:
     STATE_ENCODE = "encode"
     STATE_DELIVER = "deliver"
     STATE_RETRY = "retry"
+    STATE_PARKED = "parked"
     STATE_DONE = "done"
 
     def __init__(
@@ -55,6 +62,7 @@ class QueuedOutboundMessage:
         self.payload: Union[str, bytes] = None
         self.retries = None
         self.retry_at: float = None
+        self.failures = 0
         self.state = self.STATE_NEW
         self.target = target
         self.task: asyncio.Task = None
@@ -63,10 +71,84 @@ class QueuedOutboundMessage:
         self.api_key: str = None
 
 
+class EndpointHealth:
+    """
+    Delivery health of an outbound endpoint, acting as a circuit breaker.
+
+    After repeated delivery failures the circuit is opened: messages for the
+    endpoint are parked until a cooldown has passed, then a single message is
+    sent as a probe. A successful delivery closes the circuit again.
+    """
+
+    STATE_CLOSED = "closed"
+    STATE_OPEN = "open"
+    STATE_HALF_OPEN = "half-open"
+
+    def __init__(self, origin: str):
+        """Initialize the endpoint health."""
+        self.origin = origin
+        self.failures = 0
+        self.trips = 0
+        self.state = self.STATE_CLOSED
+        self.open_until: float = None
+        self.parked = deque()
+
+    def serialize(self) -> dict:
+        """Get the endpoint health as a dict."""
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "parked": len(self.parked),
+        }
+
+
+class WebhookBatch:
+    """Webhook events collected for delivery to one endpoint in a single request."""
+
+    def __init__(
+        self,
+        endpoint: str,
+        api_key: str = None,
+        metadata: dict = None,
+        transport_id: str = None,
+        max_attempts: int = None,
+    ):
+        """Initialize the webhook batch."""
+        self.endpoint = endpoint
+        self.api_key = api_key
+        self.metadata = metadata
+        self.transport_id = transport_id
+        self.max_attempts = max_attempts
+        self.events = []
+        self.timer: asyncio.TimerHandle = None
+
+    def add(self, topic: str, payload_json: str, seq: str = None):
+        """Add a serialized webhook event to the batch."""
+        event = f'{{"topic": {json.dumps(topic)}, "payload": {payload_json}'
+        if seq:
+            event += f', "seq": {int(seq)}'
+        self.events.append(event + "}")
+
+    def serialize(self) -> str:
+        """Get the request body, a JSON array of the webhook events."""
+        return "[" + ", ".join(self.events) + "]"
+
+
+def backoff_delay(base: float, attempt: int, limit: float) -> float:
+    """Get an exponential backoff delay with jitter for a retry attempt."""
+    delay = min(base * (2 ** attempt), limit)
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
 class OutboundTransportManager:
     """Outbound transport manager class."""
 
     MAX_RETRY_COUNT = 4
+    RETRY_DELAY = 10.0
+    RETRY_MAX_DELAY = 300.0
+    CIRCUIT_FAILURE_THRESHOLD = 5
+    CIRCUIT_COOLDOWN = 10.0
+    CIRCUIT_MAX_COOLDOWN = 300.0
 
     def __init__(
         self, context: InjectionContext, handle_not_delivered: Callable = None
@@ -82,16 +164,39 @@ class OutboundTransportManager:
         self.context = context
         self.loop = asyncio.get_event_loop()
         self.handle_not_delivered = handle_not_delivered
-        self.outbound_buffer = []
+        # all messages being processed
+        self.outbound_buffer = set()
         self.outbound_event = asyncio.Event()
         self.outbound_new = []
+        # messages ready for delivery, and finished messages
+        self.outbound_ready = deque()
+        self.outbound_done = deque()
+        # heap of (retry_at, sequence, message) for failed deliveries
+        self.outbound_retry = []
+        self._retry_seq = count()
+        # endpoint origin -> health, for endpoints with failed deliveries
+        self.endpoint_health = {}
+        # heap of (open_until, sequence, origin) for open circuits
+        self._circuit_timers = []
         self.registered_schemes = {}
         self.registered_transports = {}
         self.running_transports = {}
         self.task_queue = TaskQueue(max_active=200)
         self._process_task: asyncio.Task = None
+        # (endpoint, api key, metadata) -> webhook events pending delivery
+        self.webhook_batches = {}
+        self.webhook_batch_size = (
+            self.context.settings.get("admin.webhook_batch_size") or 1
+        )
+        self.webhook_batch_linger = (
+            self.context.settings.get("admin.webhook_batch_linger", 100) / 1000.0
+        )
         if self.context.settings.get("transport.max_outbound_retry"):
             self.MAX_RETRY_COUNT = self.context.settings["transport.max_outbound_retry"]
+        if self.context.settings.get("transport.circuit_failure_threshold"):
+            self.CIRCUIT_FAILURE_THRESHOLD = self.context.settings[
+                "transport.circuit_failure_threshold"
+            ]
 
     async def setup(self):
         """Perform setup operations."""
@@ -184,6 +289,17 @@ class OutboundTransportManager:
 
     async def stop(self, wait: bool = True):
         """Stop all running transports."""
+        # send partial webhook batches now rather than dropping them
+        for key, batch in list(self.webhook_batches.items()):
+            self.flush_webhook_batch(key, batch.transport_id, batch.max_attempts)
+        if wait:
+            # let the process loop start delivery of the flushed batches
+            while (
+                self.outbound_new
+                and self._process_task
+                and not self._process_task.done()
+            ):
+                await asyncio.sleep(0)
         if self._process_task and not self._process_task.done():
             self._process_task.cancel()
         await self.task_queue.complete(None if wait else 0)
@@ -263,7 +379,7 @@ class OutboundTransportManager:
     def enqueue_webhook(
         self,
         topic: str,
-        payload: dict,
+        payload: Union[dict, str],
         endpoint: str,
         max_attempts: int = None,
         metadata: dict = None,
@@ -271,9 +387,13 @@ class OutboundTransportManager:
         """
         Add a webhook to the queue.
 
+        If webhook batching is enabled, the event is added to the pending batch
+        for the endpoint, which is queued when full or when the linger time
+        has passed.
+
         Args:
             topic: The webhook topic
-            payload: The webhook payload
+            payload: The webhook payload, or its JSON serialization
             endpoint: The webhook endpoint
             max_attempts: Override the maximum number of attempts
             metadata: Additional metadata associated with the payload
@@ -283,15 +403,78 @@ class OutboundTransportManager:
 
         """
         transport_id = self.get_running_transport_for_endpoint(endpoint)
-        queued = QueuedOutboundMessage(None, None, None, transport_id)
+        api_key = None
         if len(endpoint.split("#")) > 1:
             endpoint_hash_split = endpoint.split("#")
             endpoint = endpoint_hash_split[0]
             api_key = endpoint_hash_split[1]
-            queued.api_key = api_key
-        queued.endpoint = f"{endpoint}/topic/{topic}/"
+        if not isinstance(payload, str):
+            payload = json.dumps(payload)
+
+        if self.webhook_batch_size > 1:
+            # the sequence number is sent per event, not as a request header
+            metadata = dict(metadata or {})
+            seq = metadata.pop(WEBHOOK_SEQ_HEADER, None)
+            key = (endpoint, api_key, tuple(sorted(metadata.items())))
+            batch = self.webhook_batches.get(key)
+            if not batch:
+                batch = self.webhook_batches[key] = WebhookBatch(
+                    endpoint, api_key, metadata or None, transport_id, max_attempts
+                )
+                batch.timer = self.loop.call_later(
+                    self.webhook_batch_linger,
+                    self.flush_webhook_batch,
+                    key,
+                    transport_id,
+                    max_attempts,
+                )
+            batch.add(topic, payload, seq)
+            if len(batch.events) >= self.webhook_batch_size:
+                self.flush_webhook_batch(key, transport_id, max_attempts)
+            return
+
+        self._queue_webhook(
+            transport_id,
+            f"{endpoint}/topic/{topic}/",
+            payload,
+            api_key,
+            metadata,
+            max_attempts,
+        )
+
+    def flush_webhook_batch(
+        self, key: tuple, transport_id: str, max_attempts: int = None
+    ):
+        """Queue a pending webhook batch for delivery as one request."""
+        batch = self.webhook_batches.pop(key, None)
+        if not batch:
+            return
+        if batch.timer:
+            batch.timer.cancel()
+        self._queue_webhook(
+            transport_id,
+            f"{batch.endpoint}/topic/batch/",
+            batch.serialize(),
+            batch.api_key,
+            batch.metadata,
+            max_attempts,
+        )
+
+    def _queue_webhook(
+        self,
+        transport_id: str,
+        endpoint: str,
+        payload: str,
+        api_key: str = None,
+        metadata: dict = None,
+        max_attempts: int = None,
+    ):
+        """Add a serialized webhook request to the queue."""
+        queued = QueuedOutboundMessage(None, None, None, transport_id)
+        queued.api_key = api_key
+        queued.endpoint = endpoint
         queued.metadata = metadata
-        queued.payload = json.dumps(payload)
+        queued.payload = payload
         queued.state = QueuedOutboundMessage.STATE_PENDING
         queued.retries = 4 if max_attempts is None else max_attempts - 1
         self.outbound_new.append(queued)
@@ -329,61 +512,45 @@ class OutboundTransportManager:
         while True:
             self.outbound_event.clear()
             loop_time = get_timer()
-            upd_buffer = []
-            retry_count = 0
-
-            for queued in self.outbound_buffer:
-                if queued.state == QueuedOutboundMessage.STATE_DONE:
-                    if queued.error:
-                        LOGGER.exception(
-                            "Outbound message could not be delivered to %s",
-                            queued.endpoint,
-                            exc_info=queued.error,
-                        )
-                        if self.handle_not_delivered and queued.message:
-                            self.handle_not_delivered(queued.profile, queued.message)
-                    continue  # remove from buffer
-
-                deliver = False
-
-                if queued.state == QueuedOutboundMessage.STATE_PENDING:
-                    deliver = True
-                elif queued.state == QueuedOutboundMessage.STATE_RETRY:
-                    if queued.retry_at < loop_time:
-                        queued.retry_at = None
-                        deliver = True
-                    else:
-                        retry_count += 1
-
-                if deliver:
-                    queued.state = QueuedOutboundMessage.STATE_DELIVER
-                    p_time = trace_event(
-                        self.context.settings,
-                        queued.message if queued.message else queued.payload,
-                        outcome="OutboundTransportManager.DELIVER.START."
-                        + queued.endpoint,
-                    )
-                    self.deliver_queued_message(queued)
-                    trace_event(
-                        self.context.settings,
-                        queued.message if queued.message else queued.payload,
-                        outcome="OutboundTransportManager.DELIVER.END."
-                        + queued.endpoint,
-                        perf_counter=p_time,
-                    )
 
-                upd_buffer.append(queued)
+            while self.outbound_done:
+                queued = self.outbound_done.popleft()
+                self.outbound_buffer.discard(queued)
+                if queued.error:
+                    LOGGER.exception(
+                        "Outbound message could not be delivered to %s",
+                        queued.endpoint,
+                        exc_info=queued.error,
+                    )
+                    if self.handle_not_delivered and queued.message:
+                        self.handle_not_delivered(queued.profile, queued.message)
+
+            while self.outbound_retry and self.outbound_retry[0][0] <= loop_time:
+                queued = heapq.heappop(self.outbound_retry)[2]
+                queued.retry_at = None
+                self.outbound_ready.append(queued)
+
+            while self._circuit_timers and self._circuit_timers[0][0] <= loop_time:
+                origin = heapq.heappop(self._circuit_timers)[2]
+                health = self.endpoint_health.get(origin)
+                if (
+                    health
+                    and health.state == EndpointHealth.STATE_OPEN
+                    and health.parked
+                ):
+                    # send a parked message as the probe
+                    self.outbound_ready.append(health.parked.popleft())
 
-            new_pending = 0
             new_messages = self.outbound_new
             self.outbound_new = []
 
             for queued in new_messages:
+                self.outbound_buffer.add(queued)
                 if queued.state == QueuedOutboundMessage.STATE_NEW:
                     if queued.message and queued.message.enc_payload:
                         queued.payload = queued.message.enc_payload
                         queued.state = QueuedOutboundMessage.STATE_PENDING
-                        new_pending += 1
+                        self.outbound_ready.append(queued)
                     else:
                         queued.state = QueuedOutboundMessage.STATE_ENCODE
                         p_time = trace_event(
@@ -398,20 +565,117 @@ class OutboundTransportManager:
                             outcome="OutboundTransportManager.ENCODE.END",
                             perf_counter=p_time,
                         )
-                else:
-                    new_pending += 1
+                elif queued.state == QueuedOutboundMessage.STATE_PENDING:
+                    self.outbound_ready.append(queued)
 
-                upd_buffer.append(queued)
+            while self.outbound_ready:
+                queued = self.outbound_ready.popleft()
+                health = self.endpoint_health and self.endpoint_health.get(
+                    self._endpoint_origin(queued)
+                )
+                if health and not self._allow_delivery(health, loop_time):
+                    queued.state = QueuedOutboundMessage.STATE_PARKED
+                    health.parked.append(queued)
+                    continue
+                queued.state = QueuedOutboundMessage.STATE_DELIVER
+                p_time = trace_event(
+                    self.context.settings,
+                    queued.message if queued.message else queued.payload,
+                    outcome="OutboundTransportManager.DELIVER.START." + queued.endpoint,
+                )
+                self.deliver_queued_message(queued)
+                trace_event(
+                    self.context.settings,
+                    queued.message if queued.message else queued.payload,
+                    outcome="OutboundTransportManager.DELIVER.END." + queued.endpoint,
+                    perf_counter=p_time,
+                )
 
-            self.outbound_buffer = upd_buffer
-            if self.outbound_buffer:
-                if (not new_pending) and (not retry_count):
-                    await self.outbound_event.wait()
-                elif retry_count:
-                    # only retries - yield here so we don't hog resources
-                    await asyncio.sleep(0.05)
-            else:
+            if not self.outbound_buffer:
                 break
+            wake_times = [
+                timers[0][0]
+                for timers in (self.outbound_retry, self._circuit_timers)
+                if timers
+            ]
+            if wake_times:
+                # sleep until the next retry or probe is due, unless woken before
+                try:
+                    await asyncio.wait_for(
+                        self.outbound_event.wait(),
+                        max(min(wake_times) - get_timer(), 0),
+                    )
+                except asyncio.TimeoutError:
+                    pass
+            else:
+                await self.outbound_event.wait()
+
+    @staticmethod
+    def _endpoint_origin(queued: QueuedOutboundMessage) -> str:
+        """Get the origin (scheme and host) of the message endpoint."""
+        parsed = urlparse(queued.endpoint)
+        return f"{parsed.scheme}://{parsed.netloc}"
+
+    def _allow_delivery(self, health: EndpointHealth, now: float) -> bool:
+        """Check whether a message may be delivered to an endpoint."""
+        if health.state == EndpointHealth.STATE_CLOSED:
+            return True
+        if health.state == EndpointHealth.STATE_OPEN and now >= health.open_until:
+            # let this message through as the probe
+            health.state = EndpointHealth.STATE_HALF_OPEN
+            return True
+        return False
+
+    def _endpoint_succeeded(self, queued: QueuedOutboundMessage):
+        """Record a successful delivery, closing the endpoint circuit."""
+        health = self.endpoint_health.pop(self._endpoint_origin(queued), None)
+        if health and health.parked:
+            LOGGER.info("Outbound endpoint %s recovered", health.origin)
+            for parked in health.parked:
+                parked.state = QueuedOutboundMessage.STATE_PENDING
+            self.outbound_ready.extend(health.parked)
+
+    def _endpoint_failed(self, queued: QueuedOutboundMessage):
+        """Record a failed delivery, opening the endpoint circuit if needed."""
+        origin = self._endpoint_origin(queued)
+        health = self.endpoint_health.get(origin)
+        if not health:
+            health = self.endpoint_health[origin] = EndpointHealth(origin)
+        health.failures += 1
+        if health.state == EndpointHealth.STATE_HALF_OPEN or (
+            health.state == EndpointHealth.STATE_CLOSED
+            and health.failures >= self.CIRCUIT_FAILURE_THRESHOLD
+        ):
+            cooldown = backoff_delay(
+                self.CIRCUIT_COOLDOWN, health.trips, self.CIRCUIT_MAX_COOLDOWN
+            )
+            health.trips += 1
+            health.state = EndpointHealth.STATE_OPEN
+            health.open_until = time.perf_counter() + cooldown
+            heapq.heappush(
+                self._circuit_timers,
+                (health.open_until, next(self._retry_seq), origin),
+            )
+            LOGGER.warning(
+                "Outbound endpoint %s failing, pausing delivery for %.1fs",
+                origin,
+                cooldown,
+            )
+        if not queued.retries and health.state == EndpointHealth.STATE_OPEN:
+            # retries exhausted while the endpoint is down:
+            # fail the parked messages rather than retrying each one
+            while health.parked:
+                parked = health.parked.popleft()
+                parked.error = queued.error
+                parked.state = QueuedOutboundMessage.STATE_DONE
+                self.outbound_done.append(parked)
+
+    def endpoint_stats(self) -> dict:
+        """Get the health of endpoints with failed deliveries."""
+        return {
+            origin: health.serialize()
+            for origin, health in self.endpoint_health.items()
+        }
 
     def encode_queued_message(self, queued: QueuedOutboundMessage) -> asyncio.Task:
         """Kick off encoding of a queued message."""
@@ -439,8 +703,10 @@ class OutboundTransportManager:
         if completed.exc_info:
             queued.error = completed.exc_info
             queued.state = QueuedOutboundMessage.STATE_DONE
+            self.outbound_done.append(queued)
         else:
             queued.state = QueuedOutboundMessage.STATE_PENDING
+            self.outbound_ready.append(queued)
         queued.task = None
         self.process_queued()
 
@@ -463,6 +729,8 @@ class OutboundTransportManager:
         """Handle completion of queued message delivery."""
         if completed.exc_info:
             queued.error = completed.exc_info
+            queued.failures += 1
+            self._endpoint_failed(queued)
 
             if queued.retries:
                 if LOGGER.isEnabledFor(logging.DEBUG):
@@ -487,16 +755,25 @@ class OutboundTransportManager:
                     )
                 queued.retries -= 1
                 queued.state = QueuedOutboundMessage.STATE_RETRY
-                queued.retry_at = time.perf_counter() + 10
+                queued.retry_at = time.perf_counter() + backoff_delay(
+                    self.RETRY_DELAY, queued.failures - 1, self.RETRY_MAX_DELAY
+                )
+                heapq.heappush(
+                    self.outbound_retry,
+                    (queued.retry_at, next(self._retry_seq), queued),
+                )
             else:
                 LOGGER.exception(
                     ">>> Outbound message failed to deliver, NOT Re-queued.",
                     exc_info=queued.error,
                 )
                 queued.state = QueuedOutboundMessage.STATE_DONE
+                self.outbound_done.append(queued)
         else:
             queued.error = None
             queued.state = QueuedOutboundMessage.STATE_DONE
+            self.outbound_done.append(queued)
+            self._endpoint_succeeded(queued)
         queued.task = None
         self.process_queued()
 
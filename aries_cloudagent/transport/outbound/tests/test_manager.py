@@ -1,3 +1,4 @@
+import asyncio
 import json
 
 from asynctest import TestCase as AsyncTestCase, mock as async_mock
@@ -122,6 +123,141 @@ class TestOutboundTransportManager(AsyncTestCase):
         assert mgr.get_running_transport_for_scheme("http") is None
         transport.stop.assert_awaited_once_with()
 
+    async def test_retry_delivery(self):
+        context = InjectionContext()
+        mgr = OutboundTransportManager(context)
+
+        transport = async_mock.MagicMock(schemes=["http"], wire_format=None)
+        transport.start = async_mock.CoroutineMock()
+        transport.handle_message = async_mock.CoroutineMock(
+            side_effect=[OutboundDeliveryError(), None]
+        )
+        transport_cls = async_mock.MagicMock(schemes=["http"], return_value=transport)
+        mgr.register_class(transport_cls, "transport_cls")
+        await mgr.start_transport("transport_cls")
+
+        message = OutboundMessage(
+            payload="{}",
+            enc_payload=b"encoded",
+            target=ConnectionTarget(endpoint="http://localhost"),
+        )
+        with async_mock.patch.object(
+            test_module,
+            "get_timer",
+            async_mock.MagicMock(
+                side_effect=lambda: test_module.time.perf_counter() + 20
+            ),
+        ), async_mock.patch.object(test_module.LOGGER, "error", async_mock.MagicMock()):
+            # retry is due straight away
+            mgr.enqueue_message(InMemoryProfile.test_profile(), message)
+            await mgr.flush()
+
+        assert transport.handle_message.await_count == 2
+        assert not mgr.outbound_buffer
+        assert not mgr.outbound_retry
+        assert not mgr.outbound_ready
+        assert not mgr.outbound_done
+
+    async def test_circuit_breaker(self):
+        context = InjectionContext()
+        context.update_settings({"transport.circuit_failure_threshold": 2})
+        mock_handle_not_delivered = async_mock.MagicMock()
+        mgr = OutboundTransportManager(context, mock_handle_not_delivered)
+        mgr.process_queued = async_mock.MagicMock()
+        failed = async_mock.MagicMock(exc_info=(KeyError, KeyError("nope"), None))
+        succeeded = async_mock.MagicMock(exc_info=None)
+
+        def queued(path="/"):
+            result = QueuedOutboundMessage(None, None, None, "transport_cls")
+            result.endpoint = f"http://1.2.3.4:8081{path}"
+            result.retries = 1
+            return result
+
+        first, second = queued("/a"), queued("/b")
+        with async_mock.patch.object(test_module.LOGGER, "error"):
+            mgr.finished_deliver(first, failed)
+            assert mgr.endpoint_health["http://1.2.3.4:8081"].state == "closed"
+            mgr.finished_deliver(second, failed)
+        health = mgr.endpoint_health["http://1.2.3.4:8081"]
+        assert health.state == "open"
+        assert len(mgr._circuit_timers) == 1
+        assert 0 < first.retry_at - test_module.time.perf_counter() <= 10
+
+        # messages for the endpoint are parked until the cooldown has passed
+        third = queued()
+        assert not mgr._allow_delivery(health, test_module.get_timer())
+        health.parked.append(third)
+        assert mgr.endpoint_stats() == {
+            "http://1.2.3.4:8081": {"state": "open", "failures": 2, "parked": 1}
+        }
+        assert mgr._allow_delivery(health, health.open_until)
+        assert health.state == "half-open"
+        assert not mgr._allow_delivery(health, health.open_until)
+
+        # failed probe re-opens the circuit; with no retries left,
+        # the parked messages are failed too
+        first.retries = 0
+        with async_mock.patch.object(test_module.LOGGER, "exception"):
+            mgr.finished_deliver(first, failed)
+        assert health.state == "open"
+        assert health.trips == 2
+        assert list(mgr.outbound_done) == [third, first]
+        assert third.state == QueuedOutboundMessage.STATE_DONE
+
+        # successful delivery closes the circuit and releases parked messages
+        fourth = queued()
+        health.parked.append(fourth)
+        mgr.finished_deliver(second, succeeded)
+        assert not mgr.endpoint_health
+        assert list(mgr.outbound_ready) == [fourth]
+        assert fourth.state == QueuedOutboundMessage.STATE_PENDING
+
+    async def test_process_loop_parked(self):
+        context = InjectionContext()
+        mgr = OutboundTransportManager(context)
+        health = test_module.EndpointHealth("http://1.2.3.4:8081")
+        health.state = health.STATE_OPEN
+        health.open_until = test_module.get_timer() + 3600
+        mgr.endpoint_health[health.origin] = health
+        mock_queued = async_mock.MagicMock(
+            state=QueuedOutboundMessage.STATE_PENDING,
+            endpoint="http://1.2.3.4:8081/path",
+        )
+        mgr.outbound_new.append(mock_queued)
+        mgr._circuit_timers.append((health.open_until, 0, health.origin))
+
+        with async_mock.patch.object(
+            mgr, "deliver_queued_message", async_mock.MagicMock()
+        ) as mock_deliver, async_mock.patch.object(
+            test_module.asyncio, "wait_for", async_mock.CoroutineMock()
+        ) as mock_wait_for:
+            mock_wait_for.side_effect = KeyError()
+            with self.assertRaises(KeyError):
+                await mgr._process_loop()
+            mock_deliver.assert_not_called()
+            assert list(health.parked) == [mock_queued]
+            assert mock_queued.state == QueuedOutboundMessage.STATE_PARKED
+            # sleeps until the circuit may be probed
+            assert 3500 < mock_wait_for.call_args[0][1] <= 3600
+            mock_wait_for.call_args[0][0].close()
+
+            # the probe is sent once the cooldown has passed
+            mgr._circuit_timers[0] = (0, 0, health.origin)
+            health.open_until = 0
+            with async_mock.patch.object(
+                mgr.outbound_event, "wait", async_mock.CoroutineMock()
+            ) as mock_wait:
+                mock_wait.side_effect = KeyError()
+                with self.assertRaises(KeyError):
+                    await mgr._process_loop()
+            mock_deliver.assert_called_once_with(mock_queued)
+            assert health.state == health.STATE_HALF_OPEN
+
+    def test_backoff_delay(self):
+        for attempt in range(10):
+            delay = test_module.backoff_delay(10, attempt, 300)
+            assert min(10 * 2 ** attempt, 300) / 2 <= delay <= 300
+
     async def test_stop_cancel(self):
         context = InjectionContext()
         context.update_settings({"transport.outbound_configs": ["http"]})
@@ -167,6 +303,86 @@ class TestOutboundTransportManager(AsyncTestCase):
             assert queued.retries == test_attempts - 1
             assert queued.state == QueuedOutboundMessage.STATE_PENDING
 
+    async def test_enqueue_webhook_batch(self):
+        context = InjectionContext()
+        context.update_settings(
+            {"admin.webhook_batch_size": 3, "admin.webhook_batch_linger": 10}
+        )
+        mgr = OutboundTransportManager(context)
+        transport_cls = async_mock.MagicMock()
+        transport_cls.schemes = ["http"]
+        transport_cls.return_value = async_mock.MagicMock()
+        transport_cls.return_value.schemes = ["http"]
+        transport_cls.return_value.start = async_mock.CoroutineMock()
+        transport_cls.return_value.stop = async_mock.CoroutineMock()
+        tid = mgr.register_class(transport_cls, "transport_cls")
+        await mgr.start_transport(tid)
+        metadata = {"x-wallet-id": "wallet"}
+
+        with async_mock.patch.object(mgr, "process_queued") as mock_process:
+            for index in range(4):
+                mgr.enqueue_webhook(
+                    "topic",
+                    '{"index": %d}' % index,
+                    "http://example#abc",
+                    None,
+                    dict(metadata, **{test_module.WEBHOOK_SEQ_HEADER: str(index + 1)}),
+                )
+            mgr.enqueue_webhook("other", {"index": 0}, "http://other")
+
+            # first batch is full
+            mock_process.assert_called_once_with()
+            assert len(mgr.outbound_new) == 1
+            queued = mgr.outbound_new[0]
+            assert queued.endpoint == "http://example/topic/batch/"
+            assert queued.api_key == "abc"
+            assert queued.metadata == metadata
+            assert json.loads(queued.payload) == [
+                {"topic": "topic", "payload": {"index": index}, "seq": index + 1}
+                for index in range(3)
+            ]
+            assert len(mgr.webhook_batches) == 2
+
+            # remaining batches are sent after the linger time
+            await asyncio.sleep(0.05)
+            assert not mgr.webhook_batches
+            assert [json.loads(queued.payload) for queued in mgr.outbound_new[1:]] == [
+                [{"topic": "topic", "payload": {"index": 3}, "seq": 4}],
+                [{"topic": "other", "payload": {"index": 0}}],
+            ]
+
+            mgr.enqueue_webhook("topic", {}, "http://example")
+            await mgr.stop()
+            assert not mgr.webhook_batches
+
+    async def test_stop_webhook_batch(self):
+        context = InjectionContext()
+        context.update_settings(
+            {"admin.webhook_batch_size": 3, "admin.webhook_batch_linger": 10000}
+        )
+        mgr = OutboundTransportManager(context)
+        transport_cls = async_mock.MagicMock()
+        transport_cls.schemes = ["http"]
+        transport_cls.return_value = async_mock.MagicMock()
+        transport_cls.return_value.schemes = ["http"]
+        transport_cls.return_value.start = async_mock.CoroutineMock()
+        transport_cls.return_value.stop = async_mock.CoroutineMock()
+        transport_cls.return_value.handle_message = async_mock.CoroutineMock()
+        tid = mgr.register_class(transport_cls, "transport_cls")
+        await mgr.start_transport(tid)
+
+        # a batch which is neither full nor past its linger time
+        mgr.enqueue_webhook("topic", {"index": 0}, "http://example#abc")
+        assert mgr.webhook_batches
+        await mgr.stop()
+
+        assert not mgr.webhook_batches
+        transport_cls.return_value.handle_message.assert_awaited_once()
+        args = transport_cls.return_value.handle_message.call_args[0]
+        assert json.loads(args[1]) == [{"topic": "topic", "payload": {"index": 0}}]
+        assert args[2] == "http://example/topic/batch/"
+        assert args[4] == "abc"
+
     async def test_process_done_x(self):
         mock_task = async_mock.MagicMock(
             done=async_mock.MagicMock(return_value=True),
@@ -182,7 +398,9 @@ class TestOutboundTransportManager(AsyncTestCase):
             mgr._process_done(mock_task)
 
     async def test_process_finished_x(self):
-        mock_queued = async_mock.MagicMock(retries=1)
+        mock_queued = async_mock.MagicMock(
+            retries=1, failures=0, endpoint="http://1.2.3.4:8081"
+        )
         mock_task = async_mock.MagicMock(
             exc_info=(KeyError, KeyError("nope"), None),
         )
@@ -205,7 +423,8 @@ class TestOutboundTransportManager(AsyncTestCase):
         context = InjectionContext()
         mock_handle_not_delivered = async_mock.MagicMock()
         mgr = OutboundTransportManager(context, mock_handle_not_delivered)
-        mgr.outbound_buffer.append(mock_queued)
+        mgr.outbound_buffer.add(mock_queued)
+        mgr.outbound_retry.append((mock_queued.retry_at, 0, mock_queued))
 
         with async_mock.patch.object(
             test_module, "trace_event", async_mock.MagicMock()
@@ -224,15 +443,20 @@ class TestOutboundTransportManager(AsyncTestCase):
         context = InjectionContext()
         mock_handle_not_delivered = async_mock.MagicMock()
         mgr = OutboundTransportManager(context, mock_handle_not_delivered)
-        mgr.outbound_buffer.append(mock_queued)
+        mgr.outbound_buffer.add(mock_queued)
+        mgr.outbound_retry.append((mock_queued.retry_at, 0, mock_queued))
 
         with async_mock.patch.object(
-            test_module.asyncio, "sleep", async_mock.CoroutineMock()
-        ) as mock_sleep_x:
-            mock_sleep_x.side_effect = KeyError()
+            test_module.asyncio, "wait_for", async_mock.CoroutineMock()
+        ) as mock_wait_for:
+            mock_wait_for.side_effect = KeyError()
             with self.assertRaises(KeyError):  # cover retry logic and bail
                 await mgr._process_loop()
             assert mock_queued.retry_at is not None
+            # sleeps until the retry is due
+            timeout = mock_wait_for.call_args[0][1]
+            assert 3500 < timeout <= 3600
+            mock_wait_for.call_args[0][0].close()
 
     async def test_process_loop_new(self):
         context = InjectionContext()
@@ -291,20 +515,28 @@ class TestOutboundTransportManager(AsyncTestCase):
         context = InjectionContext()
         mock_handle_not_delivered = async_mock.MagicMock()
         mgr = OutboundTransportManager(context, mock_handle_not_delivered)
-        mgr.outbound_buffer.append(mock_queued)
+        mgr.outbound_buffer.add(mock_queued)
+        mgr.outbound_done.append(mock_queued)
 
         await mgr._process_loop()
+        mock_handle_not_delivered.assert_called_once_with(
+            mock_queued.profile, mock_queued.message
+        )
+        assert not mgr.outbound_buffer
 
     async def test_finished_deliver_x_log_debug(self):
         mock_queued = async_mock.MagicMock(
-            state=QueuedOutboundMessage.STATE_DONE, retries=1
+            state=QueuedOutboundMessage.STATE_DONE,
+            retries=1,
+            failures=0,
+            endpoint="http://1.2.3.4:8081",
         )
         mock_completed_x = async_mock.MagicMock(exc_info=KeyError("an error occurred"))
 
         context = InjectionContext()
         mock_handle_not_delivered = async_mock.MagicMock()
         mgr = OutboundTransportManager(context, mock_handle_not_delivered)
-        mgr.outbound_buffer.append(mock_queued)
+        mgr.outbound_buffer.add(mock_queued)
         with async_mock.patch.object(
             test_module.LOGGER, "exception", async_mock.MagicMock()
         ) as mock_logger_exception, async_mock.patch.object(
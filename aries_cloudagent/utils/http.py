@@ -1,10 +1,20 @@
 """HTTP utility methods."""
 
 import asyncio
+import threading
+import weakref
 
-from aiohttp import BaseConnector, ClientError, ClientResponse, ClientSession
+from aiohttp import (
+    BaseConnector,
+    ClientError,
+    ClientResponse,
+    ClientSession,
+    ClientTimeout,
+    TCPConnector,
+)
 from aiohttp.web import HTTPConflict
 
+from ..config.settings import Settings
 from ..core.error import BaseError
 
 from .repeat import RepeatSequence
@@ -46,11 +56,12 @@ async def fetch_stream(
 
     """
     limit = max_attempts if retry else 1
-    if not session:
+    owned = not session
+    if owned:
         session = ClientSession(
             connector=connector, connector_owner=(not connector), trust_env=True
         )
-    async with session:
+    try:
         async for attempt in RepeatSequence(limit, interval, backoff):
             try:
                 async with attempt.timeout(request_timeout):
@@ -64,6 +75,9 @@ async def fetch_stream(
             except (ClientError, asyncio.TimeoutError) as e:
                 if attempt.final:
                     raise FetchError("Exceeded maximum fetch attempts") from e
+    finally:
+        if owned:
+            await session.close()
 
 
 async def fetch(
@@ -95,11 +109,12 @@ async def fetch(
 
     """
     limit = max_attempts if retry else 1
-    if not session:
+    owned = not session
+    if owned:
         session = ClientSession(
             connector=connector, connector_owner=(not connector), trust_env=True
         )
-    async with session:
+    try:
         async for attempt in RepeatSequence(limit, interval, backoff):
             try:
                 async with attempt.timeout(request_timeout):
@@ -113,6 +128,9 @@ async def fetch(
             except (ClientError, asyncio.TimeoutError) as e:
                 if attempt.final:
                     raise FetchError("Exceeded maximum fetch attempts") from e
+    finally:
+        if owned:
+            await session.close()
 
 
 async def put_file(
@@ -150,11 +168,12 @@ async def put_file(
     data = {**extra_data}
     limit = max_attempts if retry else 1
 
-    if not session:
+    owned = not session
+    if owned:
         session = ClientSession(
             connector=connector, connector_owner=(not connector), trust_env=True
         )
-    async with session:
+    try:
         async for attempt in RepeatSequence(limit, interval, backoff):
             try:
                 async with attempt.timeout(request_timeout):
@@ -172,3 +191,132 @@ async def put_file(
             except (ClientError, asyncio.TimeoutError) as e:
                 if attempt.final:
                     raise PutError("Exceeded maximum put attempts") from e
+    finally:
+        if owned:
+            await session.close()
+
+
+class HttpClient:
+    """
+    Shared HTTP client for fetching and uploading resources.
+
+    Connections are kept alive and reused between requests, up to a total
+    limit and a limit per host. Requests time out when connecting, or waiting
+    for data, takes longer than the configured timeout; large downloads are
+    not limited in total time.
+
+    Client sessions are bound to the event loop they were created on, so one
+    session is opened for each loop the client is used from, such as the
+    JSON-LD document loader's background loop. Connection limits apply to
+    each session.
+    """
+
+    def __init__(
+        self,
+        limit: int = None,
+        limit_per_host: int = None,
+        timeout: float = None,
+        keepalive_timeout: float = 15.0,
+    ):
+        """
+        Initialize the HTTP client.
+
+        Args:
+            limit: The maximum number of open connections, 100 by default
+            limit_per_host: The maximum number of open connections to one host,
+                10 by default
+            timeout: The connection and read timeout in seconds, 30 by default
+            keepalive_timeout: Seconds to keep idle connections open
+
+        """
+        self.limit = limit or 100
+        self.limit_per_host = limit_per_host or 10
+        self.timeout = timeout or 30.0
+        self.keepalive_timeout = keepalive_timeout
+        # event loop -> client session
+        self._sessions = weakref.WeakKeyDictionary()
+        self._sessions_lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "HttpClient":
+        """Create an HTTP client from the configuration settings."""
+        return cls(
+            limit=settings.get("http_client.limit"),
+            limit_per_host=settings.get("http_client.limit_per_host"),
+            timeout=settings.get("http_client.timeout"),
+        )
+
+    @property
+    def session(self) -> ClientSession:
+        """Accessor for the client session of the current event loop."""
+        loop = asyncio.get_event_loop()
+        with self._sessions_lock:
+            session = self._sessions.get(loop)
+            if not session or session.closed:
+                session = self._sessions[loop] = self._create_session()
+            return session
+
+    def _create_session(self) -> ClientSession:
+        """Create a client session on the current event loop."""
+        return ClientSession(
+            connector=TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+            ),
+            timeout=ClientTimeout(sock_connect=self.timeout, sock_read=self.timeout),
+            trust_env=True,
+        )
+
+    async def fetch(self, url: str, **kwargs):
+        """Fetch from an HTTP server; see `fetch` for the arguments."""
+        kwargs.setdefault("request_timeout", self.timeout)
+        return await fetch(url, session=self.session, **kwargs)
+
+    async def put_file(self, url: str, file_data: dict, extra_data: dict, **kwargs):
+        """Put a file to an HTTP server; see `put_file` for the arguments."""
+        kwargs.setdefault("request_timeout", self.timeout)
+        return await put_file(
+            url, file_data, extra_data, session=self.session, **kwargs
+        )
+
+    async def download(
+        self, url: str, file_path: str, chunk_size: int = 65536, digest=None
+    ):
+        """
+        Download a resource to a file without blocking the event loop.
+
+        Args:
+            url: the address to fetch
+            file_path: the path of the file to write
+            chunk_size: the size of the chunks to read and write
+            digest: an optional hash object to update with the content
+
+        """
+        try:
+            async with self.session.get(url) as response:
+                if response.status < 200 or response.status >= 300:
+                    raise FetchError(
+                        f"Bad response from server: {response.status} - "
+                        f"{response.reason}"
+                    )
+                with open(file_path, "wb") as out:
+                    async for chunk in response.content.iter_chunked(chunk_size):
+                        out.write(chunk)
+                        if digest:
+                            digest.update(chunk)
+        except (ClientError, asyncio.TimeoutError) as e:
+            raise FetchError(f"Error downloading {url}: {e}") from e
+
+    async def close(self):
+        """Close the client sessions and their connections."""
+        current = asyncio.get_event_loop()
+        with self._sessions_lock:
+            sessions = list(self._sessions.items())
+            self._sessions.clear()
+        for loop, session in sessions:
+            if loop is current:
+                await session.close()
+            elif loop.is_running():
+                # sessions must be closed on their own loop
+                asyncio.run_coroutine_threadsafe(session.close(), loop)
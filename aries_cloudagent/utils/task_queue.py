@@ -3,10 +3,14 @@
 import asyncio
 import logging
 import time
-from typing import Callable, Coroutine, Tuple
+
+from collections import OrderedDict, deque
+from typing import Callable, Coroutine, Mapping, Sequence, Tuple
 
 LOGGER = logging.getLogger(__name__)
 
+DEFAULT_LANE = "default"
+
 
 def coro_ident(coro: Coroutine):
     """Extract an identifier for a coroutine."""
@@ -65,6 +69,8 @@ class PendingTask:
         ident: str = None,
         task_future: asyncio.Future = None,
         queued_time: float = None,
+        lane: str = None,
+        fair_key: str = None,
     ):
         """
         Initialize the pending task.
@@ -75,6 +81,9 @@ class PendingTask:
             ident: A string identifier for the task
             task_future: A future to be resolved to the asyncio Task
             queued_time: When the pending task was added to the queue
+            lane: The name of the queue lane to run the task in
+            fair_key: The key pending tasks of the lane are shared fairly between,
+                such as a connection or tenant identifier
         """
         if not asyncio.iscoroutine(coro):
             raise ValueError(f"Expected coroutine, got {coro}")
@@ -84,6 +93,8 @@ class PendingTask:
         self.queued_time: float = queued_time
         self.unqueued_time: float = None
         self.ident = ident or coro_ident(coro)
+        self.lane = lane or DEFAULT_LANE
+        self.fair_key = fair_key
         self.task_future = task_future or asyncio.get_event_loop().create_future()
 
     def cancel(self):
@@ -121,11 +132,107 @@ class PendingTask:
         return f"<{self.__class__.__name__} ident={self.ident}>"
 
 
+class TaskLane:
+    """
+    A priority class of pending tasks within a task queue.
+
+    Pending tasks are grouped by their fair key and taken from each group in
+    turn, so that one busy connection or tenant cannot hold up the others.
+    """
+
+    def __init__(self, name: str, quota: int = 0):
+        """
+        Initialize the lane.
+
+        Args:
+            name: The lane name
+            quota: The maximum number of active tasks for the lane, if limited
+        """
+        self.name = name
+        self.quota = quota
+        self.current_active = 0
+        self.current_pending = 0
+        self.total_started = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        # fair key -> deque of pending tasks, in round-robin order
+        self._pending = OrderedDict()
+
+    @property
+    def ready(self) -> bool:
+        """Check whether a pending task of the lane may be started."""
+        return bool(self.current_pending) and (
+            not self.quota or self.current_active < self.quota
+        )
+
+    @property
+    def pending_tasks(self) -> Sequence[PendingTask]:
+        """Accessor for the pending tasks of the lane."""
+        return [pending for tasks in self._pending.values() for pending in tasks]
+
+    def push(self, pending: PendingTask):
+        """Add a pending task to the lane."""
+        tasks = self._pending.get(pending.fair_key)
+        if tasks is None:
+            tasks = self._pending[pending.fair_key] = deque()
+        tasks.append(pending)
+        self.current_pending += 1
+
+    def pop(self) -> PendingTask:
+        """Take the next pending task, moving on to the next fair key."""
+        key, tasks = next(iter(self._pending.items()))
+        pending = tasks.popleft()
+        if tasks:
+            self._pending.move_to_end(key)
+        else:
+            del self._pending[key]
+        self.current_pending -= 1
+        return pending
+
+    def clear(self) -> Sequence[PendingTask]:
+        """Remove and return all pending tasks."""
+        pending = self.pending_tasks
+        self._pending.clear()
+        self.current_pending = 0
+        return pending
+
+    def started(self, pending: PendingTask = None, now: float = None):
+        """Record a task of the lane being started."""
+        self.current_active += 1
+        self.total_started += 1
+        if pending and pending.queued_time:
+            wait = now - pending.queued_time
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+
+    @property
+    def stats(self) -> dict:
+        """Get the lane statistics."""
+        return {
+            "quota": self.quota,
+            "active": self.current_active,
+            "pending": self.current_pending,
+            "started": self.total_started,
+            "wait_avg": self.total_started and self.total_wait / self.total_started,
+            "wait_max": self.max_wait,
+        }
+
+
 class TaskQueue:
-    """A class for managing a set of asyncio tasks."""
+    """
+    A class for managing a set of asyncio tasks.
+
+    Pending tasks are assigned to lanes, which are served in priority order
+    and may each be limited to a number of active tasks, so that a burst of
+    lower priority work leaves room for other tasks.
+    """
 
     def __init__(
-        self, max_active: int = 0, timed: bool = False, trace_fn: Callable = None
+        self,
+        max_active: int = 0,
+        timed: bool = False,
+        trace_fn: Callable = None,
+        lanes: Mapping[str, int] = None,
     ):
         """
         Initialize the task queue.
@@ -134,10 +241,18 @@ class TaskQueue:
             max_active: The maximum number of tasks to automatically run
             timed: A flag indicating that timing should be collected for tasks
             trace_fn: A callback for all completed tasks
+            lanes: The lane names in priority order, mapped to their quotas
+                of active tasks (0 for no limit besides `max_active`)
         """
         self.loop = asyncio.get_event_loop()
         self.active_tasks = []
-        self.pending_tasks = []
+        self.lanes = OrderedDict(
+            (name, TaskLane(name, quota or 0)) for name, quota in (lanes or {}).items()
+        )
+        if DEFAULT_LANE not in self.lanes:
+            self.lanes[DEFAULT_LANE] = TaskLane(DEFAULT_LANE)
+        # active task -> lane, for tasks started from a lane
+        self._task_lanes = {}
         self.timed = timed
         self.total_done = 0
         self.total_failed = 0
@@ -175,12 +290,27 @@ class TaskQueue:
     @property
     def current_pending(self) -> int:
         """Accessor for the current number of pending tasks in the queue."""
-        return len(self.pending_tasks)
+        return sum(lane.current_pending for lane in self.lanes.values())
 
     @property
     def current_size(self) -> int:
         """Accessor for the total number of tasks in the queue."""
-        return len(self.active_tasks) + len(self.pending_tasks)
+        return len(self.active_tasks) + self.current_pending
+
+    @property
+    def pending_tasks(self) -> Sequence[PendingTask]:
+        """Accessor for the pending tasks, in lane priority order."""
+        return [
+            pending for lane in self.lanes.values() for pending in lane.pending_tasks
+        ]
+
+    def get_lane(self, name: str) -> TaskLane:
+        """Get a lane by name, falling back to the default lane."""
+        return self.lanes.get(name) or self.lanes[DEFAULT_LANE]
+
+    def lane_stats(self) -> dict:
+        """Get the statistics for each lane."""
+        return {name: lane.stats for name, lane in self.lanes.items()}
 
     def __bool__(self) -> bool:
         """
@@ -199,7 +329,7 @@ class TaskQueue:
         """Start the process to run queued tasks."""
         if self._drain_task and not self._drain_task.done():
             self._drain_evt.set()
-        elif self.pending_tasks:
+        elif self.current_pending:
             self._drain_task = self.loop.create_task(self._drain_loop())
             self._drain_task.add_done_callback(lambda task: self._drain_done(task))
         return self._drain_task
@@ -218,12 +348,13 @@ class TaskQueue:
         # waiting for the drain event, to avoid yielding to other queue methods
         while True:
             self._drain_evt.clear()
-            while self.pending_tasks and (
-                not self._max_active or len(self.active_tasks) < self._max_active
-            ):
-                pending: PendingTask = self.pending_tasks.pop(0)
-                if pending.queued_time:
-                    pending.unqueued_time = time.perf_counter()
+            while not self._max_active or len(self.active_tasks) < self._max_active:
+                lane = next((lane for lane in self.lanes.values() if lane.ready), None)
+                if not lane:
+                    break
+                pending: PendingTask = lane.pop()
+                pending.unqueued_time = time.perf_counter()
+                if self.timed and pending.queued_time:
                     timing = {
                         "queued": pending.queued_time,
                         "unqueued": pending.unqueued_time,
@@ -233,11 +364,13 @@ class TaskQueue:
                 task = self.run(
                     pending.coro, pending.complete_hook, pending.ident, timing
                 )
+                self._task_lanes[task] = lane
+                lane.started(pending, pending.unqueued_time)
                 try:
                     pending.task = task
                 except ValueError:
                     LOGGER.warning("Pending task future already fulfilled")
-            if self.pending_tasks:
+            if self.current_pending:
                 await self._drain_evt.wait()
             else:
                 break
@@ -249,9 +382,9 @@ class TaskQueue:
         Args:
             pending: The `PendingTask` to add to the task queue
         """
-        if self.timed and not pending.queued_time:
+        if not pending.queued_time:
             pending.queued_time = time.perf_counter()
-        self.pending_tasks.append(pending)
+        self.get_lane(pending.lane).push(pending)
         self.drain()
 
     def add_active(
@@ -310,7 +443,12 @@ class TaskQueue:
         return self.add_active(task, task_complete, ident, timing)
 
     def put(
-        self, coro: Coroutine, task_complete: Callable = None, ident: str = None
+        self,
+        coro: Coroutine,
+        task_complete: Callable = None,
+        ident: str = None,
+        lane: str = None,
+        fair_key: str = None,
     ) -> PendingTask:
         """
         Add a new task to the queue, delaying execution if busy.
@@ -319,15 +457,25 @@ class TaskQueue:
             coro: The coroutine to run
             task_complete: A callback to run on completion
             ident: A string identifier for the task
+            lane: The name of the lane to run the task in
+            fair_key: The key pending tasks of the lane are shared fairly between
 
         Returns: a future resolving to the asyncio task instance once queued
 
         """
-        pending = PendingTask(coro, task_complete, ident)
+        pending = PendingTask(coro, task_complete, ident, lane=lane, fair_key=fair_key)
+        task_lane = self.get_lane(pending.lane)
         if self._cancelled:
             pending.cancel()
-        elif self.ready:
-            pending.task = self.run(coro, task_complete, pending.ident)
+        elif (
+            self.ready
+            and not task_lane.current_pending
+            and (not task_lane.quota or task_lane.current_active < task_lane.quota)
+        ):
+            task = self.run(coro, task_complete, pending.ident)
+            self._task_lanes[task] = task_lane
+            task_lane.started()
+            pending.task = task
         else:
             self.add_pending(pending)
         return pending
@@ -362,6 +510,9 @@ class TaskQueue:
             self.active_tasks.remove(task)
         except ValueError:
             pass
+        lane = self._task_lanes.pop(task, None)
+        if lane:
+            lane.current_active -= 1
         self.drain()
 
     def cancel_pending(self):
@@ -369,9 +520,9 @@ class TaskQueue:
         if self._drain_task:
             self._drain_task.cancel()
             self._drain_task = None
-        for pending in self.pending_tasks:
-            pending.cancel()
-        self.pending_tasks = []
+        for lane in self.lanes.values():
+            for pending in lane.clear():
+                pending.cancel()
 
     def cancel(self):
         """Cancel any pending or active tasks in the queue."""
@@ -1,8 +1,14 @@
+import asyncio
+import hashlib
+import os
+import tempfile
+
 from aiohttp import web
 from aiohttp.test_utils import AioHTTPTestCase, unittest_run_loop
 from asynctest import mock as async_mock, mock_open
 
-from ..http import fetch, fetch_stream, FetchError, put_file, PutError
+from ...config.settings import Settings
+from ..http import fetch, fetch_stream, FetchError, HttpClient, put_file, PutError
 
 
 class TestTransportUtils(AioHTTPTestCase):
@@ -69,6 +75,7 @@ class TestTransportUtils(AioHTTPTestCase):
         )
         assert result == [1]
         assert self.succeed_calls == 1
+        assert not self.client.session.closed
 
     @unittest_run_loop
     async def test_fetch_default_client(self):
@@ -129,3 +136,92 @@ class TestTransportUtils(AioHTTPTestCase):
                     json=True,
                 )
         assert self.fail_calls == 2
+
+    @unittest_run_loop
+    async def test_http_client(self):
+        server_addr = f"http://localhost:{self.server.port}"
+        client = HttpClient(limit_per_host=2, timeout=5)
+        assert await client.fetch(f"{server_addr}/succeed", json=True) == [1]
+        session = client.session
+        assert session.connector.limit_per_host == 2
+        assert await client.fetch(f"{server_addr}/succeed") == "[true]"
+        assert client.session is session
+        assert self.succeed_calls == 2
+
+        with async_mock.patch("builtins.open", mock_open(read_data="data")):
+            result = await client.put_file(
+                f"{server_addr}/succeed",
+                {"tails": "/tmp/dummy/path"},
+                {"genesis": "..."},
+                json=True,
+            )
+        assert result == [1]
+
+        with self.assertRaises(FetchError):
+            await client.fetch(f"{server_addr}/fail", max_attempts=2, interval=0)
+        assert self.fail_calls == 2
+
+        await client.close()
+        assert session.closed
+        assert client.session is not session
+        await client.close()
+
+    @unittest_run_loop
+    async def test_http_client_other_loop(self):
+        server_addr = f"http://localhost:{self.server.port}"
+        client = HttpClient()
+        assert await client.fetch(f"{server_addr}/succeed") == "[true]"
+        session = client.session
+        other_sessions = []
+
+        async def fetch_other_loop():
+            other_sessions.append(client.session)
+            return await client.fetch(f"{server_addr}/succeed")
+
+        def run_other_loop():
+            loop = asyncio.new_event_loop()
+            try:
+                return loop.run_until_complete(fetch_other_loop())
+            finally:
+                loop.run_until_complete(other_sessions[0].close())
+                loop.close()
+
+        # the client is used from the loop of another thread
+        result = await asyncio.get_event_loop().run_in_executor(None, run_other_loop)
+        assert result == "[true]"
+        assert other_sessions[0] is not session
+        assert client.session is session
+        assert self.succeed_calls == 2
+
+        await client.close()
+        assert session.closed
+
+    @unittest_run_loop
+    async def test_http_client_download(self):
+        server_addr = f"http://localhost:{self.server.port}"
+        client = HttpClient()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "download")
+            digest = hashlib.sha256()
+            await client.download(
+                f"{server_addr}/succeed", file_path, chunk_size=2, digest=digest
+            )
+            with open(file_path, "rb") as downloaded:
+                assert downloaded.read() == b"[true]"
+            assert digest.digest() == hashlib.sha256(b"[true]").digest()
+
+            with self.assertRaises(FetchError):
+                await client.download(f"{server_addr}/fail", file_path)
+            assert self.fail_calls == 1
+
+            with self.assertRaises(FetchError):
+                await client.download("http://localhost:0/none", file_path)
+        await client.close()
+
+    def test_http_client_settings(self):
+        client = HttpClient.from_settings(
+            Settings({"http_client.limit": 5, "http_client.timeout": 2})
+        )
+        assert client.limit == 5
+        assert client.limit_per_host == 10
+        assert client.timeout == 2
@@ -226,3 +226,63 @@ class TestTaskQueue(AsyncTestCase):
         assert len(completed) == 2
         assert "queued" not in completed[0][1]
         assert "queued" in completed[1][1]
+
+    async def test_lanes_priority(self):
+        queue = TaskQueue(max_active=1, lanes={"high": 0, "low": 0})
+        assert list(queue.lanes) == ["high", "low", "default"]
+        started = []
+
+        async def record(val):
+            started.append(val)
+
+        queue.run(retval(0, delay=0.01))
+        queue.put(record("low"), lane="low")
+        queue.put(record("default"))
+        queue.put(record("high"), lane="high")
+        queue.put(record("unknown"), lane="unknown")
+        assert queue.current_pending == 4
+        assert [pend.lane for pend in queue.pending_tasks] == [
+            "high",
+            "low",
+            "default",
+            "unknown",
+        ]
+        await queue.flush()
+        assert started == ["high", "low", "default", "unknown"]
+
+    async def test_lanes_quota(self):
+        queue = TaskQueue(max_active=3, lanes={"bulk": 1})
+        bulk1 = await queue.put(retval(1, delay=0.05), lane="bulk")
+        bulk2 = queue.put(retval(2), lane="bulk")
+        other = await queue.put(retval(3))
+        assert queue.lanes["bulk"].current_active == 1
+        assert queue.lanes["bulk"].current_pending == 1
+        assert not bulk2.task
+        assert await other == 3
+        assert await bulk1 == 1
+        assert await (await bulk2) == 2
+        await queue.flush()
+
+        stats = queue.lane_stats()
+        assert stats["bulk"]["quota"] == 1
+        assert stats["bulk"]["active"] == 0
+        assert stats["bulk"]["pending"] == 0
+        assert stats["bulk"]["started"] == 2
+        assert stats["bulk"]["wait_max"] >= stats["bulk"]["wait_avg"] > 0
+        assert stats["default"]["started"] == 1
+        assert stats["default"]["wait_max"] == 0
+
+    async def test_lanes_fair(self):
+        queue = TaskQueue(max_active=1)
+        started = []
+
+        async def record(val):
+            started.append(val)
+
+        queue.run(retval(0, delay=0.01))
+        for val in ("a1", "a2", "a3"):
+            queue.put(record(val), fair_key="a")
+        for val in ("b1", "b2"):
+            queue.put(record(val), fair_key="b")
+        await queue.flush()
+        assert started == ["a1", "b1", "a2", "b2", "a3"]
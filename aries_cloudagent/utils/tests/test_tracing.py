@@ -1,6 +1,9 @@
+import asyncio
 import json
 import requests
 
+from aiohttp import web
+from aiohttp.test_utils import AioHTTPTestCase, unittest_run_loop
 from asynctest import mock as async_mock, TestCase as AsyncTestCase
 
 from ...protocols.out_of_band.v1_0.messages.invitation import InvitationMessage
@@ -142,13 +145,21 @@ class TestTracing(AsyncTestCase):
             "trace.target": "http://fluentd:8080/",
             "trace.tag": "acapy.trace",
         }
-        test_module.trace_event(
-            context,
-            message,
-            handler="message_handler",
-            perf_counter=None,
-            outcome="processed OK",
-        )
+        exporter = async_mock.MagicMock()
+        with async_mock.patch.object(
+            test_module, "get_trace_exporter", return_value=exporter
+        ), async_mock.patch.object(test_module.requests, "post") as mock_post:
+            test_module.trace_event(
+                context,
+                message,
+                handler="message_handler",
+                perf_counter=None,
+                outcome="processed OK",
+            )
+        mock_post.assert_not_called()
+        url, event = exporter.submit.call_args[0]
+        assert url == "http://fluentd:8080/acapy.trace"
+        assert json.loads(event)["thread_id"] == "dummy_thread_id_12345"
 
     async def test_post_event_with_error(self):
         message = Ping()
@@ -195,3 +206,80 @@ class TestTracing(AsyncTestCase):
         assert len(trace_reports) == 1
         trace_report = trace_reports[0]
         assert trace_report.thread_id == message._thread.thid
+
+
+class TestTraceExporter(AioHTTPTestCase):
+    async def setUpAsync(self):
+        self.received = []
+        self.fail = False
+
+    async def get_application(self):
+        app = web.Application()
+        app.add_routes([web.post("/trace", self.trace_route)])
+        return app
+
+    async def trace_route(self, request):
+        if self.fail:
+            raise web.HTTPServiceUnavailable()
+        self.received.append(await request.json())
+        return web.Response()
+
+    @unittest_run_loop
+    async def test_batched_export(self):
+        url = f"http://localhost:{self.server.port}/trace"
+        exporter = test_module.TraceExporter(batch_size=3, flush_interval=0.01)
+
+        for i in range(5):
+            exporter.submit(url, json.dumps({"n": i}))
+        assert exporter.pending == 5
+        for _ in range(100):
+            if not exporter.pending and exporter.total_sent == 5:
+                break
+            await asyncio.sleep(0.01)
+        assert self.received == [[{"n": 0}, {"n": 1}, {"n": 2}], [{"n": 3}, {"n": 4}]]
+        assert exporter.stats == {
+            "trace_pending": 0,
+            "trace_sent": 5,
+            "trace_dropped": 0,
+            "trace_failed": 0,
+        }
+
+        self.fail = True
+        exporter.submit(url, json.dumps({"n": 5}))
+        await exporter.close()
+        assert exporter.total_failed == 1
+
+    @unittest_run_loop
+    async def test_drop_policy(self):
+        url = f"http://localhost:{self.server.port}/trace"
+        exporter = test_module.TraceExporter(buffer_size=2, flush_interval=60)
+        for i in range(4):
+            exporter.submit(url, json.dumps({"n": i}))
+        assert exporter.total_dropped == 2
+        await exporter.close()
+        # one event per request by default, as posted by trace_event
+        assert self.received == [{"n": 2}, {"n": 3}]
+
+        self.received.clear()
+        exporter = test_module.TraceExporter(
+            buffer_size=2, flush_interval=60, drop_policy="newest"
+        )
+        for i in range(4):
+            exporter.submit(url, json.dumps({"n": i}))
+        assert exporter.total_dropped == 2
+        await exporter.close()
+        assert self.received == [{"n": 0}, {"n": 1}]
+
+        with self.assertRaises(ValueError):
+            test_module.TraceExporter(drop_policy="random")
+
+    @unittest_run_loop
+    async def test_get_trace_exporter(self):
+        with async_mock.patch.object(test_module, "_TRACE_EXPORTER", None):
+            assert test_module.get_trace_exporter() is None
+            exporter = test_module.get_trace_exporter(
+                {"trace.buffer_size": 10, "trace.drop_policy": "newest"}
+            )
+            assert exporter.buffer_size == 10
+            assert exporter.drop_policy == "newest"
+            assert test_module.get_trace_exporter() is exporter
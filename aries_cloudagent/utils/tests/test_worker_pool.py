@@ -0,0 +1,122 @@
+import asyncio
+import threading
+
+from asynctest import TestCase as AsyncTestCase, mock as async_mock
+
+from ...config.settings import Settings
+
+from .. import worker_pool as test_module
+from ..worker_pool import WorkerPool
+
+
+def thread_name() -> str:
+    return threading.current_thread().name
+
+
+def fail():
+    raise ValueError("failed")
+
+
+class TestWorkerPool(AsyncTestCase):
+    async def test_run(self):
+        pool = WorkerPool(max_workers=2)
+        assert await pool.run(sum, [1, 2, 3]) == 6
+        assert await pool.run(int, "ff", base=16) == 255
+        assert (await pool.run(thread_name)).startswith("acapy-worker")
+        with self.assertRaises(ValueError):
+            await pool.run(fail)
+        assert pool.stats == {
+            "worker_active": 0,
+            "worker_pending": 0,
+            "worker_done": 3,
+            "worker_failed": 1,
+        }
+        pool.close()
+        assert not pool._thread_executor
+
+    async def test_run_limit(self):
+        pool = WorkerPool(max_workers=1)
+        release = threading.Event()
+        first = asyncio.ensure_future(pool.run(release.wait, 5))
+        second = asyncio.ensure_future(pool.run(sum, [1]))
+        await asyncio.sleep(0.05)
+        assert pool.current_active == 1
+        assert pool.current_pending == 1
+        assert not second.done()
+        release.set()
+        assert await first
+        assert await second == 1
+        assert pool.current_active == 0
+        pool.close()
+
+    async def test_run_limit_other_loop(self):
+        pool = WorkerPool(max_workers=1)
+        release = threading.Event()
+        first = asyncio.ensure_future(pool.run(release.wait, 5))
+        await asyncio.sleep(0.01)
+
+        def run_other_loop():
+            loop = asyncio.new_event_loop()
+            try:
+                return loop.run_until_complete(pool.run(sum, [1]))
+            finally:
+                loop.close()
+
+        # the limit applies to calls from the loop of another thread
+        second = asyncio.get_event_loop().run_in_executor(None, run_other_loop)
+        await asyncio.sleep(0.05)
+        assert pool.current_active == 1
+        assert pool.current_pending == 1
+        assert not second.done()
+        release.set()
+        assert await first
+        assert await second == 1
+        assert pool.stats["worker_active"] == 0
+        assert pool.stats["worker_done"] == 2
+        pool.close()
+
+    async def test_run_limit_cancel(self):
+        pool = WorkerPool(max_workers=1)
+        release = threading.Event()
+        first = asyncio.ensure_future(pool.run(release.wait, 5))
+        second = asyncio.ensure_future(pool.run(sum, [1]))
+        third = asyncio.ensure_future(pool.run(sum, [2]))
+        await asyncio.sleep(0.05)
+        second.cancel()
+        await asyncio.sleep(0)
+        assert pool.current_pending == 1
+        release.set()
+        assert await first
+        assert await third == 2
+        assert second.cancelled()
+        assert pool.stats["worker_active"] == 0
+        assert pool._available == 1
+        pool.close()
+
+    async def test_run_process(self):
+        pool = WorkerPool(max_workers=1, mode="process")
+        assert pool._executor(False) is pool._thread_executor
+        assert pool._executor(True) is pool._process_executor
+        assert pool._process_executor is not pool._thread_executor
+        assert await pool.run(sum, [1, 2], process=True) == 3
+        pool.close()
+        assert not pool._process_executor
+
+    def test_settings(self):
+        pool = WorkerPool.from_settings(
+            Settings({"worker_pool.size": 3, "worker_pool.mode": "process"})
+        )
+        assert pool.max_workers == 3
+        assert pool.mode == WorkerPool.MODE_PROCESS
+        assert WorkerPool().max_workers >= 1
+        with self.assertRaises(ValueError):
+            WorkerPool(mode="fiber")
+
+    async def test_shared_pool(self):
+        with async_mock.patch.object(test_module, "_WORKER_POOL", None):
+            pool = test_module.get_worker_pool(Settings({"worker_pool.size": 2}))
+            assert pool.max_workers == 2
+            assert test_module.get_worker_pool() is pool
+            assert await test_module.run_in_worker(sum, [2, 2]) == 4
+            assert test_module.close_worker_pool() is pool
+            assert test_module.close_worker_pool() is None
@@ -1,11 +1,16 @@
 """Event tracing."""
 
+import asyncio
 import json
 import logging
 import time
 import datetime
 import requests
 
+from collections import deque
+from typing import Optional
+
+from aiohttp import ClientError, ClientSession, ClientTimeout
 from marshmallow import fields
 
 from ..transport.inbound.message import InboundMessage
@@ -23,6 +28,11 @@ from ..messaging.models.openapi import OpenAPISchema
 LOGGER = logging.getLogger(__name__)
 DT_FMT = "%Y-%m-%d %H:%M:%S.%f%z"
 
+TRACE_BUFFER_SIZE = 1000
+TRACE_BATCH_SIZE = 1
+TRACE_FLUSH_INTERVAL = 1.0
+TRACE_POST_TIMEOUT = 10.0
+
 
 class AdminAPIMessageTracingSchema(OpenAPISchema):
     """
@@ -39,6 +49,206 @@ class AdminAPIMessageTracingSchema(OpenAPISchema):
     )
 
 
+class TraceExporter:
+    """
+    Export trace events to http endpoints from a background task.
+
+    Events are held in a bounded buffer, so that tracing does not block the
+    event loop. By default each event is posted as a JSON object, as by the
+    synchronous fallback; with a batch size above one, events are posted in
+    batches as a JSON array, which the trace target must accept. When the
+    buffer is full, either the oldest buffered event or the new event is
+    dropped, according to the drop policy.
+    """
+
+    DROP_OLDEST = "oldest"
+    DROP_NEWEST = "newest"
+
+    def __init__(
+        self,
+        buffer_size: int = None,
+        batch_size: int = None,
+        flush_interval: float = None,
+        drop_policy: str = None,
+    ):
+        """
+        Initialize a `TraceExporter` instance.
+
+        Args:
+            buffer_size: The maximum number of buffered events
+            batch_size: The maximum number of events posted per request, as a
+                JSON array if above 1 (default)
+            flush_interval: Seconds to wait for a full batch before posting
+            drop_policy: Which event to drop when the buffer is full,
+                "oldest" (default) or "newest"
+
+        """
+        self.buffer_size = buffer_size or TRACE_BUFFER_SIZE
+        self.batch_size = batch_size or TRACE_BATCH_SIZE
+        self.flush_interval = (
+            TRACE_FLUSH_INTERVAL if flush_interval is None else flush_interval
+        )
+        self.drop_policy = drop_policy or self.DROP_OLDEST
+        if self.drop_policy not in (self.DROP_OLDEST, self.DROP_NEWEST):
+            raise ValueError(f"Unsupported trace drop policy: {drop_policy}")
+        self.total_sent = 0
+        self.total_dropped = 0
+        self.total_failed = 0
+        self._buffer = deque()
+        self._loop = None
+        self._ready: asyncio.Event = None
+        self._full: asyncio.Event = None
+        self._task: asyncio.Task = None
+
+    @classmethod
+    def from_settings(cls, settings) -> "TraceExporter":
+        """Create a trace exporter from the trace settings."""
+        return cls(
+            buffer_size=settings.get("trace.buffer_size"),
+            batch_size=settings.get("trace.batch_size"),
+            drop_policy=settings.get("trace.drop_policy"),
+        )
+
+    @property
+    def pending(self) -> int:
+        """Accessor for the number of buffered events."""
+        return len(self._buffer)
+
+    @property
+    def stats(self) -> dict:
+        """Get the export counters."""
+        return {
+            "trace_pending": self.pending,
+            "trace_sent": self.total_sent,
+            "trace_dropped": self.total_dropped,
+            "trace_failed": self.total_failed,
+        }
+
+    def submit(self, url: str, event: str):
+        """
+        Buffer an event for export, without blocking.
+
+        Must be called from within the running event loop.
+
+        Args:
+            url: The endpoint to post the event to
+            event: The JSON encoded event
+
+        """
+        self._start()
+        if len(self._buffer) >= self.buffer_size:
+            self.total_dropped += 1
+            if self.drop_policy == self.DROP_NEWEST:
+                return
+            self._buffer.popleft()
+        self._buffer.append((url, event))
+        self._ready.set()
+        if len(self._buffer) >= self.batch_size:
+            self._full.set()
+
+    def _start(self):
+        """Start the export task on the running event loop, if not running."""
+        loop = asyncio.get_event_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._ready = asyncio.Event()
+            self._full = asyncio.Event()
+            self._task = None
+            if self._buffer:
+                self._ready.set()
+        if not self._task or self._task.done():
+            self._task = loop.create_task(self._run())
+
+    async def _run(self):
+        """Post buffered events until cancelled."""
+        async with ClientSession(
+            timeout=ClientTimeout(total=TRACE_POST_TIMEOUT)
+        ) as session:
+            while True:
+                await self._ready.wait()
+                if len(self._buffer) < self.batch_size:
+                    self._full.clear()
+                    try:
+                        await asyncio.wait_for(self._full.wait(), self.flush_interval)
+                    except asyncio.TimeoutError:
+                        pass
+                await self._flush(session)
+
+    async def _flush(self, session: ClientSession):
+        """Post all buffered events in batches."""
+        while self._buffer:
+            url = self._buffer[0][0]
+            events = []
+            while (
+                self._buffer
+                and len(events) < self.batch_size
+                and self._buffer[0][0] == url
+            ):
+                events.append(self._buffer.popleft()[1])
+            try:
+                async with session.post(
+                    url,
+                    data=(
+                        "[" + ",".join(events) + "]"
+                        if self.batch_size > 1
+                        else events[0]
+                    ),
+                    headers={"Content-Type": "application/json"},
+                ) as response:
+                    response.raise_for_status()
+            except asyncio.CancelledError:
+                self._buffer.extendleft(reversed(events))
+                raise
+            except (ClientError, asyncio.TimeoutError) as e:
+                self.total_failed += len(events)
+                LOGGER.warning(
+                    "Error posting %d trace events to %s: %s", len(events), url, e
+                )
+            else:
+                self.total_sent += len(events)
+        if self._ready:
+            self._ready.clear()
+
+    async def close(self):
+        """Stop the export task and post any remaining events."""
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self._buffer:
+            async with ClientSession(
+                timeout=ClientTimeout(total=TRACE_POST_TIMEOUT)
+            ) as session:
+                await self._flush(session)
+        self._loop = None
+
+
+_TRACE_EXPORTER: TraceExporter = None
+
+
+def get_trace_exporter(context=None) -> Optional[TraceExporter]:
+    """
+    Get the shared trace exporter.
+
+    Args:
+        context: The trace settings used to create the exporter. If not
+            provided, None is returned when no exporter has been created.
+
+    """
+    global _TRACE_EXPORTER
+    if not _TRACE_EXPORTER and context is not None:
+        _TRACE_EXPORTER = TraceExporter.from_settings(context)
+    return _TRACE_EXPORTER
+
+
+def _event_loop_running() -> bool:
+    """Check whether we are running within an event loop."""
+    try:
+        return asyncio.get_event_loop().is_running()
+    except RuntimeError:
+        return False
+
+
 def get_timer() -> float:
     """Return a timer."""
     return time.perf_counter()
@@ -224,12 +434,18 @@ def trace_event(
                 LOGGER.info(" %s %s", context["trace.tag"], event_str)
             else:
                 # should be an http endpoint
-                _ = requests.post(
-                    context["trace.target"]
-                    + (context["trace.tag"] if context["trace.tag"] else ""),
-                    data=event_str,
-                    headers={"Content-Type": "application/json"},
+                url = context["trace.target"] + (
+                    context["trace.tag"] if context["trace.tag"] else ""
                 )
+                if raise_errors or not _event_loop_running():
+                    # post synchronously so that the caller sees any error
+                    _ = requests.post(
+                        url,
+                        data=event_str,
+                        headers={"Content-Type": "application/json"},
+                    )
+                else:
+                    get_trace_exporter(context).submit(url, event_str)
         except Exception as e:
             if raise_errors:
                 raise
@@ -0,0 +1,200 @@
+"""Worker pool for running CPU-bound work off the event loop."""
+
+import asyncio
+import logging
+import os
+import threading
+
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Optional
+
+from ..config.settings import Settings
+
+LOGGER = logging.getLogger(__name__)
+
+
+class WorkerPool:
+    """
+    Bounded pool of workers for CPU-bound functions.
+
+    Functions always run in worker threads, unless the pool is in process mode
+    and the caller marks the function as able to run in another process (the
+    function and its arguments must then be picklable). Process mode lets an
+    agent use several cores for pure-Python work held back by the GIL.
+
+    At most `max_workers` functions are submitted at once; further calls wait
+    on the event loop, where they are counted as pending. The limit is shared
+    by all event loops using the pool, such as the JSON-LD document loader's.
+    """
+
+    MODE_THREAD = "thread"
+    MODE_PROCESS = "process"
+
+    def __init__(self, max_workers: int = None, mode: str = None):
+        """
+        Initialize the worker pool.
+
+        Args:
+            max_workers: The maximum number of functions running at once,
+                by default the number of processors
+            mode: 'thread' (default) or 'process'
+
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.mode = mode or self.MODE_THREAD
+        if self.mode not in (self.MODE_THREAD, self.MODE_PROCESS):
+            raise ValueError(f"Unsupported worker pool mode: {self.mode}")
+        self._thread_executor: Executor = None
+        self._process_executor: Executor = None
+        # guards the free slots, waiters and statistics, as the pool may be
+        # used from the event loops of several threads
+        self._lock = threading.Lock()
+        self._available = self.max_workers
+        # (event loop, future) for calls waiting for a free slot, in order
+        self._waiters = deque()
+        self.current_active = 0
+        self.current_pending = 0
+        self.total_done = 0
+        self.total_failed = 0
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "WorkerPool":
+        """Create a worker pool from the configuration settings."""
+        return cls(
+            max_workers=settings.get("worker_pool.size"),
+            mode=settings.get("worker_pool.mode"),
+        )
+
+    @property
+    def stats(self) -> dict:
+        """Get the worker pool statistics."""
+        return {
+            "worker_active": self.current_active,
+            "worker_pending": self.current_pending,
+            "worker_done": self.total_done,
+            "worker_failed": self.total_failed,
+        }
+
+    def _executor(self, process: bool) -> Executor:
+        """Get the executor to run a function in, starting it if necessary."""
+        if process and self.mode == self.MODE_PROCESS:
+            if not self._process_executor:
+                self._process_executor = ProcessPoolExecutor(self.max_workers)
+            return self._process_executor
+        if not self._thread_executor:
+            self._thread_executor = ThreadPoolExecutor(
+                self.max_workers, thread_name_prefix="acapy-worker"
+            )
+        return self._thread_executor
+
+    async def run(self, func: Callable, *args, process: bool = False, **kwargs):
+        """
+        Run a function in the pool and return its result.
+
+        Args:
+            func: The function to run
+            args: Positional arguments for the function
+            process: Whether the function may run in a worker process
+            kwargs: Keyword arguments for the function
+
+        """
+        loop = asyncio.get_event_loop()
+        await self._acquire(loop)
+        try:
+            result = await loop.run_in_executor(
+                self._executor(process), partial(func, *args, **kwargs)
+            )
+        except Exception:
+            with self._lock:
+                self.total_failed += 1
+            raise
+        finally:
+            self._release()
+        with self._lock:
+            self.total_done += 1
+        return result
+
+    async def _acquire(self, loop: asyncio.AbstractEventLoop):
+        """Take a free slot, waiting on the event loop if necessary."""
+        with self._lock:
+            if self._available:
+                self._available -= 1
+                self.current_active += 1
+                return
+            waiter = loop.create_future()
+            self._waiters.append((loop, waiter))
+            self.current_pending += 1
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            with self._lock:
+                if (loop, waiter) in self._waiters:
+                    self._waiters.remove((loop, waiter))
+                    self.current_pending -= 1
+                    raise
+            if waiter.done() and not waiter.cancelled():
+                # cancelled after being handed a slot, pass it on
+                self._release()
+            raise
+
+    def _release(self):
+        """Hand a slot to the next waiting call, or free it."""
+        with self._lock:
+            self.current_active -= 1
+            while self._waiters:
+                loop, waiter = self._waiters.popleft()
+                self.current_pending -= 1
+                if not loop.is_closed():
+                    self.current_active += 1
+                    loop.call_soon_threadsafe(self._grant, waiter)
+                    return
+            self._available += 1
+
+    def _grant(self, waiter: asyncio.Future):
+        """Wake a waiting call on its own event loop."""
+        if waiter.done():
+            # the call was cancelled while the slot was being handed over
+            self._release()
+        else:
+            waiter.set_result(None)
+
+    def close(self, wait: bool = True):
+        """Shut down the worker threads and processes."""
+        for executor in (self._thread_executor, self._process_executor):
+            if executor:
+                executor.shutdown(wait=wait)
+        self._thread_executor = None
+        self._process_executor = None
+
+
+_WORKER_POOL: WorkerPool = None
+
+
+def get_worker_pool(settings: Settings = None) -> WorkerPool:
+    """
+    Get the shared worker pool, creating it if necessary.
+
+    Args:
+        settings: The settings used to create the pool, if not yet created
+
+    """
+    global _WORKER_POOL
+    if not _WORKER_POOL:
+        _WORKER_POOL = WorkerPool.from_settings(settings or Settings())
+    return _WORKER_POOL
+
+
+def close_worker_pool(wait: bool = True) -> Optional[WorkerPool]:
+    """Shut down the shared worker pool, if created."""
+    global _WORKER_POOL
+    pool, _WORKER_POOL = _WORKER_POOL, None
+    if pool:
+        pool.close(wait)
+    return pool
+
+
+async def run_in_worker(func: Callable, *args, process: bool = False, **kwargs):
+    """Run a CPU-bound function in the shared worker pool."""
+    return await get_worker_pool().run(func, *args, process=process, **kwargs)
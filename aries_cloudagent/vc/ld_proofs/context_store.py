@@ -0,0 +1,71 @@
+"""Persistent stores for remote JSON-LD context documents."""
+
+import json
+
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from ...core.profile import Profile
+from ...storage.base import BaseStorage
+from ...storage.error import StorageNotFoundError
+from ...storage.record import StorageRecord
+
+
+class BaseContextStore(ABC):
+    """Abstract store for fetched JSON-LD context documents."""
+
+    @abstractmethod
+    async def get(self, url: str) -> Optional[dict]:
+        """
+        Get a stored context document.
+
+        Args:
+            url: The context url
+
+        Returns:
+            The loaded document, or None if not stored
+
+        """
+
+    @abstractmethod
+    async def set(self, url: str, document: dict):
+        """
+        Store a context document.
+
+        Args:
+            url: The context url
+            document: The loaded document, as returned by the document loader
+
+        """
+
+
+class StorageContextStore(BaseContextStore):
+    """Context store keeping documents as non-secrets storage records."""
+
+    RECORD_TYPE = "jsonld_context"
+
+    def __init__(self, profile: Profile):
+        """Initialize a `StorageContextStore` instance."""
+        self.profile = profile
+
+    async def get(self, url: str) -> Optional[dict]:
+        """Get a stored context document."""
+        async with self.profile.session() as session:
+            storage = session.inject(BaseStorage)
+            try:
+                record = await storage.get_record(self.RECORD_TYPE, url)
+            except StorageNotFoundError:
+                return None
+        return json.loads(record.value)
+
+    async def set(self, url: str, document: dict):
+        """Store a context document, replacing any previous version."""
+        value = json.dumps(document)
+        async with self.profile.session() as session:
+            storage = session.inject(BaseStorage)
+            try:
+                record = await storage.get_record(self.RECORD_TYPE, url)
+            except StorageNotFoundError:
+                await storage.add_record(StorageRecord(self.RECORD_TYPE, value, id=url))
+            else:
+                await storage.update_record(record, value, record.tags)
@@ -0,0 +1,36 @@
+"""Well-known JSON-LD contexts shipped with the agent."""
+
+from ..constants import (
+    CREDENTIALS_CONTEXT_V1_URL,
+    DID_V1_CONTEXT_URL,
+    SECURITY_CONTEXT_BBS_URL,
+    SECURITY_CONTEXT_V1_URL,
+    SECURITY_CONTEXT_V2_URL,
+    SECURITY_CONTEXT_V3_URL,
+)
+
+from .bbs_v1 import BBS_V1
+from .credentials_v1 import CREDENTIALS_V1
+from .did_v1 import DID_V1
+from .security_v1 import SECURITY_V1
+from .security_v2 import SECURITY_V2
+from .security_v3_unstable import SECURITY_V3_UNSTABLE
+
+STATIC_CONTEXTS = {
+    CREDENTIALS_CONTEXT_V1_URL: CREDENTIALS_V1,
+    DID_V1_CONTEXT_URL: DID_V1,
+    SECURITY_CONTEXT_BBS_URL: BBS_V1,
+    SECURITY_CONTEXT_V1_URL: SECURITY_V1,
+    SECURITY_CONTEXT_V2_URL: SECURITY_V2,
+    SECURITY_CONTEXT_V3_URL: SECURITY_V3_UNSTABLE,
+}
+
+__all__ = [
+    BBS_V1,
+    CREDENTIALS_V1,
+    DID_V1,
+    SECURITY_V1,
+    SECURITY_V2,
+    SECURITY_V3_UNSTABLE,
+    STATIC_CONTEXTS,
+]
@@ -1,3 +1,5 @@
+"""BBS+ signatures v1 JSON-LD context."""
+
 BBS_V1 = {
     "@context": {
         "@version": 1.1,
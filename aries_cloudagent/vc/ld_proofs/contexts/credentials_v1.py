@@ -1,3 +1,5 @@
+"""W3C Verifiable Credentials v1 JSON-LD context."""
+
 CREDENTIALS_V1 = {
     "@context": {
         "@version": 1.1,
@@ -1,3 +1,5 @@
+"""W3C Decentralized Identifiers v1 JSON-LD context."""
+
 DID_V1 = {
     "@context": {
         "@protected": True,
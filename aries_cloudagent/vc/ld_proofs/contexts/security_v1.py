@@ -1,3 +1,5 @@
+"""W3C Security Vocabulary v1 JSON-LD context."""
+
 SECURITY_V1 = {
     "@context": {
         "id": "@id",
@@ -1,3 +1,5 @@
+"""W3C Security Vocabulary v2 JSON-LD context."""
+
 SECURITY_V2 = {
     "@context": [
         {"@version": 1.1},
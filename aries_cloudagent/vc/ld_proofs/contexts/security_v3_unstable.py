@@ -1,3 +1,5 @@
+"""W3C Security Vocabulary v3 (unstable) JSON-LD context."""
+
 SECURITY_V3_UNSTABLE = {
     "@context": [
         {
@@ -44,12 +46,12 @@ SECURITY_V3_UNSTABLE = {
                                 "@container": "@set",
                             },
                             "capabilityInvocation": {
-                                "@id": "https://w3id.org/security#capabilityInvocationMethod",
+                                "@id": "https://w3id.org/security#capabilityInvocationMethod",  # noqa: E501
                                 "@type": "@id",
                                 "@container": "@set",
                             },
                             "capabilityDelegation": {
-                                "@id": "https://w3id.org/security#capabilityDelegationMethod",
+                                "@id": "https://w3id.org/security#capabilityDelegationMethod",  # noqa: E501
                                 "@type": "@id",
                                 "@container": "@set",
                             },
@@ -105,12 +107,12 @@ SECURITY_V3_UNSTABLE = {
                                 "@container": "@set",
                             },
                             "capabilityInvocation": {
-                                "@id": "https://w3id.org/security#capabilityInvocationMethod",
+                                "@id": "https://w3id.org/security#capabilityInvocationMethod",  # noqa: E501
                                 "@type": "@id",
                                 "@container": "@set",
                             },
                             "capabilityDelegation": {
-                                "@id": "https://w3id.org/security#capabilityDelegationMethod",
+                                "@id": "https://w3id.org/security#capabilityDelegationMethod",  # noqa: E501
                                 "@type": "@id",
                                 "@container": "@set",
                             },
@@ -175,12 +177,12 @@ SECURITY_V3_UNSTABLE = {
                                 "@container": "@set",
                             },
                             "capabilityInvocation": {
-                                "@id": "https://w3id.org/security#capabilityInvocationMethod",
+                                "@id": "https://w3id.org/security#capabilityInvocationMethod",  # noqa: E501
                                 "@type": "@id",
                                 "@container": "@set",
                             },
                             "capabilityDelegation": {
-                                "@id": "https://w3id.org/security#capabilityDelegationMethod",
+                                "@id": "https://w3id.org/security#capabilityDelegationMethod",  # noqa: E501
                                 "@type": "@id",
                                 "@container": "@set",
                             },
@@ -230,12 +232,12 @@ SECURITY_V3_UNSTABLE = {
                                 "@container": "@set",
                             },
                             "capabilityInvocation": {
-                                "@id": "https://w3id.org/security#capabilityInvocationMethod",
+                                "@id": "https://w3id.org/security#capabilityInvocationMethod",  # noqa: E501
                                 "@type": "@id",
                                 "@container": "@set",
                             },
                             "capabilityDelegation": {
-                                "@id": "https://w3id.org/security#capabilityDelegationMethod",
+                                "@id": "https://w3id.org/security#capabilityDelegationMethod",  # noqa: E501
                                 "@type": "@id",
                                 "@container": "@set",
                             },
@@ -253,7 +255,7 @@ SECURITY_V3_UNSTABLE = {
                     },
                 },
             },
-            "EcdsaKoblitzSignature2016": "https://w3id.org/security#EcdsaKoblitzSignature2016",
+            "EcdsaKoblitzSignature2016": "https://w3id.org/security#EcdsaKoblitzSignature2016",  # noqa: E501
             "Ed25519Signature2018": {
                 "@id": "https://w3id.org/security#Ed25519Signature2018",
                 "@context": {
@@ -291,12 +293,12 @@ SECURITY_V3_UNSTABLE = {
                                 "@container": "@set",
                             },
                             "capabilityInvocation": {
-                                "@id": "https://w3id.org/security#capabilityInvocationMethod",
+                                "@id": "https://w3id.org/security#capabilityInvocationMethod",  # noqa: E501
                                 "@type": "@id",
                                 "@container": "@set",
                             },
                             "capabilityDelegation": {
-                                "@id": "https://w3id.org/security#capabilityDelegationMethod",
+                                "@id": "https://w3id.org/security#capabilityDelegationMethod",  # noqa: E501
                                 "@type": "@id",
                                 "@container": "@set",
                             },
@@ -316,11 +318,11 @@ SECURITY_V3_UNSTABLE = {
             },
             "EncryptedMessage": "https://w3id.org/security#EncryptedMessage",
             "GraphSignature2012": "https://w3id.org/security#GraphSignature2012",
-            "LinkedDataSignature2015": "https://w3id.org/security#LinkedDataSignature2015",
-            "LinkedDataSignature2016": "https://w3id.org/security#LinkedDataSignature2016",
+            "LinkedDataSignature2015": "https://w3id.org/security#LinkedDataSignature2015",  # noqa: E501
+            "LinkedDataSignature2016": "https://w3id.org/security#LinkedDataSignature2016",  # noqa: E501
             "CryptographicKey": "https://w3id.org/security#Key",
             "authenticationTag": "https://w3id.org/security#authenticationTag",
-            "canonicalizationAlgorithm": "https://w3id.org/security#canonicalizationAlgorithm",
+            "canonicalizationAlgorithm": "https://w3id.org/security#canonicalizationAlgorithm",  # noqa: E501
             "cipherAlgorithm": "https://w3id.org/security#cipherAlgorithm",
             "cipherData": "https://w3id.org/security#cipherData",
             "cipherKey": "https://w3id.org/security#cipherKey",
@@ -403,12 +405,12 @@ SECURITY_V3_UNSTABLE = {
                                 "@container": "@set",
                             },
                             "capabilityInvocation": {
-                                "@id": "https://w3id.org/security#capabilityInvocationMethod",
+                                "@id": "https://w3id.org/security#capabilityInvocationMethod",  # noqa: E501
                                 "@type": "@id",
                                 "@container": "@set",
                             },
                             "capabilityDelegation": {
-                                "@id": "https://w3id.org/security#capabilityDelegationMethod",
+                                "@id": "https://w3id.org/security#capabilityDelegationMethod",  # noqa: E501
                                 "@type": "@id",
                                 "@container": "@set",
                             },
@@ -463,12 +465,12 @@ SECURITY_V3_UNSTABLE = {
                                 "@container": "@set",
                             },
                             "capabilityInvocation": {
-                                "@id": "https://w3id.org/security#capabilityInvocationMethod",
+                                "@id": "https://w3id.org/security#capabilityInvocationMethod",  # noqa: E501
                                 "@type": "@id",
                                 "@container": "@set",
                             },
                             "capabilityDelegation": {
-                                "@id": "https://w3id.org/security#capabilityDelegationMethod",
+                                "@id": "https://w3id.org/security#capabilityDelegationMethod",  # noqa: E501
                                 "@type": "@id",
                                 "@container": "@set",
                             },
@@ -486,9 +488,9 @@ SECURITY_V3_UNSTABLE = {
                     },
                 },
             },
-            "EcdsaSecp256k1VerificationKey2019": "https://w3id.org/security#EcdsaSecp256k1VerificationKey2019",
-            "EcdsaSecp256r1VerificationKey2019": "https://w3id.org/security#EcdsaSecp256r1VerificationKey2019",
-            "Ed25519VerificationKey2018": "https://w3id.org/security#Ed25519VerificationKey2018",
+            "EcdsaSecp256k1VerificationKey2019": "https://w3id.org/security#EcdsaSecp256k1VerificationKey2019",  # noqa: E501
+            "EcdsaSecp256r1VerificationKey2019": "https://w3id.org/security#EcdsaSecp256r1VerificationKey2019",  # noqa: E501
+            "Ed25519VerificationKey2018": "https://w3id.org/security#Ed25519VerificationKey2018",  # noqa: E501
             "EquihashProof2018": "https://w3id.org/security#EquihashProof2018",
             "ExportKeyOperation": "https://w3id.org/security#ExportKeyOperation",
             "GenerateKeyOperation": "https://w3id.org/security#GenerateKeyOperation",
@@ -529,12 +531,12 @@ SECURITY_V3_UNSTABLE = {
                                 "@container": "@set",
                             },
                             "capabilityInvocation": {
-                                "@id": "https://w3id.org/security#capabilityInvocationMethod",
+                                "@id": "https://w3id.org/security#capabilityInvocationMethod",  # noqa: E501
                                 "@type": "@id",
                                 "@container": "@set",
                             },
                             "capabilityDelegation": {
-                                "@id": "https://w3id.org/security#capabilityDelegationMethod",
+                                "@id": "https://w3id.org/security#capabilityDelegationMethod",  # noqa: E501
                                 "@type": "@id",
                                 "@container": "@set",
                             },
@@ -558,7 +560,7 @@ SECURITY_V3_UNSTABLE = {
             "UnwrapKeyOperation": "https://w3id.org/security#UnwrapKeyOperation",
             "VerifyOperation": "https://w3id.org/security#VerifyOperation",
             "WrapKeyOperation": "https://w3id.org/security#WrapKeyOperation",
-            "X25519KeyAgreementKey2019": "https://w3id.org/security#X25519KeyAgreementKey2019",
+            "X25519KeyAgreementKey2019": "https://w3id.org/security#X25519KeyAgreementKey2019",  # noqa: E501
             "allowedAction": "https://w3id.org/security#allowedAction",
             "assertionMethod": {
                 "@id": "https://w3id.org/security#assertionMethod",
@@ -1,9 +1,9 @@
 """JSON-LD document loader methods."""
 
 import asyncio
-import concurrent.futures
+import threading
 
-from typing import Callable
+from typing import Callable, Dict
 
 from pydid.did_url import DIDUrl
 from pyld.documentloader import requests
@@ -12,26 +12,59 @@ from ...cache.base import BaseCache
 from ...core.profile import Profile
 from ...resolver.did_resolver import DIDResolver
 
+from .context_store import BaseContextStore, StorageContextStore
+from .contexts import STATIC_CONTEXTS
 from .error import LinkedDataProofException
 
 
 class DocumentLoader:
-    """JSON-LD document loader."""
-
-    def __init__(self, profile: Profile, cache_ttl: int = 300) -> None:
+    """JSON-LD document loader.
+
+    Well-known contexts are served from the bundled `STATIC_CONTEXTS` without
+    any I/O. Other http(s) documents are looked up in the cache and the context
+    store before being fetched, unless remote fetches are disabled.
+
+    Lookups run on a single background event loop shared by all callers, so that
+    many documents can be loaded at once. Concurrent lookups of the same url
+    share one load.
+
+    As pyld calls the loader synchronously, usually from a worker thread, the
+    cache, DID resolver and context store are used from the background loop's
+    thread rather than the agent's main loop. They must therefore not hold
+    objects bound to one event loop, such as connection pools or futures, nor
+    assume that they are only accessed from a single thread.
+    """
+
+    def __init__(
+        self,
+        profile: Profile,
+        cache_ttl: int = 300,
+        context_store: BaseContextStore = None,
+    ) -> None:
         """Initialize new DocumentLoader instance.
 
         Args:
             profile (Profile): The profile
             cache_ttl (int, optional): TTL for cached documents. Defaults to 300.
+            context_store (BaseContextStore, optional): Persistent store for
+                fetched documents. Defaults to the injected store, if any.
 
         """
         self.profile = profile
         self.resolver = profile.inject(DIDResolver)
         self.cache = profile.inject(BaseCache, required=False)
+        self.context_store = context_store or profile.inject(
+            BaseContextStore, required=False
+        )
+        if not self.context_store and profile.settings.get("jsonld.persist_contexts"):
+            self.context_store = StorageContextStore(profile)
+        self.allow_remote = not profile.settings.get("jsonld.no_remote_contexts")
         self.requests_loader = requests.requests_document_loader()
-        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
         self.cache_ttl = cache_ttl
+        self._loop: asyncio.AbstractEventLoop = None
+        self._loop_lock = threading.Lock()
+        # url -> in-flight load, only accessed from the background loop
+        self._pending: Dict[str, asyncio.Future] = {}
 
     async def _load_did_document(self, did: str, options: dict):
         # Resolver expects plain did without path, query, etc...
@@ -50,8 +83,37 @@ class DocumentLoader:
 
         return document
 
-    def _load_http_document(self, url: str, options: dict):
-        document = self.requests_loader(url, options)
+    def _load_static_document(self, url: str) -> dict:
+        context = STATIC_CONTEXTS.get(url)
+        if not context:
+            return None
+
+        return {
+            "contentType": "application/ld+json",
+            "contextUrl": None,
+            "documentUrl": url,
+            "document": context,
+        }
+
+    async def _load_http_document(self, url: str, options: dict):
+        if self.context_store:
+            document = await self.context_store.get(url)
+            if document:
+                return document
+
+        if not self.allow_remote:
+            raise LinkedDataProofException(
+                f"Remote JSON-LD document {url} is not available locally "
+                "and remote document loading is disabled"
+            )
+
+        # the pyld requests loader is blocking, keep the loop free for other loads
+        document = await asyncio.get_event_loop().run_in_executor(
+            None, self.requests_loader, url, options
+        )
+
+        if self.context_store:
+            await self.context_store.set(url, document)
 
         return document
 
@@ -59,6 +121,11 @@ class DocumentLoader:
     async def _load_async(self, url: str, options: dict):
         """Retrieve http(s) or did document."""
 
+        # Bundled contexts never need a cache or network round trip
+        document = self._load_static_document(url)
+        if document:
+            return document
+
         cache_key = f"json_ld_document_resolver::{url}"
 
         # Try to get from cache
@@ -71,7 +138,7 @@ class DocumentLoader:
         if url.startswith("did:"):
             document = await self._load_did_document(url, options)
         elif url.startswith("http://") or url.startswith("https://"):
-            document = self._load_http_document(url, options)
+            document = await self._load_http_document(url, options)
         else:
             raise LinkedDataProofException(
                 "Unrecognized url format. Must start with "
@@ -84,26 +151,68 @@ class DocumentLoader:
 
         return document
 
-    def _load_sync(self, url: str, options: dict):
-        """Run document loader in event loop to make it async.
-
-        NOTE: This should be called in a thread where an event loop is not already
-        running, such as a new thread.
-        """
-        loop = asyncio.new_event_loop()
-        return loop.run_until_complete(self._load_async(url, options))
+    async def _load_shared(self, url: str, options: dict):
+        """Load a document, joining any in-flight load of the same url."""
+        task = self._pending.get(url)
+        if not task:
+            task = asyncio.ensure_future(self._load_async(url, options))
+            self._pending[url] = task
+
+            def _done(_):
+                if self._pending.get(url) is task:
+                    del self._pending[url]
+
+            task.add_done_callback(_done)
+
+        # a cancelled waiter must not cancel the load for the other waiters
+        return await asyncio.shield(task)
+
+    @staticmethod
+    def _run_loop(loop: asyncio.AbstractEventLoop):
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Get the background event loop, starting it on first use."""
+        with self._loop_lock:
+            if not self._loop:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=self._run_loop,
+                    args=(loop,),
+                    name="DocumentLoader",
+                    daemon=True,
+                ).start()
+                self._loop = loop
+        return self._loop
 
     def load_document(self, url: str, options: dict):
         """Load JSON-LD document.
 
         Method signature conforms to PyLD document loader interface
 
-        Document loading is processed in separate thread to deal with
-        async to sync transformation.
+        Bundled contexts are returned directly. Other documents are loaded on the
+        background event loop, blocking only the calling thread.
         """
-        future = self.executor.submit(self._load_sync, url, options)
+        document = self._load_static_document(url)
+        if document:
+            return document
+
+        future = asyncio.run_coroutine_threadsafe(
+            self._load_shared(url, options), self._get_loop()
+        )
         return future.result()
 
+    def close(self):
+        """Stop the background event loop."""
+        with self._loop_lock:
+            loop, self._loop = self._loop, None
+        if loop:
+            loop.call_soon_threadsafe(loop.stop)
+
     def __call__(self, url: str, options: dict):
         """Load JSON-LD Document."""
 
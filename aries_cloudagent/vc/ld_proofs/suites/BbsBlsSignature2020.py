@@ -67,8 +67,11 @@ class BbsBlsSignature2020(BbsBlsSignature2020Base):
         proof = purpose.update(proof)
 
         # Create statements to sign
-        verify_data = self._create_verify_data(
-            proof=proof, document=document, document_loader=document_loader
+        verify_data = await self._run_blocking(
+            self._create_verify_data,
+            proof=proof,
+            document=document,
+            document_loader=document_loader,
         )
 
         # Encode statements as bytes
@@ -90,8 +93,11 @@ class BbsBlsSignature2020(BbsBlsSignature2020Base):
         """Verify proof against document and proof purpose."""
         try:
             # Create statements to verify
-            verify_data = self._create_verify_data(
-                proof=proof, document=document, document_loader=document_loader
+            verify_data = await self._run_blocking(
+                self._create_verify_data,
+                proof=proof,
+                document=document,
+                document_loader=document_loader,
             )
 
             # Encode statements as bytes
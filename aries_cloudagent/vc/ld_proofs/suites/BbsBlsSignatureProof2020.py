@@ -20,6 +20,7 @@ if BbsBlsSignature2020Base.BBS_SUPPORTED:
     )
 
 from ....utils.dependencies import assert_ursa_bbs_signatures_installed
+from ....utils.worker_pool import run_in_worker
 from ....wallet.util import b64_to_bytes, bytes_to_b64
 from ..crypto import KeyPair
 from ..error import LinkedDataProofException
@@ -202,7 +203,7 @@ class BbsBlsSignatureProof2020(BbsBlsSignature2020Base):
             nonce=nonce,
         )
 
-        output_proof = bls_create_proof(proof_request)
+        output_proof = await run_in_worker(bls_create_proof, proof_request)
 
         # Set the proof value on the derived proof
         derived_proof["proofValue"] = bytes_to_b64(
@@ -276,7 +277,7 @@ class BbsBlsSignatureProof2020(BbsBlsSignature2020Base):
                 nonce=b64_to_bytes(proof["nonce"]),
             )
 
-            verified = bls_verify_proof(verify_request)
+            verified = await run_in_worker(bls_verify_proof, verify_request)
 
             if not verified:
                 raise LinkedDataProofException(
@@ -1,12 +1,12 @@
 """Abstract base class for linked data proofs."""
 
-
 from abc import ABC
 from pyld import jsonld
-from typing import List, TYPE_CHECKING, Union
+from typing import Callable, List, TYPE_CHECKING, Union
 
 from typing_extensions import TypedDict
 
+from ....utils.worker_pool import run_in_worker
 from ..check import get_properties_without_context
 from ..constants import SECURITY_CONTEXT_URL
 from ..error import LinkedDataProofException
@@ -112,6 +112,15 @@ class LinkedDataProof(ABC):
             f"{self.signature_type} signature suite does not support deriving proofs"
         )
 
+    async def _run_blocking(self, func: Callable, **kwargs):
+        """Run blocking JSON-LD processing in the shared worker pool.
+
+        Keeps the event loop responsive while pyld expands and canonizes
+        documents, which may also wait on the document loader. The document
+        loader is not picklable, so this always runs in a worker thread.
+        """
+        return await run_in_worker(func, **kwargs)
+
     def _canonize(self, *, input, document_loader: DocumentLoaderMethod) -> str:
         """Canonize input document using URDNA2015 algorithm."""
         # application/n-quads format always returns str
@@ -105,8 +105,11 @@ class LinkedDataSignature(LinkedDataProof, metaclass=ABCMeta):
         proof = purpose.update(proof)
 
         # Create data to sign
-        verify_data = self._create_verify_data(
-            proof=proof, document=document, document_loader=document_loader
+        verify_data = await self._run_blocking(
+            self._create_verify_data,
+            proof=proof,
+            document=document,
+            document_loader=document_loader,
         )
 
         # Sign data
@@ -125,8 +128,11 @@ class LinkedDataSignature(LinkedDataProof, metaclass=ABCMeta):
         """Verify proof against document and proof purpose."""
         try:
             # Create data to verify
-            verify_data = self._create_verify_data(
-                proof=proof, document=document, document_loader=document_loader
+            verify_data = await self._run_blocking(
+                self._create_verify_data,
+                proof=proof,
+                document=document,
+                document_loader=document_loader,
             )
 
             # Fetch verification method
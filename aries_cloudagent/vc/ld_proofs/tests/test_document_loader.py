@@ -0,0 +1,158 @@
+import asyncio
+import threading
+import time
+
+from asynctest import TestCase
+from asynctest import mock as async_mock
+
+from ....cache.base import BaseCache
+from ....cache.in_memory import InMemoryCache
+from ....core.in_memory import InMemoryProfile
+from ....resolver.did_resolver import DIDResolver
+from ..constants import CREDENTIALS_CONTEXT_V1_URL, SECURITY_CONTEXT_BBS_URL
+from ..context_store import StorageContextStore
+from ..contexts import STATIC_CONTEXTS
+from ..document_loader import DocumentLoader
+from ..error import LinkedDataProofException
+
+REMOTE_URL = "https://w3id.org/citizenship/v1"
+REMOTE_DOC = {
+    "contentType": "application/ld+json",
+    "contextUrl": None,
+    "documentUrl": REMOTE_URL,
+    "document": {"@context": {"name": "http://schema.org/name"}},
+}
+
+
+class TestDocumentLoader(TestCase):
+    def setUp(self):
+        self.profile = InMemoryProfile.test_profile()
+        self.profile.context.injector.bind_instance(DIDResolver, async_mock.MagicMock())
+
+    def loader(self, **kwargs) -> DocumentLoader:
+        loader = DocumentLoader(self.profile, **kwargs)
+        loader.requests_loader = async_mock.MagicMock(return_value=REMOTE_DOC)
+        return loader
+
+    def test_static_contexts(self):
+        loader = self.loader()
+
+        for url in (CREDENTIALS_CONTEXT_V1_URL, SECURITY_CONTEXT_BBS_URL):
+            document = loader(url, {})
+            assert document["documentUrl"] == url
+            assert document["document"] is STATIC_CONTEXTS[url]
+        loader.requests_loader.assert_not_called()
+
+    def test_remote_context(self):
+        loader = self.loader()
+
+        assert loader(REMOTE_URL, {}) == REMOTE_DOC
+        loader.requests_loader.assert_called_once_with(REMOTE_URL, {})
+
+    def test_remote_context_disabled(self):
+        self.profile.settings["jsonld.no_remote_contexts"] = True
+        loader = self.loader()
+
+        assert loader(CREDENTIALS_CONTEXT_V1_URL, {})
+        with self.assertRaises(LinkedDataProofException):
+            loader(REMOTE_URL, {})
+        loader.requests_loader.assert_not_called()
+
+    def test_unrecognized_url(self):
+        with self.assertRaises(LinkedDataProofException):
+            self.loader()("urn:uuid:1234", {})
+
+    def test_context_store(self):
+        self.profile.settings["jsonld.persist_contexts"] = True
+        loader = self.loader()
+        assert isinstance(loader.context_store, StorageContextStore)
+
+        assert loader(REMOTE_URL, {}) == REMOTE_DOC
+        loader.requests_loader.assert_called_once_with(REMOTE_URL, {})
+
+        # a new loader without network access is served from storage
+        self.profile.settings["jsonld.no_remote_contexts"] = True
+        loader = self.loader()
+        assert loader(REMOTE_URL, {}) == REMOTE_DOC
+        loader.requests_loader.assert_not_called()
+
+    async def test_storage_context_store(self):
+        store = StorageContextStore(self.profile)
+
+        assert await store.get(REMOTE_URL) is None
+        await store.set(REMOTE_URL, REMOTE_DOC)
+        assert await store.get(REMOTE_URL) == REMOTE_DOC
+
+        updated = dict(REMOTE_DOC, document={"@context": {}})
+        await store.set(REMOTE_URL, updated)
+        assert await store.get(REMOTE_URL) == updated
+
+    async def test_concurrent_loads(self):
+        loader = self.loader()
+        released = threading.Event()
+
+        def slow_loader(url, options):
+            released.wait(5)
+            return REMOTE_DOC
+
+        loader.requests_loader = async_mock.MagicMock(side_effect=slow_loader)
+
+        # pyld calls the loader from worker threads
+        loop = asyncio.get_event_loop()
+        pending = [loop.run_in_executor(None, loader, REMOTE_URL, {}) for _ in range(3)]
+        await asyncio.sleep(0.05)
+        assert not any(task.done() for task in pending)
+        released.set()
+
+        assert await asyncio.gather(*pending) == [REMOTE_DOC] * 3
+        loader.requests_loader.assert_called_once_with(REMOTE_URL, {})
+        assert not loader._pending
+
+        loader.close()
+        loader.close()
+        assert loader(REMOTE_URL, {}) == REMOTE_DOC
+        loader.close()
+
+    async def test_default_cache_threads(self):
+        cache = InMemoryCache(max_entries=50, max_bytes=100000)
+        self.profile.context.injector.bind_instance(BaseCache, cache)
+        loader = self.loader()
+        loader.requests_loader = async_mock.MagicMock(
+            side_effect=lambda url, options: dict(REMOTE_DOC, documentUrl=url)
+        )
+        # record whether cache updates from the two threads overlap
+        expire = cache._remove_expired_cache_items
+        running = []
+        overlapped = []
+
+        def slow_expire():
+            running.append(1)
+            overlapped.append(len(running) > 1)
+            time.sleep(0.0005)
+            expire()
+            running.pop()
+
+        cache._remove_expired_cache_items = slow_expire
+
+        def load_all():
+            for i in range(200):
+                url = f"https://example.org/{i}"
+                assert loader(url, {})["documentUrl"] == url
+
+        # the loader's background loop and the main loop share the cache
+        loop = asyncio.get_event_loop()
+        loading = loop.run_in_executor(None, load_all)
+        i = 0
+        while not loading.done():
+            await cache.set(f"main-{i}", {"value": i}, 0.001)
+            await cache.get(f"main-{i // 2}")
+            i += 1
+            await asyncio.sleep(0)
+        await loading
+
+        assert overlapped and not any(overlapped)
+        assert len(cache._cache) <= 50
+        assert cache.total_bytes == sum(
+            entry.get("size", 0) for entry in cache._cache.values()
+        )
+        loader.close()
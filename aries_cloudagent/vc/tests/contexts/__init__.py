@@ -1,9 +1,11 @@
-from .did_v1 import DID_V1
-from .security_v1 import SECURITY_V1
-from .security_v2 import SECURITY_V2
-from .security_v3_unstable import SECURITY_V3_UNSTABLE
-from .bbs_v1 import BBS_V1
-from .credentials_v1 import CREDENTIALS_V1
+from ...ld_proofs.contexts import (
+    BBS_V1,
+    CREDENTIALS_V1,
+    DID_V1,
+    SECURITY_V1,
+    SECURITY_V2,
+    SECURITY_V3_UNSTABLE,
+)
 from .citizenship_v1 import CITIZENSHIP_V1
 from .examples_v1 import EXAMPLES_V1
 from .odrl import ODRL
@@ -1,6 +1,7 @@
 """Cryptography functions used by BasicWallet."""
 
 from collections import OrderedDict
+from functools import lru_cache
 from typing import Callable, Optional, Sequence, Tuple, Union, List
 
 import nacl.bindings
@@ -20,6 +21,9 @@ from .bbs import (
     sign_messages_bls12381g2,
 )
 
+# number of converted public keys kept for reuse between messages
+KEY_CACHE_SIZE = 1024
+
 
 def create_keypair(key_type: KeyType, seed: bytes = None) -> Tuple[bytes, bytes]:
     """
@@ -240,14 +244,13 @@ def add_pack_recipients(
         A tuple of (json result, key)
 
     """
+    if from_secret:
+        sender_vk = bytes_to_b58(sign_pk_from_sk(from_secret)).encode("utf-8")
+        sk = nacl.bindings.crypto_sign_ed25519_sk_to_curve25519(from_secret)
     for target_vk in to_verkeys:
-        target_pk = nacl.bindings.crypto_sign_ed25519_pk_to_curve25519(target_vk)
+        target_pk = ed25519_pk_to_curve25519(target_vk)
         if from_secret:
-            sender_pk = sign_pk_from_sk(from_secret)
-            sender_vk = bytes_to_b58(sender_pk).encode("utf-8")
             enc_sender = nacl.bindings.crypto_box_seal(sender_vk, target_pk)
-            sk = nacl.bindings.crypto_sign_ed25519_sk_to_curve25519(from_secret)
-
             nonce = nacl.utils.random(nacl.bindings.crypto_box_NONCEBYTES)
             enc_cek = nacl.bindings.crypto_box(cek, nonce, target_pk, sk)
             wrapper.add_recipient(
@@ -273,6 +276,7 @@ def add_pack_recipients(
             )
 
 
+@lru_cache(maxsize=KEY_CACHE_SIZE)
 def ed25519_pk_to_curve25519(public_key: bytes) -> bytes:
     """Covert a public Ed25519 key to a public Curve25519 key as bytes."""
     return nacl.bindings.crypto_sign_ed25519_pk_to_curve25519(public_key)
@@ -486,7 +490,7 @@ def extract_payload_key(sender_cek: dict, recip_secret: bytes) -> Tuple[bytes, s
     Returns: A tuple of the CEK and sender verkey
     """
     recip_vk = sign_pk_from_sk(recip_secret)
-    recip_pk = nacl.bindings.crypto_sign_ed25519_pk_to_curve25519(recip_vk)
+    recip_pk = ed25519_pk_to_curve25519(recip_vk)
     recip_sk = nacl.bindings.crypto_sign_ed25519_sk_to_curve25519(recip_secret)
 
     if sender_cek["nonce"] and sender_cek["sender"]:
@@ -494,9 +498,7 @@ def extract_payload_key(sender_cek: dict, recip_secret: bytes) -> Tuple[bytes, s
             sender_cek["sender"], recip_pk, recip_sk
         )
         sender_vk = sender_vk_bin.decode("utf-8")
-        sender_pk = nacl.bindings.crypto_sign_ed25519_pk_to_curve25519(
-            b58_to_bytes(sender_vk_bin)
-        )
+        sender_pk = ed25519_pk_to_curve25519(b58_to_bytes(sender_vk_bin))
         cek = nacl.bindings.crypto_box_open(
             sender_cek["key"], sender_cek["nonce"], sender_pk, recip_sk
         )
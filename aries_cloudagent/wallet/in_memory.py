@@ -1,9 +1,9 @@
 """In-memory implementation of BaseWallet interface."""
 
-import asyncio
 from typing import List, Sequence, Tuple, Union
 
 from ..core.in_memory import InMemoryProfile
+from ..utils.worker_pool import run_in_worker
 
 from .base import BaseWallet
 from .did_info import KeyInfo, DIDInfo
@@ -14,6 +14,7 @@ from .crypto import (
     verify_signed_message,
     encode_pack_message,
     decode_pack_message,
+    decode_pack_message_outer,
 )
 from .key_type import KeyType
 from .did_method import DIDMethod
@@ -392,7 +393,9 @@ class InMemoryWallet(BaseWallet):
             key_info = await self.get_local_did_for_verkey(from_verkey)
 
         secret = self._get_private_key(from_verkey)
-        signature = sign_message(message, secret, key_info.key_type)
+        signature = await run_in_worker(
+            sign_message, message, secret, key_info.key_type, process=True
+        )
         return signature
 
     async def verify_message(
@@ -428,7 +431,14 @@ class InMemoryWallet(BaseWallet):
             raise WalletError("Message not provided")
         verkey_bytes = b58_to_bytes(from_verkey)
 
-        verified = verify_signed_message(message, signature, verkey_bytes, key_type)
+        verified = await run_in_worker(
+            verify_signed_message,
+            message,
+            signature,
+            verkey_bytes,
+            key_type,
+            process=True,
+        )
         return verified
 
     async def pack_message(
@@ -454,8 +464,8 @@ class InMemoryWallet(BaseWallet):
 
         keys_bin = [b58_to_bytes(key) for key in to_verkeys]
         secret = self._get_private_key(from_verkey) if from_verkey else None
-        result = await asyncio.get_event_loop().run_in_executor(
-            None, encode_pack_message, message, keys_bin, secret
+        result = await run_in_worker(
+            encode_pack_message, message, keys_bin, secret, process=True
         )
         return result
 
@@ -477,12 +487,17 @@ class InMemoryWallet(BaseWallet):
         if not enc_message:
             raise WalletError("Message not provided")
         try:
-            (
-                message,
-                from_verkey,
-                to_verkey,
-            ) = await asyncio.get_event_loop().run_in_executor(
-                None, lambda: decode_pack_message(enc_message, self._get_private_key)
+            # look up the recipient keys here, as the wallet is not shared
+            # with worker processes
+            _, recips, _ = decode_pack_message_outer(enc_message)
+            secrets = {}
+            for recip_vk in recips:
+                try:
+                    secrets[recip_vk] = self._get_private_key(recip_vk)
+                except WalletError:
+                    pass
+            message, from_verkey, to_verkey = await run_in_worker(
+                decode_pack_message, enc_message, secrets.get, process=True
             )
         except ValueError as e:
             raise WalletError("Message could not be unpacked: {}".format(str(e)))
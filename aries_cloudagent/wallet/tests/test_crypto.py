@@ -40,6 +40,28 @@ class TestUtil(TestCase):
 
         assert test_module.sign_pk_from_sk(secret_key) in secret_key
 
+    def test_pack_key_cache(self):
+        sender_pk, sender_sk = test_module.create_ed25519_keypair()
+        target_pk, target_sk = test_module.create_ed25519_keypair()
+        secrets = {
+            test_module.bytes_to_b58(target_pk): target_sk,
+        }
+        test_module.ed25519_pk_to_curve25519.cache_clear()
+
+        for _ in range(2):
+            packed = test_module.encode_pack_message("message", [target_pk], sender_sk)
+            message, sender_vk, recip_vk = test_module.decode_pack_message(
+                packed, secrets.get
+            )
+            assert message == "message"
+            assert sender_vk == test_module.bytes_to_b58(sender_pk)
+            assert recip_vk == test_module.bytes_to_b58(target_pk)
+
+        # public keys are converted once, secret keys are never cached
+        cache_info = test_module.ed25519_pk_to_curve25519.cache_info()
+        assert cache_info.misses == 2
+        assert cache_info.currsize == 2
+
     def test_decode_pack_message_x(self):
         with mock.patch.object(
             test_module, "decode_pack_message_outer", mock.MagicMock()